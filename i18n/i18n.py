@@ -296,9 +296,39 @@ def remove_unnecessary():
                 # run black after this
 
 
+def build_translation_catalog(translations_array):
+    """
+    Packs translations into a compact binary catalog, read on demand by
+    krux_settings.LocaleControl instead of holding every string in RAM:
+    - count of strings (uint16, little-endian)
+    - count + 1 offsets into the blob (uint16, little-endian)
+    - UTF-8 blob with all strings concatenated
+    """
+    encoded = [translation.encode("utf-8") for translation in translations_array]
+    offsets = [0]
+    for translation in encoded:
+        offsets.append(offsets[-1] + len(translation))
+    if offsets[-1] > 0xFFFF:
+        raise ValueError("ERROR: Translation catalog exceeds 64KiB")
+    header = len(encoded).to_bytes(2, "little")
+    header += b"".join(offset.to_bytes(2, "little") for offset in offsets)
+    return header, encoded
+
+
+def write_translation_catalog(language_file, translations_array):
+    """Writes a binary catalog as a bytes literal, one translation per line"""
+    header, encoded = build_translation_catalog(translations_array)
+    language_file.write("translation_catalog = (\n")
+    for i in range(0, len(header), 32):
+        language_file.write("    " + repr(header[i : i + 32]) + "\n")
+    for translation in encoded:
+        language_file.write("    " + repr(translation) + "\n")
+    language_file.write(")\n")
+
+
 def bake_translations():
     """
-    Bakes individual translation tables into separate files inside the krux namespace
+    Bakes individual translation catalogs into separate files inside the krux namespace
     within a 'translations' subfolder.
     """
     translations_dir = join(SRC_DIR, "krux", "translations")
@@ -328,7 +358,7 @@ def bake_translations():
                     translations_array.append(translations[slug])
             language_code = basename(translation_filename).split(".")[0][:2]
 
-            # Write the individual translation array to a separate Python file
+            # Write the individual translation catalog to a separate Python file
             # in the 'translations' subfolder
             with open(
                 join(translations_dir, f"{language_code}.py"),
@@ -338,9 +368,7 @@ def bake_translations():
             ) as language_file:
                 language_file.write(KRUX_LICENSE)
                 language_file.write("# pylint: disable=C0301\n")
-                language_file.write("translation_array = ")
-                language_file.write(repr(translations_array))
-                language_file.write("\n")
+                write_translation_catalog(language_file, translations_array)
                 print("Baked: " + translations_dir + f"/{language_code}.py")
     # Create an reference array for index lookup
     reference_array = []
@@ -27,6 +27,7 @@ import cv2
 from numpy import zeros_like
 from kruxsim import events
 from kruxsim.mocks.board import BOARD_CONFIG
+from kruxsim.mocks import qrcode
 from krux.krux_settings import Settings
 
 COLOR_BLACK = (0, 0, 0)
@@ -339,6 +340,7 @@ def draw_string(x, y, s, color, bgcolor=COLOR_BLACK):
 def draw_qr_code_binary(
     offset_x, offset_y, code_bin, max_width, dark_color, light_color, background
 ):
+    qrcode.frame_drawn()
 
     def run():
         starting_size = int(math.sqrt(len(code_bin) * 8))
@@ -89,8 +89,16 @@ class UART:
 
 
 class SDCard:
+    # Remounts since the last flow was reported, see SDCard.report()
+    remounts = 0
+
     def remount():
-        pass
+        SDCard.remounts += 1
+
+    def report():
+        """Prints and resets the remounts counted for the finished user flow"""
+        print("SD card remounts in flow:", SDCard.remounts)
+        SDCard.remounts = 0
 
 
 def unique_id():
@@ -20,12 +20,54 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import sys
+import time
 from unittest import mock
 import pyqrcode
 import re
 
+# QR codes encoded and drawn since the last flow was reported, see report()
+encodes = 0
+encode_time = 0.0
+frame_times = []
+
 
 def encode(data):
+    global encodes, encode_time
+    start = time.perf_counter()
+    binary_qr = _encode(data)
+    encode_time += time.perf_counter() - start
+    encodes += 1
+    return binary_qr
+
+
+def frame_drawn():
+    """Records the time a QR code frame was drawn"""
+    frame_times.append(time.perf_counter())
+
+
+def report():
+    """Prints and resets the QR encoding time and frame interval jitter measured for
+    the finished user flow"""
+    global encodes, encode_time
+    if encodes:
+        print(
+            "QR encodes in flow: %d, %.1f ms total, %.1f ms avg"
+            % (encodes, encode_time * 1000, encode_time * 1000 / encodes)
+        )
+    intervals = [b - a for a, b in zip(frame_times, frame_times[1:])]
+    if intervals:
+        mean = sum(intervals) / len(intervals)
+        jitter = (sum((i - mean) ** 2 for i in intervals) / len(intervals)) ** 0.5
+        print(
+            "QR frames in flow: %d, interval %.1f ms avg, %.1f ms jitter"
+            % (len(frame_times), mean * 1000, jitter * 1000)
+        )
+    encodes = 0
+    encode_time = 0.0
+    frame_times.clear()
+
+
+def _encode(data):
     # Uses string encoded qr as it already cleaned up the frames
     # PyQRcode also doesn't offer any binary output
 
@@ -66,12 +66,16 @@ class MockStatistics:
 
 
 class Mockqrcode:
-    def __init__(self, data):
+    def __init__(self, data, rect):
         self.data = data
+        self._rect = rect
 
     def payload(self):
         return self.data
 
+    def rect(self):
+        return self._rect
+
 
 capturer = None
 
@@ -92,12 +96,41 @@ def run(on):
             capturer.release()
 
 
-def find_qrcodes(img):
-    codes = []
+# Time spent decoding snapshots since the last flow was reported, see report()
+decode_times = {"full": [], "roi": []}
+
+
+def find_qrcodes(img, roi=None):
+    """Decodes the QR codes in img (PIL image or numpy array), or in its roi
+    (x, y, w, h) only, returning them with their rects in img coordinates"""
+    x, y = 0, 0
+    if roi is not None:
+        x, y, w, h = roi
+        if isinstance(img, Image.Image):
+            img = img.crop((x, y, x + w, y + h))
+        else:
+            img = img[y : y + h, x : x + w]
+    start = time.perf_counter()
     data = decode(img)
-    if data:
-        codes.append(Mockqrcode(data[0].data.decode()))
-    return codes
+    decode_times["full" if roi is None else "roi"].append(time.perf_counter() - start)
+    return [
+        Mockqrcode(
+            code.data.decode(),
+            (code.rect.left + x, code.rect.top + y, code.rect.width, code.rect.height),
+        )
+        for code in data
+    ]
+
+
+def report():
+    """Prints and resets the per-snapshot decode times for the finished user flow"""
+    for search, times in decode_times.items():
+        if times:
+            print(
+                "QR decode (%s) in flow: %d snapshots, %.1f ms avg"
+                % (search, len(times), sum(times) * 1000 / len(times))
+            )
+        times.clear()
 
 
 def snapshot():
@@ -130,7 +163,7 @@ def snapshot():
         img = Image.fromarray(rgb_frame)
 
         m.get_frame.return_value = rgb_frame
-        m.find_qrcodes.return_value = find_qrcodes(img)
+        m.find_qrcodes.side_effect = lambda roi=None: find_qrcodes(img, roi)
         m.to_bytes.return_value = frame.tobytes()
         m.get_statistics.return_value = MockStatistics(lab_frame)
         m.width.return_value = frame.shape[1]
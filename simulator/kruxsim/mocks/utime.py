@@ -33,3 +33,11 @@ def ticks():
 
 if not getattr(time, "ticks_ms", None):
     setattr(time, "ticks_ms", ticks)
+
+
+def ticks_us():
+    return int((time.time() * 1000000) - start_time * 1000)
+
+
+if not getattr(time, "ticks_us", None):
+    setattr(time, "ticks_us", ticks_us)
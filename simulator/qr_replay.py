@@ -0,0 +1,101 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2025 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Replays recorded camera frames through the simulator's QR decoder, comparing
+per-frame decode time of full-frame searches against region of interest tracking.
+
+    python simulator/qr_replay.py scan.mp4
+    python simulator/qr_replay.py frames/%04d.png
+"""
+
+import argparse
+import time
+from cv2 import VideoCapture, cvtColor, COLOR_BGR2RGB
+from PIL import Image
+from kruxsim.mocks import qrcode  # registers the qrcode module krux.qr imports
+from kruxsim.mocks import sensor
+from krux.qr import QRCodeTracker
+
+
+class ReplayImage:
+    """Camera frame exposing the image methods used by the QR capture loop"""
+
+    def __init__(self, frame):
+        self.img = Image.fromarray(cvtColor(frame, COLOR_BGR2RGB))
+
+    def width(self):
+        return self.img.width
+
+    def height(self):
+        return self.img.height
+
+    def find_qrcodes(self, roi=None):
+        return sensor.find_qrcodes(self.img, roi)
+
+
+class FullFrameSearch:
+    """Searches every frame in full, as the capture loop did before tracking"""
+
+    def find_qrcodes(self, img):
+        return img.find_qrcodes()
+
+
+def load_frames(source):
+    capture = VideoCapture(source)
+    frames = []
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(ReplayImage(frame))
+    capture.release()
+    return frames
+
+
+def replay(frames, finder):
+    decoded = set()
+    found = 0
+    start = time.perf_counter()
+    for img in frames:
+        codes = finder.find_qrcodes(img)
+        if codes:
+            found += 1
+            decoded.update(code.payload() for code in codes)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(frames), found, len(decoded)
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("source", help="video file or image sequence pattern")
+args = parser.parse_args()
+
+frames = load_frames(args.source)
+if not frames:
+    raise SystemExit("No frames read from %s" % args.source)
+
+print("%d frames" % len(frames))
+for name, finder in (("full frame", FullFrameSearch()), ("ROI", QRCodeTracker())):
+    ms_per_frame, found, decoded = replay(frames, finder)
+    print(
+        "%-10s %.2f ms/frame, codes in %d frames, %d distinct payloads"
+        % (name, ms_per_frame, found, decoded)
+    )
+    sensor.report()
@@ -60,6 +60,13 @@ parser.add_argument(
     required=False,
     action=argparse.BooleanOptionalAction,
 )
+parser.add_argument(
+    "--profile-scan",
+    type=bool,
+    default=False,
+    required=False,
+    action=argparse.BooleanOptionalAction,
+)
 parser.add_argument(
     "--exit-after-sequence",
     type=bool,
@@ -106,6 +113,11 @@ from kruxsim.mocks import deflate
 if args.printer:
     machine.simulate_printer()
 
+if args.profile_scan:
+    from krux import profiler
+
+    profiler.SCAN_PROFILING = True
+
 from kruxsim.mocks import secp256k1
 from kruxsim.mocks import qrcode
 from kruxsim.mocks import sensor
@@ -212,6 +224,9 @@ t.start()
 
 
 def shutdown():
+    machine.SDCard.report()
+    qrcode.report()
+    sensor.report()
     if t.is_alive():
         t.alive = False
 
@@ -269,6 +284,10 @@ try:
                 shutdown()
             elif event.type >= pg.USEREVENT:
                 if event.type == events.SCREENSHOT_EVENT:
+                    # A sequence screenshot ends a user flow
+                    machine.SDCard.report()
+                    qrcode.report()
+                    sensor.report()
                     screenshot(event.dict["filename"])
                 else:
                     event.dict["f"]()
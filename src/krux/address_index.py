@@ -0,0 +1,131 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2025 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import hashlib
+from .settings import SD_PATH, Store
+from .krux_settings import Settings
+
+ADDRESS_INDEX_MAGIC = b"KAI\x01"
+ADDRESS_INDEX_RECORD_SIZE = 4
+ADDRESS_INDEX_MAX_DEPTH = 10000
+ADDRESS_INDEX_FILENAME = "addr-%s-%d.idx"
+
+
+def script_digest(script_pubkey):
+    """Returns the truncated hash stored in the index for a scriptPubKey"""
+    return hashlib.sha256(script_pubkey.data).digest()[:ADDRESS_INDEX_RECORD_SIZE]
+
+
+class AddressIndex:
+    """Table of truncated scriptPubKey hashes of one descriptor branch, where the
+    record at position i belongs to the address at derivation index i.
+
+    Records are only hints: callers must derive the address at a candidate
+    index to confirm a match.
+    """
+
+    def __init__(self, descriptor, branch_index=0, location=None):
+        from embit.descriptor.checksum import checksum
+
+        self.filename = ADDRESS_INDEX_FILENAME % (
+            checksum(str(descriptor)),
+            branch_index,
+        )
+        self.location = location or Settings().persist.location
+        self.hashes = bytearray()
+        # Number of records already written to storage
+        self.saved = 0
+        self._load()
+
+    def __len__(self):
+        return len(self.hashes) // ADDRESS_INDEX_RECORD_SIZE
+
+    def _path(self):
+        return Store.get_vfs_location(self.location) + self.filename
+
+    def _load(self):
+        try:
+            if self.location == SD_PATH:
+                from .sd_card import SDHandler
+
+                with SDHandler() as sd:
+                    data = sd.read_binary(self.filename)
+            else:
+                with open(self._path(), "rb") as f:
+                    data = f.read()
+        except:
+            return
+
+        if data[: len(ADDRESS_INDEX_MAGIC)] != ADDRESS_INDEX_MAGIC:
+            return
+        size = len(data) - len(ADDRESS_INDEX_MAGIC)
+        partial = size % ADDRESS_INDEX_RECORD_SIZE
+        size = min(size - partial, ADDRESS_INDEX_MAX_DEPTH * ADDRESS_INDEX_RECORD_SIZE)
+        self.hashes = bytearray(
+            data[len(ADDRESS_INDEX_MAGIC) : len(ADDRESS_INDEX_MAGIC) + size]
+        )
+        # A partial trailing record (e.g. an interrupted write) would misalign
+        # appended records, so leave saved at 0 to rewrite the whole file
+        if not partial:
+            self.saved = len(self)
+
+    def append(self, index, script_pubkey):
+        """Records the scriptPubKey derived at index if it extends the table"""
+        if index != len(self) or index >= ADDRESS_INDEX_MAX_DEPTH:
+            return
+        self.hashes.extend(script_digest(script_pubkey))
+
+    def find(self, script_pubkey):
+        """Yields the derivation indexes whose record matches the scriptPubKey"""
+        digest = script_digest(script_pubkey)
+        data = bytes(self.hashes)
+        pos = data.find(digest)
+        while pos != -1:
+            if pos % ADDRESS_INDEX_RECORD_SIZE == 0:
+                yield pos // ADDRESS_INDEX_RECORD_SIZE
+                pos = data.find(digest, pos + ADDRESS_INDEX_RECORD_SIZE)
+            else:
+                pos = data.find(digest, pos + 1)
+
+    def save(self):
+        """Appends the records not yet stored, returns False if storage failed"""
+        if self.saved == len(self):
+            return True
+        start = self.saved * ADDRESS_INDEX_RECORD_SIZE
+        if self.saved:
+            mode, data = "ab", self.hashes[start:]
+        else:
+            mode, data = "wb", ADDRESS_INDEX_MAGIC + bytes(self.hashes)
+        try:
+            if self.location == SD_PATH:
+                from .sd_card import SDHandler
+
+                with SDHandler():
+                    with open(self._path(), mode) as f:
+                        f.write(data)
+            else:
+                with open(self._path(), mode) as f:
+                    f.write(data)
+        except:
+            return False
+        self.saved = len(self)
+        return True
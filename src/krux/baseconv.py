@@ -21,6 +21,9 @@
 # THE SOFTWARE.
 from binascii import a2b_base64, b2a_base64
 
+# Base64 chars read from a stream at once, a multiple of 4
+B64_READ_CHUNK_SIZE = 1024
+
 
 def base_decode(v, base):
     """Abstraction to decode the str data in v as base; returns bytes"""
@@ -79,6 +82,57 @@ def base_encode(v, base):
     raise ValueError("not supported base: {}".format(base))
 
 
+class Base64Reader:
+    """Read-only file-like adapter that base64-decodes a stream as it is
+    read, one chunk of 4-char groups at a time, so the encoded text and the
+    decoded data are never held in memory together
+    """
+
+    def __init__(self, stream, chunk_size=B64_READ_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.pending = b""  # Encoded chars not yet forming a 4-char group
+        self.buffer = b""  # Decoded bytes
+        self.position = 0
+
+    def _decode_chunk(self):
+        """Decodes the next chunk of the stream into the buffer,
+        returns False at the end of the stream
+        """
+        while True:
+            chunk = self.stream.read(self.chunk_size)
+            if not chunk:
+                if self.pending:
+                    raise ValueError("Incomplete base64 data")
+                return False
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            # Line breaks and other whitespace are not part of the data
+            chunk = self.pending + b"".join(chunk.split())
+            complete = len(chunk) - len(chunk) % 4
+            self.pending = chunk[complete:]
+            if complete:
+                self.buffer = a2b_base64(chunk[:complete])
+                self.position = 0
+                return True
+
+    def read(self, size=-1):
+        """Returns up to size decoded bytes, or all remaining if size is negative"""
+        parts = []
+        while size != 0:
+            if self.position >= len(self.buffer) and not self._decode_chunk():
+                break
+            end = len(self.buffer)
+            if size > 0:
+                end = min(end, self.position + size)
+                size -= end - self.position
+            parts.append(self.buffer[self.position : end])
+            self.position = end
+        if len(parts) == 1:
+            return parts[0]
+        return b"".join(parts)
+
+
 def hint_encodings(str_data):
     """NON-VERIFIED encoding hints of what input string might be, returns list"""
 
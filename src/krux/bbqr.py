@@ -39,17 +39,54 @@ BBQR_ALWAYS_COMPRESS_THRESHOLD = 5000  # bytes
 class BBQrCode:
     """A BBQr code, containing the data, encoding, and file type"""
 
-    def __init__(self, payload, encoding=None, file_type=None):
-        """Initializes the BBQr code with the given data, encoding, and file type"""
+    def __init__(self, payload, encoding=None, file_type=None, data=None):
+        """Initializes the BBQr code with the given data, encoding, and file type.
+        Payload is the encoded text, or None if it should be produced from the
+        binary data on demand
+        """
 
         if encoding not in KNOWN_ENCODINGS:
             raise ValueError("Invalid BBQr encoding")
         if file_type not in KNOWN_FILETYPES:
             raise ValueError("Invalid BBQr file type")
-        self.payload = payload
+        self._payload = payload
+        self.data = data
         self.encoding = encoding
         self.file_type = file_type
 
+    @property
+    def payload(self):
+        """Returns the whole encoded payload text"""
+        if self._payload is None and self.data is not None:
+            return self.payload_slice(0, self.payload_length())
+        return self._payload
+
+    def payload_length(self):
+        """Returns the length of the encoded payload text"""
+        if self.data is None:
+            return len(self._payload)
+        if self.encoding == "H":
+            return len(self.data) * 2
+        # Base32 without padding, 8 chars for each 5 bytes
+        return (len(self.data) * 8 + 4) // 5
+
+    def payload_slice(self, start, end):
+        """Returns the encoded payload text from start to end, encoding only the
+        needed bytes. Start must be aligned to 8 chars (5 bytes) on base32
+        """
+        if self.data is None:
+            return self._payload[start:end]
+        end = min(end, self.payload_length())
+        if self.encoding == "H":
+            from binascii import hexlify
+
+            return hexlify(self.data[start // 2 : (end + 1) // 2]).decode().upper()
+
+        import base32
+
+        end_byte = len(self.data) if end == self.payload_length() else end * 5 // 8
+        return base32.encode(self.data[start * 5 // 8 : end_byte], False)
+
 
 def parse_bbqr(data):
     """
@@ -105,42 +142,101 @@ def deflate_decompress(data):
         raise ValueError("Error decompressing BBQR")
 
 
-def decode_bbqr(parts, encoding, file_type):
-    """Decodes the given data as BBQR, returning the decoded data"""
-
-    if encoding == "H":
-        from binascii import unhexlify
-
-        data_bytes = bytearray()
-        for _, part in sorted(parts.items()):
-            data_bytes.extend(unhexlify(part))
-        return bytes(data_bytes)
+class BBQrDecoder:
+    """Decodes BBQr parts as they are scanned into a preallocated buffer,
+    so neither the parts' text nor concatenated copies are kept in memory
+    """
 
-    import base32
+    def __init__(self, encoding, file_type, total):
+        self.encoding = encoding
+        self.file_type = file_type
+        self.total = total
+        # Decoded size of every part but the last, all have the same size
+        self.part_size = None
+        self.buffer = None
+        # Last part, when decoded before any other part gave the buffer size
+        self.last_part = None
+        self.received = set()
+
+    def add(self, index, part):
+        """Decodes a part's text into its slot of the buffer"""
+        if index in self.received:
+            return
+        if not 0 <= index < self.total:
+            raise ValueError("Invalid BBQR part index")
+        data = self._decode_part(part)
+        self.received.add(index)
+        if self.buffer is None:
+            if index == self.total - 1 and self.total > 1:
+                # Shorter than the others, can't tell the buffer size
+                self.last_part = data
+                return
+            # Room for all parts, trimmed when the last part is stored
+            self.part_size = len(data)
+            self.buffer = bytearray(self.part_size * self.total)
+        self._store(index, data)
+        if self.last_part is not None:
+            data, self.last_part = self.last_part, None
+            self._store(self.total - 1, data)
+
+    def _decode_part(self, part):
+        if self.encoding == "H":
+            from binascii import unhexlify
+
+            return unhexlify(part)
+
+        import base32
 
-    binary_data = b""
-    for _, part in sorted(parts.items()):
         padding = (8 - (len(part) % 8)) % 8
-        padded_part = part + (padding * "=")
-        binary_data += base32.decode(padded_part)
-
-    if encoding == "Z":
-        if file_type in "JU":
-            return deflate_decompress(binary_data).decode("utf-8")
-        return deflate_decompress(binary_data)
-    if file_type in "JU":
-        return binary_data.decode("utf-8")
-    return binary_data
+        return base32.decode(part + (padding * "="))
+
+    def _store(self, index, data):
+        last = index == self.total - 1
+        if len(data) > self.part_size or (not last and len(data) != self.part_size):
+            raise ValueError("Invalid BBQR part size")
+        start = index * self.part_size
+        end = start + len(data)
+        self.buffer[start:end] = data
+        if last:
+            # Trim the room left after the shorter last part
+            self.buffer[end:] = b""
+
+    def is_complete(self):
+        """Returns True when all parts were decoded into the buffer"""
+        return self.buffer is not None and len(self.received) == self.total
+
+    def result(self):
+        """Returns the decoded data, decompressed and as text if needed"""
+        if not self.is_complete():
+            raise ValueError("Incomplete BBQR")
+        binary_data = self.buffer
+        self.buffer = None
+        if self.encoding == "Z":
+            gc.collect()
+            binary_data = deflate_decompress(binary_data)
+        else:
+            binary_data = bytes(binary_data)
+        if self.file_type in "JU":
+            return binary_data.decode("utf-8")
+        return binary_data
 
 
-def encode_bbqr(data, encoding="Z", file_type="P"):
-    """Encodes the given data as BBQR, returning the encoded data and format"""
+def decode_bbqr(parts, encoding, file_type):
+    """Decodes the given data as BBQR, returning the decoded data"""
+    if not parts:
+        raise ValueError("Incomplete BBQR")
+    # Missing indexes leave the decoder incomplete instead of failing lookups
+    total = max(parts) + 1
+    decoder = BBQrDecoder(encoding, file_type, total)
+    for index, part in parts.items():
+        decoder.add(index, part)
+    return decoder.result()
 
-    if encoding == "H":
-        from binascii import hexlify
 
-        data = hexlify(data).decode()
-        return BBQrCode(data.upper(), encoding, file_type)
+def encode_bbqr(data, encoding="Z", file_type="P"):
+    """Encodes the given data as BBQR, returning the encoded data and format.
+    Only the (compressed) binary data is kept, parts' text is encoded on demand
+    """
 
     data = data.encode() if isinstance(data, str) else data
     if encoding == "Z":
@@ -159,9 +255,37 @@ def encode_bbqr(data, encoding="Z", file_type="P"):
 
     gc.collect()
 
-    import base32
+    return BBQrCode(None, encoding, file_type, data=data)
+
+
+def plan_bbqr(data, max_width, file_type="P"):
+    """Encodes the given data as the BBQR whose animation takes the fewest QR
+    codes of max_width, returning it and its number of parts (frames)
+    """
+    from .qr import find_min_num_parts, FORMAT_BBQR
+
+    data = data.encode() if isinstance(data, str) else data
+    if len(data) > BBQR_ALWAYS_COMPRESS_THRESHOLD:
+        # RAM won't be enough to have both compressed and not compressed data
+        candidates = [BBQrCode(None, "Z", file_type, data=deflate_compress(data))]
+    else:
+        # On ties, earlier encodings are simpler to decode. Hex is never
+        # denser than base32 for binary data, so it is not tried
+        candidates = [
+            BBQrCode(None, "2", file_type, data=data),
+            BBQrCode(None, "Z", file_type, data=deflate_compress(data)),
+        ]
+
+    best = None
+    for candidate in candidates:
+        num_parts, part_size = find_min_num_parts(candidate, max_width, FORMAT_BBQR)
+        # Fewest parts first, then the smallest (least dense) ones
+        if best is None or (num_parts, part_size) < (best[1], best[2]):
+            best = (candidate, num_parts, part_size)
+    del candidates
+    gc.collect()
 
-    return BBQrCode(base32.encode(data, False), encoding, file_type)
+    return best[0], best[1]
 
 
 def int2base36(n):
@@ -43,6 +43,8 @@ class Context:
 
     def clear(self):
         """Clears all sensitive data from the context, resetting it"""
+        if self.is_logged_in():
+            self.wallet.key.root.wipe_cache()
         self.wallet = None
         gc.collect()
 
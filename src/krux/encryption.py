@@ -114,18 +114,18 @@ class MnemonicStorage:
         b64_kef = base_encode(kef_envelope, 64)
         mnemonics = {}
         if sd_card:
-            # load current MNEMONICS_FILE
-            try:
-                with SDHandler() as sd:
-                    contents = sd.read(MNEMONICS_FILE)
-                    orig_len = len(contents)
-                    mnemonics = json.loads(contents)
-            except:
-                orig_len = 0
-
-            # save the new MNEMONICS_FILE
             try:
+                # single mount session to load and save MNEMONICS_FILE
                 with SDHandler() as sd:
+                    # load current MNEMONICS_FILE
+                    try:
+                        contents = sd.read(MNEMONICS_FILE)
+                        orig_len = len(contents)
+                        mnemonics = json.loads(contents)
+                    except:
+                        orig_len = 0
+
+                    # save the new MNEMONICS_FILE
                     mnemonics[mnemonic_id] = {"b64_kef": b64_kef}
                     contents = json.dumps(mnemonics)
                     # pad contents to orig_len to avoid abandoned bytes on sdcard
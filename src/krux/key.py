@@ -136,6 +136,53 @@ FINGERPRINT_SYMBOL = "⊚"
 DERIVATION_PATH_SYMBOL = "↳"
 
 
+# Derived keys kept by CachedHDKey, each the parent of a recently derived key
+DERIVATION_CACHE_SIZE = 8
+
+
+class CachedHDKey(bip32.HDKey):
+    """BIP32 key that keeps the parents of recently derived keys, so their
+    siblings (e.g. PSBT inputs and outputs of the same account) are derived
+    from the deepest cached ancestor instead of from this key
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (path, key) pairs, least recently used first
+        self.derivation_cache = []
+
+    def derive(self, path):
+        """path: int array or a string starting with m/"""
+        if isinstance(path, str):
+            path = bip32.parse_path(path)
+        path = tuple(path)
+
+        ancestor = self
+        depth = 0
+        used = None
+        for entry in self.derivation_cache:
+            prefix = entry[0]
+            if depth < len(prefix) <= len(path) and path[: len(prefix)] == prefix:
+                ancestor = entry[1]
+                depth = len(prefix)
+                used = entry
+        if used is not None:
+            self.derivation_cache.remove(used)
+            self.derivation_cache.append(used)
+
+        if depth < len(path) - 1:
+            ancestor = bip32.HDKey.derive(ancestor, path[depth:-1])
+            depth = len(path) - 1
+            self.derivation_cache.append((path[:-1], ancestor))
+            if len(self.derivation_cache) > DERIVATION_CACHE_SIZE:
+                self.derivation_cache.pop(0)
+        return bip32.HDKey.derive(ancestor, path[depth:])
+
+    def wipe_cache(self):
+        """Drops all cached derived keys"""
+        self.derivation_cache = []
+
+
 class Key:
     """Represents a BIP39 mnemonic-based private key"""
 
@@ -202,7 +249,7 @@ class Key:
     @classmethod
     def extract_root(cls, mnemonic, passphrase, network):
         """Calculate and return the BIP32 root key based on mnemonic"""
-        return bip32.HDKey.from_seed(
+        return CachedHDKey.from_seed(
             bip39.mnemonic_to_seed(mnemonic, passphrase), version=network["xprv"]
         )
 
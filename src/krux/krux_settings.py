@@ -69,16 +69,17 @@ CNC_HEAD_ROUTER = "router"
 CNC_HEAD_LASER = "laser"
 
 
+TRANSLATION_CACHE_SIZE = 32
+
+
 def t(slug):
     """Translates a slug according to the current locale"""
-    if not locale_control.translation:
+    if not locale_control.catalog:
         return slug
-    slug_id = binascii.crc32(slug.encode("utf-8"))
-    try:
-        translation_index = locale_control.reference.index(slug_id)
-    except:
+    translation_index = locale_control.index.get(binascii.crc32(slug.encode("utf-8")))
+    if translation_index is None:
         return slug
-    return locale_control.translation[translation_index]
+    return locale_control.translation(translation_index)
 
 
 class LocaleControl:
@@ -86,7 +87,10 @@ class LocaleControl:
 
     def __init__(self):
         self.reference = None
-        self.translation = None
+        self.index = {}
+        self.catalog = None
+        self.cache = {}
+        self.cache_order = []
         self.locales = []
         self.update_locales()
 
@@ -101,9 +105,12 @@ class LocaleControl:
     def load_locale(self, locale):
         """Loads translation based on the given locale"""
 
+        self.cache = {}
+        self.cache_order = []
         if locale == DEFAULT_LOCALE:
             self.reference = None
-            self.translation = None
+            self.index = {}
+            self.catalog = None
             return
         module_path = "krux.translations.{}".format(locale[:2])
         translation_module = __import__(module_path)
@@ -111,11 +118,37 @@ class LocaleControl:
         for part in module_path.split(".")[1:]:
             translation_module = getattr(translation_module, part)
 
-        self.translation = getattr(translation_module, "translation_array")
+        # Binary catalog baked by i18n.py, strings are decoded on demand
+        self.catalog = getattr(translation_module, "translation_catalog")
         if self.reference is None:
             from .translations import ref_array
 
             self.reference = ref_array
+            # Slug CRC32 -> translation index, so t() doesn't scan ref_array
+            self.index = {slug_id: i for i, slug_id in enumerate(ref_array)}
+
+    def translation(self, index):
+        """Returns the translation at the given catalog index, keeping
+        the most recently used strings in a small LRU cache"""
+        if index in self.cache:
+            if self.cache_order[-1] != index:
+                self.cache_order.remove(index)
+                self.cache_order.append(index)
+            return self.cache[index]
+
+        catalog = self.catalog
+        # Offsets table follows the uint16 count, blob follows the offsets
+        pos = 2 + 2 * index
+        start = catalog[pos] | catalog[pos + 1] << 8
+        end = catalog[pos + 2] | catalog[pos + 3] << 8
+        blob = 4 + 2 * (catalog[0] | catalog[1] << 8)
+        text = catalog[blob + start : blob + end].decode("utf-8")
+
+        if len(self.cache_order) >= TRANSLATION_CACHE_SIZE:
+            del self.cache[self.cache_order.pop(0)]
+        self.cache[index] = text
+        self.cache_order.append(index)
+        return text
 
 
 locale_control = LocaleControl()
@@ -370,6 +403,7 @@ class HardwareSettings(SettingsNamespace):
     """Hardware Related Settings"""
 
     namespace = "settings.hardware"
+    scan_profiling = CategorySetting("scan_profiling", False, [False, True])
 
     def __init__(self):
         self.printer = PrinterSettings()
@@ -394,6 +428,7 @@ class HardwareSettings(SettingsNamespace):
             hardware_menu["display_amg"] = t("Display")
         elif kboard.can_flip_orientation or kboard.can_control_brightness:
             hardware_menu["display"] = t("Display")
+        hardware_menu["scan_profiling"] = t("Scan Profiling")
 
         return hardware_menu[attr]
 
@@ -471,16 +506,20 @@ class SecuritySettings(SettingsNamespace):
     """Security settings"""
 
     namespace = "settings.security"
+    address_index = CategorySetting("address_index", False, [False, True])
     auto_shutdown = NumberSetting(int, "auto_shutdown", 10, [0, 60])
     hide_mnemonic = CategorySetting("hide_mnemonic", False, [False, True])
     boot_flash_hash = CategorySetting("boot_flash_hash", False, [False, True])
+    cache_descriptor = CategorySetting("cache_descriptor", False, [False, True])
 
     def label(self, attr):
         """Returns a label for UI when given a setting name or namespace"""
         return {
+            "address_index": t("Address Index"),
             "auto_shutdown": t("Shutdown Time"),
             "hide_mnemonic": t("Hide Mnemonics"),
             "boot_flash_hash": t("TC Flash Hash at Boot"),
+            "cache_descriptor": t("Cache Descriptor"),
         }[attr]
 
 
@@ -353,17 +353,20 @@ class DatumToolMenu(Page):
     def read_file(self):
         """Handler for the 'Read File' menu item"""
         from .utils import Utils
+        from ..sd_card import SDSession
 
-        if not self.has_sd_card():
-            self.ctx.display.clear()
-            self.flash_error(t("SD card not detected."))
-            return MENU_CONTINUE
+        # Card check and load share a single mount
+        with SDSession():
+            if not self.has_sd_card():
+                self.ctx.display.clear()
+                self.flash_error(t("SD card not detected."))
+                return MENU_CONTINUE
 
-        utils = Utils(self.ctx)
-        try:
-            filename, contents = utils.load_file(prompt=False)
-        except OSError:
-            pass
+            utils = Utils(self.ctx)
+            try:
+                filename, contents = utils.load_file(prompt=False)
+            except OSError:
+                pass
 
         if not contents:
             return MENU_CONTINUE
@@ -401,7 +404,7 @@ class DatumTool(Page):
 
     def view_qr(self):
         """Reusable handler for viewing a QR code"""
-        from ..qr import QR_CAPACITY_BYTE, QR_CAPACITY_ALPHANUMERIC, QR_CAPACITY_NUMERIC
+        from ..qr import qr_capacity
         from ..bbqr import encode_bbqr
         import urtypes
         from ur.ur import UR
@@ -410,12 +413,12 @@ class DatumTool(Page):
         def is_alnum(c):
             return ("A" <= c <= "Z") or ("0" <= c <= "9") or c in (" $%*+-./:")
 
-        seedqrview_thresh = QR_CAPACITY_BYTE[STATIC_QR_MAX_SIZE]
+        seedqrview_thresh = qr_capacity(STATIC_QR_MAX_SIZE + 1, "byte")
         if not isinstance(self.contents, bytes):
             if all(c.isdigit() for c in self.contents):
-                seedqrview_thresh = QR_CAPACITY_NUMERIC[STATIC_QR_MAX_SIZE]
+                seedqrview_thresh = qr_capacity(STATIC_QR_MAX_SIZE + 1, "numeric")
             elif all(is_alnum(c) for c in self.contents):
-                seedqrview_thresh = QR_CAPACITY_ALPHANUMERIC[STATIC_QR_MAX_SIZE]
+                seedqrview_thresh = qr_capacity(STATIC_QR_MAX_SIZE + 1, "alphanumeric")
 
         if len(self.contents) <= seedqrview_thresh:
             from .encryption_ui import prompt_for_text_update
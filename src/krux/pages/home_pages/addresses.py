@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 
 import gc
+import _thread
 from ...display import BOTTOM_PROMPT_LINE
 from ...krux_settings import t
 from ...settings import THIN_SPACE
@@ -31,11 +32,79 @@ from .. import (
     MENU_CONTINUE,
     MENU_EXIT,
     ESC_KEY,
+    LOAD_FROM_CAMERA,
+    LOAD_FROM_SD,
 )
 from ...format import format_address
 
 SCAN_ADDRESS_LIMIT = 50
 EXPORT_ADDRESS_LIMIT = SCAN_ADDRESS_LIMIT * 100
+ADDRESS_LIST_GAP_LIMIT = SCAN_ADDRESS_LIMIT * 2
+# Previous, current and next pages of the address list
+ADDRESS_PAGES_CACHED = 3
+
+
+class AddressPages:
+    """Pages of derived addresses of one branch, keeping the most recently used
+    pages and deriving the neighbours of the current one in the background"""
+
+    def __init__(self, wallet, branch_index, page_size, cached=ADDRESS_PAGES_CACHED):
+        self.wallet = wallet
+        self.branch_index = branch_index
+        self.page_size = page_size
+        self.cached = cached
+        # {page start index: [addresses]}, least recently used first in self.recent
+        self.pages = {}
+        self.recent = []
+        self.lock = _thread.allocate_lock()
+
+    def __contains__(self, start):
+        return start in self.pages
+
+    def get(self, start):
+        """Returns the addresses of the page starting at start, waiting for or
+        deriving it if not cached"""
+        with self.lock:
+            if start not in self.pages:
+                self._derive(start)
+            self._touch(start)
+            return self.pages[start]
+
+    def prefetch(self, *starts):
+        """Starts deriving the pages starting at starts in the background"""
+        starts = [start for start in starts if start >= 0 and start not in self.pages]
+        if starts:
+            # Taken here so get() and wait() can't run ahead of the new thread
+            self.lock.acquire()
+            _thread.start_new_thread(self._prefetch, (starts,))
+
+    def wait(self):
+        """Waits for a background derivation to finish"""
+        with self.lock:
+            pass
+
+    def _prefetch(self, starts):
+        try:
+            for start in starts:
+                if start not in self.pages:
+                    self._derive(start)
+                    self._touch(start)
+        finally:
+            self.lock.release()
+
+    def _derive(self, start):
+        self.pages[start] = list(
+            self.wallet.obtain_addresses(
+                start, limit=self.page_size, branch_index=self.branch_index
+            )
+        )
+
+    def _touch(self, start):
+        if start in self.recent:
+            self.recent.remove(start)
+        self.recent.append(start)
+        while len(self.recent) > self.cached:
+            del self.pages[self.recent.pop(0)]
 
 
 class Addresses(Page):
@@ -69,6 +138,7 @@ class Addresses(Page):
                         else lambda: self._receive_change_menu(self.export_address)
                     ),
                 ),
+                (t("Check Address List"), self.check_address_list),
             ],
         )
         submenu.run_loop()
@@ -88,6 +158,7 @@ class Addresses(Page):
             else t("Loading receive addresses…")
         )
         max_addresses = self.ctx.display.max_menu_lines() - 3
+        pages = AddressPages(self.ctx.wallet, addr_type, max_addresses)
         address_index = 0
         while True:
             items = []
@@ -99,12 +170,10 @@ class Addresses(Page):
                     )
                 )
 
-            self.ctx.display.clear()
-            self.ctx.display.draw_centered_text(loading_txt)
-            addresses = self.ctx.wallet.obtain_addresses(
-                address_index, limit=max_addresses, branch_index=addr_type
-            )
-            for addr in addresses:
+            if address_index not in pages:
+                self.ctx.display.clear()
+                self.ctx.display.draw_centered_text(loading_txt)
+            for addr in pages.get(address_index):
                 pos_str = str(address_index) + "." + THIN_SPACE
                 qr_title = pos_str + format_address(addr)
                 items.append(
@@ -125,6 +194,7 @@ class Addresses(Page):
             )
 
             submenu = Menu(self.ctx, items)
+            pages.prefetch(address_index, address_index - 2 * max_addresses)
             stay_on_this_addr_menu = True
             while stay_on_this_addr_menu:
                 next_index = len(submenu.menu) - 2
@@ -136,6 +206,8 @@ class Addresses(Page):
 
                 if index == submenu.back_index:  # Back
                     del submenu, items
+                    pages.wait()
+                    self._save_address_index(addr_type)
                     gc.collect()
                     return MENU_CONTINUE
                 if index == next_index:  # Next
@@ -165,6 +237,12 @@ class Addresses(Page):
                 y_offset, x_offset, line, i, highlight_state, addr_prefix
             )
 
+    def _save_address_index(self, addr_type):
+        """Stores the addresses derived so far if address indexing is enabled"""
+        address_index = self.ctx.wallet.address_index(addr_type)
+        if address_index is not None:
+            address_index.save()
+
     def show_address(self, addr, title="", quick_exit=False):
         """Show addr provided as a QRCode"""
         from ..qr_view import SeedQRView
@@ -254,6 +332,7 @@ class Addresses(Page):
                             )
                             wdt.feed()
 
+                self._save_address_index(addr_type)
                 self.flash_text(
                     t("Saved to SD card:") + "\n\n%s" % filename,
                     highlight_prefix=":",
@@ -261,6 +340,147 @@ class Addresses(Page):
         except OSError:
             self.flash_text(t("SD card not detected."))
 
+    def check_address_list(self):
+        """Handler for the 'Check Address List' menu item"""
+        from ...wallet import parse_address_list
+
+        load_method = self.load_method()
+        data = None
+        if load_method == LOAD_FROM_CAMERA:
+            from ..qr_capture import QRCodeCapture
+
+            qr_capture = QRCodeCapture(self.ctx)
+            data, _ = qr_capture.qr_capture_loop()
+        elif load_method == LOAD_FROM_SD:
+            from ..utils import Utils
+
+            try:
+                _, data = Utils(self.ctx).load_file(prompt=False)
+            except OSError:
+                pass
+        else:  # Cancel
+            return MENU_CONTINUE
+
+        addresses = []
+        if data is not None:
+            try:
+                if isinstance(data, bytes):
+                    data = data.decode()
+                addresses = parse_address_list(data)
+            except:
+                pass
+        if not addresses:
+            self.flash_error(t("Failed to load"))
+            return MENU_CONTINUE
+
+        from ..utils import Utils
+
+        gap_limit = ""
+        while gap_limit == "":
+            gap_limit = Utils(self.ctx).capture_index_from_keypad(
+                t("Gap Limit"),
+                initial_val=ADDRESS_LIST_GAP_LIMIT,
+                range_min=1,
+                range_max=EXPORT_ADDRESS_LIMIT,
+            )
+        if gap_limit is None:
+            return MENU_CONTINUE
+
+        matches = self._match_address_list(addresses, gap_limit)
+
+        self.ctx.display.clear()
+        self.ctx.display.draw_centered_text(
+            t("%d of %d addresses belong to this wallet")
+            % (len(matches), len(addresses))
+        )
+        self.ctx.input.wait_for_button()
+
+        items = []
+        for branch_index, branch_txt in ((0, t("Receive")), (1, t("Change"))):
+            branch_matches = sorted(
+                (index, addr)
+                for branch, index, addr in matches
+                if branch == branch_index
+            )
+            if branch_matches:
+                items.append((branch_txt + ":", None))
+            for index, addr in branch_matches:
+                pos_str = str(index) + "." + THIN_SPACE
+                qr_title = pos_str + format_address(addr)
+                items.append(
+                    (
+                        self.fit_to_line(addr, pos_str, fixed_chars=3),
+                        lambda address=addr, title=qr_title: self.show_address(
+                            address, title
+                        ),
+                    )
+                )
+        found = set(addr for _, _, addr in matches)
+        not_found = [addr for addr in addresses if addr not in found]
+        if not_found:
+            items.append((t("Not found:"), None))
+        for addr in not_found:
+            items.append(
+                (
+                    self.fit_to_line(addr),
+                    lambda address=addr: self.show_address(
+                        address, format_address(address)
+                    ),
+                )
+            )
+
+        submenu = Menu(self.ctx, items)
+        submenu.run_loop()
+        return MENU_CONTINUE
+
+    def _match_address_list(self, addresses, gap_limit):
+        """Derives each branch once, until all addresses are found or gap_limit
+        addresses in a row don't match, returning (branch, index, address) matches
+        """
+        from embit.networks import NETWORKS
+        from embit.script import address_to_scriptpubkey
+        from ...wdt import wdt
+
+        network = NETWORKS[self.ctx.wallet.which_network()]
+        targets = {}
+        for addr in addresses:
+            targets[address_to_scriptpubkey(addr).data] = addr
+
+        branches = ((0, t("Receive")),)
+        if self.ctx.wallet.has_change_addr():
+            branches += ((1, t("Change")),)
+
+        matches = []
+        for branch_index, branch_txt in branches:
+            last_match = -1
+            index = 0
+            for script_pubkey in self.ctx.wallet.obtain_script_pubkeys(
+                branch_index=branch_index
+            ):
+                if index % SCAN_ADDRESS_LIMIT == 0:
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        t("Verifying…") + "\n\n%s %d" % (branch_txt, index)
+                    )
+                    wdt.feed()
+
+                addr = targets.get(script_pubkey.data)
+                # Same script on another network is not a match
+                if addr is not None and script_pubkey.address(network=network) == addr:
+                    matches.append((branch_index, index, addr))
+                    del targets[script_pubkey.data]
+                    last_match = index
+
+                if not targets or index - last_match >= gap_limit:
+                    break
+                index += 1
+
+            self._save_address_index(branch_index)
+            gc.collect()
+            if not targets:
+                break
+        return matches
+
     def _scan_highlight_addr(self, result_message):
         """Case highlight address for scan"""
         from ..utils import Utils
@@ -329,23 +549,41 @@ class Addresses(Page):
             is_valid_txt = "%s\n\n" + t("is a valid address!")
             not_found_txt = "%s\n\n" + t("was NOT FOUND in the first %d addresses")
 
+            from embit.script import address_to_scriptpubkey
+
+            target = address_to_scriptpubkey(addr)
+            address_index = self.ctx.wallet.address_index(addr_type)
+
             found = False
             num_checked = 0
+            if address_index is not None:
+                # Records are truncated hashes, confirm candidates by deriving them.
+                # A miss is not trusted: stored records are unauthenticated, so
+                # the indexed range is derived again below
+                for i in address_index.find(target):
+                    if addr in self.ctx.wallet.obtain_addresses(i, 1, addr_type):
+                        found = True
+                        num_checked = i + 1
+                        break
+
             while not found:
                 self.ctx.display.clear()
                 self.ctx.display.draw_centered_text(
                     checking_match_txt
                     % (num_checked, num_checked + SCAN_ADDRESS_LIMIT - 1)
                 )
-                for some_addr in self.ctx.wallet.obtain_addresses(
+                for script_pubkey in self.ctx.wallet.obtain_script_pubkeys(
                     num_checked, limit=SCAN_ADDRESS_LIMIT, branch_index=addr_type
                 ):
                     num_checked += 1
 
-                    found = addr == some_addr
+                    found = script_pubkey == target and addr in (
+                        self.ctx.wallet.obtain_addresses(num_checked - 1, 1, addr_type)
+                    )
                     if found:
                         break
 
+                self._save_address_index(addr_type)
                 gc.collect()
 
                 if not found:
@@ -258,7 +258,9 @@ class Home(Page):
 
         if index == 1:  # Sign to QR code
             signer.sign()
-            signed_psbt, qr_format = signer.psbt_qr()
+            signed_psbt, qr_format, num_parts = signer.psbt_qr(
+                self.ctx.display.qr_data_width()
+            )
 
             # memory management
             del signer
@@ -268,6 +270,15 @@ class Home(Page):
 
             utils = Utils(self.ctx)
 
+            if num_parts and num_parts > 1:
+                # Every part must be scanned, so a whole loop is the least it takes
+                from ...input import QR_ANIM_PERIOD
+
+                self.flash_text(
+                    t("%d QR codes, %ds per loop")
+                    % (num_parts, (num_parts * QR_ANIM_PERIOD + 999) // 1000)
+                )
+
             while True:
                 self.display_qr_codes(signed_psbt, qr_format)
                 utils.print_standard_qr(
@@ -278,7 +289,8 @@ class Home(Page):
                     return MENU_CONTINUE
 
         # index == 2: Sign to SD card
-        signer.sign(trim=False)
+        if not signer.streamed:
+            signer.sign(trim=False)
         psbt_filename = self._format_psbt_file_extension(psbt_filename)
         gc.collect()
 
@@ -288,8 +300,10 @@ class Home(Page):
             try:
                 with SDHandler() as sd:
                     if signer.is_b64_file:
-                        signed_psbt, _ = signer.psbt_qr()
+                        signed_psbt, _, _ = signer.psbt_qr()
                         sd.write(psbt_filename, signed_psbt)
+                    elif signer.streamed:
+                        self._sign_streamed_to_sd(sd, signer, psbt_filename)
                     else:
                         with open(SDHandler.PATH_STR % psbt_filename, "wb") as f:
                             # Write PSBT data directly to the file
@@ -304,6 +318,26 @@ class Home(Page):
 
         return MENU_CONTINUE
 
+    def _sign_streamed_to_sd(self, sd, signer, psbt_filename):
+        """Signs one input at a time into a temporary file, which replaces
+        psbt_filename once signed. The PSBT is read from its source file while
+        signing, which may be psbt_filename itself, and nothing is left on the
+        SD card if signing fails
+        """
+        from ...sd_card import SDHandler, TEMP_FILE_SUFFIX
+
+        temp_filename = psbt_filename + TEMP_FILE_SUFFIX
+        try:
+            with open(SDHandler.PATH_STR % temp_filename, "wb") as f:
+                signer.sign_to(f, trim=False)
+        except:
+            try:
+                sd.delete(temp_filename)
+            except OSError:
+                pass
+            raise
+        sd.replace(temp_filename, psbt_filename)
+
     def _format_psbt_file_extension(self, psbt_filename=""):
         """Formats the PSBT filename"""
         from ...sd_card import (
@@ -421,7 +455,7 @@ class Home(Page):
         self.ctx.input.wait_for_button()
 
         # display Inputs, Self-transfer and Change (have addresses)
-        for message in outputs[1:]:
+        for message in outputs.pages(1):
             self.ctx.display.clear()
             self.ctx.display.draw_centered_text(message, highlight_prefix=":")
 
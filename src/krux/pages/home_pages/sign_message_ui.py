@@ -41,11 +41,11 @@ from ...sd_card import (
     SIGNATURE_FILE_EXTENSION,
     SIGNED_FILE_SUFFIX,
     PUBKEY_FILE_EXTENSION,
+    SDSession,
 )
 from ...settings import TEST_TXT, MAIN_TXT
 from ...kboard import kboard
 
-
 SD_MESSAGE_HEADER = "-----BEGIN BITCOIN SIGNED MESSAGE-----"
 SD_SIGNATURE_HEADER = "-----BEGIN BITCOIN SIGNATURE-----"
 SD_SIGNATURE_FOOTER = "-----END BITCOIN SIGNATURE-----"
@@ -292,8 +292,11 @@ class SignMessage(Utils):
         if index == 0:  # QR
             at_address = address != ""
             self._export_to_qr(sig, pubkey, qr_format, at_address)
-        elif self.has_sd_card():  # SD
-            self._export_to_sd(sig, pubkey, message_filename, message, address)
+        else:  # SD
+            # Card check and save share a single mount
+            with SDSession():
+                if self.has_sd_card():
+                    self._export_to_sd(sig, pubkey, message_filename, message, address)
         return MENU_CONTINUE
 
     def _export_to_qr(self, sig, pubkey, qr_format, at_address=False):
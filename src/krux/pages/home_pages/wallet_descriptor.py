@@ -39,6 +39,7 @@ from ...qr import FORMAT_NONE, FORMAT_PMOFN
 from ...sd_card import (
     DESCRIPTOR_FILE_EXTENSION,
     JSON_FILE_EXTENSION,
+    SDSession,
 )
 from ...themes import theme
 from ...key import FINGERPRINT_SYMBOL, DERIVATION_PATH_SYMBOL, P2TR
@@ -103,25 +104,33 @@ class WalletDescriptor(Page):
             utils.print_standard_qr(wallet_data, qr_format, title)
 
             # Try to save the Wallet output descriptor on the SD card
-            if self.has_sd_card() and not self.ctx.wallet.persisted:
-                from ..file_operations import SaveFile
-
-                save_page = SaveFile(self.ctx)
-                if is_encrypted:
-                    file_content = wallet_data
-                else:
-                    file_content = self.ctx.wallet.descriptor.to_string()
-                self.ctx.wallet.persisted = save_page.save_file(
-                    file_content,
-                    self.ctx.wallet.label,
-                    self.ctx.wallet.label,
-                    title + ":",
-                    DESCRIPTOR_FILE_EXTENSION,
-                    save_as_binary=is_encrypted,
-                )
+            if not self.ctx.wallet.persisted:
+                self._save_wallet_to_sd(wallet_data, title, is_encrypted)
 
         return MENU_CONTINUE
 
+    def _save_wallet_to_sd(self, wallet_data, title, is_encrypted):
+        """Offers to save the wallet output descriptor, if there is an SD card"""
+        from ..file_operations import SaveFile
+
+        # Card check and save share a single mount
+        with SDSession():
+            if not self.has_sd_card():
+                return
+            save_page = SaveFile(self.ctx)
+            if is_encrypted:
+                file_content = wallet_data
+            else:
+                file_content = self.ctx.wallet.descriptor.to_string()
+            self.ctx.wallet.persisted = save_page.save_file(
+                file_content,
+                self.ctx.wallet.label,
+                self.ctx.wallet.label,
+                title + ":",
+                DESCRIPTOR_FILE_EXTENSION,
+                save_as_binary=is_encrypted,
+            )
+
     def _load_wallet(self):
         """Load a wallet output descriptor from the camera or SD card"""
 
@@ -208,6 +217,7 @@ class WalletDescriptor(Page):
             self.display_loading_wallet(wallet)
             if self.prompt(t("Load?"), BOTTOM_PROMPT_LINE):
                 self.ctx.wallet = wallet
+                wallet.save_cache()
                 self.flash_text(t("Wallet output descriptor loaded!"))
 
         return MENU_CONTINUE
@@ -415,6 +415,7 @@ class Login(Page):
         self.ctx.display.draw_centered_text(t("Loading…"))
 
         self.ctx.wallet = Wallet(key)
+        self.ctx.wallet.load_cache()
         return MENU_EXIT
 
     def _confirm_key_from_digits(self, mnemonic, charset):
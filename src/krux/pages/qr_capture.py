@@ -25,15 +25,18 @@ from . import Page
 from ..display import FONT_HEIGHT, MINIMAL_PADDING, BOTTOM_LINE
 from ..input import PRESSED
 from ..themes import theme
-from ..qr import QRPartParser, FORMAT_UR
+from ..qr import QRPartParser, QRCodeTracker, FORMAT_UR, detect_format
 from ..wdt import wdt
-from ..krux_settings import t
+from ..krux_settings import t, Settings
 from ..camera import QR_SCAN_MODE, ANTI_GLARE_MODE, ZOOMED_MODE
 from ..kboard import kboard
+from .. import profiler
 
 ANTI_GLARE_WAIT_TIME = 500
 MESSAGE_DISPLAY_PERIOD = 5000
 PROGRESS_BAR_HEIGHT = 15
+MISSING_PARTS_LISTED = 3
+RECENT_PAYLOADS = 4
 
 
 class QRCodeCapture(Page):
@@ -122,6 +125,22 @@ class QRCodeCapture(Page):
                 theme.fg_color,
             )
 
+        # When few parts are left, list them below the bar if there is room
+        missing_y = self.progress_bar_offset_y + PROGRESS_BAR_HEIGHT
+        if (
+            parser.total_count() > 1
+            and 0 < parser.missing_count() <= MISSING_PARTS_LISTED
+            and missing_y + FONT_HEIGHT <= self.ctx.display.height()
+        ):
+            self.ctx.display.fill_rectangle(
+                0, missing_y, self.ctx.display.width(), FONT_HEIGHT, theme.bg_color
+            )
+            self.ctx.display.draw_hcentered_text(
+                ", ".join(str(part) for part in parser.missing_parts()),
+                missing_y,
+                max_lines=1,
+            )
+
         self.ctx.display.to_landscape()
 
     def qr_capture_loop(self):
@@ -132,10 +151,17 @@ class QRCodeCapture(Page):
         self.ctx.camera.initialize_run()
 
         parser = QRPartParser()
+        tracker = QRCodeTracker()
         prev_parsed_count = 0
-        new_part = None
+        new_parts = []
         previous_part = None
         ur_highlighted = False
+        # Payloads parsed last, an animation holds each frame for several snapshots
+        recent_payloads = [None] * RECENT_PAYLOADS
+        recent_index = 0
+        scan_profiler = None
+        if profiler.SCAN_PROFILING or Settings().hardware.scan_profiling:
+            scan_profiler = profiler.ScanProfiler()
 
         # Flush events ocurred while loading camera
         self.ctx.input.reset_ios_state()
@@ -150,6 +176,8 @@ class QRCodeCapture(Page):
         self.ctx.display.to_landscape()
         while True:
             wdt.feed()
+            if scan_profiler:
+                scan_profiler.frame()
 
             if self.ctx.light:
                 self.light_control()
@@ -160,35 +188,60 @@ class QRCodeCapture(Page):
             if self.ctx.input.page_event():
                 if self.ctx.camera.has_antiglare():
                     self.anti_glare_control()
+                    # Snapshot size may change with the mode (zoomed is 240x240)
+                    tracker.roi = None
                 else:
                     break
 
             # Exit the capture loop with PAGE_PREV or TOUCH
             if self.ctx.input.page_prev_event() or self.ctx.input.touch_event():
                 break
+            if scan_profiler:
+                scan_profiler.mark("input")
 
-            if new_part is not None and new_part != previous_part:
+            if new_parts:
                 if parser.format == FORMAT_UR:
                     self.update_progress_ur(parser, theme.highlight_color)
                     ur_highlighted = True
                     previous_part = None
                 else:
-                    self.update_progress_other(parser, new_part, previous_part)
-                    previous_part = new_part
-                new_part = None
+                    for new_part in new_parts:
+                        if new_part != previous_part:
+                            self.update_progress_other(parser, new_part, previous_part)
+                            previous_part = new_part
+                new_parts = []
             elif ur_highlighted:
                 self.update_progress_ur(parser, theme.fg_color)
                 ur_highlighted = False
+            if scan_profiler:
+                scan_profiler.mark("progress")
 
             img = self.ctx.camera.snapshot()
+            if scan_profiler:
+                scan_profiler.mark("snapshot")
             if time.ticks_ms() < start_time + MESSAGE_DISPLAY_PERIOD:
                 self.ctx.display.render_image(img, title_lines=title_lines)
             else:
                 self.ctx.display.render_image(img)
-
-            res = img.find_qrcodes()
-            if res:
-                data = res[0].payload()
+            if scan_profiler:
+                self.ctx.display.draw_string(0, 0, scan_profiler.overlay())
+                scan_profiler.mark("render")
+
+            codes = tracker.find_qrcodes(img)
+            if scan_profiler:
+                scan_profiler.mark("find")
+
+            # Every code in the frame is parsed, as a sheet of parts may be in view
+            for code in codes or ():
+                data = code.payload()
+                # Skip frames seen again while the animation holds them
+                if data in recent_payloads:
+                    continue
+                recent_payloads[recent_index] = data
+                recent_index = (recent_index + 1) % RECENT_PAYLOADS
+                # Skip a foreign QR in view, parts of the scanned code may raise
+                if is_foreign_code(parser, data):
+                    continue
                 new_part = parser.parse(data)
 
                 if (
@@ -197,10 +250,20 @@ class QRCodeCapture(Page):
                 ):
                     prev_parsed_count = parser.processed_parts_count()
                     new_part = True
+                if new_part is not None:
+                    new_parts.append(new_part)
+                if parser.is_complete():
+                    break
+            if scan_profiler:
+                scan_profiler.mark("parse")
 
             if parser.is_complete():
+                if scan_profiler:
+                    scan_profiler.complete()
                 break
 
+        if scan_profiler:
+            scan_profiler.report()
         self.ctx.camera.stop_sensor()
         if self.ctx.light:
             self.ctx.light.turn_off()
@@ -211,6 +274,18 @@ class QRCodeCapture(Page):
         return None, None
 
 
+def is_foreign_code(parser, data):
+    """Returns whether data is not a part of the code the parser is scanning"""
+    if parser.format is None:
+        return False
+    qr_format, bbqr = detect_format(data)
+    if qr_format != parser.format:
+        return True
+    return bbqr is not None and (
+        bbqr.encoding != parser.bbqr.encoding or bbqr.file_type != parser.bbqr.file_type
+    )
+
+
 def qr_str_to_bytes(qr_result):
     """
     both simulator and MaixPy will return qrcode result as str,
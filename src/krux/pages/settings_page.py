@@ -217,6 +217,10 @@ class SettingsPage(Page):
     def _settings_exit_check(self):
         """Handler for the 'Back' on settings screen"""
 
+        # Nothing to store, spares remounting the SD card
+        if not store.dirty:
+            return MENU_EXIT
+
         # If user selected to persist on SD, we will try to remout and save
         # flash is always mounted, so settings is always persisted
         if Settings().persist.location == SD_PATH:
@@ -477,6 +481,11 @@ class SettingsPage(Page):
                 self.ctx.display.draw_centered_text(t("Processing…"))
 
                 self.ctx.camera = Camera()
+            if setting.attr == "cache_descriptor" and starting_category:
+                # Don't keep the descriptor stored once caching is disabled
+                from ..wallet import delete_descriptor_cache
+
+                delete_descriptor_cache()
 
         return MENU_CONTINUE
 
@@ -58,9 +58,12 @@ class Utils(Page):
 
     def load_file(self, file_ext="", prompt=True, only_get_filename=False):
         """Load a file from SD card"""
-        from ..sd_card import SDHandler
+        from ..sd_card import SDHandler, SDSession
 
-        if self.has_sd_card():
+        # Card check and load share a single mount
+        with SDSession():
+            if not self.has_sd_card():
+                return "", None
             with SDHandler() as sd:
                 self.ctx.display.clear()
                 if not prompt or self.prompt(
@@ -0,0 +1,129 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2025 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import time
+
+# Opt-in timing of the QR scan stages, shown over the camera image and, at the
+# end of a scan, printed and saved to SD as CSV. Enabled by the Scan Profiling
+# hardware setting, or forced on by the simulator's --profile-scan
+SCAN_PROFILING = False
+
+SCAN_STAGES = ("input", "progress", "snapshot", "render", "find", "parse")
+# Upper bounds (ms) of the histogram buckets, slower samples go to a last bucket
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200)
+PROFILE_FILENAME = "scan_profile.csv"
+
+
+class ScanProfiler:
+    """Times each stage of the QR capture loop's frames, keeping per-stage
+    histograms, frames per second and the frames taken to complete a scan
+    """
+
+    def __init__(self):
+        self.histograms = {
+            stage: [0] * (len(HISTOGRAM_BUCKETS_MS) + 1) for stage in SCAN_STAGES
+        }
+        self.totals = {stage: 0 for stage in SCAN_STAGES}
+        self.maximums = {stage: 0 for stage in SCAN_STAGES}
+        self.frames = 0
+        self.frames_to_complete = None
+        self.start_us = time.ticks_us()
+        self.mark_us = self.start_us
+        # Frames per second, measured over the last second
+        self.fps = 0
+        self.window_us = self.start_us
+        self.window_frames = 0
+
+    def frame(self):
+        """Starts timing a new frame"""
+        now = time.ticks_us()
+        self.mark_us = now
+        self.frames += 1
+        self.window_frames += 1
+        if now - self.window_us >= 1000000:
+            self.fps = self.window_frames * 1000000 // (now - self.window_us)
+            self.window_us = now
+            self.window_frames = 0
+
+    def mark(self, stage):
+        """Adds the time since the frame started or the last mark to stage"""
+        now = time.ticks_us()
+        elapsed = now - self.mark_us
+        self.mark_us = now
+        self.totals[stage] += elapsed
+        self.maximums[stage] = max(self.maximums[stage], elapsed)
+        bucket = 0
+        while (
+            bucket < len(HISTOGRAM_BUCKETS_MS)
+            and elapsed >= HISTOGRAM_BUCKETS_MS[bucket] * 1000
+        ):
+            bucket += 1
+        self.histograms[stage][bucket] += 1
+
+    def complete(self):
+        """Records the frames taken until the scan was complete"""
+        self.frames_to_complete = self.frames
+
+    def overlay(self):
+        """Returns a short status line to draw over the camera image"""
+        return "%d fps %d frames" % (self.fps, self.frames)
+
+    def to_csv(self):
+        """Returns the stages' timings and the scan's counters as CSV"""
+        lines = [
+            "stage,count,avg_us,max_us,"
+            + ",".join("<%dms" % bound for bound in HISTOGRAM_BUCKETS_MS)
+            + ",>=%dms" % HISTOGRAM_BUCKETS_MS[-1]
+        ]
+        for stage in SCAN_STAGES:
+            count = sum(self.histograms[stage])
+            lines.append(
+                "%s,%d,%d,%d,%s"
+                % (
+                    stage,
+                    count,
+                    self.totals[stage] // count if count else 0,
+                    self.maximums[stage],
+                    ",".join(str(n) for n in self.histograms[stage]),
+                )
+            )
+        elapsed_us = time.ticks_us() - self.start_us
+        lines.append("frames,%d" % self.frames)
+        lines.append(
+            "fps,%.1f" % (self.frames * 1000000 / elapsed_us if elapsed_us else 0)
+        )
+        lines.append(
+            "frames_to_complete,%s"
+            % ("" if self.frames_to_complete is None else self.frames_to_complete)
+        )
+        return "\n".join(lines) + "\n"
+
+    def report(self):
+        """Prints the CSV and saves it to SD, when one is available"""
+        csv = self.to_csv()
+        print(csv)
+        try:
+            from .sd_card import SDHandler
+
+            with SDHandler() as sd:
+                sd.write(PROFILE_FILENAME, csv)
+        except:
+            pass
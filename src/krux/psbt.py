@@ -20,7 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import gc
-from embit.psbt import PSBT, CompressMode
+import os
+from embit.psbt import PSBT, InputScope, CompressMode
 from ur.ur import UR
 import urtypes
 from urtypes.crypto import CRYPTO_PSBT
@@ -41,6 +42,12 @@ BTC_SYMBOL = "₿"
 
 MAX_POLICY_COSIGNERS_DISPLAYED = 5
 
+# SD PSBTs larger than this are signed streaming one input at a time
+LARGE_PSBT_FILE_SIZE = 64 * 1024
+
+# Derived branch keys kept per cosigner xpub while matching pubkeys
+COSIGNER_BRANCH_CACHE_SIZE = 4
+
 
 class Counter(dict):
     """Helper class for dict"""
@@ -50,6 +57,51 @@ class Counter(dict):
         return self.get(key, 0)
 
 
+class OutputMessages:
+    """Review messages of a PSBT's outputs, a summary followed by one message
+    per output. Output messages are only rendered when requested
+    """
+
+    def __init__(self, signer, vout, summary, sequences):
+        self.signer = signer
+        self.vout = vout
+        self.summary = summary
+        # [(title, [output indexes])]
+        self.sequences = sequences
+
+    def __len__(self):
+        return 1 + sum(len(indexes) for _, indexes in self.sequences)
+
+    def __getitem__(self, page):
+        if page < 0:
+            page += len(self)
+        if page == 0:
+            return self.summary
+        page -= 1
+        for title, indexes in self.sequences:
+            if 0 <= page < len(indexes):
+                return self.signer.output_message(
+                    title, page + 1, self.vout[indexes[page]]
+                )
+            page -= len(indexes)
+        raise IndexError("message index out of range")
+
+    def __iter__(self):
+        return self.pages()
+
+    def pages(self, start=0):
+        """Yields the messages from start on"""
+        if start == 0:
+            yield self.summary
+            start = 1
+        page = 1
+        for title, indexes in self.sequences:
+            for number, index in enumerate(indexes, 1):
+                if page >= start:
+                    yield self.signer.output_message(title, number, self.vout[index])
+                page += 1
+
+
 class PSBTSigner:
     """Responsible for validating and signing PSBTs"""
 
@@ -59,7 +111,9 @@ class PSBTSigner:
         self.ur_type = None
         self.qr_format = qr_format
         self.policy = None
+        self.cosigners = None
         self.is_b64_file = False
+        self.streamed = False
 
         # Parse the PSBT
         if psbt_filename:
@@ -68,19 +122,32 @@ class PSBTSigner:
 
             file_path = "/%s/%s" % (SD_PATH, psbt_filename)
             try:
-                with open(file_path, "rb") as file:
-                    self.psbt = PSBT.read_from(file)
+                if os.stat(file_path)[6] > LARGE_PSBT_FILE_SIZE:
+                    from .psbt_stream import StreamedPSBT
+
+                    self.psbt = StreamedPSBT(file_path)
+                    self.streamed = True
+            except:
+                # Not a binary PSBTv0, will be loaded whole
+                pass
+            try:
+                if not self.streamed:
+                    with open(file_path, "rb") as file:
+                        self.psbt = PSBT.read_from(file)
                 self.validate()
             except:
                 try:
                     self.policy = None  # Reset policy
+                    self.cosigners = None
+                    self.streamed = False
                     self.is_b64_file = self.file_is_base64_encoded(file_path)
                     if self.is_b64_file:
                         # BlueWallet exports PSBTs as base64 encoded files
-                        # So it will be decoded and loaded uncompressed
-                        with open(file_path, "r") as file:
-                            psbt_data = file.read()
-                        self.psbt = PSBT.parse(base_decode(psbt_data, 64))
+                        # So it will be decoded while read and loaded uncompressed
+                        from .baseconv import Base64Reader
+
+                        with open(file_path, "rb") as file:
+                            self.psbt = PSBT.read_from(Base64Reader(file))
                     else:
                         # Try to load the PSBT in compressed mode
                         with open(file_path, "rb") as file:
@@ -149,19 +216,11 @@ class PSBTSigner:
     def validate(self):
         """Validates the PSBT"""
         # From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L110
-        xpubs = []
-        origin_less_xpub = None
-        try:
-            xpubs, origin_less_xpub = self.xpubs()
-        except:
-            # Expected to fail to get xpubs from Miniscript PSBT
-            pass
+        cosigners = self.cosigner_index()
         for inp in self.psbt.inputs:
             # get policy of the input
             try:
-                inp_policy = self.get_policy_from_psbt_input(
-                    inp, xpubs, origin_less_xpub
-                )
+                inp_policy = self.get_policy_from_psbt_input(inp, cosigners)
             except:
                 raise ValueError("Unable to get policy")
             # if policy is None - assign current
@@ -188,7 +247,7 @@ class PSBTSigner:
             if self.wallet.policy != self.policy:
                 raise ValueError("policy mismatch")
 
-    def get_policy_from_psbt_input(self, tx_input, xpubs, origin_less_xpub=None):
+    def get_policy_from_psbt_input(self, tx_input, cosigners):
         """Extracts the scriptPubKey from an input's UTXO and determines the policy."""
         if tx_input.witness_utxo:
             scriptpubkey = tx_input.witness_utxo.script_pubkey
@@ -198,7 +257,7 @@ class PSBTSigner:
         else:
             raise ValueError("No UTXO information available in the input.")
 
-        return get_policy(tx_input, scriptpubkey, xpubs, origin_less_xpub)
+        return get_policy(tx_input, scriptpubkey, cosigners)
 
     def path_mismatch(self):
         """Verifies if the PSBT key path matches loaded keys's derivation path"""
@@ -309,19 +368,19 @@ class PSBTSigner:
 
         return resume_fee_str, fee_percent
 
-    def _sequence_render(self, title, elements):
+    def output_message(self, title, number, vout):
+        """Renders the address and amount of a transaction output"""
         from .format import format_address
 
-        message_seq = []
-        for i, out in enumerate(elements):
-            message_seq.append(
-                (("%d. " + title + " \n\n%s\n\n") % (i + 1, format_address(out[0])))
-                + self._btc_render(out[1], prefix="")
-            )
-        return message_seq
+        address = vout.script_pubkey.address(network=self.wallet.key.network)
+        return (
+            ("%d. " + title + " \n\n%s\n\n") % (number, format_address(address))
+        ) + self._btc_render(vout.value, prefix="")
 
     def outputs(self):
-        """Returns a list of messages describing where amounts are going"""
+        """Returns the messages describing where amounts are going, rendered
+        on demand as they are displayed
+        """
 
         inp_amount = 0
         for inp in self.psbt.inputs:
@@ -336,9 +395,9 @@ class PSBTSigner:
             + "\n\n"
         )
 
+        spend_list = []
         self_transfer_list = []
         change_list = []
-        spend_list = []
 
         self_amount = 0
         change_amount = 0
@@ -348,50 +407,25 @@ class PSBTSigner:
 
         output_policy_count = Counter()
 
-        xpubs = []
-        origin_less_xpub = None
-        try:
-            xpubs, origin_less_xpub = self.xpubs()
-        except:
-            # Expected to fail to get xpubs from Miniscript PSBT
-            pass
+        # Single pass classifying outputs, addresses are only encoded when
+        # their page is rendered
+        cosigners = self.cosigner_index()
+        # PSBT.tx is rebuilt from all scopes on each access
+        vout = self.psbt.tx.vout
         for i, out in enumerate(self.psbt.outputs):
-            out_policy = get_policy(
-                out, self.psbt.tx.vout[i].script_pubkey, xpubs, origin_less_xpub
-            )
+            out_policy = get_policy(out, vout[i].script_pubkey, cosigners)
             output_policy_count[out_policy["type"]] += 1
             output_type = self._classify_output(out_policy, out)
 
             if output_type == CHANGE:
-                change_list.append(
-                    (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
-                    )
-                )
-                change_amount += self.psbt.tx.vout[i].value
+                change_list.append(i)
+                change_amount += vout[i].value
             elif output_type == SELF_TRANSFER:
-                self_transfer_list.append(
-                    (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
-                    )
-                )
-                self_amount += self.psbt.tx.vout[i].value
+                self_transfer_list.append(i)
+                self_amount += vout[i].value
             else:  # Address is from other wallet
-                spend_list.append(
-                    (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
-                    )
-                )
-                spend_amount += self.psbt.tx.vout[i].value
+                spend_list.append(i)
+                spend_amount += vout[i].value
 
         if len(spend_list) > 0:
             resume_spend_str = (
@@ -414,24 +448,22 @@ class PSBTSigner:
             inp_amount, self_amount + change_amount + spend_amount, output_policy_count
         )
 
-        messages = []
-        # first screen - resume
-        messages.append(
+        # first screen - resume, followed by sequences of spend,
+        # self_transfer and change
+        messages = OutputMessages(
+            self,
+            vout,
             resume_inputs_str
             + resume_spend_str
             + resume_self_or_change_str
-            + resume_fee_str
+            + resume_fee_str,
+            [
+                (t("Spend:"), spend_list),
+                (t("Self-transfer:"), self_transfer_list),
+                (t("Change:"), change_list),
+            ],
         )
 
-        # sequence of spend
-        messages.extend(self._sequence_render(t("Spend:"), spend_list))
-
-        # sequence of self_transfer
-        messages.extend(self._sequence_render(t("Self-transfer:"), self_transfer_list))
-
-        # sequence of change
-        messages.extend(self._sequence_render(t("Change:"), change_list))
-
         return messages, fee_percent
 
     def add_signatures(self):
@@ -475,6 +507,16 @@ class PSBTSigner:
 
     def sign(self, trim=True):
         """Signs the PSBT and preserves necessary fields for the final transaction"""
+        if self.streamed:
+            # Signed into memory, to be exported as QR codes
+            from io import BytesIO
+
+            signed = BytesIO()
+            self.sign_to(signed, trim)
+            self.psbt = PSBT.parse(signed.getvalue())
+            self.streamed = False
+            return
+
         self.add_signatures()
 
         if not trim:
@@ -482,52 +524,57 @@ class PSBTSigner:
 
         trimmed_psbt = PSBT(self.psbt.tx)
         for i, inp in enumerate(self.psbt.inputs):
-            # Copy the final_scriptwitness if present
-            if inp.final_scriptwitness:
-                trimmed_psbt.inputs[i].final_scriptwitness = inp.final_scriptwitness
-
-            # Copy any partial signatures
-            if inp.partial_sigs:
-                trimmed_psbt.inputs[i].partial_sigs = inp.partial_sigs
-
-            # Preserve witness UTXO if present
-            if inp.witness_utxo:
-                trimmed_psbt.inputs[i].witness_utxo = inp.witness_utxo
-
-            # Preserve non-witness UTXO if present (for legacy inputs)
-            if inp.non_witness_utxo:
-                trimmed_psbt.inputs[i].non_witness_utxo = inp.non_witness_utxo
-
-            # Preserve redeem_script for P2SH or nested SegWit
-            if inp.redeem_script:
-                trimmed_psbt.inputs[i].redeem_script = inp.redeem_script
+            trimmed_psbt.inputs[i] = trimmed_input(inp)
 
-            # Preserve witness_script for P2WSH multisig
-            if inp.witness_script:
-                trimmed_psbt.inputs[i].witness_script = inp.witness_script
-
-            # Preserve taproot_key_sig for Taproot inputs
-            if inp.taproot_key_sig:
-                trimmed_psbt.inputs[i].taproot_key_sig = inp.taproot_key_sig
+        self.psbt = trimmed_psbt
 
-            # Preserve taproot script path sigs
-            if inp.taproot_sigs:
-                trimmed_psbt.inputs[i].taproot_sigs = inp.taproot_sigs
+    def sign_to(self, stream, trim=True):
+        """Signs a streamed PSBT one input at a time, writing each signed
+        input to stream instead of holding the whole PSBT in memory
+        """
+        self.psbt.write_global(stream, trim)
+        sigs_added = 0
+        for i, inp in enumerate(self.psbt.inputs):
+            # Scopes are re-read from the file, so fingerprints are filled again
+            self._fill_zero_fingerprint_scope(inp)
+            sigs_added += self.psbt.sign_input(i, inp, self.wallet.key.root)
+            if trim:
+                inp = trimmed_input(inp)
+            inp.write_to(stream, version=self.psbt.version)
+            del inp
+            gc.collect()
+        if sigs_added == 0:
+            raise ValueError("cannot sign")
 
-        self.psbt = trimmed_psbt
+        if trim:
+            for _ in range(len(self.psbt.outputs)):
+                stream.write(b"\x00")
+            return
+        for out in self.psbt.outputs:
+            self._fill_zero_fingerprint_scope(out)
+            out.write_to(stream, version=self.psbt.version)
 
-    def psbt_qr(self):
-        """Returns the psbt in the same form it was read as a QR code"""
+    def psbt_qr(self, max_width=None):
+        """Returns the psbt in the same form it was read as a QR code, its format
+        and number of QR codes, if known. Given the QR codes' max_width, BBQR is
+        encoded to be shown in the fewest parts
+        """
         psbt_data = self.psbt.serialize()
 
         self.psbt = None  # Remove PSBT free RAM
         gc.collect()
 
         if self.qr_format == FORMAT_BBQR:
-            from .bbqr import encode_bbqr
+            num_parts = None
+            if max_width:
+                from .bbqr import plan_bbqr
 
-            psbt_data = encode_bbqr(psbt_data, file_type="P")
-            return psbt_data, self.qr_format
+                psbt_data, num_parts = plan_bbqr(psbt_data, max_width, file_type="P")
+            else:
+                from .bbqr import encode_bbqr
+
+                psbt_data = encode_bbqr(psbt_data, file_type="P")
+            return psbt_data, self.qr_format, num_parts
 
         if self.base_encoding is not None:
             from .baseconv import base_encode
@@ -541,8 +588,9 @@ class PSBTSigner:
                     urtypes.crypto.PSBT(psbt_data).to_cbor(),
                 ),
                 self.qr_format,
+                None,
             )
-        return psbt_data, self.qr_format
+        return psbt_data, self.qr_format, None
 
     def xpubs(self):
         """Returns the xpubs in the PSBT mapped to their derivations, falling back to
@@ -576,6 +624,19 @@ class PSBTSigner:
 
         return xpubs, origin_less_xpub
 
+    def cosigner_index(self):
+        """Returns the index of cosigner xpubs, built once per PSBT"""
+        if self.cosigners is None:
+            xpubs = {}
+            origin_less_xpub = None
+            try:
+                xpubs, origin_less_xpub = self.xpubs()
+            except:
+                # Expected to fail to get xpubs from Miniscript PSBT
+                pass
+            self.cosigners = CosignerIndex(xpubs, origin_less_xpub)
+        return self.cosigners
+
     def psbt_policy_string(self):
         """Returns the policy string containing script type and cosigners' fingerprints"""
 
@@ -612,6 +673,47 @@ class PSBTSigner:
         return policy_str
 
 
+def trimmed_input(inp):
+    """Returns a copy of the input scope with only the fields needed
+    to finalize the transaction
+    """
+    trimmed = InputScope(vin=inp.vin)
+
+    # Copy the final_scriptwitness if present
+    if inp.final_scriptwitness:
+        trimmed.final_scriptwitness = inp.final_scriptwitness
+
+    # Copy any partial signatures
+    if inp.partial_sigs:
+        trimmed.partial_sigs = inp.partial_sigs
+
+    # Preserve witness UTXO if present
+    if inp.witness_utxo:
+        trimmed.witness_utxo = inp.witness_utxo
+
+    # Preserve non-witness UTXO if present (for legacy inputs)
+    if inp.non_witness_utxo:
+        trimmed.non_witness_utxo = inp.non_witness_utxo
+
+    # Preserve redeem_script for P2SH or nested SegWit
+    if inp.redeem_script:
+        trimmed.redeem_script = inp.redeem_script
+
+    # Preserve witness_script for P2WSH multisig
+    if inp.witness_script:
+        trimmed.witness_script = inp.witness_script
+
+    # Preserve taproot_key_sig for Taproot inputs
+    if inp.taproot_key_sig:
+        trimmed.taproot_key_sig = inp.taproot_key_sig
+
+    # Preserve taproot script path sigs
+    if inp.taproot_sigs:
+        trimmed.taproot_sigs = inp.taproot_sigs
+
+    return trimmed
+
+
 def is_multisig(policy):
     """Returns a boolean indicating if the policy is a multisig"""
     return (
@@ -635,52 +737,112 @@ def is_miniscript(policy):
     )
 
 
+class CosignerIndex:
+    """Cosigner xpubs indexed by fingerprint and origin derivation
+
+    Pubkeys are matched with a lookup instead of scanning all xpubs, derived
+    branch keys are reused across inputs and each xpub is encoded only once
+    """
+
+    def __init__(self, xpubs, origin_less_xpub=None):
+        self.origin_less_xpub = origin_less_xpub
+        self.by_origin = {}
+        self.origin_lengths = set()
+        for xpub, origin_der in xpubs.items():
+            key = (origin_der.fingerprint, tuple(origin_der.derivation))
+            # [xpub, base58 string, derived branches]
+            self.by_origin.setdefault(key, []).append([xpub, None, {}])
+            self.origin_lengths.add(len(origin_der.derivation))
+
+    def cosigner(self, pubkey, der, taproot=False):
+        """Returns the base58 xpub that derives pubkey at der, or None"""
+        path = der.derivation
+        if taproot:
+            # Origin derivation can be any prefix of the full path
+            origin_lengths = sorted(self.origin_lengths)
+        else:
+            # Last two indexes give pub from xpub
+            origin_lengths = (max(len(path) - 2, 0),)
+        for origin_length in origin_lengths:
+            if origin_length > len(path):
+                continue
+            key = (der.fingerprint, tuple(path[:origin_length]))
+            for entry in self.by_origin.get(key, ()):
+                derived_key = self._derive(entry, path[origin_length:])
+                if taproot:
+                    matched = derived_key.xonly() == pubkey.xonly()
+                else:
+                    # check that it derives to pubkey actually
+                    matched = derived_key == pubkey
+                if matched:
+                    if entry[1] is None:
+                        # append strings so they can be sorted and compared
+                        entry[1] = entry[0].to_base58()
+                    return entry[1]
+        return None
+
+    def _derive(self, entry, remainder):
+        """Derives the pubkey at remainder, reusing the derived branch"""
+        if not remainder:
+            return entry[0].key
+        branch = tuple(remainder[:-1])
+        branches = entry[2]
+        branch_key = branches.get(branch)
+        if branch_key is None:
+            branch_key = entry[0].derive(branch)
+            if len(branches) < COSIGNER_BRANCH_CACHE_SIZE:
+                branches[branch] = branch_key
+        return child_pubkey(branch_key, remainder[-1])
+
+
+def child_pubkey(xpub, index):
+    """Returns the pubkey of the non-hardened child of xpub at index
+
+    Same as xpub.child(index).key, without building and encoding a child HDKey
+    """
+    import hmac
+    from embit.bip32 import HARDENED_INDEX, HDError
+    from embit.ec import PublicKey
+    from embit.util import secp256k1
+
+    if not 0 <= index < HARDENED_INDEX:
+        raise HDError("Can't do hardened with public key")
+
+    data = xpub.key.sec() + index.to_bytes(4, "big")
+    tweak = hmac.new(xpub.chain_code, data, digestmod="sha512").digest()[:32]
+    point = secp256k1.ec_pubkey_parse(xpub.key.sec())
+    return PublicKey(secp256k1.ec_pubkey_add(point, tweak))
+
+
 # From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L41
-def get_cosigners(pubkeys, derivations, xpubs):
+def get_cosigners(pubkeys, derivations, cosigner_index):
     """Returns xpubs used to derive pubkeys using global xpub field from psbt"""
     cosigners = []
-    for _, pubkey in enumerate(pubkeys):
+    for pubkey in pubkeys:
         if pubkey not in derivations:
             raise ValueError("missing derivation")
-        der = derivations[pubkey]
-        for xpub in xpubs:
-            origin_der = xpubs[xpub]
-            # check fingerprint
-            if origin_der.fingerprint == der.fingerprint:
-                # check derivation - last two indexes give pub from xpub
-                if origin_der.derivation == der.derivation[:-2]:
-                    # check that it derives to pubkey actually
-                    if xpub.derive(der.derivation[-2:]).key == pubkey:
-                        # append strings so they can be sorted and compared
-                        cosigners.append(xpub.to_base58())
-                        break
+        xpub = cosigner_index.cosigner(pubkey, derivations[pubkey])
+        if xpub:
+            cosigners.append(xpub)
     if len(cosigners) != len(pubkeys):
         raise ValueError("cannot get all cosigners")
     return sorted(cosigners)
 
 
-def get_cosigners_miniscript(derivations, xpubs):
+def get_cosigners_miniscript(derivations, cosigner_index):
     """Compares the derivations with the xpubs to check and get the cosigners"""
     cosigners = []
     for pubkey, der in derivations.items():
-        for xpub in xpubs:
-            origin_der = xpubs[xpub]
-            # Check that the fingerprint matches
-            if origin_der.fingerprint == der.fingerprint:
-                # Check that the derivation path matches except for the last two indices
-                if origin_der.derivation == der.derivation[:-2]:
-                    # Verify that the xpub derives the pubkey
-                    if xpub.derive(der.derivation[-2:]).key == pubkey:
-                        # Append the xpub as a base58 string
-                        cosigners.append(xpub.to_base58())
-                        break
+        xpub = cosigner_index.cosigner(pubkey, der)
+        if xpub:
+            cosigners.append(xpub)
     # Ensure all pubkeys have a matching xpub
     if len(cosigners) != len(derivations):
         raise ValueError("cannot get all cosigners")
     return sorted(cosigners)
 
 
-def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpub=None):
+def get_cosigners_taproot_miniscript(taproot_derivations, cosigner_index):
     """
     Compares the taproot derivations with the xpubs to check get the cosigners
     """
@@ -688,28 +850,14 @@ def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpu
     cosigners = []
     for xonly_pubkey, der_info in taproot_derivations.items():
         _, der = der_info  # tap_leaf_hashes are not used
-        fp = der.fingerprint
-        full_path = der.derivation
-
-        for xpub in xpubs:
-            origin_der = xpubs[xpub]
-            # Check that the fingerprint matches
-            if origin_der.fingerprint == fp:
-                # Check that the origin derivation is a prefix of the full derivation path
-                if full_path[: len(origin_der.derivation)] == origin_der.derivation:
-                    # Derive the remainder of the path
-                    remainder = full_path[len(origin_der.derivation) :]
-                    # Verify that the xpub derives to the given xonly_pubkey
-                    derived_key = xpub.derive(remainder).key
-                    if derived_key.xonly() == xonly_pubkey.xonly():
-                        # Append the xpub as a base58 string
-                        cosigners.append(xpub.to_base58())
-                        break
-
-    if origin_less_xpub:
+        xpub = cosigner_index.cosigner(xonly_pubkey, der, taproot=True)
+        if xpub:
+            cosigners.append(xpub)
+
+    if cosigner_index.origin_less_xpub:
         # Pocicies which don't cover internal key spending (e.g. taptree only)
         # can have an origin-less xpub for internal key derivation
-        cosigners.append(origin_less_xpub.to_base58())
+        cosigners.append(cosigner_index.origin_less_xpub.to_base58())
 
     # Ensure all pubkeys have a matching xpub
     if len(cosigners) != len(taproot_derivations):
@@ -720,7 +868,7 @@ def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpu
 
 # Modified from: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L64
 # and https://github.com/SeedSigner/seedsigner/blob/dev/src/seedsigner/models/psbt_parser.py
-def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
+def get_policy(scope, scriptpubkey, cosigner_index):
     """Parse scope and get policy"""
     from embit.finalizer import parse_multisig
 
@@ -751,7 +899,7 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
             policy.update({"m": m, "n": len(pubkeys)})
 
             # check pubkeys are derived from cosigners
-            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, xpubs)
+            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, cosigner_index)
             policy.update({"cosigners": cosigners})
         except:
             pass
@@ -766,7 +914,7 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
             policy.update({"m": m, "n": len(pubkeys)})
 
             # check pubkeys are derived from cosigners
-            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, xpubs)
+            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, cosigner_index)
             policy.update({"cosigners": cosigners})
         except:
             try:
@@ -774,7 +922,9 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
                 policy.update({"miniscript": P2WSH})
 
                 # Will succeed to verify cosigners only if the descriptor is loaded
-                cosigners = get_cosigners_miniscript(scope.bip32_derivations, xpubs)
+                cosigners = get_cosigners_miniscript(
+                    scope.bip32_derivations, cosigner_index
+                )
                 policy.update({"cosigners": cosigners})
             except:
                 pass
@@ -789,7 +939,7 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
 
             # Will succeed to verify cosigners only if the descriptor is loaded
             cosigners = get_cosigners_taproot_miniscript(
-                scope.taproot_bip32_derivations, xpubs, origin_less_xpub
+                scope.taproot_bip32_derivations, cosigner_index
             )
             # Only add cosigners if is miniscript (multiple cosigners),
             # otherwise it probably is single-sig taproot
@@ -0,0 +1,206 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2025 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from embit import compact
+from embit.psbt import (
+    PSBT,
+    PSBTError,
+    InputScope,
+    OutputScope,
+    CompressMode,
+    read_string,
+    ser_string,
+)
+from embit.transaction import Transaction
+
+COPY_CHUNK_SIZE = 1024
+
+
+def skip_scope(stream, position):
+    """Skips the key-value map starting at position without reading its
+    values, returning the position right after its separator
+    """
+    while True:
+        stream.seek(position)
+        key_len = compact.read_from(stream)
+        position += len(compact.to_bytes(key_len)) + key_len
+        if key_len == 0:
+            return position
+        stream.seek(position)
+        value_len = compact.read_from(stream)
+        position += len(compact.to_bytes(value_len)) + value_len
+
+
+def copy_range(src, dst, start, end):
+    """Copies the bytes of src between start and end to dst, in chunks"""
+    src.seek(start)
+    while start < end:
+        chunk = src.read(min(COPY_CHUNK_SIZE, end - start))
+        if not chunk:
+            raise PSBTError("Unexpected end of file")
+        dst.write(chunk)
+        start += len(chunk)
+
+
+class StreamedScopes:
+    """Sequence of a PSBT file's input or output scopes, each parsed from
+    the file only when accessed
+    """
+
+    def __init__(self, psbt, scope_cls, offsets, tx_items):
+        self.psbt = psbt
+        self.scope_cls = scope_cls
+        self.offsets = offsets
+        self.tx_items = tx_items
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _read(self, file, index, compress):
+        file.seek(self.offsets[index])
+        return self.scope_cls.read_from(file, self.tx_items[index], compress)
+
+    def __getitem__(self, index):
+        with open(self.psbt.file_path, "rb") as file:
+            return self._read(file, index, CompressMode.KEEP_ALL)
+
+    def __iter__(self):
+        return self.scopes()
+
+    def scopes(self, compress=CompressMode.KEEP_ALL):
+        """Yields each scope in turn, keeping the file open between them"""
+        with open(self.psbt.file_path, "rb") as file:
+            for index in range(len(self.offsets)):
+                yield self._read(file, index, compress)
+
+
+class StreamedPSBT:
+    """PSBT kept on a file, of which only the global map and the offsets of
+    the input and output scopes are held in memory. Scopes are parsed one at
+    a time, so its size is limited by the storage rather than by RAM
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.tx = None
+        self.version = None
+        self.global_end = 0
+        # Spent outputs' values and scripts, only needed to sign taproot inputs
+        self._spent_values = None
+        self._spent_scripts = None
+
+        input_offsets = []
+        output_offsets = []
+        unknown = {}
+        with open(file_path, "rb") as file:
+            if file.read(len(PSBT.MAGIC)) != PSBT.MAGIC:
+                raise PSBTError("Invalid PSBT magic")
+            while True:
+                key = read_string(file)
+                # separator
+                if len(key) == 0:
+                    break
+                value = read_string(file)
+                if key == b"\x00":
+                    if self.tx is not None:
+                        raise PSBTError("Duplicated transaction field")
+                    self.tx = Transaction.parse(value)
+                elif key == b"\xfb":
+                    self.version = int.from_bytes(value, "little")
+                else:
+                    if key in unknown:
+                        raise PSBTError("Duplicated key")
+                    unknown[key] = value
+            if self.tx is None or self.version == 2:
+                raise PSBTError("Only PSBTv0 can be streamed")
+            self.global_end = file.tell()
+
+            position = self.global_end
+            for _ in self.tx.vin:
+                input_offsets.append(position)
+                position = skip_scope(file, position)
+            for _ in self.tx.vout:
+                output_offsets.append(position)
+                position = skip_scope(file, position)
+
+        # Parses xpubs and other global fields
+        global_map = PSBT(None, unknown, version=self.version)
+        self.xpubs = global_map.xpubs
+        self.unknown = global_map.unknown
+
+        self.inputs = StreamedScopes(self, InputScope, input_offsets, self.tx.vin)
+        self.outputs = StreamedScopes(self, OutputScope, output_offsets, self.tx.vout)
+
+    def spent_outputs(self):
+        """Returns the values and scripts of all outputs spent by the
+        transaction, as taproot sighashes commit to them
+        """
+        if self._spent_values is None:
+            values = []
+            scripts = []
+            # Compressed, non_witness_utxo are verified and dropped as read
+            for inp in self.inputs.scopes(CompressMode.CLEAR_ALL):
+                values.append(inp.utxo.value)
+                scripts.append(inp.utxo.script_pubkey)
+            self._spent_values = values
+            self._spent_scripts = scripts
+        return self._spent_values, self._spent_scripts
+
+    def sign_input(self, index, inp, root):
+        """Signs a single input scope read from this PSBT, returning the
+        number of signatures added to it
+        """
+        return _InputSigner(self, index, inp).sign_with(root)
+
+    def write_global(self, stream, trim=False):
+        """Writes the global map, only with the unsigned transaction if trimmed"""
+        if not trim:
+            with open(self.file_path, "rb") as file:
+                copy_range(file, stream, 0, self.global_end)
+            return
+        stream.write(PSBT.MAGIC)
+        ser_string(stream, b"\x00")
+        ser_string(stream, self.tx.serialize())
+        stream.write(b"\x00")
+
+
+class _InputSigner(PSBT):
+    """Signs one input scope of a StreamedPSBT with embit's signing logic,
+    computing its sighashes over the streamed PSBT's transaction
+    """
+
+    def __init__(self, streamed, index, inp):
+        super().__init__(unknown={})
+        self.streamed = streamed
+        self.index = index
+        self.inputs = [inp]
+
+    def sighash_segwit(self, i, *args, **kwargs):
+        return self.streamed.tx.sighash_segwit(self.index, *args, **kwargs)
+
+    def sighash_legacy(self, i, *args, **kwargs):
+        return self.streamed.tx.sighash_legacy(self.index, *args, **kwargs)
+
+    def sighash_taproot(self, i, script_pubkeys=None, values=None, **kwargs):
+        values, script_pubkeys = self.streamed.spent_outputs()
+        return self.streamed.tx.sighash_taproot(
+            self.index, script_pubkeys=script_pubkeys, values=values, **kwargs
+        )
@@ -20,7 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=E1101
-import io
 import math
 import qrcode
 
@@ -41,88 +40,77 @@ UR_BYTEWORDS_CRC_LEN = 4  # 32 bits CRC used on Bytewords encoding
 
 UR_MIN_FRAGMENT_LENGTH = 10
 
-# https://www.qrcode.com/en/about/version.html
-# List of capacities, based on versions
-# Tables below are limited to version 20 and we use L (Low) ECC (Error Correction Code) Level
-
-# [0-9] = 10 chars
-# Version 1(index 0)=21x21px = 41 chars, version 2=25x25px = 77 chars ...
-QR_CAPACITY_NUMERIC = [
-    41,
-    77,
-    127,
-    187,
-    255,
-    322,
-    370,
-    461,
-    552,
-    652,
-    772,
-    883,
-    1022,
-    1101,
-    1250,
-    1408,
-    1548,
-    1725,
-    1903,
-    2061,
-]
+# Bytes of encoded frames kept in memory to replay an animated QR code
+QR_FRAMES_CACHE_BUDGET = 64 * 1024
 
+# Snapshots searched only around the last codes found before a full frame search
+ROI_FULL_FRAME_PERIOD = 10
 
-# [A-Z0-9 $%*+\-./:] = 45 chars (no lowercase!)
-# Version 1(index 0)=21x21px = 25 chars, version 2=25x25px = 47 chars ...
-QR_CAPACITY_ALPHANUMERIC = [
-    25,
-    47,
-    77,
-    114,
-    154,
-    195,
-    224,
-    279,
-    335,
-    395,
-    468,
-    535,
-    619,
-    667,
-    758,
-    854,
-    938,
-    1046,
-    1153,
-    1249,
-]
+ECC_LOW = 0
+ECC_MEDIUM = 1
+ECC_QUARTILE = 2
+ECC_HIGH = 3
 
+# Error correction level used by the qrcode encoder
+QR_ENCODER_ECC = ECC_LOW
 
-# ASCII, UTF-8 (any 8-bit / 1 byte sequence)
-# Requires more pixels to show information
-# Version 1(index 0)=21x21px = 17 bytes, version 2=25x25px = 32 bytes ...
-QR_CAPACITY_BYTE = [
-    17,
-    32,
-    53,
-    78,
-    106,
-    134,
-    154,
-    192,
-    230,
-    271,
-    321,
-    367,
-    425,
-    458,
-    520,
-    586,
-    644,
-    718,
-    792,
-    858,
+QR_MAX_VERSION = 40
+
+# https://www.qrcode.com/en/about/version.html
+# Data codewords (bytes) available on each version, from version 1 (index 0)
+# to version 40, for ECC levels (L, M, Q, H)
+QR_DATA_CODEWORDS = [
+    (19, 16, 13, 9),
+    (34, 28, 22, 16),
+    (55, 44, 34, 26),
+    (80, 64, 48, 36),
+    (108, 86, 62, 46),
+    (136, 108, 76, 60),
+    (156, 124, 88, 66),
+    (194, 154, 110, 86),
+    (232, 182, 132, 100),
+    (274, 216, 154, 122),
+    (324, 254, 180, 140),
+    (370, 290, 206, 158),
+    (428, 334, 244, 180),
+    (461, 365, 261, 197),
+    (523, 415, 295, 223),
+    (589, 453, 325, 253),
+    (647, 507, 367, 283),
+    (721, 563, 397, 313),
+    (795, 627, 445, 341),
+    (861, 669, 485, 385),
+    (932, 714, 512, 406),
+    (1006, 782, 568, 442),
+    (1094, 860, 614, 464),
+    (1174, 914, 664, 514),
+    (1276, 1000, 718, 538),
+    (1370, 1062, 754, 596),
+    (1468, 1128, 808, 628),
+    (1531, 1193, 871, 661),
+    (1631, 1267, 911, 701),
+    (1735, 1373, 985, 745),
+    (1843, 1455, 1033, 793),
+    (1955, 1541, 1115, 845),
+    (2071, 1631, 1171, 901),
+    (2191, 1725, 1231, 961),
+    (2306, 1812, 1286, 986),
+    (2434, 1914, 1354, 1054),
+    (2566, 1992, 1426, 1096),
+    (2702, 2102, 1502, 1142),
+    (2812, 2216, 1582, 1222),
+    (2956, 2334, 1666, 1276),
 ]
 
+# Character count indicator bits, for versions 1-9, 10-26 and 27-40
+QR_COUNT_BITS = {
+    "numeric": (10, 12, 14),
+    "alphanumeric": (9, 11, 13),
+    "byte": (8, 16, 16),
+}
+
+QR_MODE_INDICATOR_BITS = 4
+
 
 class QRPartParser:
     """Responsible for parsing either a singular or animated series of QR codes
@@ -135,6 +123,43 @@ class QRPartParser:
         self.format = None
         self.decoder = None
         self.bbqr = None
+        # Bitmap of received part positions and how many are still missing
+        self.received = None
+        self.missing = -1
+
+    def _track(self, position, total):
+        """Marks the part at position (0-based) as received"""
+        if total != self.total:
+            # First part, or a different total: track parts parsed so far again
+            self.total = total
+            self.received = bytearray((total + 7) // 8)
+            self.missing = total
+            offset = 0 if self.format == FORMAT_BBQR else 1
+            for index in self.parts:
+                self._mark(index - offset)
+        else:
+            self._mark(position)
+
+    def _mark(self, position):
+        if 0 <= position < self.total:
+            mask = 1 << (position & 7)
+            if not self.received[position >> 3] & mask:
+                self.received[position >> 3] |= mask
+                self.missing -= 1
+
+    def missing_count(self):
+        """Returns the number of parts not received yet, or -1 if unknown"""
+        return self.missing
+
+    def missing_parts(self):
+        """Returns the numbers (1-based) of the parts not received yet"""
+        if self.received is None:
+            return []
+        return [
+            position + 1
+            for position in range(self.total)
+            if not self.received[position >> 3] & (1 << (position & 7))
+        ]
 
     def parsed_count(self):
         """Returns the number of parsed parts so far"""
@@ -170,11 +195,11 @@ class QRPartParser:
 
         if self.format == FORMAT_NONE:
             self.parts[1] = data
-            self.total = 1
+            self._track(0, 1)
         elif self.format == FORMAT_PMOFN:
             part, index, total = parse_pmofn_qr_part(data)
             self.parts[index] = part
-            self.total = total
+            self._track(index - 1, total)
             return index - 1
         elif self.format == FORMAT_UR:
             if not self.decoder:
@@ -183,11 +208,17 @@ class QRPartParser:
                 self.decoder = URDecoder()
             self.decoder.receive_part(data)
         elif self.format == FORMAT_BBQR:
-            from .bbqr import parse_bbqr
+            from .bbqr import parse_bbqr, BBQrDecoder
 
             part, index, total = parse_bbqr(data)
-            self.parts[index] = part
-            self.total = total
+            if self.decoder is None:
+                self.decoder = BBQrDecoder(
+                    self.bbqr.encoding, self.bbqr.file_type, total
+                )
+            # Part's text is decoded right away, only its index is kept
+            self.decoder.add(index, part)
+            self.parts[index] = None
+            self._track(index, total)
             return index
         return None
 
@@ -195,16 +226,8 @@ class QRPartParser:
         """Returns a boolean indicating whether or not enough parts have been parsed"""
         if self.format == FORMAT_UR:
             return self.decoder.is_complete()
-        keys_check = (
-            sum(range(1, self.total + 1))
-            if self.format in (FORMAT_PMOFN, FORMAT_NONE)
-            else sum(range(self.total))
-        )
-        return (
-            self.total != -1
-            and self.parsed_count() == self.total_count()
-            and sum(self.parts.keys()) == keys_check
-        )
+        # Parts out of the total's range are not tracked, but would still be parsed
+        return self.missing == 0 and len(self.parts) == self.total
 
     def result(self):
         """Returns the combined part data"""
@@ -214,19 +237,60 @@ class QRPartParser:
             return UR(self.decoder.result.type, bytearray(self.decoder.result.cbor))
 
         if self.format == FORMAT_BBQR:
-            from .bbqr import decode_bbqr
+            return self.decoder.result()
 
-            return decode_bbqr(self.parts, self.bbqr.encoding, self.bbqr.file_type)
-
-        code_buffer = io.StringIO("")
-        for _, part in sorted(self.parts.items()):
+        if self.total == 1:
+            return self.parts[1]
+        # Parts are complete, indexed 1 to total, and joined with a single copy
+        parts = [self.parts[index] for index in range(1, self.total + 1)]
+        for part in parts:
             if isinstance(part, bytes):
-                # Encoded data won't write on StringIO
-                return part
-            code_buffer.write(part)
-        code = code_buffer.getvalue()
-        code_buffer.close()
-        return code
+                return b"".join(
+                    chunk if isinstance(chunk, bytes) else chunk.encode()
+                    for chunk in parts
+                )
+        return "".join(parts)
+
+
+class QRCodeTracker:
+    """Finds QR codes in camera snapshots, searching first a region of interest
+    around the last codes found, as an animated QR code barely moves between frames
+    """
+
+    def __init__(self):
+        self.roi = None
+        self.roi_snapshots = 0
+
+    def find_qrcodes(self, img):
+        """Returns the QR codes found in the image"""
+        if self.roi is not None and self.roi_snapshots < ROI_FULL_FRAME_PERIOD:
+            self.roi_snapshots += 1
+            codes = img.find_qrcodes(self.roi)
+        else:
+            self.roi_snapshots = 0
+            codes = img.find_qrcodes()
+        # After a miss, next snapshot is fully searched
+        self.roi = self.padded_rect(img, codes) if codes else None
+        return codes
+
+    def padded_rect(self, img, codes):
+        """Returns the codes' bounding rectangle, padded by half its size on each
+        side and limited to the image
+        """
+        left, top, right, bottom = img.width(), img.height(), 0, 0
+        for code in codes:
+            x, y, w, h = code.rect()
+            left = min(left, x)
+            top = min(top, y)
+            right = max(right, x + w)
+            bottom = max(bottom, y + h)
+        pad_x = (right - left) // 2
+        pad_y = (bottom - top) // 2
+        left = max(0, left - pad_x)
+        top = max(0, top - pad_y)
+        right = min(img.width(), right + pad_x)
+        bottom = min(img.height(), bottom + pad_y)
+        return (left, top, right - left, bottom - top)
 
 
 def to_qr_codes(data, max_width, qr_format):
@@ -275,80 +339,121 @@ def to_qr_codes(data, max_width, qr_format):
                     int2base36(num_parts),
                     int2base36(part_index),
                 )
-                part = None
+                end = (part_index + 1) * part_size
                 if part_index == num_parts - 1:
-                    part = header + data.payload[part_index * part_size :]
-                    part_index = 0
-                else:
-                    part = (
-                        header
-                        + data.payload[
-                            part_index * part_size : (part_index + 1) * part_size
-                        ]
-                    )
-                    part_index += 1
+                    end = data.payload_length()
+                # Part's text is encoded on demand from BBQr's binary data
+                part = header + data.payload_slice(part_index * part_size, end)
+                part_index = (part_index + 1) % num_parts
                 code = qrcode.encode(part)
                 yield (code, num_parts)
 
 
+def cached_qr_codes(data, max_width, qr_format, budget=QR_FRAMES_CACHE_BUDGET):
+    """Endlessly yields the same QR codes as to_qr_codes, keeping the frames of the
+    first cycle in memory when they fit in budget bytes, so later cycles are not
+    encoded again. Over budget, or for UR (fountain parts differ on each cycle),
+    frames are encoded every time they are shown
+    """
+    frames = None if qr_format == FORMAT_UR else []
+    frames_size = 0
+    while True:
+        for code, num_parts in to_qr_codes(data, max_width, qr_format):
+            if frames is not None:
+                frames_size += len(code)
+                if frames_size > budget:
+                    frames = None
+                else:
+                    frames.append(code)
+            yield (code, num_parts)
+            if frames is not None and len(frames) == num_parts:
+                while True:
+                    for code in frames:
+                        yield (code, num_parts)
+
+
 def get_size(qr_code):
     """Returns the size of the qr code as the number of chars until the first newline"""
     size = math.sqrt(len(qr_code) * 8)
     return int(size)
 
 
-def max_qr_bytes(max_width, encoding="byte"):
-    """Calculates the maximum length, in bytes, a QR code of a given size can store"""
+def qr_capacity(version, encoding="byte", ecc=QR_ENCODER_ECC):
+    """Calculates how many characters of the given encoding mode
+    ("numeric", "alphanumeric" or "byte") a QR code version can store
+    """
+    if version < 10:
+        count_bits = QR_COUNT_BITS[encoding][0]
+    elif version < 27:
+        count_bits = QR_COUNT_BITS[encoding][1]
+    else:
+        count_bits = QR_COUNT_BITS[encoding][2]
+    bits = QR_DATA_CODEWORDS[version - 1][ecc] * 8
+    bits -= QR_MODE_INDICATOR_BITS + count_bits
+    if encoding == "numeric":
+        # 10 bits per 3 digits, 4 or 7 bits for the remaining 1 or 2 digits
+        chars = bits // 10 * 3
+        if bits % 10 >= 7:
+            return chars + 2
+        if bits % 10 >= 4:
+            return chars + 1
+        return chars
+    if encoding == "alphanumeric":
+        # 11 bits per 2 chars, 6 bits for a remaining char
+        chars = bits // 11 * 2
+        if bits % 11 >= 6:
+            return chars + 1
+        return chars
+    return bits // 8
+
+
+def qr_version(max_width):
+    """Returns the largest QR code version that fits within max_width"""
     # Given qr_size = 17 + 4 * version + 2 * frame_size
     max_width -= 2  # Subtract frame width
-    qr_version = (max_width - 17) // 4
-    if encoding == "alphanumeric":
-        capacity_list = QR_CAPACITY_ALPHANUMERIC
-    else:
-        capacity_list = QR_CAPACITY_BYTE
+    return min(max(1, (max_width - 17) // 4), QR_MAX_VERSION)
 
-    try:
-        return capacity_list[qr_version - 1]
-    except:
-        # Limited to version 20
-        return capacity_list[-1]
+
+def max_qr_bytes(max_width, encoding="byte", ecc=QR_ENCODER_ECC):
+    """Calculates the maximum length, in bytes, a QR code of a given size can store"""
+    return qr_capacity(qr_version(max_width), encoding, ecc)
 
 
-def find_min_num_parts(data, max_width, qr_format):
+def find_min_num_parts(data, max_width, qr_format, ecc=QR_ENCODER_ECC):
     """Finds the minimum number of QR parts necessary to encode the data in
     the specified format within the max_width constraint
     """
     encoding = "alphanumeric" if qr_format == FORMAT_BBQR else "byte"
-    qr_capacity = max_qr_bytes(max_width, encoding)
+    capacity = max_qr_bytes(max_width, encoding, ecc)
     if qr_format == FORMAT_PMOFN:
         data_length = len(data)
-        part_size = qr_capacity - PMOFN_PREFIX_LENGTH_1D
+        part_size = capacity - PMOFN_PREFIX_LENGTH_1D
         # where prefix = "pXofY " where Y < 9
         num_parts = (data_length + part_size - 1) // part_size
         if num_parts > 9:  # Prefix has 2 digits numbers, so re-calculate
-            part_size = qr_capacity - PMOFN_PREFIX_LENGTH_2D
+            part_size = capacity - PMOFN_PREFIX_LENGTH_2D
             # where prefix = "pXXofYY " where max YY = 99
             num_parts = (data_length + part_size - 1) // part_size
         part_size = (data_length + num_parts - 1) // num_parts
     elif qr_format == FORMAT_UR:
-        qr_capacity -= (
+        capacity -= (
             # This is an approximation, UR index grows indefinitely
             UR_GENERIC_PREFIX_LENGTH  # index: ~ "ur:crypto-psbt/xxx-xx/"
         )
         # UR will add a bunch of info (some duplicated) on the body of each QR
         # Info's lenght is multiplied by 2 in Bytewords.encode step
-        qr_capacity -= (UR_CBOR_PREFIX_LEN + UR_BYTEWORDS_CRC_LEN) * 2
-        qr_capacity = max(UR_MIN_FRAGMENT_LENGTH, qr_capacity)
+        capacity -= (UR_CBOR_PREFIX_LEN + UR_BYTEWORDS_CRC_LEN) * 2
+        capacity = max(UR_MIN_FRAGMENT_LENGTH, capacity)
         data_length = len(data.cbor)
         data_length *= 2  # UR will Bytewords.encode, which multiply bytes length by 2
-        num_parts = (data_length + qr_capacity - 1) // qr_capacity
+        num_parts = (data_length + capacity - 1) // capacity
         # For UR, part size will be the input for "max_fragment_len"
         part_size = len(data.cbor) // num_parts
         part_size = max(part_size, UR_MIN_FRAGMENT_LENGTH)
         # UR won't use "num_parts", will use encoder.fountain_encoder.seq_len() instead
     elif qr_format == FORMAT_BBQR:
-        data_length = len(data.payload)
-        max_part_size = qr_capacity - BBQR_PREFIX_LENGTH
+        data_length = data.payload_length()
+        max_part_size = capacity - BBQR_PREFIX_LENGTH
         if data_length < max_part_size:
             return 1, data_length
         # Round max_part_size to the nearest lower multiple of 8
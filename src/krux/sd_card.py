@@ -24,6 +24,7 @@ from machine import SDCard
 from .settings import SD_PATH
 
 SIGNED_FILE_SUFFIX = "-signed"
+TEMP_FILE_SUFFIX = ".tmp"
 PSBT_FILE_EXTENSION = ".psbt"
 B64_FILE_EXTENSION = ".txt"
 DESCRIPTOR_FILE_EXTENSION = ".txt"
@@ -37,14 +38,46 @@ SVG_IMAGE_EXTENSION = ".svg"
 
 
 class SDHandler:
-    """A simple handler to work with files on SDCard"""
+    """A simple handler to work with files on SDCard
+
+    Handlers share a reference-counted mount session: while a handler is open,
+    nested handlers reuse its mount instead of remounting the SDCard. The card
+    is remounted when a new session starts or after a card-change or I/O error.
+    """
 
     PATH_STR = "/" + SD_PATH + "/%s"
 
+    # Number of open handlers sharing the current mount session
+    sessions = 0
+    mounted = False
+
     def __init__(self):
         pass
 
     def __enter__(self):
+        if SDHandler.sessions and SDHandler.mounted:
+            try:
+                # reuse the session's mount if the card is still present
+                os.listdir(SDHandler.PATH_STR % ".")
+            except OSError:
+                SDHandler.remount()
+        else:
+            SDHandler.remount()
+
+        SDHandler.sessions += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        SDHandler.sessions -= 1
+        if exc_type is not None and issubclass(exc_type, OSError):
+            # card may have been removed or changed, remount on next use
+            SDHandler.mounted = False
+
+    @staticmethod
+    def remount():
+        """Remounts the SDCard, raises an exception if not found"""
+        SDHandler.mounted = False
+
         # try to remount the SDCard, can take up to 500ms
         SDCard.remount()
 
@@ -52,10 +85,7 @@ class SDHandler:
         os.listdir(SDHandler.PATH_STR % ".")
 
         # if the code reaches here, no exception was raised
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        SDHandler.mounted = True
 
     def write_binary(self, filename, data):
         """Writes the data in binary format into the filename, truncating the file first"""
@@ -81,6 +111,12 @@ class SDHandler:
         """Deletes the filename"""
         os.remove(SDHandler.PATH_STR % filename)
 
+    def replace(self, filename, new_filename):
+        """Renames filename to new_filename, replacing it if it exists"""
+        if SDHandler.file_exists(SDHandler.PATH_STR % new_filename):
+            self.delete(new_filename)
+        os.rename(SDHandler.PATH_STR % filename, SDHandler.PATH_STR % new_filename)
+
     @staticmethod
     def dir_exists(filename):
         """Checks if the file exists and is a directory"""
@@ -96,3 +132,17 @@ class SDHandler:
             return (os.stat(filename)[0] & 0x4000) == 0
         except OSError:
             return False
+
+
+class SDSession(SDHandler):
+    """Holds a mount session across a flow that checks for the SDCard and then
+    opens handlers, so they share a single remount. Unlike SDHandler, no error
+    is raised if the card is missing: handlers opened within remount and fail
+    """
+
+    def __enter__(self):
+        try:
+            return super().__enter__()
+        except:
+            SDHandler.sessions += 1
+            return self
@@ -34,6 +34,7 @@ FLASH_PATH = "flash"
 # Specific storage filenames
 SETTINGS_FILENAME = "settings.json"
 MNEMONICS_FILE = "seeds.json"
+DESCRIPTOR_CACHE_FILE = "descriptor.json"
 
 # Network settings
 MAIN_TXT = "main"
@@ -42,6 +43,9 @@ TEST_TXT = "test"
 THIN_SPACE = " "  # "\u2009"
 ELLIPSIS = "…"  # "\u2026"
 
+# Sentinel for settings not stored, lookups fall back to their default value
+_MISSING = object()
+
 
 class SettingsNamespace:
     """Represents a settings namespace containing settings and child namespaces"""
@@ -160,6 +164,8 @@ class Store:
         self.settings = {}
         self.file_location = Store.get_vfs_location(SD_PATH)
         self.dirty = False
+        # Resolved lookups: {namespace: {setting_name: value or _MISSING}}
+        self._cache = {}
 
         # Check for the correct settings persist location
         # Try to load from SD
@@ -195,20 +201,30 @@ class Store:
         try:
             with open(self.file_location + SETTINGS_FILENAME, "r") as f:
                 self.settings = json.loads(f.read())
+                self._cache.clear()
         except:
             pass
 
     def get(self, namespace, setting_name, default_value):
         """Returns a setting value under the given namespace, or default value if not set"""
-        s = json.loads(
-            json.dumps(self.settings)
-        )  # deepcopy to avoid building out namespaces
-        for level in namespace.split("."):
-            s[level] = s.get(level, {})
-            s = s[level]
-        if setting_name not in s:
+        cached = self._cache.get(namespace)
+        if cached is None:
+            cached = self._cache[namespace] = {}
+        if setting_name not in cached:
+            cached[setting_name] = self._lookup(namespace, setting_name)
+        value = cached[setting_name]
+        if value is _MISSING:
             return default_value
-        return s[setting_name]
+        return value
+
+    def _lookup(self, namespace, setting_name):
+        """Walks the namespaces without building them out, returns _MISSING if not set"""
+        s = self.settings
+        for level in namespace.split("."):
+            s = s.get(level)
+            if not isinstance(s, dict):
+                return _MISSING
+        return s.get(setting_name, _MISSING)
 
     def set(self, namespace, setting_name, setting_value):
         """Stores a setting value under the given namespace if new/changed.
@@ -221,6 +237,7 @@ class Store:
         old_value = s.get(setting_name, None)
         if old_value != setting_value:
             s[setting_name] = setting_value
+            self._cache.clear()
             self.dirty = True
 
     def delete(self, namespace, setting_name):
@@ -235,6 +252,7 @@ class Store:
             s = s[level]
         if setting_name in s:
             del s[setting_name]
+            self._cache.clear()
             self.dirty = True
         for s, level in reversed(levels):
             if not s[level]:
@@ -34,6 +34,8 @@ available_languages = [
 ]
 ref_array = [
     232475068,
+    3577285423,
+    358485593,
     1185266064,
     1503087751,
     2405586747,
@@ -51,6 +53,7 @@ ref_array = [
     3439746594,
     4121028614,
     3270727197,
+    1058917316,
     900375497,
     2693258820,
     3857613120,
@@ -68,11 +71,13 @@ ref_array = [
     2519455027,
     2363604010,
     2038226551,
+    766295548,
     3138204438,
     1207696150,
     1583186953,
     3768416405,
     388908871,
+    1140135841,
     3442025874,
     3119547911,
     1187826970,
@@ -148,6 +153,7 @@ ref_array = [
     1077771640,
     1893243331,
     1871146425,
+    3540664097,
     3549015533,
     602716148,
     1198393582,
@@ -211,6 +217,7 @@ ref_array = [
     4063104189,
     2325721074,
     4092516657,
+    461273768,
     3089363813,
     1577637745,
     391304453,
@@ -282,6 +289,7 @@ ref_array = [
     4117455079,
     4038076821,
     923277590,
+    1927849906,
     4006316572,
     2736506158,
     2029624154,
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% des Betrags.",
-    "%d von %d Multisig",
-    "%d bis %d ",
-    "%s Bits (%s Bits/px)",
-    "%s wurde entfernt.",
-    "%s: geladen!",
-    "(Experimental)",
-    "(nur zur Betrachtung)",
-    "12 Wörter",
-    "24 Wörter",
-    "Über",
-    "Annahme akzeptieren?",
-    "Konto",
-    "Konto #0 würde angenommen",
-    "Kontoindex",
-    "Wallet-Passphrase hinzufügen oder ändern?",
-    "Zusätzliche Entropie von der Kamera erforderlich für %s",
-    "Adresse",
-    "Richte Kamera und Sicherungsplatte richtig aus.",
-    "Blendschutzmodus",
-    "Aussehen",
-    "Bist Du sicher?",
-    "BGR-Farben",
-    "BIP39-Mnemonik",
-    "Zurück",
-    "Zurück zum Menü",
-    "Mnemonik-Backup",
-    "Ungültige Signatur",
-    "Base64-Passwort",
-    "Baudrate",
-    "Binäres Gitter",
-    "Randpolsterung",
-    "Helligkeit",
-    "Tasten",
-    "Entprellung der Tasten",
-    "Aufnahme abgebrochen",
-    "Change Adresse",
-    "Thema ändern und neu starten?",
-    "Change:",
-    "Änderungen bleiben bis zum Herunterfahren bestehen.",
-    "Prüfe SD-Karte",
-    "Überprüfen, ob diese Adresse zu dieser Wallet gehört?",
-    "Überprüfte %d Adresse ohne Übereinstimmungen.",
-    "SD-Karte wird gesucht…",
-    "Bestätigen Sie den Tamper Check Code",
-    "Datum konvertieren",
-    "Änderungsadresse konnte nicht ermittelt werden.",
-    "QR Code erstellen",
-    "QR-Code aus Text erstellen?",
-    "Erstellt:",
-    "Aktueller Tamper Check Code",
-    "Benutzerdefinierter Link QR-Code",
-    "Custom Text",
-    "Anpassen",
-    "Wenn Sie Ihr Wallet anpassen, wird ein neuer Schlüssel generiert und der Deskriptor entladen.",
-    "Schnitttiefe",
-    "Cut-Methode",
-    "Datum-Werkzeug",
-    "Dezimal",
-    "Entschlüsseln?",
-    "Standard-Wallet",
-    "Diese Datei löschen?",
-    "Tiefe pro Durchgang",
-    "Derivation-Pfad",
-    "BIP85-Entropie ableiten?",
-    "Deskriptor-Adressen",
-    "Gerätetests",
-    "Bildschirm",
-    "Schalten Sie das Gerät nicht aus, es kann eine Weile dauern.",
-    "Konvertierung abgeschlossen",
-    "Fertig?",
-    "Doppelte Gedächtnisstütze",
-    "Driver",
-    "Leer",
-    "Aktivieren?",
-    "Verschlüsseln",
-    "Verschlüsselt",
-    "Verschlüsselter QR-Code",
-    "Speicherung der verschlüsselten Mnemonic mit ID:",
-    "Verschlüsselte Mnemonic wurde nicht gespeichert",
-    "Verschlüsselung",
-    "Verschlüsselungsmodus",
-    "Geben Sie %d BIP39 Wörter ein.",
-    "Geben Sie einen Tamper Check Code mit 6+ Zeichen ein",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Zahl von 1 bis 2048 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Hexadezimalzahl von 1 bis 800 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Oktalzahl von 1 bis 4000 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic ein.",
-    "Benutzerdaten löschen",
-    "Benutzerdaten werden gelöscht…",
-    "Fehler:",
-    "Esc",
-    "Dateien durchsuchen?",
-    "Adressen exportieren",
-    "%s wird auf SD-Karte exportiert…",
-    "Öffentlicher Schlüssel",
-    "Werkeinstellungen",
-    "Fehler beim Sammeln der Kameraentropie",
-    "Entschlüsselung fehlgeschlagen",
-    "Laden fehlgeschlagen.",
-    "Mnemonic konnte nicht gespeichert werden",
-    "Gebühr:",
-    "Vorschubgeschwindigkeit",
-    "Dateiname",
-    "Dateiname %s existiert auf SD-Karte.",
-    "Den Flash mit Entropie von der Kamera füllen?",
-    "Flash wird gefüllt",
-    "Fingerabdruck in PSBT deaktiviert",
-    "Flash-Karte",
-    "Flash-Tools",
-    "Flash gefüllt mit Kameraentropie",
-    "Flötendurchmesser",
-    "Frei:",
-    "Vom Speicher",
-    "Löschen Sie Ihre SD-Karte vollständig in einem anderen Gerät, um sicherzustellen, dass die Daten nicht wiederhergestellt werden können",
-    "Mnemonik erzeugen",
-    "Go",
-    "Gute Entropie",
-    "Hardware",
-    "Kopfart",
-    "Hex öffentlicher Schlüssel:",
-    "Hexadezimal",
-    "Mnemonics ausblenden",
-    "Hohe Gebühren!",
-    "ID",
-    "ID existiert bereits",
-    "Index",
-    "Input (%d):",
-    "Unzureichende Entropie!",
-    "Ungültiger Tamper Check Code",
-    "Ungültige Adresse",
-    "Ungültiger Derivation-Pfad",
-    "Ungültige mnemonische Lange",
-    "Ungültige Wallet:",
-    "Umkehren",
-    "Invertierte Farben",
-    "KEF-verschlüsselt",
-    "Schlüssel",
-    "Schlüssel wurde nicht zur Verfügung gestellt",
-    "Krux Drucker Test-QR",
-    "LCD-Typ",
-    "Sprache",
-    "Lassen Sie das Feld leer, wenn Sie möchten, dass Krux ein gültiges letztes Wort auswählt",
-    "Links",
-    "Länge:",
-    "Leitungsverzögerung",
-    "Linie:",
-    "Adressen auflisten",
-    "Mnemonic laden",
-    "Wallet laden",
-    "Einen vertrauenswürdigen Wallet-Deskriptor laden, um Adressen anzuzeigen?",
-    "Von SD-Karte laden",
-    "Von SD-Karte laden?",
-    "Von der Kamera laden",
-    "Laden?",
-    "Kamera wird geladen…",
-    "Änderungsadressen werden geladen…",
-    "Einlegen des Druckers…",
-    "Empfangsadressen werden geladen…",
-    "Lädt…",
-    "Spracheinstellung",
-    "Speicherort",
-    "Mittel",
-    "Nachricht",
-    "Nachricht:",
-    "Miniscript",
-    "X-Koordinaten spiegeln",
-    "Fehlende Signaturdatei",
-    "Mnemonic",
-    "Mnemotechnik und Passphrase werden beibehalten.",
-    "Geändert:",
-    "Native Segwit - 84 würde angenommen",
-    "Netzwerk",
-    "Neue Mnemonic",
-    "Neue Firmware erkannt.",
-    "Nein",
-    "Keine Passphrase",
-    "Nicht genug Würfe!",
-    "Zahlen",
-    "Oktal",
-    "Andere Formate",
-    "Überschreiben?",
-    "PAGE zum Umschalten der Bildschirmhelligkeit",
-    "PBKDF2 iter.",
-    "Male gestanzte Punkte schwarz an, damit sie erkannt werden können.",
-    "Papierbreite",
-    "Teil",
-    "Teil M von N",
-    "Teilegröße",
-    "Passphrase",
-    "Passwortlänge",
-    "Pfad stimmt nicht überein",
-    "Muster erkannt!",
-    "Alle gespeicherten verschlüsselten Mnemoniken und Einstellungen dauerhaft vom Flash-Speicher entfernen?",
-    "Speicher",
-    "Pixelabweichungsindex:",
-    "Klartext-QR",
-    "Bitte lade einen Wallet Ausgabedeskriptor",
-    "Tauchrate",
-    "Richtlinientyp",
-    "Schlechte Entropie!",
-    "Leistung",
-    "PAGE zum Abbrechen drücken.",
-    "PAGE für Moduswechsel",
-    "Drucke Test-QR",
-    "Tinyseed drucken?",
-    "Als QR-Code drucken",
-    "Als QR-Code drucken?",
-    "Drucken?",
-    "Drucker",
-    "Druckertreiber nicht gesetzt!",
-    "Druckbild…",
-    "Trotzdem fortfahren?",
-    "Weiter?",
-    "Wird bearbeitet…",
-    "Nachweislich nicht ausgebbar",
-    "QR-Code",
-    "QR-Etikett",
-    "Menge",
-    "RX Pin",
-    "Neustart",
-    "Empfangen",
-    "Region:",
-    "Löschen %s?",
-    "Mnemonic löschen",
-    "Firmware-Dateien von der SD-Karte entfernen?",
-    "Res. - Format",
-    "Werkseinstellungen wiederherstellen und neu starten?",
-    "Ergebnis",
-    "Zurück zum QR-Viewer",
-    "Erneut Überprüfen",
-    "Überprüfe gescannte Daten und bearbeite sie bei Bedarf",
-    "Rechts",
-    "Würfel mindestens %d Mal, um eine Mnemonic zu erzeugen.",
-    "Rollenverteilung:",
-    "Würfe:",
-    "Um 180 Grad drehen",
-    "SD-Karte",
-    "SD-Karte nicht erkannt.",
-    "SHA256 der Würfe:",
-    "SHA256 des Snapshots:",
-    "QR-Bild auf SD-Karte speichern",
-    "Auf SD-Karte speichern",
-    "Auf SD-Karte speichern?",
-    "Auf SD-Karte gespeichert:",
-    "Skala",
-    "Adresse scannen",
-    "Scan BIP39 Passphrase",
-    "Schlüssel QR-Code Scannen",
-    "Wörter 1-12 erneut scannen",
-    "Wörter 13-24 scannen",
-    "Bildschirmschonerzeit",
-    "Script-Art",
-    "Sicherheit",
-    "Selbstübertragung oder Change (%d):",
-    "Selbstübertragung:",
-    "Legen Sie zuerst einen Tamper Check Code fest",
-    "Einstellungen",
-    "Die Einstellungen werden intern auf Flash gespeichert.",
-    "Einstellungen auf SD-Karte gespeichert.",
-    "Shannons Entropie:",
-    "Datum anzeigen",
-    "Ausschalten",
-    "Abschaltzeit",
-    "Abfahren…",
-    "Signieren",
-    "Am QR-Code unterschreiben",
-    "Auf SD-Karte signieren",
-    "Signieren?",
-    "Signatur:",
-    "Signierte Nachricht",
-    "Signierte PSBT",
-    "Unterzeichnung…",
-    "Single-Sig",
-    "Größe:",
-    "Einige Schecks können nicht durchgeführt werden.",
-    "Einige Knoten sind nicht gehärtet:",
-    "Ausgabe (%d):",
-    "Ausgaben:",
-    "Standardmodus",
-    "Statisch",
-    "Statistiken für Nerds",
-    "Auf Flash speichern",
-    "Auf der SD-Karte speichern",
-    "Stärke",
-    "Stark",
-    "Wischen um den Modus zu ändern",
-    "TC Flash-Hash",
-    "TC Flash-Hash beim Start",
-    "TOUCH oder ENTER zum Erfassen",
-    "TOUCH oder ENTER zum Installieren.",
-    "TR interner Schlüssel",
-    "TX Pin",
-    "Tamper Check Code",
-    "Tamper Check Code erfolgreich gesetzt",
-    "Tamper Check Codes stimmen nicht überein",
-    "Test-Suite",
-    "Ergebnisse der Testsuite",
-    "Test:",
-    "Text",
-    "Thema",
-    "Thermisch",
-    "Um sicherzustellen, dass die Daten nicht wiederhergestellt werden können, verwenden Sie die Funktion 'Gerät löschen'",
-    "Helligkeit umschalten",
-    "Werkzeuge",
-    "Berühre Schwellenwert",
-    "Touchscreen",
-    "Weiter versuchen?",
-    "BIP39 Passphrase eingeben",
-    "Schlüssel eingeben",
-    "Widerrufen",
-    "Einheit",
-    "KEF-ID aktualisieren?",
-    "QR-Etikett aktualisieren?",
-    "Upgrade abgeschlossen.",
-    "Verwende eine schwarze Hintergrundfläche.",
-    "Verwende die Entropie der Kamera, um eine neue Mnemonic zu erstellen",
-    "Aktueller Wert",
-    "Standard verwenden?",
-    "Standard-PBKDF2-Iteration verwenden.?",
-    "Fingerabdruck als ID verwenden?",
-    "Belegt:",
-    "Benutzerdaten",
-    "Wert %S außerhalb  des Bereichs: [ %s, %s]",
-    "Überprüfung…",
-    "Version",
-    "Via Kamera",
-    "Via D20",
-    "Via D6",
-    "Via manueller Eingabe",
-    "Via Wörter",
-    "Sichtbares Etikett",
-    "Warte auf die Erfassung",
-    "Wallet",
-    "Wallet-Deskriptor",
-    "Wallet Ausgabedeskriptor",
-    "Wallet Ausgabedeskriptor geladen!",
-    "Wallet Ausgabedeskriptor nicht gefunden.",
-    "Warnung:",
-    "Schwach",
-    "Wort %d",
-    "Wortnummern",
-    "Wörter",
-    "Ja",
-    "Zoommodus",
-    "binär: {} Bytes",
-    "failed:",
-    "aus SECHSKANT",
-    "von base32",
-    "von base43",
-    "von base64",
-    "aus Sechskant",
-    "von utf8",
-    "ist eine gültige Adresse!",
-    "schaltkoffer",
-    "Erfolgsrate:",
-    "wischen",
-    "text: {} chars",
-    "zu SECHSKANT",
-    "zu base32",
-    "an base43",
-    "zu base64",
-    "zu Sechskant",
-    "zu utf8",
-    "unbekannt",
-    "wurde in den ersten %d Adressen nicht gefunden",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0e\x00,\x00X\x00j\x00t\x00\x88\x00\x9a\x00\xa6\x00\xb4\x00\xc9\x00\xd3\x00\xdd\x00\xe2\x00\xf6\x00"
+    b"\xfb\x00\x15\x01\x1f\x01J\x01\x83\x01\x8a\x01\x95\x01\xc4\x01\xd4\x01\xdc\x01\xeb\x01\xf5\x01\x03\x02\n\x02\x1b\x02*\x02"
+    b"=\x02L\x02T\x02c\x02q\x02{\x02\x81\x02\x97\x02\xb3\x02\xc7\x02\xd5\x02\xf3\x02\xfa\x02.\x03A\x03P\x03"
+    b"\x88\x03\xb8\x03\xd0\x03\xf5\x03\x07\x047\x04H\x04c\x04l\x04\x87\x04\xa7\x04\xb2\x04\xba\x04\x18\x05$\x05/\x05"
+    b"=\x05D\x05S\x05b\x05w\x05\x8a\x05\x99\x05\xb1\x05\xc4\x05\xd0\x05\xda\x05\x17\x062\x069\x06T\x06Z\x06"
+    b"^\x06i\x06w\x06\x85\x06\x9d\x06\xce\x06\xfe\x06\x0e\x07$\x07C\x07w\x07\xb8\x07\x03\x08I\x08r\x08\x88\x08"
+    b"\xa9\x08\xb0\x08\xb3\x08\xc7\x08\xdb\x08\xfd\x08\x15\t&\tL\tk\t\x80\t\xa8\t\xb0\t\xc7\t\xd0\t\xf4\t"
+    b'"\n5\nV\na\nl\n\x8d\n\x9f\n\xa4\n\xb0\n:\x0bF\x0bW\x0bY\x0bf\x0bn\x0bu\x0b'
+    b"\x92\x0b\x9d\x0b\xb1\x0b\xc0\x0b\xc2\x0b\xd6\x0b\xdb\x0b\xe6\x0b\xfd\x0b\x1a\x0c,\x0cG\x0cc\x0cu\x0c}\x0c\x8f\x0c"
+    b"\xa1\x0c\xab\x0c\xd9\x0c\xed\x0c\xf4\x0c\xfb\x0cV\r[\rb\rv\r|\r\x8e\r\x9c\r\xa8\r\xf2\r\x04\x0e"
+    b"\x17\x0e+\x0e1\x0eG\x0ek\x0e\x83\x0e\xa5\x0e\xad\x0e\xbe\x0e\xc9\x0e\xcf\x0e\xd8\x0e\xe2\x0e\xec\x0e\x02\x0f\x18\x0f"
+    b" \x0fO\x0fY\x0f}\x0f\x85\x0f\x92\x0f\xa8\x0f\xac\x0f\xbc\x0f\xcf\x0f\xde\x0f\xe4\x0f\xe9\x0f\xf7\x0f\x06\x102\x10"
+    b">\x10\x81\x10\x8d\x10\x91\x10\x9d\x10\xa9\x10\xb3\x10\xc1\x10\xdb\x10\xea\x10R\x11Z\x11p\x11{\x11\xa4\x11\xad\x11"
+    b"\xbb\x11\xce\x11\xd6\x11\xf2\x11\x08\x12\x16\x12'\x12:\x12N\x12V\x12]\x12z\x12\x86\x12\x9a\x12\xa1\x12\xb3\x12"
+    b"\xcf\x12\xd6\x12\xe0\x12\xe5\x12\xeb\x12\xf3\x12\xfc\x12\x03\x13\x0f\x13 \x13L\x13Y\x13\x8d\x13\x95\x13\xaa\x13\xbd\x13"
+    b"\xf5\x13\xfb\x133\x14D\x14K\x14]\x14e\x14|\x14\x8e\x14\xa3\x14\xc1\x14\xd7\x14\xee\x14\x07\x15\x0c\x15\x1b\x15"
+    b'0\x15J\x15X\x15s\x15\x88\x15\x9d\x15\xa7\x15\xb1\x15\xd5\x15\xe8\x15\x15\x16"\x16X\x16\x7f\x16\x91\x16\x9f\x16'
+    b"\xaa\x16\xb6\x16\xc1\x16\xca\x16\xe3\x16\xf9\x16\x03\x17\x0c\x17\x1f\x17-\x17>\x17H\x17P\x17\x82\x17\xa5\x17\xb2\x17"
+    b"\xbb\x17\xc8\x17\xd0\x17\xe6\x17\xf9\x17\x13\x18\x1a\x18\x1f\x18>\x18K\x18c\x18\x80\x18\xa2\x18\xb8\x18\xbe\x18\xcf\x18"
+    b"\xf4\x18\x1d\x19'\x19?\x19D\x19H\x19M\x19V\x19\xcd\x19\xe2\x19\xeb\x19\x01\x1a\x0c\x1a\x1d\x1a6\x1aI\x1a"
+    b"S\x1aZ\x1ao\x1a\x88\x1a\x9e\x1a\xc8\x1a\x0c\x1b\x1a\x1b-\x1bR\x1bq\x1bx\x1b\x85\x1b\xb0\x1b\xc0\x1b\xc7\x1b"
+    b"\xd1\x1b\xd8\x1b\xde\x1b\xf3\x1b\xfe\x1b\x10\x1c'\x1c-\x1c>\x1cV\x1cw\x1c\x9f\x1c\xa7\x1c\xae\x1c\xb5\x1c\xc0\x1c"
+    b"\xc7\x1c\xc9\x1c\xd2\x1c\xe2\x1c\xe9\x1c\xf6\x1c\x00\x1d\n\x1d\x14\x1d!\x1d)\x1dC\x1dO\x1d[\x1db\x1dp\x1d"
+    b"|\x1d\x85\x1d\x8e\x1d\x97\x1d\xa3\x1d\xaa\x1d\xb3\x1d\xe1\x1d"
+    b"% des Betrags."
+    b"%d QR-Codes, %ds pro Durchlauf"
+    b"%d von %d Adressen geh\xc3\xb6ren zu dieser Wallet"
+    b"%d von %d Multisig"
+    b"%d bis %d "
+    b"%s Bits (%s Bits/px)"
+    b"%s wurde entfernt."
+    b"%s: geladen!"
+    b"(Experimental)"
+    b"(nur zur Betrachtung)"
+    b"12 W\xc3\xb6rter"
+    b"24 W\xc3\xb6rter"
+    b"\xc3\x9cber"
+    b"Annahme akzeptieren?"
+    b"Konto"
+    b"Konto #0 w\xc3\xbcrde angenommen"
+    b"Kontoindex"
+    b"Wallet-Passphrase hinzuf\xc3\xbcgen oder \xc3\xa4ndern?"
+    b"Zus\xc3\xa4tzliche Entropie von der Kamera erforderlich f\xc3\xbcr %s"
+    b"Adresse"
+    b"Adressindex"
+    b"Richte Kamera und Sicherungsplatte richtig aus."
+    b"Blendschutzmodus"
+    b"Aussehen"
+    b"Bist Du sicher?"
+    b"BGR-Farben"
+    b"BIP39-Mnemonik"
+    b"Zur\xc3\xbcck"
+    b"Zur\xc3\xbcck zum Men\xc3\xbc"
+    b"Mnemonik-Backup"
+    b"Ung\xc3\xbcltige Signatur"
+    b"Base64-Passwort"
+    b"Baudrate"
+    b"Bin\xc3\xa4res Gitter"
+    b"Randpolsterung"
+    b"Helligkeit"
+    b"Tasten"
+    b"Entprellung der Tasten"
+    b"Deskriptor zwischenspeichern"
+    b"Aufnahme abgebrochen"
+    b"Change Adresse"
+    b"Thema \xc3\xa4ndern und neu starten?"
+    b"Change:"
+    b"\xc3\x84nderungen bleiben bis zum Herunterfahren bestehen."
+    b"Adressliste pr\xc3\xbcfen"
+    b"Pr\xc3\xbcfe SD-Karte"
+    b"\xc3\x9cberpr\xc3\xbcfen, ob diese Adresse zu dieser Wallet geh\xc3\xb6rt?"
+    b"\xc3\x9cberpr\xc3\xbcfte %d Adresse ohne \xc3\x9cbereinstimmungen."
+    b"SD-Karte wird gesucht\xe2\x80\xa6"
+    b"Best\xc3\xa4tigen Sie den Tamper Check Code"
+    b"Datum konvertieren"
+    b"\xc3\x84nderungsadresse konnte nicht ermittelt werden."
+    b"QR Code erstellen"
+    b"QR-Code aus Text erstellen?"
+    b"Erstellt:"
+    b"Aktueller Tamper Check Code"
+    b"Benutzerdefinierter Link QR-Code"
+    b"Custom Text"
+    b"Anpassen"
+    b"Wenn Sie Ihr Wallet anpassen, wird ein neuer Schl\xc3\xbcssel generiert und der Deskriptor entladen."
+    b"Schnitttiefe"
+    b"Cut-Methode"
+    b"Datum-Werkzeug"
+    b"Dezimal"
+    b"Entschl\xc3\xbcsseln?"
+    b"Standard-Wallet"
+    b"Diese Datei l\xc3\xb6schen?"
+    b"Tiefe pro Durchgang"
+    b"Derivation-Pfad"
+    b"BIP85-Entropie ableiten?"
+    b"Deskriptor-Adressen"
+    b"Ger\xc3\xa4tetests"
+    b"Bildschirm"
+    b"Schalten Sie das Ger\xc3\xa4t nicht aus, es kann eine Weile dauern."
+    b"Konvertierung abgeschlossen"
+    b"Fertig?"
+    b"Doppelte Ged\xc3\xa4chtnisst\xc3\xbctze"
+    b"Driver"
+    b"Leer"
+    b"Aktivieren?"
+    b"Verschl\xc3\xbcsseln"
+    b"Verschl\xc3\xbcsselt"
+    b"Verschl\xc3\xbcsselter QR-Code"
+    b"Speicherung der verschl\xc3\xbcsselten Mnemonic mit ID:"
+    b"Verschl\xc3\xbcsselte Mnemonic wurde nicht gespeichert"
+    b"Verschl\xc3\xbcsselung"
+    b"Verschl\xc3\xbcsselungsmodus"
+    b"Geben Sie %d BIP39 W\xc3\xb6rter ein."
+    b"Geben Sie einen Tamper Check Code mit 6+ Zeichen ein"
+    b"Gib jedes Wort Deiner BIP39 Mnemonic als Zahl von 1 bis 2048 ein."
+    b"Gib jedes Wort Deiner BIP39 Mnemonic als Hexadezimalzahl von 1 bis 800 ein."
+    b"Gib jedes Wort Deiner BIP39 Mnemonic als Oktalzahl von 1 bis 4000 ein."
+    b"Gib jedes Wort Deiner BIP39 Mnemonic ein."
+    b"Benutzerdaten l\xc3\xb6schen"
+    b"Benutzerdaten werden gel\xc3\xb6scht\xe2\x80\xa6"
+    b"Fehler:"
+    b"Esc"
+    b"Dateien durchsuchen?"
+    b"Adressen exportieren"
+    b"%s wird auf SD-Karte exportiert\xe2\x80\xa6"
+    b"\xc3\x96ffentlicher Schl\xc3\xbcssel"
+    b"Werkeinstellungen"
+    b"Fehler beim Sammeln der Kameraentropie"
+    b"Entschl\xc3\xbcsselung fehlgeschlagen"
+    b"Laden fehlgeschlagen."
+    b"Mnemonic konnte nicht gespeichert werden"
+    b"Geb\xc3\xbchr:"
+    b"Vorschubgeschwindigkeit"
+    b"Dateiname"
+    b"Dateiname %s existiert auf SD-Karte."
+    b"Den Flash mit Entropie von der Kamera f\xc3\xbcllen?"
+    b"Flash wird gef\xc3\xbcllt"
+    b"Fingerabdruck in PSBT deaktiviert"
+    b"Flash-Karte"
+    b"Flash-Tools"
+    b"Flash gef\xc3\xbcllt mit Kameraentropie"
+    b"Fl\xc3\xb6tendurchmesser"
+    b"Frei:"
+    b"Vom Speicher"
+    b"L\xc3\xb6schen Sie Ihre SD-Karte vollst\xc3\xa4ndig in einem anderen Ger\xc3\xa4t, um sicherzustellen, dass die Daten nicht wiederhergestellt werden k\xc3\xb6nnen"
+    b"L\xc3\xbcckenlimit"
+    b"Mnemonik erzeugen"
+    b"Go"
+    b"Gute Entropie"
+    b"Hardware"
+    b"Kopfart"
+    b"Hex \xc3\xb6ffentlicher Schl\xc3\xbcssel:"
+    b"Hexadezimal"
+    b"Mnemonics ausblenden"
+    b"Hohe Geb\xc3\xbchren!"
+    b"ID"
+    b"ID existiert bereits"
+    b"Index"
+    b"Input (%d):"
+    b"Unzureichende Entropie!"
+    b"Ung\xc3\xbcltiger Tamper Check Code"
+    b"Ung\xc3\xbcltige Adresse"
+    b"Ung\xc3\xbcltiger Derivation-Pfad"
+    b"Ung\xc3\xbcltige mnemonische Lange"
+    b"Ung\xc3\xbcltige Wallet:"
+    b"Umkehren"
+    b"Invertierte Farben"
+    b"KEF-verschl\xc3\xbcsselt"
+    b"Schl\xc3\xbcssel"
+    b"Schl\xc3\xbcssel wurde nicht zur Verf\xc3\xbcgung gestellt"
+    b"Krux Drucker Test-QR"
+    b"LCD-Typ"
+    b"Sprache"
+    b"Lassen Sie das Feld leer, wenn Sie m\xc3\xb6chten, dass Krux ein g\xc3\xbcltiges letztes Wort ausw\xc3\xa4hlt"
+    b"Links"
+    b"L\xc3\xa4nge:"
+    b"Leitungsverz\xc3\xb6gerung"
+    b"Linie:"
+    b"Adressen auflisten"
+    b"Mnemonic laden"
+    b"Wallet laden"
+    b"Einen vertrauensw\xc3\xbcrdigen Wallet-Deskriptor laden, um Adressen anzuzeigen?"
+    b"Von SD-Karte laden"
+    b"Von SD-Karte laden?"
+    b"Von der Kamera laden"
+    b"Laden?"
+    b"Kamera wird geladen\xe2\x80\xa6"
+    b"\xc3\x84nderungsadressen werden geladen\xe2\x80\xa6"
+    b"Einlegen des Druckers\xe2\x80\xa6"
+    b"Empfangsadressen werden geladen\xe2\x80\xa6"
+    b"L\xc3\xa4dt\xe2\x80\xa6"
+    b"Spracheinstellung"
+    b"Speicherort"
+    b"Mittel"
+    b"Nachricht"
+    b"Nachricht:"
+    b"Miniscript"
+    b"X-Koordinaten spiegeln"
+    b"Fehlende Signaturdatei"
+    b"Mnemonic"
+    b"Mnemotechnik und Passphrase werden beibehalten."
+    b"Ge\xc3\xa4ndert:"
+    b"Native Segwit - 84 w\xc3\xbcrde angenommen"
+    b"Netzwerk"
+    b"Neue Mnemonic"
+    b"Neue Firmware erkannt."
+    b"Nein"
+    b"Keine Passphrase"
+    b"Nicht genug W\xc3\xbcrfe!"
+    b"Nicht gefunden:"
+    b"Zahlen"
+    b"Oktal"
+    b"Andere Formate"
+    b"\xc3\x9cberschreiben?"
+    b"PAGE zum Umschalten der Bildschirmhelligkeit"
+    b"PBKDF2 iter."
+    b"Male gestanzte Punkte schwarz an, damit sie erkannt werden k\xc3\xb6nnen."
+    b"Papierbreite"
+    b"Teil"
+    b"Teil M von N"
+    b"Teilegr\xc3\xb6\xc3\x9fe"
+    b"Passphrase"
+    b"Passwortl\xc3\xa4nge"
+    b"Pfad stimmt nicht \xc3\xbcberein"
+    b"Muster erkannt!"
+    b"Alle gespeicherten verschl\xc3\xbcsselten Mnemoniken und Einstellungen dauerhaft vom Flash-Speicher entfernen?"
+    b"Speicher"
+    b"Pixelabweichungsindex:"
+    b"Klartext-QR"
+    b"Bitte lade einen Wallet Ausgabedeskriptor"
+    b"Tauchrate"
+    b"Richtlinientyp"
+    b"Schlechte Entropie!"
+    b"Leistung"
+    b"PAGE zum Abbrechen dr\xc3\xbccken."
+    b"PAGE f\xc3\xbcr Moduswechsel"
+    b"Drucke Test-QR"
+    b"Tinyseed drucken?"
+    b"Als QR-Code drucken"
+    b"Als QR-Code drucken?"
+    b"Drucken?"
+    b"Drucker"
+    b"Druckertreiber nicht gesetzt!"
+    b"Druckbild\xe2\x80\xa6"
+    b"Trotzdem fortfahren?"
+    b"Weiter?"
+    b"Wird bearbeitet\xe2\x80\xa6"
+    b"Nachweislich nicht ausgebbar"
+    b"QR-Code"
+    b"QR-Etikett"
+    b"Menge"
+    b"RX Pin"
+    b"Neustart"
+    b"Empfangen"
+    b"Region:"
+    b"L\xc3\xb6schen %s?"
+    b"Mnemonic l\xc3\xb6schen"
+    b"Firmware-Dateien von der SD-Karte entfernen?"
+    b"Res. - Format"
+    b"Werkseinstellungen wiederherstellen und neu starten?"
+    b"Ergebnis"
+    b"Zur\xc3\xbcck zum QR-Viewer"
+    b"Erneut \xc3\x9cberpr\xc3\xbcfen"
+    b"\xc3\x9cberpr\xc3\xbcfe gescannte Daten und bearbeite sie bei Bedarf"
+    b"Rechts"
+    b"W\xc3\xbcrfel mindestens %d Mal, um eine Mnemonic zu erzeugen."
+    b"Rollenverteilung:"
+    b"W\xc3\xbcrfe:"
+    b"Um 180 Grad drehen"
+    b"SD-Karte"
+    b"SD-Karte nicht erkannt."
+    b"SHA256 der W\xc3\xbcrfe:"
+    b"SHA256 des Snapshots:"
+    b"QR-Bild auf SD-Karte speichern"
+    b"Auf SD-Karte speichern"
+    b"Auf SD-Karte speichern?"
+    b"Auf SD-Karte gespeichert:"
+    b"Skala"
+    b"Adresse scannen"
+    b"Scan BIP39 Passphrase"
+    b"Schl\xc3\xbcssel QR-Code Scannen"
+    b"Scan-Profiling"
+    b"W\xc3\xb6rter 1-12 erneut scannen"
+    b"W\xc3\xb6rter 13-24 scannen"
+    b"Bildschirmschonerzeit"
+    b"Script-Art"
+    b"Sicherheit"
+    b"Selbst\xc3\xbcbertragung oder Change (%d):"
+    b"Selbst\xc3\xbcbertragung:"
+    b"Legen Sie zuerst einen Tamper Check Code fest"
+    b"Einstellungen"
+    b"Die Einstellungen werden intern auf Flash gespeichert."
+    b"Einstellungen auf SD-Karte gespeichert."
+    b"Shannons Entropie:"
+    b"Datum anzeigen"
+    b"Ausschalten"
+    b"Abschaltzeit"
+    b"Abfahren\xe2\x80\xa6"
+    b"Signieren"
+    b"Am QR-Code unterschreiben"
+    b"Auf SD-Karte signieren"
+    b"Signieren?"
+    b"Signatur:"
+    b"Signierte Nachricht"
+    b"Signierte PSBT"
+    b"Unterzeichnung\xe2\x80\xa6"
+    b"Single-Sig"
+    b"Gr\xc3\xb6\xc3\x9fe:"
+    b"Einige Schecks k\xc3\xb6nnen nicht durchgef\xc3\xbchrt werden."
+    b"Einige Knoten sind nicht geh\xc3\xa4rtet:"
+    b"Ausgabe (%d):"
+    b"Ausgaben:"
+    b"Standardmodus"
+    b"Statisch"
+    b"Statistiken f\xc3\xbcr Nerds"
+    b"Auf Flash speichern"
+    b"Auf der SD-Karte speichern"
+    b"St\xc3\xa4rke"
+    b"Stark"
+    b"Wischen um den Modus zu \xc3\xa4ndern"
+    b"TC Flash-Hash"
+    b"TC Flash-Hash beim Start"
+    b"TOUCH oder ENTER zum Erfassen"
+    b"TOUCH oder ENTER zum Installieren."
+    b"TR interner Schl\xc3\xbcssel"
+    b"TX Pin"
+    b"Tamper Check Code"
+    b"Tamper Check Code erfolgreich gesetzt"
+    b"Tamper Check Codes stimmen nicht \xc3\xbcberein"
+    b"Test-Suite"
+    b"Ergebnisse der Testsuite"
+    b"Test:"
+    b"Text"
+    b"Thema"
+    b"Thermisch"
+    b"Um sicherzustellen, dass die Daten nicht wiederhergestellt werden k\xc3\xb6nnen, verwenden Sie die Funktion 'Ger\xc3\xa4t l\xc3\xb6schen'"
+    b"Helligkeit umschalten"
+    b"Werkzeuge"
+    b"Ber\xc3\xbchre Schwellenwert"
+    b"Touchscreen"
+    b"Weiter versuchen?"
+    b"BIP39 Passphrase eingeben"
+    b"Schl\xc3\xbcssel eingeben"
+    b"Widerrufen"
+    b"Einheit"
+    b"KEF-ID aktualisieren?"
+    b"QR-Etikett aktualisieren?"
+    b"Upgrade abgeschlossen."
+    b"Verwende eine schwarze Hintergrundfl\xc3\xa4che."
+    b"Verwende die Entropie der Kamera, um eine neue Mnemonic zu erstellen"
+    b"Aktueller Wert"
+    b"Standard verwenden?"
+    b"Standard-PBKDF2-Iteration verwenden.?"
+    b"Fingerabdruck als ID verwenden?"
+    b"Belegt:"
+    b"Benutzerdaten"
+    b"Wert %S au\xc3\x9ferhalb  des Bereichs: [ %s, %s]"
+    b"\xc3\x9cberpr\xc3\xbcfung\xe2\x80\xa6"
+    b"Version"
+    b"Via Kamera"
+    b"Via D20"
+    b"Via D6"
+    b"Via manueller Eingabe"
+    b"Via W\xc3\xb6rter"
+    b"Sichtbares Etikett"
+    b"Warte auf die Erfassung"
+    b"Wallet"
+    b"Wallet-Deskriptor"
+    b"Wallet Ausgabedeskriptor"
+    b"Wallet Ausgabedeskriptor geladen!"
+    b"Wallet Ausgabedeskriptor nicht gefunden."
+    b"Warnung:"
+    b"Schwach"
+    b"Wort %d"
+    b"Wortnummern"
+    b"W\xc3\xb6rter"
+    b"Ja"
+    b"Zoommodus"
+    b"bin\xc3\xa4r: {} Bytes"
+    b"failed:"
+    b"aus SECHSKANT"
+    b"von base32"
+    b"von base43"
+    b"von base64"
+    b"aus Sechskant"
+    b"von utf8"
+    b"ist eine g\xc3\xbcltige Adresse!"
+    b"schaltkoffer"
+    b"Erfolgsrate:"
+    b"wischen"
+    b"text: {} chars"
+    b"zu SECHSKANT"
+    b"zu base32"
+    b"an base43"
+    b"zu base64"
+    b"zu Sechskant"
+    b"zu utf8"
+    b"unbekannt"
+    b"wurde in den ersten %d Adressen nicht gefunden"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% del monto.",
-    "%d de %d multisig",
-    "%d a %d",
-    "%s bits (%s bits/px)",
-    "%s eliminado.",
-    "%s: ¡cargado!",
-    "(Experimental)",
-    "(Solo para observación)",
-    "12 palabras",
-    "24 palabras",
-    "Nosotros",
-    "¿Aceptar la suposición?",
-    "Cuenta",
-    "Se supondría que la cuenta #0",
-    "Índice de la cuenta",
-    "¿Añadir o cambiar passphrase de la cartera?",
-    "Se requiere entropía adicional de la cámara para %s",
-    "Dirección",
-    "Alinea la cámara y la placa de respaldo correctamente.",
-    "Modo antirreflejo",
-    "Apariencia",
-    "¿Estás seguro?",
-    "Colores BGR",
-    "Mnemónico BIP39",
-    "Atrás",
-    "Volver al Menú",
-    "Backup del Mnemónico",
-    "Firma incorrecta",
-    "Contraseña Base64",
-    "Baudrate",
-    "Cuadrícula binaria",
-    "Grosor del Borde",
-    "Brillo",
-    "Botones",
-    "Rebote de Botones",
-    "Captura cancelada",
-    "Cambio",
-    "¿Cambiar de tema y reiniciar?",
-    "Cambio:",
-    "Los cambios durarán hasta que el dispositivo se apague.",
-    "Revisar Tarjeta SD",
-    "¿Verificar que la dirección pertenece a esta cartera?",
-    "Comprobado %d direcciones sin coincidencias.",
-    "Buscando tarjeta SD…",
-    "Confirmar el código de verificación",
-    "Convertir dato",
-    "No se pudo determinar la dirección de cambio.",
-    "Crear código QR",
-    "¿Crear código QR a partir de texto?",
-    "Creado:",
-    "Código de verificación actual",
-    "Código QR personalizado",
-    "Texto Personalizado",
-    "Personalizar",
-    "Personalizar tu cartera generará una nueva clave y descargará el Descriptor.",
-    "Profundidad de Corte",
-    "Método de Corte",
-    "Herramienta de datos",
-    "Decimal",
-    "¿Descifrar?",
-    "Cartera Predeterminada",
-    "¿Eliminar este archivo?",
-    "Profundidad por Pasada",
-    "Ruta de derivación",
-    "¿Derivar entropía BIP85?",
-    "Direcciones del descriptor",
-    "Pruebas del dispositivo",
-    "Pantalla",
-    "No apagues el dispositivo, puede tardar un tiempo en completarse.",
-    "Listo para convertir",
-    "¿Listo?",
-    "Doble mnemónico",
-    "Operador",
-    "Vacío",
-    "¿Permitir?",
-    "Cifrar",
-    "Cifrado",
-    "Código QR Cifrado",
-    "Mnemónico cifrado almacenado con ID:",
-    "Mnemónico cifrado no se almacenó",
-    "Cifrado",
-    "Modo de Cifrado",
-    "Ingrese %d palabras BIP39.",
-    "Introduzca un código de verificación de más de 6 caracteres",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número del 1 al 2048.",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número en hexadecimal del 1 al 800.",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número en octal del 1 al 4000.",
-    "Ingresa cada palabra de tu mnemónico BIP39.",
-    "Borrar datos de usuario",
-    "Borrando los datos del usuario…",
-    "Error:",
-    "Esc",
-    "¿Explorar archivos?",
-    "Exportar direcciones",
-    "Exportando %s a la tarjeta SD…",
-    "Clave Pública Extendida",
-    "Ajustes de Fábrica",
-    "Error al recopilar la entropía de la cámara",
-    "Error al descifrar",
-    "Error al cargar",
-    "No pudo almacenar mnemónico",
-    "Comisión:",
-    "Feed Rate",
-    "Nombre del Archivo",
-    "El nombre de archivo %s existe en la tarjeta SD.",
-    "¿Llenar el flash con entropía de la cámara?",
-    "Llenando Flash",
-    "Huella dactilar no establecida en PSBT",
-    "Mapa Flash",
-    "Herramientas Flash",
-    "Flash lleno de entropía de cámara",
-    "Diámetro de la Flauta",
-    "Libre:",
-    "Desde el Almacenamiento",
-    "Borra completamente su tarjeta SD en otro dispositivo para asegurarse de que los datos sean irrecuperables",
-    "Generar Mnemónico",
-    "Ir",
-    "Buena entropía",
-    "Hardware",
-    "Tipo de cabezal",
-    "Clave Pública Hexadecimal:",
-    "Hexadecimal",
-    "Ocultar Mnemónicos",
-    "¡Tarifas altas!",
-    "Identificador",
-    "ID ya existe",
-    "Índice",
-    "Entradas (%d):",
-    "¡Entropía Insuficiente!",
-    "Código de verificación no válido",
-    "Dirección inválida",
-    "Ruta de derivación no válida",
-    "Longitud mnemónica no válida",
-    "Cartera inválida:",
-    "Invertir",
-    "Colores Invertidos",
-    "Kef encriptado",
-    "Clave",
-    "No se proporcionó la clave",
-    "Test de impresión QR",
-    "Tipo de LCD",
-    "Idioma",
-    "Déjalo en blanco si quieres que Krux elija una última palabra válida",
-    "Izquierda",
-    "Longitud:",
-    "Retraso de Línea",
-    "Línea:",
-    "Listar direcciones",
-    "Importar Mnemónico",
-    "Cargar Cartera",
-    "¿Cargar un descriptor de monedero de confianza para ver las direcciones?",
-    "Cargar desde tarjeta SD",
-    "¿Cargar desde la tarjeta SD?",
-    "Cargar desde la cámara",
-    "¿Cargar?",
-    "Cargando cámara…",
-    "Cargando direcciones de cambio…",
-    "Cargando impresora…",
-    "Cargando direcciones de recepción…",
-    "Cargando…",
-    "Idioma",
-    "Ubicación",
-    "Medio",
-    "Mensaje",
-    "Mensaje:",
-    "Miniscript",
-    "Espejo de coordenadas X",
-    "Falta archivo de firma",
-    "Mnemónico",
-    "Mnemónico y passphrase se mantendrán.",
-    "Modificado:",
-    "Segwit nativo - 84 se supondría",
-    "Red",
-    "Nuevo Mnemónico",
-    "Nuevo firmware detectado.",
-    "No",
-    "Sin Passphrase",
-    "¡No hay suficientes tiradas!",
-    "Números",
-    "Octales",
-    "Otros Formatos",
-    "¿Sobrescribir?",
-    "PAGE para alternar el brillo",
-    "PBKDF2 iter.",
-    "Pinte los puntos perforados de negro para que puedan ser detectados.",
-    "Ancho del Papel",
-    "Parte",
-    "Parte M de N",
-    "Tamaño de la Pieza",
-    "Passphrase",
-    "Longitud",
-    "La ruta no coincide",
-    "¡Patrón detectado!",
-    "¿Eliminar permanentemente todos los mnemónicos y configuraciones cifradas almacenadas del flash?",
-    "Guardar",
-    "Índice de desviación de píxeles:",
-    "QR de Texto",
-    "Carga un descriptor de cartera",
-    "Tasa de Caída",
-    "Tipo de póliza",
-    "Baja entropía!",
-    "Potencia",
-    "Pulse PAGE para cancelar.",
-    "PAGE para cambiar el modo",
-    "Prueba de Impresión QR",
-    "¿Imprimir Tinyseed?",
-    "Imprimir como Código QR",
-    "¿Imprimir con Codigo QR?",
-    "¿Impresión?",
-    "Impresora",
-    "¡El controlador de impresora no está configurado!",
-    "Imprimiendo…",
-    "¿Proceder de todas maneras?",
-    "¿Continuar?",
-    "Procesando…",
-    "No se puede gastar",
-    "Código QR",
-    "Etiqueta QR",
-    "Cantidad",
-    "RX Pin",
-    "Reiniciar",
-    "Recepción",
-    "Región:",
-    "Eliminar %s?",
-    "Eliminar Mnemónico",
-    "¿Eliminar archivos de firmware de la tarjeta SD?",
-    "Res. - Formato",
-    "¿Restablecer a la configuración de fábrica y reiniciar?",
-    "Resultados",
-    "Volver al QR",
-    "Revisar nuevamente",
-    "Revisa los datos escaneados, edítalos si es necesario",
-    "Derecha",
-    "Tira el dado al menos %d veces para generar un mnemónico.",
-    "Distribución de tiradas:",
-    "Tiradas:",
-    "Girar 180°",
-    "Tarjeta SD",
-    "Tarjeta SD no detectada.",
-    "SHA256 de las tiradas:",
-    "SHA256 de la instantánea:",
-    "Guardar Imagen QR en la Tarjeta SD",
-    "Guardar en tarjeta SD",
-    "¿Guardar en la tarjeta SD?",
-    "Guardado en la tarjeta SD:",
-    "Escala",
-    "Escanear Dirección",
-    "Escanear Passphrase BIP39",
-    "Escanear el Código QR",
-    "Escaneo de palabras 1-12 de nuevo",
-    "Escaneo de palabras 13-24",
-    "Tiempo de Espera del Protector de Pantalla",
-    "Tipo de Script",
-    "Seguridad",
-    "Autotransferencia o Cambio (%d):",
-    "Autotransferencia:",
-    "Establezca primero un código de verificación",
-    "Ajustes",
-    "Ajustes almacenados internamente en flash.",
-    "Configuración almacenada en la tarjeta SD.",
-    "Entropía de Shannon:",
-    "Mostrar dato",
-    "Apagar",
-    "Tiempo de Apagado",
-    "Apagado…",
-    "Firmar",
-    "Firmar en Código QR",
-    "Firmar en la Tarjeta SD",
-    "¿Firmar?",
-    "Firma:",
-    "Mensaje Firmado",
-    "PSBT Firmado",
-    "Firma…",
-    "Single-sig",
-    "Tamaño:",
-    "Algunas comprobaciones no se pueden realizar.",
-    "Algunos nodos no están endurecidos:",
-    "Gastos (%d):",
-    "Gasto:",
-    "Modo estándar",
-    "Estático",
-    "Estadísticas para Entendidos",
-    "Almacenar en Flash",
-    "Almacenar en la Tarjeta SD",
-    "Fuerza",
-    "Fuerte",
-    "Deslizar para cambiar de modo",
-    "TC Hash Flash",
-    "TC Flash Hash al arranque",
-    "TOCA o ENTER para capturar",
-    "TOCA o ENTER para instalar.",
-    "Clave interna TR",
-    "TX Pin",
-    "Código de verificación",
-    "Código de verificación establecido con éxito",
-    "Los códigos de verificación no coinciden",
-    "Suite de Pruebas",
-    "Resultados de la suite de pruebas",
-    "Prueba:",
-    "Texto",
-    "Tema",
-    "Térmico",
-    "Para garantizar que los datos no se puedan recuperar, utiliza la función de borrar dispositivo",
-    "Alternar Brillo",
-    "Herramientas",
-    "Umbral Táctil",
-    "Pantalla Táctil",
-    "¿Intentar con mas?",
-    "Escribe la Passphrase BIP39",
-    "Introduce la clave",
-    "Deshacer",
-    "Unidad",
-    "¿Actualizar ID de Kef?",
-    "¿Actualizar etiqueta QR?",
-    "Actualización completa.",
-    "Usa una superficie de fondo negra.",
-    "Usa la entropía de la cámara para crear una nueva mnemónica",
-    "Valor Actual",
-    "¿Usar el modo predeterminado?",
-    "Utilice el iter PBKDF2 predeterminado.?",
-    "¿Usar huella dactilar como identificación?",
-    "Usado:",
-    "Usuario",
-    "Valor %s fuera del rango: [ %s, %s]",
-    "Verificando…",
-    "Versión",
-    "Desde Cámara",
-    "Vía D20",
-    "Vía D6",
-    "Introducción Manual",
-    "A Través de Palabras",
-    "la etiqueta legible",
-    "Espera la captura",
-    "Cartera",
-    "Descriptor de Cartera",
-    "Descriptor de salida de cartera",
-    "¡Se ha cargado el descriptor de salida de la cartera!",
-    "No se encontró el descriptor de salida de la cartera.",
-    "Advertencia:",
-    "Débil",
-    "Palabra %d",
-    "Números de Palabra",
-    "Palabras",
-    "Sí",
-    "Modo ampliado",
-    "binary: {} bytes",
-    "failed:",
-    "desde HEXADECIMAL",
-    "desde base32",
-    "desde base43",
-    "desde base64",
-    "desde hexadecimal",
-    "desde utf8",
-    "es una dirección válida!",
-    "caja de cambio",
-    "Tasa de éxito:",
-    "deslizar",
-    "text: {} caracteres",
-    "a HEXADECIMAL",
-    "a base32",
-    "a base43",
-    "a base64",
-    "a hexadecimal",
-    "a utf8",
-    "desconocido",
-    "NO FUE ENCONTRADO en las primeras %d direcciones",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0c\x00)\x00W\x00h\x00o\x00\x83\x00\x90\x00\x9e\x00\xac\x00\xc4\x00\xcf\x00\xda\x00\xe2\x00\xfb\x00"
+    b'\x01\x01\x1f\x013\x01`\x01\x95\x01\x9f\x01\xb5\x01\xec\x01\xfd\x01\x07\x02\x17\x02"\x022\x028\x02G\x02\\\x02'
+    b"l\x02~\x02\x86\x02\x99\x02\xa9\x02\xaf\x02\xb6\x02\xc7\x02\xe3\x02\xf4\x02\xfa\x02\x18\x03\x1f\x03W\x03u\x03\x87\x03"
+    b"\xbe\x03\xea\x03\x00\x04%\x043\x04a\x04q\x04\x96\x04\x9d\x04\xbc\x04\xd4\x04\xe7\x04\xf3\x04A\x05U\x05e\x05"
+    b"y\x05\x80\x05\x8c\x05\xa2\x05\xba\x05\xd0\x05\xe3\x05\xfd\x05\x17\x06.\x066\x06w\x06\x8b\x06\x93\x06\xa3\x06\xab\x06"
+    b'\xb1\x06\xbc\x06\xc2\x06\xc9\x06\xdb\x06\x00\x07"\x07)\x078\x07R\x07\x90\x07\xda\x072\x08\x85\x08\xb1\x08\xc8\x08'
+    b"\xe9\x08\xef\x08\xf2\x08\x06\t\x1a\t:\tR\te\t\x92\t\xa4\t\xb3\t\xcf\t\xd9\t\xe2\t\xf4\t$\n"
+    b"R\n`\n\x86\n\x90\n\xa2\n\xc5\n\xdb\n\xe1\n\xf8\nb\x0bs\x0b\x85\x0b\x87\x0b\x96\x0b\x9e\x0b\xad\x0b"
+    b"\xc8\x0b\xd3\x0b\xe6\x0b\xf6\x0b\x03\x0c\x0f\x0c\x16\x0c$\x0c=\x0c`\x0ct\x0c\x92\x0c\xb0\x0c\xc2\x0c\xca\x0c\xdc\x0c"
+    b"\xea\x0c\xef\x0c\n\r\x1f\r*\r0\rw\r\x80\r\x89\r\x9a\r\xa1\r\xb3\r\xc6\r\xd4\r\x1d\x0e4\x0e"
+    b"Q\x0eh\x0eq\x0e\x84\x0e\xa5\x0e\xba\x0e\xdf\x0e\xea\x0e\xf0\x0e\xfa\x0e\xff\x0e\x06\x0f\x0e\x0f\x18\x0f/\x0fE\x0f"
+    b"O\x0fv\x0f\x81\x0f\xa1\x0f\xa4\x0f\xb4\x0f\xcd\x0f\xcf\x0f\xdd\x0f\xfa\x0f\t\x10\x11\x10\x18\x10&\x105\x10Q\x10"
+    b"]\x10\xa1\x10\xb0\x10\xb5\x10\xc1\x10\xd4\x10\xde\x10\xe6\x10\xf9\x10\r\x11o\x11v\x11\x99\x11\xa4\x11\xc2\x11\xd0\x11"
+    b"\xdf\x11\xee\x11\xf6\x11\x0f\x12(\x12?\x12S\x12k\x12\x84\x12\x91\x12\x9a\x12\xcd\x12\xdb\x12\xf7\x12\x03\x13\x10\x13"
+    b'"\x13,\x137\x13?\x13E\x13N\x13X\x13`\x13l\x13\x7f\x13\xb0\x13\xbe\x13\xf8\x13\x02\x14\x0e\x14 \x14'
+    b"V\x14]\x14\x97\x14\xb0\x14\xb8\x14\xc3\x14\xcd\x14\xe5\x14\xfb\x14\x15\x157\x15L\x15g\x15\x81\x15\x87\x15\x9a\x15"
+    b"\xb3\x15\xc9\x15\xdd\x15\xfe\x15\x17\x16A\x16O\x16X\x16x\x16\x8a\x16\xb8\x16\xbf\x16\xe9\x16\x14\x17)\x175\x17"
+    b";\x17L\x17V\x17\\\x17p\x17\x87\x17\x90\x17\x96\x17\xa5\x17\xb1\x17\xb9\x17\xc3\x17\xcb\x17\xf8\x17\x1c\x18(\x18"
+    b'.\x18<\x18E\x18b\x18t\x18\x8e\x18\x94\x18\x9a\x18\xb7\x18\xc4\x18\xdd\x18\xf7\x18\x12\x19"\x19(\x19@\x19'
+    b"o\x19\x99\x19\xa9\x19\xca\x19\xd1\x19\xd6\x19\xda\x19\xe2\x19A\x1aP\x1a\\\x1aj\x1az\x1a\x8d\x1a\xa8\x1a\xba\x1a"
+    b"\xc2\x1a\xc8\x1a\xdf\x1a\xf8\x1a\x10\x1b2\x1bp\x1b|\x1b\x9a\x1b\xc1\x1b\xed\x1b\xf3\x1b\xfa\x1b\x1d\x1c+\x1c3\x1c"
+    b"@\x1cH\x1cO\x1cc\x1cx\x1c\x8b\x1c\x9c\x1c\xa3\x1c\xb8\x1c\xd7\x1c\r\x1dC\x1dO\x1dU\x1d_\x1dr\x1d"
+    b"z\x1d}\x1d\x8a\x1d\x9a\x1d\xa1\x1d\xb2\x1d\xbe\x1d\xca\x1d\xd6\x1d\xe7\x1d\xf1\x1d\x0b\x1e\x19\x1e(\x1e0\x1eC\x1e"
+    b"P\x1eX\x1e`\x1eh\x1eu\x1e{\x1e\x86\x1e\xb6\x1e"
+    b"% del monto."
+    b"%d c\xc3\xb3digos QR, %ds por ciclo"
+    b"%d de %d direcciones pertenecen a esta cartera"
+    b"%d de %d multisig"
+    b"%d a %d"
+    b"%s bits (%s bits/px)"
+    b"%s eliminado."
+    b"%s: \xc2\xa1cargado!"
+    b"(Experimental)"
+    b"(Solo para observaci\xc3\xb3n)"
+    b"12 palabras"
+    b"24 palabras"
+    b"Nosotros"
+    b"\xc2\xbfAceptar la suposici\xc3\xb3n?"
+    b"Cuenta"
+    b"Se supondr\xc3\xada que la cuenta #0"
+    b"\xc3\x8dndice de la cuenta"
+    b"\xc2\xbfA\xc3\xb1adir o cambiar passphrase de la cartera?"
+    b"Se requiere entrop\xc3\xada adicional de la c\xc3\xa1mara para %s"
+    b"Direcci\xc3\xb3n"
+    b"\xc3\x8dndice de Direcciones"
+    b"Alinea la c\xc3\xa1mara y la placa de respaldo correctamente."
+    b"Modo antirreflejo"
+    b"Apariencia"
+    b"\xc2\xbfEst\xc3\xa1s seguro?"
+    b"Colores BGR"
+    b"Mnem\xc3\xb3nico BIP39"
+    b"Atr\xc3\xa1s"
+    b"Volver al Men\xc3\xba"
+    b"Backup del Mnem\xc3\xb3nico"
+    b"Firma incorrecta"
+    b"Contrase\xc3\xb1a Base64"
+    b"Baudrate"
+    b"Cuadr\xc3\xadcula binaria"
+    b"Grosor del Borde"
+    b"Brillo"
+    b"Botones"
+    b"Rebote de Botones"
+    b"Guardar Descriptor en Cach\xc3\xa9"
+    b"Captura cancelada"
+    b"Cambio"
+    b"\xc2\xbfCambiar de tema y reiniciar?"
+    b"Cambio:"
+    b"Los cambios durar\xc3\xa1n hasta que el dispositivo se apague."
+    b"Verificar Lista de Direcciones"
+    b"Revisar Tarjeta SD"
+    b"\xc2\xbfVerificar que la direcci\xc3\xb3n pertenece a esta cartera?"
+    b"Comprobado %d direcciones sin coincidencias."
+    b"Buscando tarjeta SD\xe2\x80\xa6"
+    b"Confirmar el c\xc3\xb3digo de verificaci\xc3\xb3n"
+    b"Convertir dato"
+    b"No se pudo determinar la direcci\xc3\xb3n de cambio."
+    b"Crear c\xc3\xb3digo QR"
+    b"\xc2\xbfCrear c\xc3\xb3digo QR a partir de texto?"
+    b"Creado:"
+    b"C\xc3\xb3digo de verificaci\xc3\xb3n actual"
+    b"C\xc3\xb3digo QR personalizado"
+    b"Texto Personalizado"
+    b"Personalizar"
+    b"Personalizar tu cartera generar\xc3\xa1 una nueva clave y descargar\xc3\xa1 el Descriptor."
+    b"Profundidad de Corte"
+    b"M\xc3\xa9todo de Corte"
+    b"Herramienta de datos"
+    b"Decimal"
+    b"\xc2\xbfDescifrar?"
+    b"Cartera Predeterminada"
+    b"\xc2\xbfEliminar este archivo?"
+    b"Profundidad por Pasada"
+    b"Ruta de derivaci\xc3\xb3n"
+    b"\xc2\xbfDerivar entrop\xc3\xada BIP85?"
+    b"Direcciones del descriptor"
+    b"Pruebas del dispositivo"
+    b"Pantalla"
+    b"No apagues el dispositivo, puede tardar un tiempo en completarse."
+    b"Listo para convertir"
+    b"\xc2\xbfListo?"
+    b"Doble mnem\xc3\xb3nico"
+    b"Operador"
+    b"Vac\xc3\xado"
+    b"\xc2\xbfPermitir?"
+    b"Cifrar"
+    b"Cifrado"
+    b"C\xc3\xb3digo QR Cifrado"
+    b"Mnem\xc3\xb3nico cifrado almacenado con ID:"
+    b"Mnem\xc3\xb3nico cifrado no se almacen\xc3\xb3"
+    b"Cifrado"
+    b"Modo de Cifrado"
+    b"Ingrese %d palabras BIP39."
+    b"Introduzca un c\xc3\xb3digo de verificaci\xc3\xb3n de m\xc3\xa1s de 6 caracteres"
+    b"Ingresa cada palabra de tu mnem\xc3\xb3nico BIP39 como un n\xc3\xbamero del 1 al 2048."
+    b"Ingresa cada palabra de tu mnem\xc3\xb3nico BIP39 como un n\xc3\xbamero en hexadecimal del 1 al 800."
+    b"Ingresa cada palabra de tu mnem\xc3\xb3nico BIP39 como un n\xc3\xbamero en octal del 1 al 4000."
+    b"Ingresa cada palabra de tu mnem\xc3\xb3nico BIP39."
+    b"Borrar datos de usuario"
+    b"Borrando los datos del usuario\xe2\x80\xa6"
+    b"Error:"
+    b"Esc"
+    b"\xc2\xbfExplorar archivos?"
+    b"Exportar direcciones"
+    b"Exportando %s a la tarjeta SD\xe2\x80\xa6"
+    b"Clave P\xc3\xbablica Extendida"
+    b"Ajustes de F\xc3\xa1brica"
+    b"Error al recopilar la entrop\xc3\xada de la c\xc3\xa1mara"
+    b"Error al descifrar"
+    b"Error al cargar"
+    b"No pudo almacenar mnem\xc3\xb3nico"
+    b"Comisi\xc3\xb3n:"
+    b"Feed Rate"
+    b"Nombre del Archivo"
+    b"El nombre de archivo %s existe en la tarjeta SD."
+    b"\xc2\xbfLlenar el flash con entrop\xc3\xada de la c\xc3\xa1mara?"
+    b"Llenando Flash"
+    b"Huella dactilar no establecida en PSBT"
+    b"Mapa Flash"
+    b"Herramientas Flash"
+    b"Flash lleno de entrop\xc3\xada de c\xc3\xa1mara"
+    b"Di\xc3\xa1metro de la Flauta"
+    b"Libre:"
+    b"Desde el Almacenamiento"
+    b"Borra completamente su tarjeta SD en otro dispositivo para asegurarse de que los datos sean irrecuperables"
+    b"L\xc3\xadmite de Brecha"
+    b"Generar Mnem\xc3\xb3nico"
+    b"Ir"
+    b"Buena entrop\xc3\xada"
+    b"Hardware"
+    b"Tipo de cabezal"
+    b"Clave P\xc3\xbablica Hexadecimal:"
+    b"Hexadecimal"
+    b"Ocultar Mnem\xc3\xb3nicos"
+    b"\xc2\xa1Tarifas altas!"
+    b"Identificador"
+    b"ID ya existe"
+    b"\xc3\x8dndice"
+    b"Entradas (%d):"
+    b"\xc2\xa1Entrop\xc3\xada Insuficiente!"
+    b"C\xc3\xb3digo de verificaci\xc3\xb3n no v\xc3\xa1lido"
+    b"Direcci\xc3\xb3n inv\xc3\xa1lida"
+    b"Ruta de derivaci\xc3\xb3n no v\xc3\xa1lida"
+    b"Longitud mnem\xc3\xb3nica no v\xc3\xa1lida"
+    b"Cartera inv\xc3\xa1lida:"
+    b"Invertir"
+    b"Colores Invertidos"
+    b"Kef encriptado"
+    b"Clave"
+    b"No se proporcion\xc3\xb3 la clave"
+    b"Test de impresi\xc3\xb3n QR"
+    b"Tipo de LCD"
+    b"Idioma"
+    b"D\xc3\xa9jalo en blanco si quieres que Krux elija una \xc3\xbaltima palabra v\xc3\xa1lida"
+    b"Izquierda"
+    b"Longitud:"
+    b"Retraso de L\xc3\xadnea"
+    b"L\xc3\xadnea:"
+    b"Listar direcciones"
+    b"Importar Mnem\xc3\xb3nico"
+    b"Cargar Cartera"
+    b"\xc2\xbfCargar un descriptor de monedero de confianza para ver las direcciones?"
+    b"Cargar desde tarjeta SD"
+    b"\xc2\xbfCargar desde la tarjeta SD?"
+    b"Cargar desde la c\xc3\xa1mara"
+    b"\xc2\xbfCargar?"
+    b"Cargando c\xc3\xa1mara\xe2\x80\xa6"
+    b"Cargando direcciones de cambio\xe2\x80\xa6"
+    b"Cargando impresora\xe2\x80\xa6"
+    b"Cargando direcciones de recepci\xc3\xb3n\xe2\x80\xa6"
+    b"Cargando\xe2\x80\xa6"
+    b"Idioma"
+    b"Ubicaci\xc3\xb3n"
+    b"Medio"
+    b"Mensaje"
+    b"Mensaje:"
+    b"Miniscript"
+    b"Espejo de coordenadas X"
+    b"Falta archivo de firma"
+    b"Mnem\xc3\xb3nico"
+    b"Mnem\xc3\xb3nico y passphrase se mantendr\xc3\xa1n."
+    b"Modificado:"
+    b"Segwit nativo - 84 se supondr\xc3\xada"
+    b"Red"
+    b"Nuevo Mnem\xc3\xb3nico"
+    b"Nuevo firmware detectado."
+    b"No"
+    b"Sin Passphrase"
+    b"\xc2\xa1No hay suficientes tiradas!"
+    b"No encontradas:"
+    b"N\xc3\xbameros"
+    b"Octales"
+    b"Otros Formatos"
+    b"\xc2\xbfSobrescribir?"
+    b"PAGE para alternar el brillo"
+    b"PBKDF2 iter."
+    b"Pinte los puntos perforados de negro para que puedan ser detectados."
+    b"Ancho del Papel"
+    b"Parte"
+    b"Parte M de N"
+    b"Tama\xc3\xb1o de la Pieza"
+    b"Passphrase"
+    b"Longitud"
+    b"La ruta no coincide"
+    b"\xc2\xa1Patr\xc3\xb3n detectado!"
+    b"\xc2\xbfEliminar permanentemente todos los mnem\xc3\xb3nicos y configuraciones cifradas almacenadas del flash?"
+    b"Guardar"
+    b"\xc3\x8dndice de desviaci\xc3\xb3n de p\xc3\xadxeles:"
+    b"QR de Texto"
+    b"Carga un descriptor de cartera"
+    b"Tasa de Ca\xc3\xadda"
+    b"Tipo de p\xc3\xb3liza"
+    b"Baja entrop\xc3\xada!"
+    b"Potencia"
+    b"Pulse PAGE para cancelar."
+    b"PAGE para cambiar el modo"
+    b"Prueba de Impresi\xc3\xb3n QR"
+    b"\xc2\xbfImprimir Tinyseed?"
+    b"Imprimir como C\xc3\xb3digo QR"
+    b"\xc2\xbfImprimir con Codigo QR?"
+    b"\xc2\xbfImpresi\xc3\xb3n?"
+    b"Impresora"
+    b"\xc2\xa1El controlador de impresora no est\xc3\xa1 configurado!"
+    b"Imprimiendo\xe2\x80\xa6"
+    b"\xc2\xbfProceder de todas maneras?"
+    b"\xc2\xbfContinuar?"
+    b"Procesando\xe2\x80\xa6"
+    b"No se puede gastar"
+    b"C\xc3\xb3digo QR"
+    b"Etiqueta QR"
+    b"Cantidad"
+    b"RX Pin"
+    b"Reiniciar"
+    b"Recepci\xc3\xb3n"
+    b"Regi\xc3\xb3n:"
+    b"Eliminar %s?"
+    b"Eliminar Mnem\xc3\xb3nico"
+    b"\xc2\xbfEliminar archivos de firmware de la tarjeta SD?"
+    b"Res. - Formato"
+    b"\xc2\xbfRestablecer a la configuraci\xc3\xb3n de f\xc3\xa1brica y reiniciar?"
+    b"Resultados"
+    b"Volver al QR"
+    b"Revisar nuevamente"
+    b"Revisa los datos escaneados, ed\xc3\xadtalos si es necesario"
+    b"Derecha"
+    b"Tira el dado al menos %d veces para generar un mnem\xc3\xb3nico."
+    b"Distribuci\xc3\xb3n de tiradas:"
+    b"Tiradas:"
+    b"Girar 180\xc2\xb0"
+    b"Tarjeta SD"
+    b"Tarjeta SD no detectada."
+    b"SHA256 de las tiradas:"
+    b"SHA256 de la instant\xc3\xa1nea:"
+    b"Guardar Imagen QR en la Tarjeta SD"
+    b"Guardar en tarjeta SD"
+    b"\xc2\xbfGuardar en la tarjeta SD?"
+    b"Guardado en la tarjeta SD:"
+    b"Escala"
+    b"Escanear Direcci\xc3\xb3n"
+    b"Escanear Passphrase BIP39"
+    b"Escanear el C\xc3\xb3digo QR"
+    b"Perfilado de Escaneo"
+    b"Escaneo de palabras 1-12 de nuevo"
+    b"Escaneo de palabras 13-24"
+    b"Tiempo de Espera del Protector de Pantalla"
+    b"Tipo de Script"
+    b"Seguridad"
+    b"Autotransferencia o Cambio (%d):"
+    b"Autotransferencia:"
+    b"Establezca primero un c\xc3\xb3digo de verificaci\xc3\xb3n"
+    b"Ajustes"
+    b"Ajustes almacenados internamente en flash."
+    b"Configuraci\xc3\xb3n almacenada en la tarjeta SD."
+    b"Entrop\xc3\xada de Shannon:"
+    b"Mostrar dato"
+    b"Apagar"
+    b"Tiempo de Apagado"
+    b"Apagado\xe2\x80\xa6"
+    b"Firmar"
+    b"Firmar en C\xc3\xb3digo QR"
+    b"Firmar en la Tarjeta SD"
+    b"\xc2\xbfFirmar?"
+    b"Firma:"
+    b"Mensaje Firmado"
+    b"PSBT Firmado"
+    b"Firma\xe2\x80\xa6"
+    b"Single-sig"
+    b"Tama\xc3\xb1o:"
+    b"Algunas comprobaciones no se pueden realizar."
+    b"Algunos nodos no est\xc3\xa1n endurecidos:"
+    b"Gastos (%d):"
+    b"Gasto:"
+    b"Modo est\xc3\xa1ndar"
+    b"Est\xc3\xa1tico"
+    b"Estad\xc3\xadsticas para Entendidos"
+    b"Almacenar en Flash"
+    b"Almacenar en la Tarjeta SD"
+    b"Fuerza"
+    b"Fuerte"
+    b"Deslizar para cambiar de modo"
+    b"TC Hash Flash"
+    b"TC Flash Hash al arranque"
+    b"TOCA o ENTER para capturar"
+    b"TOCA o ENTER para instalar."
+    b"Clave interna TR"
+    b"TX Pin"
+    b"C\xc3\xb3digo de verificaci\xc3\xb3n"
+    b"C\xc3\xb3digo de verificaci\xc3\xb3n establecido con \xc3\xa9xito"
+    b"Los c\xc3\xb3digos de verificaci\xc3\xb3n no coinciden"
+    b"Suite de Pruebas"
+    b"Resultados de la suite de pruebas"
+    b"Prueba:"
+    b"Texto"
+    b"Tema"
+    b"T\xc3\xa9rmico"
+    b"Para garantizar que los datos no se puedan recuperar, utiliza la funci\xc3\xb3n de borrar dispositivo"
+    b"Alternar Brillo"
+    b"Herramientas"
+    b"Umbral T\xc3\xa1ctil"
+    b"Pantalla T\xc3\xa1ctil"
+    b"\xc2\xbfIntentar con mas?"
+    b"Escribe la Passphrase BIP39"
+    b"Introduce la clave"
+    b"Deshacer"
+    b"Unidad"
+    b"\xc2\xbfActualizar ID de Kef?"
+    b"\xc2\xbfActualizar etiqueta QR?"
+    b"Actualizaci\xc3\xb3n completa."
+    b"Usa una superficie de fondo negra."
+    b"Usa la entrop\xc3\xada de la c\xc3\xa1mara para crear una nueva mnem\xc3\xb3nica"
+    b"Valor Actual"
+    b"\xc2\xbfUsar el modo predeterminado?"
+    b"Utilice el iter PBKDF2 predeterminado.?"
+    b"\xc2\xbfUsar huella dactilar como identificaci\xc3\xb3n?"
+    b"Usado:"
+    b"Usuario"
+    b"Valor %s fuera del rango: [ %s, %s]"
+    b"Verificando\xe2\x80\xa6"
+    b"Versi\xc3\xb3n"
+    b"Desde C\xc3\xa1mara"
+    b"V\xc3\xada D20"
+    b"V\xc3\xada D6"
+    b"Introducci\xc3\xb3n Manual"
+    b"A Trav\xc3\xa9s de Palabras"
+    b"la etiqueta legible"
+    b"Espera la captura"
+    b"Cartera"
+    b"Descriptor de Cartera"
+    b"Descriptor de salida de cartera"
+    b"\xc2\xa1Se ha cargado el descriptor de salida de la cartera!"
+    b"No se encontr\xc3\xb3 el descriptor de salida de la cartera."
+    b"Advertencia:"
+    b"D\xc3\xa9bil"
+    b"Palabra %d"
+    b"N\xc3\xbameros de Palabra"
+    b"Palabras"
+    b"S\xc3\xad"
+    b"Modo ampliado"
+    b"binary: {} bytes"
+    b"failed:"
+    b"desde HEXADECIMAL"
+    b"desde base32"
+    b"desde base43"
+    b"desde base64"
+    b"desde hexadecimal"
+    b"desde utf8"
+    b"es una direcci\xc3\xb3n v\xc3\xa1lida!"
+    b"caja de cambio"
+    b"Tasa de \xc3\xa9xito:"
+    b"deslizar"
+    b"text: {} caracteres"
+    b"a HEXADECIMAL"
+    b"a base32"
+    b"a base43"
+    b"a base64"
+    b"a hexadecimal"
+    b"a utf8"
+    b"desconocido"
+    b"NO FUE ENCONTRADO en las primeras %d direcciones"
+)
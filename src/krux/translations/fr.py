@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% du montant.",
-    "%d de %d multisignature",
-    "%d à %d",
-    "%s bits (%s bits/px)",
-    "%s supprimé.",
-    "%s\u2009: chargé\u2009!",
-    "(Expérimental)",
-    "(consultation)",
-    "12 mots",
-    "24 mots",
-    "À propos",
-    "Accepter supposition\u2009?",
-    "Compte",
-    "Le compte n °0 serait supposé",
-    "Index du compte",
-    "Ajoutez ou modifiez la phrase secrète\u2009?",
-    "Entropie supplémentaire de la caméra requise pour %s",
-    "Adresse",
-    "Alignez correctement la caméra et plaque de sauvegarde.",
-    "Mode anti-reflets",
-    "Apparence",
-    "Es-tu sûr\u2009?",
-    "Couleurs BGR",
-    "Mnémonique BIP39",
-    "Retour",
-    "Retour au menu",
-    "Sauvegarde mnémonique",
-    "Signature non valide",
-    "Mot de passe Base64",
-    "Débit en bauds",
-    "Grille binaire",
-    "Rembourrage de bordure",
-    "Luminosité",
-    "Boutons",
-    "Anti-rebond des boutons",
-    "Capture annulée",
-    "Monnaie",
-    "Changer de thème et redémarrer\u2009?",
-    "La monnaie\u2009:",
-    "Les modifications dureront jusqu'à l'arrêt.",
-    "Vérifiez la carte SD",
-    "Vérifiez que l'adresse appartient à ce portefeuille\u2009?",
-    "%d adresses vérifiées sans correspondance.",
-    "Recherche de carte SD…",
-    "Confirmer le code de non compromis",
-    "Convertir le datum",
-    "Impossible de déterminer l'adresse de monnaie.",
-    "Créer un QR Code",
-    "Créer un code QR à partir de texte\u2009?",
-    "Créé\u2009:",
-    "Code de non compromis actuel",
-    "Code QR personnalisé",
-    "Texte personnalisé",
-    "Personnaliser",
-    "La personnalisation de votre portefeuille générera une nouvelle clé et déchargera le Descripteur.",
-    "Profondeur de coupe",
-    "Méthode de coupe",
-    "Outil Datum",
-    "Décimal",
-    "Déchiffrer\u2009?",
-    "Portefeuille par défaut",
-    "Supprimer ce fichier\u2009?",
-    "Profondeur par passage",
-    "Chemin de dérivation",
-    "Dériver l'entropie BIP85\u2009?",
-    "Adresses du descripteur",
-    "Tests de l'appareil",
-    "Affichage",
-    "Ne pas éteindre, cela peut prendre un certain temps.",
-    "Conversion terminée",
-    "Terminé\u2009?",
-    "Double mnémonique",
-    "Pilote",
-    "Vide",
-    "Activer\u2009?",
-    "Chiffrer",
-    "Chiffré",
-    "Code QR chiffré",
-    "Mnémonique chiffré stocké avec ID\u2009:",
-    "Le mnémonique chiffré n'a pas été stocké",
-    "Chiffrement",
-    "Mode de chiffrement",
-    "Entrez %d mots BIP39.",
-    "Saisissez un code de non compromis de plus de 6 caractères",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre de 1 à 2048.",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre en hexadécimal de 1 à 800.",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre en octal de 1 à 4000.",
-    "Entrez chaque mot de votre mnémonique BIP39.",
-    "Effacer les données de l'utilisateur",
-    "Effacement des données de l'utilisateur…",
-    "Erreur\u2009:",
-    "Esc",
-    "Explorer des fichiers\u2009?",
-    "Adresses d'exportation",
-    "Exportation de %s vers la carte SD…",
-    "Clé publique",
-    "Paramètres d'usine",
-    "Échec de la collecte de l'entropie de la caméra",
-    "Échec du déchiffrement",
-    "Échec lors du chargement",
-    "Échec du stockage mnémonique",
-    "Frais\u2009:",
-    "Taux d'alimentation",
-    "Nom de fichier",
-    "Le nom de fichier %s existe sur la carte SD.",
-    "Remplir le flash avec l'entropie de la caméra\u2009?",
-    "Remplissage du Flash",
-    "Empreinte digitale manquante dans PSBT",
-    "Plan du Flash",
-    "Outils Flash",
-    "Flash rempli par l'entropie de la caméra",
-    "Diamètre de flûte",
-    "Libre\u2009:",
-    "Du stockage",
-    "Effacez complètement votre carte SD dans un autre appareil pour assurer que les données soient irrécupérables",
-    "Générer un mnémonique",
-    "OK",
-    "Bonne entropie",
-    "Matériel",
-    "Type de tête",
-    "Clé publique hexadécimale\u2009:",
-    "Hexadécimal",
-    "Masquer les mnémoniques",
-    "Frais élevés\u2009!",
-    "ID",
-    "Id existe déjà",
-    "Index",
-    "Entrées (%d)\u2009:",
-    "Entropie insuffisante\u2009!",
-    "Code de non compromis non valide",
-    "Adresse invalide",
-    "Chemin de dérivation non valide",
-    "Longueur mnémonique invalide",
-    "Portefeuille invalide\u2009:",
-    "Inverser",
-    "Couleurs inversées",
-    "KEF chiffré",
-    "Clé",
-    "La clé n'a pas été fournie",
-    "Test de l'imprimante Krux QR",
-    "Type d'écran LCD",
-    "Langue",
-    "Laissez vide si vous souhaitez que Krux choisisse un dernier mot valide",
-    "Gauche",
-    "Longueur\u2009:",
-    "Délai de Ligne",
-    "Ligne\u2009:",
-    "Listage d'Addresses",
-    "Charger Mnémonique",
-    "Charger le portefeuille",
-    "Charger un descripteur de portefeuille de confiance pour afficher les adresses\u2009?",
-    "Charger depuis la carte SD",
-    "Charger depuis la carte SD\u2009?",
-    "Charger depuis la caméra",
-    "Charger\u2009?",
-    "Chargement de la caméra…",
-    "Chargement des adresses de monnaie…",
-    "Chargement de l'imprimante…",
-    "Chargement des adresses de réception…",
-    "Chargement…",
-    "Paramètres régionaux",
-    "Emplacement",
-    "Moyen",
-    "Message",
-    "Message\u2009:",
-    "Miniscript",
-    "Refléter coordonnées X",
-    "Fichier de signature manquant",
-    "Mnémonique",
-    "Mnémonique et phrase secrète seront conservés.",
-    "Modifié\u2009:",
-    "Native Segwit - 84 serait supposé",
-    "Réseau",
-    "Nouveau Mnémonique",
-    "Nouveau micrologiciel détecté.",
-    "Non",
-    "Pas de phrase secrète",
-    "Pas assez de jets\u2009!",
-    "Nombres",
-    "Octale",
-    "Autres formats",
-    "Écraser\u2009?",
-    "PAGE pour ajuster la luminosité",
-    "PBKDF2 iter.",
-    "Noircissez les points perforés afin qu'ils puissent être détectés.",
-    "Largeur du papier",
-    "Partie",
-    "Partie M de N",
-    "Taille de la pièce",
-    "Phrase secréte",
-    "Longueur du mot de passe",
-    "Inadéquation du chemin",
-    "Motif détecté\u2009!",
-    "Supprimer définitivement tous les mnémoniques et paramètres chiffrés stockés dans le flash\u2009?",
-    "Persistance",
-    "Indice de déviation des pixels\u2009:",
-    "QR en Texte Brut",
-    "Veuillez charger un descripteur de sortie de portefeuille",
-    "Taux de plongée",
-    "Type de politique",
-    "Entropie faible\u2009!",
-    "Puissance",
-    "Appuyez sur PAGE pour annuler.",
-    "PAGE pour changer de mode",
-    "Impression Test QR",
-    "Imprimer Tinyseed\u2009?",
-    "Imprimer Code QR",
-    "Imprimer Code QR\u2009?",
-    "Imprimer\u2009?",
-    "Imprimante",
-    "Le pilote d'imprimante n'est pas défini\u2009!",
-    "Impression…",
-    "Procéder quand même\u2009?",
-    "Procéder\u2009?",
-    "Traitement en cours…",
-    "Non-dépensable prouvé",
-    "Code QR",
-    "Texte d'étiquette QR",
-    "Quantité",
-    "RX Fiche",
-    "Redémarrer",
-    "Recevoir",
-    "Région\u2009:",
-    "Supprimer %s\u2009?",
-    "Supprimer mnémonique",
-    "Supprimer les fichiers micrologiciel de la carte SD\u2009?",
-    "Rés. - Format",
-    "Restaurer les paramètres d'usine et redémarrer\u2009?",
-    "Résultat",
-    "Retour au visualiseur QR",
-    "Revérifier",
-    "Examinez les données numérisées, modifiez-les si nécessaire",
-    "À droite",
-    "Lancez le dé au moins %d fois pour générer un mnémonique.",
-    "Distribution des jets\u2009:",
-    "Jets\u2009:",
-    "Rotation de 180°",
-    "Carte SD",
-    "Carte SD non détectée.",
-    "SHA256 de jets\u2009:",
-    "SHA256 de snapshot\u2009:",
-    "Enregistrer l'image QR sur la carte SD",
-    "Enregistrer sur la carte SD",
-    "Enregistrer sur la carte SD\u2009?",
-    "Enregistré sur la carte SD\u2009:",
-    "L'échelle",
-    "Scannez l'adresse",
-    "Scannez la phrase secrète BIP39",
-    "Scannez le Code QR de la clé",
-    "Analyser à nouveau les mots 1 à 12",
-    "Analyser les mots 13 à 24",
-    "Delai d'Inactivité",
-    "Type de Script",
-    "Sécurité",
-    "Auto-transfert ou monnaie (%d)\u2009:",
-    "Auto-transfert\u2009:",
-    "Définissez d'abord un code de non compromis",
-    "Paramètres",
-    "Paramètres stockés en interne sur flash.",
-    "Paramètres stockés sur la carte SD.",
-    "Entropie de Shannon\u2009:",
-    "Afficher le datum",
-    "Éteindre",
-    "Delai d'Arrêt",
-    "Arrêt en cours…",
-    "Signer",
-    "Signer avec le code QR",
-    "Signer sur la carte SD",
-    "Signer\u2009?",
-    "Signature\u2009:",
-    "Message signé",
-    "PSBT signé",
-    "Signature…",
-    "Clé unique",
-    "Capacité\u2009:",
-    "Certains vérifications ne peuvent pas être effectués.",
-    "Certains nœuds ne sont pas durcis :",
-    "Dépense (%d)\u2009:",
-    "Dépense\u2009:",
-    "Mode standard",
-    "Statique",
-    "Statistiques pour les geeks",
-    "Stocker sur flash",
-    "Stocker sur la carte SD",
-    "Force",
-    "Fort",
-    "Faites glisser pour changer de mode",
-    "TC Flash Hash",
-    "TC Flash Hash au démarrage",
-    "TOUCHEZ ou ENTRER pour capturer",
-    "TOUCHEZ ou ENTRER pour installer.",
-    "Clé interne TR",
-    "TX Fiche",
-    "Code de non compromis",
-    "Code de non compromis défini avec succès",
-    "Les codes de non compromis ne correspondent pas",
-    "Suite de Tests",
-    "Résultats de la suite de tests",
-    "Test:",
-    "Texte",
-    "Thème",
-    "Thermique",
-    "Pour assurer que les données soient irrécupérables, utilisez la fonctionnalité 'Effacer l'appareil'",
-    "Ajuster la luminosité",
-    "Outils",
-    "Sensibilité",
-    "Écran Tactile",
-    "Réessayer\u2009?",
-    "Entrez la phrase secrète BIP39",
-    "Taper clé",
-    "Annuler",
-    "Unité",
-    "Mettre à jour l'ID KEF\u2009?",
-    "Mettre à jour l'étiquette QR\u2009?",
-    "Mise à jour complète.",
-    "Utilisez une surface de fond noire.",
-    "Utilisez l'entropie de la caméra pour créer un nouveau mnémonique",
-    "Utiliser valeur actuelle",
-    "Utiliser le mode par défaut\u2009?",
-    "Utiliser l'itération PBKDF2 par défaut.\u2009?",
-    "Utiliser l'empreinte digitale comme pièce d'identité\u2009?",
-    "Utilisé\u2009:",
-    "Utilisateur",
-    "Valeur %s hors de portée: [%s, %s]",
-    "Vérification…",
-    "Version",
-    "Par caméra",
-    "Via D20",
-    "Via D6",
-    "Par saisie manuelle",
-    "Via Mots",
-    "sur une étiquette lisible",
-    "Attendez la capture",
-    "Portefeuille",
-    "Descripteur de Portefeuille",
-    "Descripteur de sortie du portefeuille",
-    "Descripteur de sortie du portefeuille chargé\u2009!",
-    "Descripteur de sortie du portefeuille introuvable.",
-    "Avertissement\u2009:",
-    "Faible",
-    "Mot %d",
-    "Numéros de mots",
-    "Mots",
-    "Oui",
-    "Mode zoomé",
-    "binaire\u2009: {} octets",
-    "echoué",
-    "depuis HEXA.",
-    "depuis base32",
-    "depuis base43",
-    "depuis base64",
-    "depuis hexa.",
-    "depuis utf8",
-    "Adresse valide\u2009!",
-    "casse des caractères",
-    "Taux de réussite:",
-    "glisser",
-    "texte\u2009: {} car.",
-    "vers HEXA.",
-    "vers base32",
-    "vers base43",
-    "vers base64",
-    "vers hexa.",
-    "vers utf8",
-    "inconnu",
-    "INTROUVABLE dans les %d premières adresses",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\r\x00(\x00[\x00r\x00z\x00\x8e\x00\x9b\x00\xad\x00\xbc\x00\xca\x00\xd1\x00\xd8\x00\xe1\x00\xf9\x00"
+    b"\xff\x00\x1e\x01-\x01W\x01\x8d\x01\x94\x01\xa4\x01\xdc\x01\xed\x01\xf6\x01\x04\x02\x10\x02!\x02'\x025\x02K\x02"
+    b"_\x02r\x02\x81\x02\x8f\x02\xa5\x02\xb0\x02\xb7\x02\xce\x02\xec\x02\xfc\x02\x03\x03'\x035\x03b\x03\x80\x03\x95\x03"
+    b"\xce\x03\xfa\x03\x12\x044\x04F\x04u\x04\x86\x04\xae\x04\xb8\x04\xd4\x04\xe9\x04\xfc\x04\t\x05n\x05\x81\x05\x92\x05"
+    b"\x9d\x05\xa5\x05\xb4\x05\xcc\x05\xe4\x05\xfa\x05\x0f\x06,\x06C\x06V\x06_\x06\x94\x06\xa8\x06\xb4\x06\xc6\x06\xcc\x06"
+    b"\xd0\x06\xdb\x06\xe3\x06\xeb\x06\xfb\x06#\x07P\x07[\x07n\x07\x83\x07\xbe\x07\x12\x08u\x08\xd2\x08\xff\x08$\t"
+    b"O\tY\t\\\tu\t\x8b\t\xb0\t\xbd\t\xd0\t\x01\n\x19\n2\nP\nY\nl\nz\n\xa6\n"
+    b"\xd8\n\xec\n\x12\x0b\x1f\x0b+\x0bT\x0bg\x0bp\x0b{\x0b\xec\x0b\xfb\x0b\x13\x0c\x15\x0c#\x0c,\x0c9\x0c"
+    b"X\x0cd\x0c|\x0c\x8e\x0c\x90\x0c\xa0\x0c\xa5\x0c\xb6\x0c\xcf\x0c\xef\x0c\xff\x0c\x1f\r<\rU\r]\rp\r"
+    b"|\r\x80\r\x9d\r\xb9\r\xca\r\xd0\r\x17\x0e\x1d\x0e)\x0e8\x0eA\x0eT\x0eg\x0e~\x0e\xd0\x0e\xea\x0e"
+    b"\x08\x0f!\x0f,\x0fG\x0fl\x0f\x89\x0f\xb1\x0f\xbe\x0f\xd4\x0f\xdf\x0f\xe4\x0f\xeb\x0f\xf6\x0f\x00\x10\x18\x105\x10"
+    b'@\x10q\x10}\x10\x9f\x10\xa6\x10\xb9\x10\xd9\x10\xdc\x10\xf2\x10\x07\x11\x15\x11\x1c\x11"\x110\x11<\x11\\\x11'
+    b"h\x11\xae\x11\xbf\x11\xc5\x11\xd2\x11\xe5\x11\xf4\x11\x0c\x12#\x126\x12\x99\x12\xa4\x12\xc7\x12\xd7\x12\x10\x13 \x13"
+    b"1\x13D\x13M\x13k\x13\x84\x13\x96\x13\xab\x13\xbb\x13\xcf\x13\xdb\x13\xe5\x13\x11\x14\x1e\x147\x14D\x14Z\x14"
+    b"q\x14x\x14\x8d\x14\x96\x14\x9e\x14\xa9\x14\xb1\x14\xbc\x14\xcc\x14\xe1\x14\x18\x15&\x15Z\x15c\x15{\x15\x86\x15"
+    b"\xc5\x15\xce\x15\x0b\x16$\x16,\x16=\x16E\x16]\x16o\x16\x85\x16\xab\x16\xc6\x16\xe5\x16\x04\x17\x0e\x17\x1f\x17"
+    b"?\x17\\\x17m\x17\x91\x17\xab\x17\xbe\x17\xcc\x17\xd6\x17\xf8\x17\n\x186\x18A\x18k\x18\x90\x18\xa7\x18\xb8\x18"
+    b"\xc1\x18\xcf\x18\xe1\x18\xe7\x18\xfd\x18\x13\x19\x1d\x19*\x198\x19C\x19O\x19Z\x19g\x19\x9f\x19\xc3\x19\xd4\x19"
+    b"\xe0\x19\xed\x19\xf5\x19\x10\x1a!\x1a8\x1a=\x1aA\x1ad\x1aq\x1a\x8c\x1a\xab\x1a\xcc\x1a\xdb\x1a\xe3\x1a\xf8\x1a"
+    b'"\x1bQ\x1b_\x1b~\x1b\x83\x1b\x88\x1b\x8e\x1b\x97\x1b\xfe\x1b\x14\x1c\x1a\x1c&\x1c4\x1cB\x1ca\x1ck\x1c'
+    b"r\x1cx\x1c\x93\x1c\xb5\x1c\xcc\x1c\xef\x1c3\x1dK\x1dk\x1d\x98\x1d\xd2\x1d\xde\x1d\xe9\x1d\x0c\x1e\x1c\x1e#\x1e"
+    b".\x1e5\x1e;\x1eN\x1eV\x1ep\x1e\x83\x1e\x8f\x1e\xaa\x1e\xcf\x1e\x00\x1f2\x1fC\x1fI\x1fO\x1f_\x1f"
+    b"c\x1ff\x1fq\x1f\x86\x1f\x8d\x1f\x99\x1f\xa6\x1f\xb3\x1f\xc0\x1f\xcc\x1f\xd7\x1f\xe9\x1f\xfe\x1f\x10 \x17 ( "
+    b"2 = H S ] f m \x98 "
+    b"% du montant."
+    b"%d codes QR, %ds par boucle"
+    b"%d adresses sur %d appartiennent \xc3\xa0 ce portefeuille"
+    b"%d de %d multisignature"
+    b"%d \xc3\xa0 %d"
+    b"%s bits (%s bits/px)"
+    b"%s supprim\xc3\xa9."
+    b"%s\xe2\x80\x89: charg\xc3\xa9\xe2\x80\x89!"
+    b"(Exp\xc3\xa9rimental)"
+    b"(consultation)"
+    b"12 mots"
+    b"24 mots"
+    b"\xc3\x80 propos"
+    b"Accepter supposition\xe2\x80\x89?"
+    b"Compte"
+    b"Le compte n \xc2\xb00 serait suppos\xc3\xa9"
+    b"Index du compte"
+    b"Ajoutez ou modifiez la phrase secr\xc3\xa8te\xe2\x80\x89?"
+    b"Entropie suppl\xc3\xa9mentaire de la cam\xc3\xa9ra requise pour %s"
+    b"Adresse"
+    b"Index d'adresses"
+    b"Alignez correctement la cam\xc3\xa9ra et plaque de sauvegarde."
+    b"Mode anti-reflets"
+    b"Apparence"
+    b"Es-tu s\xc3\xbbr\xe2\x80\x89?"
+    b"Couleurs BGR"
+    b"Mn\xc3\xa9monique BIP39"
+    b"Retour"
+    b"Retour au menu"
+    b"Sauvegarde mn\xc3\xa9monique"
+    b"Signature non valide"
+    b"Mot de passe Base64"
+    b"D\xc3\xa9bit en bauds"
+    b"Grille binaire"
+    b"Rembourrage de bordure"
+    b"Luminosit\xc3\xa9"
+    b"Boutons"
+    b"Anti-rebond des boutons"
+    b"Mettre le descripteur en cache"
+    b"Capture annul\xc3\xa9e"
+    b"Monnaie"
+    b"Changer de th\xc3\xa8me et red\xc3\xa9marrer\xe2\x80\x89?"
+    b"La monnaie\xe2\x80\x89:"
+    b"Les modifications dureront jusqu'\xc3\xa0 l'arr\xc3\xaat."
+    b"V\xc3\xa9rifier une liste d'adresses"
+    b"V\xc3\xa9rifiez la carte SD"
+    b"V\xc3\xa9rifiez que l'adresse appartient \xc3\xa0 ce portefeuille\xe2\x80\x89?"
+    b"%d adresses v\xc3\xa9rifi\xc3\xa9es sans correspondance."
+    b"Recherche de carte SD\xe2\x80\xa6"
+    b"Confirmer le code de non compromis"
+    b"Convertir le datum"
+    b"Impossible de d\xc3\xa9terminer l'adresse de monnaie."
+    b"Cr\xc3\xa9er un QR Code"
+    b"Cr\xc3\xa9er un code QR \xc3\xa0 partir de texte\xe2\x80\x89?"
+    b"Cr\xc3\xa9\xc3\xa9\xe2\x80\x89:"
+    b"Code de non compromis actuel"
+    b"Code QR personnalis\xc3\xa9"
+    b"Texte personnalis\xc3\xa9"
+    b"Personnaliser"
+    b"La personnalisation de votre portefeuille g\xc3\xa9n\xc3\xa9rera une nouvelle cl\xc3\xa9 et d\xc3\xa9chargera le Descripteur."
+    b"Profondeur de coupe"
+    b"M\xc3\xa9thode de coupe"
+    b"Outil Datum"
+    b"D\xc3\xa9cimal"
+    b"D\xc3\xa9chiffrer\xe2\x80\x89?"
+    b"Portefeuille par d\xc3\xa9faut"
+    b"Supprimer ce fichier\xe2\x80\x89?"
+    b"Profondeur par passage"
+    b"Chemin de d\xc3\xa9rivation"
+    b"D\xc3\xa9river l'entropie BIP85\xe2\x80\x89?"
+    b"Adresses du descripteur"
+    b"Tests de l'appareil"
+    b"Affichage"
+    b"Ne pas \xc3\xa9teindre, cela peut prendre un certain temps."
+    b"Conversion termin\xc3\xa9e"
+    b"Termin\xc3\xa9\xe2\x80\x89?"
+    b"Double mn\xc3\xa9monique"
+    b"Pilote"
+    b"Vide"
+    b"Activer\xe2\x80\x89?"
+    b"Chiffrer"
+    b"Chiffr\xc3\xa9"
+    b"Code QR chiffr\xc3\xa9"
+    b"Mn\xc3\xa9monique chiffr\xc3\xa9 stock\xc3\xa9 avec ID\xe2\x80\x89:"
+    b"Le mn\xc3\xa9monique chiffr\xc3\xa9 n'a pas \xc3\xa9t\xc3\xa9 stock\xc3\xa9"
+    b"Chiffrement"
+    b"Mode de chiffrement"
+    b"Entrez %d mots BIP39."
+    b"Saisissez un code de non compromis de plus de 6 caract\xc3\xa8res"
+    b"Entrez chaque mot de votre mn\xc3\xa9monique BIP39 sous la forme d'un nombre de 1 \xc3\xa0 2048."
+    b"Entrez chaque mot de votre mn\xc3\xa9monique BIP39 sous la forme d'un nombre en hexad\xc3\xa9cimal de 1 \xc3\xa0 800."
+    b"Entrez chaque mot de votre mn\xc3\xa9monique BIP39 sous la forme d'un nombre en octal de 1 \xc3\xa0 4000."
+    b"Entrez chaque mot de votre mn\xc3\xa9monique BIP39."
+    b"Effacer les donn\xc3\xa9es de l'utilisateur"
+    b"Effacement des donn\xc3\xa9es de l'utilisateur\xe2\x80\xa6"
+    b"Erreur\xe2\x80\x89:"
+    b"Esc"
+    b"Explorer des fichiers\xe2\x80\x89?"
+    b"Adresses d'exportation"
+    b"Exportation de %s vers la carte SD\xe2\x80\xa6"
+    b"Cl\xc3\xa9 publique"
+    b"Param\xc3\xa8tres d'usine"
+    b"\xc3\x89chec de la collecte de l'entropie de la cam\xc3\xa9ra"
+    b"\xc3\x89chec du d\xc3\xa9chiffrement"
+    b"\xc3\x89chec lors du chargement"
+    b"\xc3\x89chec du stockage mn\xc3\xa9monique"
+    b"Frais\xe2\x80\x89:"
+    b"Taux d'alimentation"
+    b"Nom de fichier"
+    b"Le nom de fichier %s existe sur la carte SD."
+    b"Remplir le flash avec l'entropie de la cam\xc3\xa9ra\xe2\x80\x89?"
+    b"Remplissage du Flash"
+    b"Empreinte digitale manquante dans PSBT"
+    b"Plan du Flash"
+    b"Outils Flash"
+    b"Flash rempli par l'entropie de la cam\xc3\xa9ra"
+    b"Diam\xc3\xa8tre de fl\xc3\xbbte"
+    b"Libre\xe2\x80\x89:"
+    b"Du stockage"
+    b"Effacez compl\xc3\xa8tement votre carte SD dans un autre appareil pour assurer que les donn\xc3\xa9es soient irr\xc3\xa9cup\xc3\xa9rables"
+    b"Limite d'\xc3\xa9cart"
+    b"G\xc3\xa9n\xc3\xa9rer un mn\xc3\xa9monique"
+    b"OK"
+    b"Bonne entropie"
+    b"Mat\xc3\xa9riel"
+    b"Type de t\xc3\xaate"
+    b"Cl\xc3\xa9 publique hexad\xc3\xa9cimale\xe2\x80\x89:"
+    b"Hexad\xc3\xa9cimal"
+    b"Masquer les mn\xc3\xa9moniques"
+    b"Frais \xc3\xa9lev\xc3\xa9s\xe2\x80\x89!"
+    b"ID"
+    b"Id existe d\xc3\xa9j\xc3\xa0"
+    b"Index"
+    b"Entr\xc3\xa9es (%d)\xe2\x80\x89:"
+    b"Entropie insuffisante\xe2\x80\x89!"
+    b"Code de non compromis non valide"
+    b"Adresse invalide"
+    b"Chemin de d\xc3\xa9rivation non valide"
+    b"Longueur mn\xc3\xa9monique invalide"
+    b"Portefeuille invalide\xe2\x80\x89:"
+    b"Inverser"
+    b"Couleurs invers\xc3\xa9es"
+    b"KEF chiffr\xc3\xa9"
+    b"Cl\xc3\xa9"
+    b"La cl\xc3\xa9 n'a pas \xc3\xa9t\xc3\xa9 fournie"
+    b"Test de l'imprimante Krux QR"
+    b"Type d'\xc3\xa9cran LCD"
+    b"Langue"
+    b"Laissez vide si vous souhaitez que Krux choisisse un dernier mot valide"
+    b"Gauche"
+    b"Longueur\xe2\x80\x89:"
+    b"D\xc3\xa9lai de Ligne"
+    b"Ligne\xe2\x80\x89:"
+    b"Listage d'Addresses"
+    b"Charger Mn\xc3\xa9monique"
+    b"Charger le portefeuille"
+    b"Charger un descripteur de portefeuille de confiance pour afficher les adresses\xe2\x80\x89?"
+    b"Charger depuis la carte SD"
+    b"Charger depuis la carte SD\xe2\x80\x89?"
+    b"Charger depuis la cam\xc3\xa9ra"
+    b"Charger\xe2\x80\x89?"
+    b"Chargement de la cam\xc3\xa9ra\xe2\x80\xa6"
+    b"Chargement des adresses de monnaie\xe2\x80\xa6"
+    b"Chargement de l'imprimante\xe2\x80\xa6"
+    b"Chargement des adresses de r\xc3\xa9ception\xe2\x80\xa6"
+    b"Chargement\xe2\x80\xa6"
+    b"Param\xc3\xa8tres r\xc3\xa9gionaux"
+    b"Emplacement"
+    b"Moyen"
+    b"Message"
+    b"Message\xe2\x80\x89:"
+    b"Miniscript"
+    b"Refl\xc3\xa9ter coordonn\xc3\xa9es X"
+    b"Fichier de signature manquant"
+    b"Mn\xc3\xa9monique"
+    b"Mn\xc3\xa9monique et phrase secr\xc3\xa8te seront conserv\xc3\xa9s."
+    b"Modifi\xc3\xa9\xe2\x80\x89:"
+    b"Native Segwit - 84 serait suppos\xc3\xa9"
+    b"R\xc3\xa9seau"
+    b"Nouveau Mn\xc3\xa9monique"
+    b"Nouveau micrologiciel d\xc3\xa9tect\xc3\xa9."
+    b"Non"
+    b"Pas de phrase secr\xc3\xa8te"
+    b"Pas assez de jets\xe2\x80\x89!"
+    b"Introuvables :"
+    b"Nombres"
+    b"Octale"
+    b"Autres formats"
+    b"\xc3\x89craser\xe2\x80\x89?"
+    b"PAGE pour ajuster la luminosit\xc3\xa9"
+    b"PBKDF2 iter."
+    b"Noircissez les points perfor\xc3\xa9s afin qu'ils puissent \xc3\xaatre d\xc3\xa9tect\xc3\xa9s."
+    b"Largeur du papier"
+    b"Partie"
+    b"Partie M de N"
+    b"Taille de la pi\xc3\xa8ce"
+    b"Phrase secr\xc3\xa9te"
+    b"Longueur du mot de passe"
+    b"Inad\xc3\xa9quation du chemin"
+    b"Motif d\xc3\xa9tect\xc3\xa9\xe2\x80\x89!"
+    b"Supprimer d\xc3\xa9finitivement tous les mn\xc3\xa9moniques et param\xc3\xa8tres chiffr\xc3\xa9s stock\xc3\xa9s dans le flash\xe2\x80\x89?"
+    b"Persistance"
+    b"Indice de d\xc3\xa9viation des pixels\xe2\x80\x89:"
+    b"QR en Texte Brut"
+    b"Veuillez charger un descripteur de sortie de portefeuille"
+    b"Taux de plong\xc3\xa9e"
+    b"Type de politique"
+    b"Entropie faible\xe2\x80\x89!"
+    b"Puissance"
+    b"Appuyez sur PAGE pour annuler."
+    b"PAGE pour changer de mode"
+    b"Impression Test QR"
+    b"Imprimer Tinyseed\xe2\x80\x89?"
+    b"Imprimer Code QR"
+    b"Imprimer Code QR\xe2\x80\x89?"
+    b"Imprimer\xe2\x80\x89?"
+    b"Imprimante"
+    b"Le pilote d'imprimante n'est pas d\xc3\xa9fini\xe2\x80\x89!"
+    b"Impression\xe2\x80\xa6"
+    b"Proc\xc3\xa9der quand m\xc3\xaame\xe2\x80\x89?"
+    b"Proc\xc3\xa9der\xe2\x80\x89?"
+    b"Traitement en cours\xe2\x80\xa6"
+    b"Non-d\xc3\xa9pensable prouv\xc3\xa9"
+    b"Code QR"
+    b"Texte d'\xc3\xa9tiquette QR"
+    b"Quantit\xc3\xa9"
+    b"RX Fiche"
+    b"Red\xc3\xa9marrer"
+    b"Recevoir"
+    b"R\xc3\xa9gion\xe2\x80\x89:"
+    b"Supprimer %s\xe2\x80\x89?"
+    b"Supprimer mn\xc3\xa9monique"
+    b"Supprimer les fichiers micrologiciel de la carte SD\xe2\x80\x89?"
+    b"R\xc3\xa9s. - Format"
+    b"Restaurer les param\xc3\xa8tres d'usine et red\xc3\xa9marrer\xe2\x80\x89?"
+    b"R\xc3\xa9sultat"
+    b"Retour au visualiseur QR"
+    b"Rev\xc3\xa9rifier"
+    b"Examinez les donn\xc3\xa9es num\xc3\xa9ris\xc3\xa9es, modifiez-les si n\xc3\xa9cessaire"
+    b"\xc3\x80 droite"
+    b"Lancez le d\xc3\xa9 au moins %d fois pour g\xc3\xa9n\xc3\xa9rer un mn\xc3\xa9monique."
+    b"Distribution des jets\xe2\x80\x89:"
+    b"Jets\xe2\x80\x89:"
+    b"Rotation de 180\xc2\xb0"
+    b"Carte SD"
+    b"Carte SD non d\xc3\xa9tect\xc3\xa9e."
+    b"SHA256 de jets\xe2\x80\x89:"
+    b"SHA256 de snapshot\xe2\x80\x89:"
+    b"Enregistrer l'image QR sur la carte SD"
+    b"Enregistrer sur la carte SD"
+    b"Enregistrer sur la carte SD\xe2\x80\x89?"
+    b"Enregistr\xc3\xa9 sur la carte SD\xe2\x80\x89:"
+    b"L'\xc3\xa9chelle"
+    b"Scannez l'adresse"
+    b"Scannez la phrase secr\xc3\xa8te BIP39"
+    b"Scannez le Code QR de la cl\xc3\xa9"
+    b"Profilage du scan"
+    b"Analyser \xc3\xa0 nouveau les mots 1 \xc3\xa0 12"
+    b"Analyser les mots 13 \xc3\xa0 24"
+    b"Delai d'Inactivit\xc3\xa9"
+    b"Type de Script"
+    b"S\xc3\xa9curit\xc3\xa9"
+    b"Auto-transfert ou monnaie (%d)\xe2\x80\x89:"
+    b"Auto-transfert\xe2\x80\x89:"
+    b"D\xc3\xa9finissez d'abord un code de non compromis"
+    b"Param\xc3\xa8tres"
+    b"Param\xc3\xa8tres stock\xc3\xa9s en interne sur flash."
+    b"Param\xc3\xa8tres stock\xc3\xa9s sur la carte SD."
+    b"Entropie de Shannon\xe2\x80\x89:"
+    b"Afficher le datum"
+    b"\xc3\x89teindre"
+    b"Delai d'Arr\xc3\xaat"
+    b"Arr\xc3\xaat en cours\xe2\x80\xa6"
+    b"Signer"
+    b"Signer avec le code QR"
+    b"Signer sur la carte SD"
+    b"Signer\xe2\x80\x89?"
+    b"Signature\xe2\x80\x89:"
+    b"Message sign\xc3\xa9"
+    b"PSBT sign\xc3\xa9"
+    b"Signature\xe2\x80\xa6"
+    b"Cl\xc3\xa9 unique"
+    b"Capacit\xc3\xa9\xe2\x80\x89:"
+    b"Certains v\xc3\xa9rifications ne peuvent pas \xc3\xaatre effectu\xc3\xa9s."
+    b"Certains n\xc5\x93uds ne sont pas durcis :"
+    b"D\xc3\xa9pense (%d)\xe2\x80\x89:"
+    b"D\xc3\xa9pense\xe2\x80\x89:"
+    b"Mode standard"
+    b"Statique"
+    b"Statistiques pour les geeks"
+    b"Stocker sur flash"
+    b"Stocker sur la carte SD"
+    b"Force"
+    b"Fort"
+    b"Faites glisser pour changer de mode"
+    b"TC Flash Hash"
+    b"TC Flash Hash au d\xc3\xa9marrage"
+    b"TOUCHEZ ou ENTRER pour capturer"
+    b"TOUCHEZ ou ENTRER pour installer."
+    b"Cl\xc3\xa9 interne TR"
+    b"TX Fiche"
+    b"Code de non compromis"
+    b"Code de non compromis d\xc3\xa9fini avec succ\xc3\xa8s"
+    b"Les codes de non compromis ne correspondent pas"
+    b"Suite de Tests"
+    b"R\xc3\xa9sultats de la suite de tests"
+    b"Test:"
+    b"Texte"
+    b"Th\xc3\xa8me"
+    b"Thermique"
+    b"Pour assurer que les donn\xc3\xa9es soient irr\xc3\xa9cup\xc3\xa9rables, utilisez la fonctionnalit\xc3\xa9 'Effacer l'appareil'"
+    b"Ajuster la luminosit\xc3\xa9"
+    b"Outils"
+    b"Sensibilit\xc3\xa9"
+    b"\xc3\x89cran Tactile"
+    b"R\xc3\xa9essayer\xe2\x80\x89?"
+    b"Entrez la phrase secr\xc3\xa8te BIP39"
+    b"Taper cl\xc3\xa9"
+    b"Annuler"
+    b"Unit\xc3\xa9"
+    b"Mettre \xc3\xa0 jour l'ID KEF\xe2\x80\x89?"
+    b"Mettre \xc3\xa0 jour l'\xc3\xa9tiquette QR\xe2\x80\x89?"
+    b"Mise \xc3\xa0 jour compl\xc3\xa8te."
+    b"Utilisez une surface de fond noire."
+    b"Utilisez l'entropie de la cam\xc3\xa9ra pour cr\xc3\xa9er un nouveau mn\xc3\xa9monique"
+    b"Utiliser valeur actuelle"
+    b"Utiliser le mode par d\xc3\xa9faut\xe2\x80\x89?"
+    b"Utiliser l'it\xc3\xa9ration PBKDF2 par d\xc3\xa9faut.\xe2\x80\x89?"
+    b"Utiliser l'empreinte digitale comme pi\xc3\xa8ce d'identit\xc3\xa9\xe2\x80\x89?"
+    b"Utilis\xc3\xa9\xe2\x80\x89:"
+    b"Utilisateur"
+    b"Valeur %s hors de port\xc3\xa9e: [%s, %s]"
+    b"V\xc3\xa9rification\xe2\x80\xa6"
+    b"Version"
+    b"Par cam\xc3\xa9ra"
+    b"Via D20"
+    b"Via D6"
+    b"Par saisie manuelle"
+    b"Via Mots"
+    b"sur une \xc3\xa9tiquette lisible"
+    b"Attendez la capture"
+    b"Portefeuille"
+    b"Descripteur de Portefeuille"
+    b"Descripteur de sortie du portefeuille"
+    b"Descripteur de sortie du portefeuille charg\xc3\xa9\xe2\x80\x89!"
+    b"Descripteur de sortie du portefeuille introuvable."
+    b"Avertissement\xe2\x80\x89:"
+    b"Faible"
+    b"Mot %d"
+    b"Num\xc3\xa9ros de mots"
+    b"Mots"
+    b"Oui"
+    b"Mode zoom\xc3\xa9"
+    b"binaire\xe2\x80\x89: {} octets"
+    b"echou\xc3\xa9"
+    b"depuis HEXA."
+    b"depuis base32"
+    b"depuis base43"
+    b"depuis base64"
+    b"depuis hexa."
+    b"depuis utf8"
+    b"Adresse valide\xe2\x80\x89!"
+    b"casse des caract\xc3\xa8res"
+    b"Taux de r\xc3\xa9ussite:"
+    b"glisser"
+    b"texte\xe2\x80\x89: {} car."
+    b"vers HEXA."
+    b"vers base32"
+    b"vers base43"
+    b"vers base64"
+    b"vers hexa."
+    b"vers utf8"
+    b"inconnu"
+    b"INTROUVABLE dans les %d premi\xc3\xa8res adresses"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% の金額.",
-    "%d の%d マルチシグネチャ",
-    "%d へ %d",
-    "%sビット(%sビット/px)",
-    "%s 削除されました.",
-    "%s:読み込まれました!",
-    "(実験的)",
-    "(閲覧専用)",
-    "12の単語",
-    "24の単語",
-    "概要",
-    "仮定を受け入れますか?",
-    "アカウント",
-    "アカウント#0は仮定されます",
-    "アカウントインデックス",
-    "ウォレットのパスフレーズを追加または変更しますか?",
-    "%sにはカメラからの追加エントロピーが必要です",
-    "アドレス",
-    "カメラとバックプレートを正しく整列させてください.",
-    "アンチグレアモード",
-    "外観",
-    "よろしいですか?",
-    "BGRカラー",
-    "BIP39 Mnemonic",
-    "戻る",
-    "メニューへ戻る",
-    "ニーモニックのバックアップ",
-    "無効なサイン",
-    "Base64パスワード",
-    "Baudrate",
-    "バイナリグリッド",
-    "ボーダーパディング",
-    "明るさ",
-    "ボタン",
-    "ボタンのデバウンス",
-    "キャプチャがキャンセルされました",
-    "お釣り",
-    "テーマの変更と再起動しますか?",
-    "お釣り:",
-    "変更はシャットダウンするまで持続します.",
-    "SDカードを確認する",
-    "このアドレスがこのウォレットに属しているか確認しますか?",
-    "%d のアドレスを確認しましたが、一致するものはありませんでした.",
-    "SDカードを確認しています…",
-    "改ざんチェックコードの確認",
-    "データムの変換",
-    "変更先住所を特定できませんでした.",
-    "QRコードを作成",
-    "テキストからQRコードを作成しますか?",
-    "作成されました:",
-    "現在の改ざんチェックコード",
-    "カスタムQRコード",
-    "カスタムテキスト",
-    "カスタマイズする",
-    "ウォレットをカスタマイズすると、新しいキーが生成され、記述子がアンロードされます.",
-    "カットの深さ",
-    "カット方法",
-    "データムツール",
-    "デシマル",
-    "デクリプト?",
-    "デフォルトの財布",
-    "このファイルを削除しますか?",
-    "パスごとの深さ",
-    "導出パス",
-    "BIP85エントロピーを導出しますか?",
-    "ディスクリプタアドレス",
-    "デバイステスト",
-    "ディスプレイ",
-    "完了するまで電源を切らないでください.",
-    "変換を完了する",
-    "完了?",
-    "ダブルニーモニック",
-    "ドライバー",
-    "空",
-    "有効化?",
-    "暗号化",
-    "暗号化されました",
-    "暗号化されたQRコード",
-    "暗号化されたニーモニックがIDとともに保存されました:",
-    "暗号化されたニーモニックが保存されませんでした",
-    "暗号化",
-    "暗号化モード",
-    "%d のBIP39ワードを入力してください.",
-    "6文字以上の改ざんチェックコードを入力してください",
-    "あなたのBIP39ニーモニックの各単語を1から2048の番号で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を1から800の16進数で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を1から4000の8進数で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を入力してください.",
-    "ユーザーのデータを消去する",
-    "ユーザーのデータを消去しています…",
-    "エラー:",
-    "エスク",
-    "アーカイブ探索?",
-    "住所をエクスポート",
-    "%sをSDカードにエクスポートしています…",
-    "拡張公開キー",
-    "初期設定",
-    "カメラエントロピーの収集に失敗しました",
-    "復号化に失敗しました",
-    "ロードに失敗しました",
-    "mnemonicの保存に失敗しました",
-    "手数料:",
-    "フィードレート",
-    "ファイル名",
-    "ファイル名 %s が SD カードに存在します.",
-    "カメラからのエントロピーでフラッシュを埋めますか?",
-    "フラッシュを充填中",
-    "PSBTでデジタル指紋が未設定",
-    "フラッシュマップ",
-    "Flashツール",
-    "カメラエントロピーで満たされたフラッシュ",
-    "フルートディアメーター",
-    "フリー:",
-    "ストレージから",
-    "データが復元できないように、他のデバイスでSDカードを完全に消去してください",
-    "Mnemonicを生成する",
-    "行く",
-    "良いentropy",
-    "ハードウェア",
-    "ヘッドタイプ",
-    "Hex公開キー:",
-    "エクサデシマル",
-    "Mnemonicsを隠す",
-    "高い手数料！",
-    "ID",
-    "IDはすでに存在します",
-    "インデックス",
-    "インプット(%d):",
-    "不十分なエントロピー!",
-    "無効な改ざんチェックコード",
-    "無効なアドレス",
-    "無効な導出パス",
-    "無効なニーモニックの長さ",
-    "無効なウォレット:",
-    "反転する",
-    "反転した色",
-    "暗号化されたKEF",
-    "キー",
-    "キーが提供されていません",
-    "KruxプリンターテストQR",
-    "LCDタイプ",
-    "言語 ",
-    "有効な最終単語をKruxに選んでもらいたい場合は、空白のままにしてください",
-    "左",
-    "長さ:",
-    "ライン遅延",
-    "ライン:",
-    "アドレスリスト",
-    "ニーモニックをロード",
-    "ウォレットをロード",
-    "信頼できるウォレット記述子をロードしてアドレスを表示しますか?",
-    "SDカードからロード ",
-    "SDカードからロードしますか?",
-    "カメラからロード",
-    "ロードしますか?",
-    "カメラを読み込んでいます…",
-    "変更住所を読み込んでいます…",
-    "プリンタを読み込んでいます…",
-    "受信アドレスを読み込んでいます…",
-    "読込中…",
-    "ロケール",
-    "場所",
-    "中間",
-    "メッセージ",
-    "メッセージ:",
-    "ミニスクリプト",
-    "ミラーX座標",
-    "署名ファイルが欠落しています",
-    "Mnemonic",
-    "Mnemonicとパスフレーズは保持されます.",
-    "修正されました:",
-    "ネイティブSegwit - 84が仮定されます",
-    "ネットワーク",
-    "新しい Mnemonic",
-    "新しいファームウェアが検出されました.",
-    "いいえ",
-    "パスフレーズなし",
-    "ロールが足りません!",
-    "数字",
-    "Octal",
-    "他のフォーマット",
-    "上書きしますか?",
-    "明るさを切り替えるPAGE",
-    "PBKDF 2 iter.",
-    "検出できるように、穴あけされた点を黒く塗ってください.",
-    "用紙幅 ",
-    "パーツ",
-    "NのパートM",
-    "パーツサイズ",
-    "パスワード",
-    "パスワードの長さ",
-    "パスの不一致",
-    "パターンが検出されました!",
-    "フラッシュからすべての保存された暗号化mnemonicsと設定を永久に削除しますか?",
-    "永続させる",
-    "ピクセル偏差指数:",
-    "プレーンテキストQR",
-    "ウォレットの出力記述子をロードしてください",
-    "沈下率",
-    "証券の種類",
-    "低品質なエントロピー!",
-    "出力",
-    "PAGEを押してキャンセルします.",
-    "PAGEを押してモードを切り替えます",
-    "テストQRを印刷",
-    "Tinyseedを印刷しますか?",
-    "QRを印刷",
-    "QRを印刷しますか?",
-    "印刷?",
-    "プリンター ",
-    "プリンタードライバーが設定されていません!",
-    "印刷しています…",
-    "そのまま進みますか?",
-    "進みますか?",
-    "処理中…",
-    "証明可能に使用不能",
-    "QRコード",
-    "QRラベル",
-    "数量",
-    "RXピン",
-    "再起動",
-    "受け取る",
-    "地域:",
-    "%sを削除しますか?",
-    "ニーモニックを削除",
-    "SDカードからファームウェアファイルを削除しますか?",
-    "Res. - フォーマット",
-    "初期化を復元して再起動しますか?",
-    "結果",
-    "QRビューワーに戻る",
-    "もう一度確認する",
-    "スキャンしたデータを確認し、必要に応じて編集します",
-    "右",
-    "mnemonicを生成するには、少なくとも%d回サイコロを振ってください.",
-    "ロールの分布:",
-    "ロール:",
-    "180°回転",
-    "SDカード",
-    "SDカードが検出されません.",
-    "ロールのSHA256:",
-    "画像のSHA256:",
-    "QR画像をSDカードに保存する",
-    "SDカードに保存する",
-    "SDカードに保存しますか?",
-    "SDカードに保存しました:",
-    "スケール",
-    "アドレススキャン",
-    "BIP39パスフレーズをスキャンする",
-    "キーのQRコードをスキャンする",
-    "単語1-12を再度スキャン中",
-    "単語13-24をスキャン中",
-    "スクリーンセーバーの時間",
-    "スクリプトタイプ",
-    "セキュリティa",
-    "自己転送または変更（%d）:",
-    "自己転送:",
-    "最初に改ざんチェックコードを設定する",
-    "設定",
-    "設定はフラッシュメモリに内部保存されています.",
-    "設定はSDカードに保存されています.",
-    "シャノンのエントロピー:",
-    "データムを表示",
-    "シャットダウン",
-    "シャットダウン時間",
-    "シャットダウンしています…",
-    "署名",
-    "QRコードにサインする",
-    "SDカードにサインする",
-    "サインしますか?",
-    "サイン:",
-    "サイン付きメッセージ",
-    "サインされたPSBT",
-    "署名…",
-    "シングルサイン",
-    "サイズ:",
-    "一部のチェックを実行できません.",
-    "一部のノードは硬化されていません:",
-    "支出（%d）:",
-    "支出:",
-    "標準モード",
-    "静止画",
-    "オタクのための統計",
-    "フラッシュに保存する",
-    "SDカードに保存する",
-    "強度",
-    "強力",
-    "スワイプしてモードを変更する",
-    "TCフラッシュハッシュ",
-    "起動時のTCフラッシュハッシュ",
-    "タッチまたはENTERでキャプチャする",
-    "タップするかEnterキーを押してインストールします.",
-    "TR内部キー",
-    "TXピン",
-    "改ざんチェックコード",
-    "改ざんチェックコードが正常に設定されました",
-    "改ざんチェックコードが一致しません",
-    "テストスイート",
-    "テストスイートの結果",
-    "テスト:",
-    "テキスト",
-    "テーマ",
-    "サーマル",
-    "データが復元不可能であることを確実にするには、デバイス消去機能を使用してください",
-    "明るさを切り替える",
-    "ツール",
-    "タッチスレッショルド",
-    "タッチスクリーン",
-    "もっと試してみますか?",
-    "BIP39パスフレーズを入力してください",
-    "キーを入力する",
-    "取り消し",
-    "ユニット",
-    "KEF IDを更新しますか?",
-    "QRラベルを更新しますか?",
-    "アップグレードが完了しました.",
-    "黒い背景面を使用してください.",
-    "カメラのエントロピーを使用して新しいmnemonicを作成してください",
-    "現在価値",
-    "1行目をデフォルトにする",
-    "デフォルトのPBKDF 2イテールを使用します.",
-    "指紋をIDとして使用しますか?",
-    "使用済み:",
-    "ユーザーのデータ",
-    "値%sが範囲外です: [ %s, %s]",
-    "認証中…",
-    "バージョン",
-    "カメラ経由",
-    "D20経由",
-    "D6経由",
-    "手動入力経由",
-    "言葉経由",
-    "表示ラベル",
-    "キャプチャを待ってください",
-    "ワレット",
-    "ウォレットディスクリプター",
-    "ウォレット出力ディスクリプター",
-    "ウォレット出力ディスクリプターがロードされました！",
-    "ウォレット出力ディスクリプターが見つかりません.",
-    "警告:",
-    "脆弱",
-    "単語 %d",
-    "単語番号",
-    "単語",
-    "はい",
-    "ズームモード",
-    "バイナリ： {}バイト",
-    "失敗",
-    "16進数から",
-    "base 32から",
-    "base 43から",
-    "base 64から",
-    "16進数から",
-    "utf 8から",
-    "有効なアドレスです！",
-    "シフトケース",
-    "成功率:",
-    "スワイプ",
-    "text: {}文字",
-    "16進数に",
-    "base 32に",
-    "base 43に",
-    "base 64に",
-    "16進数に",
-    "utf 8へ",
-    "不明",
-    "最初の%dアドレスに見つかりませんでした",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0c\x00*\x00x\x00\x99\x00\xa2\x00\xbd\x00\xd6\x00\xf2\x00\xfd\x00\x0b\x01\x16\x01!\x01'\x01F\x01"
+    b"U\x01{\x01\x9c\x01\xe5\x01&\x022\x02P\x02\x99\x02\xb4\x02\xba\x02\xd0\x02\xdc\x02\xea\x02\xf0\x02\x05\x03,\x03"
+    b">\x03S\x03[\x03s\x03\x8e\x03\x97\x03\xa0\x03\xbb\x03\xe5\x03\x15\x04\x1e\x04I\x04S\x04\x8d\x04\xab\x04\xc5\x04"
+    b"\x17\x05r\x05\x98\x05\xbf\x05\xd4\x05\x05\x06\x19\x06L\x06b\x06\x89\x06\xa0\x06\xb8\x06\xd0\x06I\x07[\x07j\x07"
+    b"\x7f\x07\x8b\x07\x9b\x07\xb3\x07\xdb\x07\xf0\x07\xfc\x07)\x08J\x08_\x08q\x08\xa8\x08\xbd\x08\xc4\x08\xdf\x08\xee\x08"
+    b'\xf1\x08\xfb\x08\x04\t\x1c\t9\t\x84\t\xc9\t\xd2\t\xe4\t\x14\n]\n\xbf\n"\x0b\x85\x0b\xd0\x0b\xf7\x0b'
+    b"*\x0c4\x0c=\x0cS\x0cn\x0c\xa5\x0c\xb7\x0c\xc3\x0c\xfc\x0c\x1a\r8\r^\rh\r}\r\x8c\r\xc2\r"
+    b"\x0b\x0e&\x0eK\x0ec\x0eq\x0e\xad\x0e\xce\x0e\xd8\x0e\xed\x0e[\x0fs\x0f\x8a\x0f\x90\x0f\x9d\x0f\xaf\x0f\xc1\x0f"
+    b"\xd1\x0f\xe6\x0f\xf8\x0f\n\x10\x0c\x10)\x10;\x10O\x10n\x10\x95\x10\xaa\x10\xbf\x10\xe3\x10\xfc\x10\x08\x11\x17\x11"
+    b",\x112\x11V\x11t\x11\x80\x11\x87\x11\xee\x11\xf1\x11\xf8\x11\x07\x12\x11\x12&\x12D\x12_\x12\xba\x12\xd5\x12"
+    b"\xfc\x12\x14\x13*\x13Q\x13{\x13\xa5\x13\xd5\x13\xe1\x13\xed\x13\xf3\x13\xf9\x13\x08\x14\x18\x14-\x14=\x14g\x14"
+    b"o\x14\xa2\x14\xb8\x14\xe7\x14\xf9\x14\x0b\x15B\x15K\x15c\x15\x7f\x15\x95\x15\x9b\x15\xa0\x15\xb8\x15\xce\x15\xed\x15"
+    b"\xfa\x15I\x16S\x16\\\x16j\x16|\x16\x8b\x16\xa3\x16\xb5\x16\xda\x16D\x17S\x17l\x17\x86\x17\xc5\x17\xce\x17"
+    b"\xdd\x17\xfc\x17\x02\x18+\x18Y\x18m\x18\x8b\x18\x96\x18\xae\x18\xb5\x18\xc5\x18\x02\x19\x1a\x196\x19F\x19R\x19"
+    b"m\x19x\x19\x83\x19\x89\x19\x91\x19\x9a\x19\xa6\x19\xad\x19\xc5\x19\xe0\x19(\x1aA\x1ao\x1au\x1a\x8f\x1a\xa7\x1a"
+    b"\xf2\x1a\xf5\x1aN\x1ba\x1bk\x1bv\x1b\x81\x1b\xa5\x1b\xb8\x1b\xc8\x1b\xed\x1b\x07\x1c(\x1cI\x1cU\x1cm\x1c"
+    b"\x99\x1c\xc2\x1c\xe9\x1c\x0b\x1d(\x1dL\x1dd\x1dw\x1d\x9b\x1d\xa8\x1d\xde\x1d\xe4\x1d'\x1eW\x1ey\x1e\x8e\x1e"
+    b"\xa3\x1e\xbe\x1e\xe5\x1e\xeb\x1e\x08\x1f%\x1f;\x1fE\x1fc\x1fy\x1f\x82\x1f\x97\x1f\xa1\x1f\xcf\x1f\x00 \x0f "
+    b"\x16 % . I g \x81 \x87 \x8d \xb7 \xd4 \xfd ,!q!\x7f!\x87!\xa5!"
+    b'\xe4!\x17","J"T"`"i"u"\xed"\x08#\x11#/#G#f#\x98#\xad#'
+    b"\xb9#\xc5#\xe1#\x02$-$X$\xb1$\xbd$\xdf$\x17%>%K%c%\x85%\x91%\xa0%"
+    b"\xaf%\xb8%\xc0%\xd2%\xde%\xed%\x14& &G&t&\xbf&\x05'\x0c'\x12'\x1b'''"
+    b"-'3'E'`'f't'\x81'\x8e'\x9b'\xa9'\xb4'\xd2'\xe4'\xee'\xfa'\x08("
+    b"\x13(\x1d('(1(<(D(J(\x82("
+    b"% \xe3\x81\xae\xe9\x87\x91\xe9\xa1\x8d."
+    b"QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89 %d \xe5\x80\x8b, 1\xe5\x91\xa8 %d\xe7\xa7\x92"
+    b"%d \xe4\xbb\xb6\xe3\x81\xae\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\x8c\xe3\x81\x93\xe3\x81\xae\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\xab\xe5\xb1\x9e\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99(\xe5\x85\xa8 %d \xe4\xbb\xb6)"
+    b"%d \xe3\x81\xae%d \xe3\x83\x9e\xe3\x83\xab\xe3\x83\x81\xe3\x82\xb7\xe3\x82\xb0\xe3\x83\x8d\xe3\x83\x81\xe3\x83\xa3"
+    b"%d \xe3\x81\xb8 %d"
+    b"%s\xe3\x83\x93\xe3\x83\x83\xe3\x83\x88(%s\xe3\x83\x93\xe3\x83\x83\xe3\x83\x88/px)"
+    b"%s \xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f."
+    b"%s:\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x81\xbe\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f!"
+    b"(\xe5\xae\x9f\xe9\xa8\x93\xe7\x9a\x84)"
+    b"(\xe9\x96\xb2\xe8\xa6\xa7\xe5\xb0\x82\xe7\x94\xa8)"
+    b"12\xe3\x81\xae\xe5\x8d\x98\xe8\xaa\x9e"
+    b"24\xe3\x81\xae\xe5\x8d\x98\xe8\xaa\x9e"
+    b"\xe6\xa6\x82\xe8\xa6\x81"
+    b"\xe4\xbb\xae\xe5\xae\x9a\xe3\x82\x92\xe5\x8f\x97\xe3\x81\x91\xe5\x85\xa5\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xa2\xe3\x82\xab\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x88"
+    b"\xe3\x82\xa2\xe3\x82\xab\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x88#0\xe3\x81\xaf\xe4\xbb\xae\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe3\x82\xa2\xe3\x82\xab\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x88\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb9"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\xae\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x82\x92\xe8\xbf\xbd\xe5\x8a\xa0\xe3\x81\xbe\xe3\x81\x9f\xe3\x81\xaf\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"%s\xe3\x81\xab\xe3\x81\xaf\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89\xe3\x81\xae\xe8\xbf\xbd\xe5\x8a\xa0\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\x8c\xe5\xbf\x85\xe8\xa6\x81\xe3\x81\xa7\xe3\x81\x99"
+    b"\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9"
+    b"\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb9"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\xa8\xe3\x83\x90\xe3\x83\x83\xe3\x82\xaf\xe3\x83\x97\xe3\x83\xac\xe3\x83\xbc\xe3\x83\x88\xe3\x82\x92\xe6\xad\xa3\xe3\x81\x97\xe3\x81\x8f\xe6\x95\xb4\xe5\x88\x97\xe3\x81\x95\xe3\x81\x9b\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x82\xa2\xe3\x83\xb3\xe3\x83\x81\xe3\x82\xb0\xe3\x83\xac\xe3\x82\xa2\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe5\xa4\x96\xe8\xa6\xb3"
+    b"\xe3\x82\x88\xe3\x82\x8d\xe3\x81\x97\xe3\x81\x84\xe3\x81\xa7\xe3\x81\x99\xe3\x81\x8b?"
+    b"BGR\xe3\x82\xab\xe3\x83\xa9\xe3\x83\xbc"
+    b"BIP39 Mnemonic"
+    b"\xe6\x88\xbb\xe3\x82\x8b"
+    b"\xe3\x83\xa1\xe3\x83\x8b\xe3\x83\xa5\xe3\x83\xbc\xe3\x81\xb8\xe6\x88\xbb\xe3\x82\x8b"
+    b"\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe3\x83\x90\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xa2\xe3\x83\x83\xe3\x83\x97"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3"
+    b"Base64\xe3\x83\x91\xe3\x82\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89"
+    b"Baudrate"
+    b"\xe3\x83\x90\xe3\x82\xa4\xe3\x83\x8a\xe3\x83\xaa\xe3\x82\xb0\xe3\x83\xaa\xe3\x83\x83\xe3\x83\x89"
+    b"\xe3\x83\x9c\xe3\x83\xbc\xe3\x83\x80\xe3\x83\xbc\xe3\x83\x91\xe3\x83\x87\xe3\x82\xa3\xe3\x83\xb3\xe3\x82\xb0"
+    b"\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95"
+    b"\xe3\x83\x9c\xe3\x82\xbf\xe3\x83\xb3"
+    b"\xe3\x83\x9c\xe3\x82\xbf\xe3\x83\xb3\xe3\x81\xae\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa6\xe3\x83\xb3\xe3\x82\xb9"
+    b"\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x82\x92\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5"
+    b"\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x81\x8c\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xab\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe3\x81\x8a\xe9\x87\xa3\xe3\x82\x8a"
+    b"\xe3\x83\x86\xe3\x83\xbc\xe3\x83\x9e\xe3\x81\xae\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\xa8\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x81\x8a\xe9\x87\xa3\xe3\x82\x8a:"
+    b"\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\xaf\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xbe\xe3\x81\xa7\xe6\x8c\x81\xe7\xb6\x9a\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x83\xaa\xe3\x82\xb9\xe3\x83\x88\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x81\x93\xe3\x81\xae\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\x8c\xe3\x81\x93\xe3\x81\xae\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\xab\xe5\xb1\x9e\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x82\x8b\xe3\x81\x8b\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"%d \xe3\x81\xae\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe3\x81\x8c\xe3\x80\x81\xe4\xb8\x80\xe8\x87\xb4\xe3\x81\x99\xe3\x82\x8b\xe3\x82\x82\xe3\x81\xae\xe3\x81\xaf\xe3\x81\x82\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f."
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xae\xe7\xa2\xba\xe8\xaa\x8d"
+    b"\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xa0\xe3\x81\xae\xe5\xa4\x89\xe6\x8f\x9b"
+    b"\xe5\xa4\x89\xe6\x9b\xb4\xe5\x85\x88\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe7\x89\xb9\xe5\xae\x9a\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f."
+    b"QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe4\xbd\x9c\xe6\x88\x90"
+    b"\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88\xe3\x81\x8b\xe3\x82\x89QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:"
+    b"\xe7\x8f\xbe\xe5\x9c\xa8\xe3\x81\xae\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\xa0QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\xa0\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88"
+    b"\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\x9e\xe3\x82\xa4\xe3\x82\xba\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x82\x92\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\x9e\xe3\x82\xa4\xe3\x82\xba\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xa8\xe3\x80\x81\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84\xe3\x82\xad\xe3\x83\xbc\xe3\x81\x8c\xe7\x94\x9f\xe6\x88\x90\xe3\x81\x95\xe3\x82\x8c\xe3\x80\x81\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x81\x8c\xe3\x82\xa2\xe3\x83\xb3\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe3\x82\xab\xe3\x83\x83\xe3\x83\x88\xe3\x81\xae\xe6\xb7\xb1\xe3\x81\x95"
+    b"\xe3\x82\xab\xe3\x83\x83\xe3\x83\x88\xe6\x96\xb9\xe6\xb3\x95"
+    b"\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xa0\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xab"
+    b"\xe3\x83\x87\xe3\x82\xb7\xe3\x83\x9e\xe3\x83\xab"
+    b"\xe3\x83\x87\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88?"
+    b"\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xae\xe8\xb2\xa1\xe5\xb8\x83"
+    b"\xe3\x81\x93\xe3\x81\xae\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x81\x94\xe3\x81\xa8\xe3\x81\xae\xe6\xb7\xb1\xe3\x81\x95"
+    b"\xe5\xb0\x8e\xe5\x87\xba\xe3\x83\x91\xe3\x82\xb9"
+    b"BIP85\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x82\x92\xe5\xb0\x8e\xe5\x87\xba\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9"
+    b"\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa4\xe3\x82\xb9\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88"
+    b"\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x83\x97\xe3\x83\xac\xe3\x82\xa4"
+    b"\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xbe\xe3\x81\xa7\xe9\x9b\xbb\xe6\xba\x90\xe3\x82\x92\xe5\x88\x87\xe3\x82\x89\xe3\x81\xaa\xe3\x81\x84\xe3\x81\xa7\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe5\xa4\x89\xe6\x8f\x9b\xe3\x82\x92\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe5\xae\x8c\xe4\xba\x86?"
+    b"\xe3\x83\x80\xe3\x83\x96\xe3\x83\xab\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf"
+    b"\xe3\x83\x89\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\x90\xe3\x83\xbc"
+    b"\xe7\xa9\xba"
+    b"\xe6\x9c\x89\xe5\x8a\xb9\xe5\x8c\x96?"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9fQR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\x8cID\xe3\x81\xa8\xe3\x81\xa8\xe3\x82\x82\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\x8c\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89"
+    b"%d \xe3\x81\xaeBIP39\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"6\xe6\x96\x87\xe5\xad\x97\xe4\xbb\xa5\xe4\xb8\x8a\xe3\x81\xae\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x892048\xe3\x81\xae\xe7\x95\xaa\xe5\x8f\xb7\xe3\x81\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x89800\xe3\x81\xae16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x894000\xe3\x81\xae8\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x83\xa6\xe3\x83\xbc\xe3\x82\xb6\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x83\xa6\xe3\x83\xbc\xe3\x82\xb6\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe3\x82\xa8\xe3\x83\xa9\xe3\x83\xbc:"
+    b"\xe3\x82\xa8\xe3\x82\xb9\xe3\x82\xaf"
+    b"\xe3\x82\xa2\xe3\x83\xbc\xe3\x82\xab\xe3\x82\xa4\xe3\x83\x96\xe6\x8e\xa2\xe7\xb4\xa2?"
+    b"\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe3\x82\xa8\xe3\x82\xaf\xe3\x82\xb9\xe3\x83\x9d\xe3\x83\xbc\xe3\x83\x88"
+    b"%s\xe3\x82\x92SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xa8\xe3\x82\xaf\xe3\x82\xb9\xe3\x83\x9d\xe3\x83\xbc\xe3\x83\x88\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe6\x8b\xa1\xe5\xbc\xb5\xe5\x85\xac\xe9\x96\x8b\xe3\x82\xad\xe3\x83\xbc"
+    b"\xe5\x88\x9d\xe6\x9c\x9f\xe8\xa8\xad\xe5\xae\x9a"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\xae\xe5\x8f\x8e\xe9\x9b\x86\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe5\xbe\xa9\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"mnemonic\xe3\x81\xae\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe6\x89\x8b\xe6\x95\xb0\xe6\x96\x99:"
+    b"\xe3\x83\x95\xe3\x82\xa3\xe3\x83\xbc\xe3\x83\x89\xe3\x83\xac\xe3\x83\xbc\xe3\x83\x88"
+    b"\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe5\x90\x8d"
+    b"\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe5\x90\x8d %s \xe3\x81\x8c SD \xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe5\xad\x98\xe5\x9c\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89\xe3\x81\xae\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\xa7\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x82\x92\xe5\x9f\x8b\xe3\x82\x81\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x82\x92\xe5\x85\x85\xe5\xa1\xab\xe4\xb8\xad"
+    b"PSBT\xe3\x81\xa7\xe3\x83\x87\xe3\x82\xb8\xe3\x82\xbf\xe3\x83\xab\xe6\x8c\x87\xe7\xb4\x8b\xe3\x81\x8c\xe6\x9c\xaa\xe8\xa8\xad\xe5\xae\x9a"
+    b"\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x97"
+    b"Flash\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xab"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\xa7\xe6\xba\x80\xe3\x81\x9f\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5"
+    b"\xe3\x83\x95\xe3\x83\xab\xe3\x83\xbc\xe3\x83\x88\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xa2\xe3\x83\xa1\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xbc"
+    b"\xe3\x83\x95\xe3\x83\xaa\xe3\x83\xbc:"
+    b"\xe3\x82\xb9\xe3\x83\x88\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xb8\xe3\x81\x8b\xe3\x82\x89"
+    b"\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x81\x8c\xe5\xbe\xa9\xe5\x85\x83\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xaa\xe3\x81\x84\xe3\x82\x88\xe3\x81\x86\xe3\x81\xab\xe3\x80\x81\xe4\xbb\x96\xe3\x81\xae\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa4\xe3\x82\xb9\xe3\x81\xa7SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\xae\x8c\xe5\x85\xa8\xe3\x81\xab\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe3\x82\xae\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x97\xe3\x83\xaa\xe3\x83\x9f\xe3\x83\x83\xe3\x83\x88"
+    b"Mnemonic\xe3\x82\x92\xe7\x94\x9f\xe6\x88\x90\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe8\xa1\x8c\xe3\x81\x8f"
+    b"\xe8\x89\xaf\xe3\x81\x84entropy"
+    b"\xe3\x83\x8f\xe3\x83\xbc\xe3\x83\x89\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2"
+    b"\xe3\x83\x98\xe3\x83\x83\xe3\x83\x89\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97"
+    b"Hex\xe5\x85\xac\xe9\x96\x8b\xe3\x82\xad\xe3\x83\xbc:"
+    b"\xe3\x82\xa8\xe3\x82\xaf\xe3\x82\xb5\xe3\x83\x87\xe3\x82\xb7\xe3\x83\x9e\xe3\x83\xab"
+    b"Mnemonics\xe3\x82\x92\xe9\x9a\xa0\xe3\x81\x99"
+    b"\xe9\xab\x98\xe3\x81\x84\xe6\x89\x8b\xe6\x95\xb0\xe6\x96\x99\xef\xbc\x81"
+    b"ID"
+    b"ID\xe3\x81\xaf\xe3\x81\x99\xe3\x81\xa7\xe3\x81\xab\xe5\xad\x98\xe5\x9c\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb9"
+    b"\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x97\xe3\x83\x83\xe3\x83\x88(%d):"
+    b"\xe4\xb8\x8d\xe5\x8d\x81\xe5\x88\x86\xe3\x81\xaa\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc!"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe5\xb0\x8e\xe5\x87\xba\xe3\x83\x91\xe3\x82\xb9"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe9\x95\xb7\xe3\x81\x95"
+    b"\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88:"
+    b"\xe5\x8f\x8d\xe8\xbb\xa2\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe5\x8f\x8d\xe8\xbb\xa2\xe3\x81\x97\xe3\x81\x9f\xe8\x89\xb2"
+    b"\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9fKEF"
+    b"\xe3\x82\xad\xe3\x83\xbc"
+    b"\xe3\x82\xad\xe3\x83\xbc\xe3\x81\x8c\xe6\x8f\x90\xe4\xbe\x9b\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93"
+    b"Krux\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88QR"
+    b"LCD\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97"
+    b"\xe8\xa8\x80\xe8\xaa\x9e "
+    b"\xe6\x9c\x89\xe5\x8a\xb9\xe3\x81\xaa\xe6\x9c\x80\xe7\xb5\x82\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x92Krux\xe3\x81\xab\xe9\x81\xb8\xe3\x82\x93\xe3\x81\xa7\xe3\x82\x82\xe3\x82\x89\xe3\x81\x84\xe3\x81\x9f\xe3\x81\x84\xe5\xa0\xb4\xe5\x90\x88\xe3\x81\xaf\xe3\x80\x81\xe7\xa9\xba\xe7\x99\xbd\xe3\x81\xae\xe3\x81\xbe\xe3\x81\xbe\xe3\x81\xab\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe5\xb7\xa6"
+    b"\xe9\x95\xb7\xe3\x81\x95:"
+    b"\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\xb3\xe9\x81\x85\xe5\xbb\xb6"
+    b"\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\xb3:"
+    b"\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x83\xaa\xe3\x82\xb9\xe3\x83\x88"
+    b"\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe4\xbf\xa1\xe9\xa0\xbc\xe3\x81\xa7\xe3\x81\x8d\xe3\x82\x8b\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81\xa6\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xba\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89 "
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe5\xa4\x89\xe6\x9b\xb4\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe5\x8f\x97\xe4\xbf\xa1\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe8\xaa\xad\xe8\xbe\xbc\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe3\x83\xad\xe3\x82\xb1\xe3\x83\xbc\xe3\x83\xab"
+    b"\xe5\xa0\xb4\xe6\x89\x80"
+    b"\xe4\xb8\xad\xe9\x96\x93"
+    b"\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8"
+    b"\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8:"
+    b"\xe3\x83\x9f\xe3\x83\x8b\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88"
+    b"\xe3\x83\x9f\xe3\x83\xa9\xe3\x83\xbcX\xe5\xba\xa7\xe6\xa8\x99"
+    b"\xe7\xbd\xb2\xe5\x90\x8d\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x81\x8c\xe6\xac\xa0\xe8\x90\xbd\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99"
+    b"Mnemonic"
+    b"Mnemonic\xe3\x81\xa8\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x81\xaf\xe4\xbf\x9d\xe6\x8c\x81\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe4\xbf\xae\xe6\xad\xa3\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:"
+    b"\xe3\x83\x8d\xe3\x82\xa4\xe3\x83\x86\xe3\x82\xa3\xe3\x83\x96Segwit - 84\xe3\x81\x8c\xe4\xbb\xae\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe3\x83\x8d\xe3\x83\x83\xe3\x83\x88\xe3\x83\xaf\xe3\x83\xbc\xe3\x82\xaf"
+    b"\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84 Mnemonic"
+    b"\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84\xe3\x83\x95\xe3\x82\xa1\xe3\x83\xbc\xe3\x83\xa0\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f."
+    b"\xe3\x81\x84\xe3\x81\x84\xe3\x81\x88"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x81\xaa\xe3\x81\x97"
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\x8c\xe8\xb6\xb3\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93!"
+    b"\xe8\xa6\x8b\xe3\x81\xa4\xe3\x81\x8b\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93:"
+    b"\xe6\x95\xb0\xe5\xad\x97"
+    b"Octal"
+    b"\xe4\xbb\x96\xe3\x81\xae\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x88"
+    b"\xe4\xb8\x8a\xe6\x9b\xb8\xe3\x81\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\x82\x92\xe5\x88\x87\xe3\x82\x8a\xe6\x9b\xbf\xe3\x81\x88\xe3\x82\x8bPAGE"
+    b"PBKDF 2 iter."
+    b"\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\xa7\xe3\x81\x8d\xe3\x82\x8b\xe3\x82\x88\xe3\x81\x86\xe3\x81\xab\xe3\x80\x81\xe7\xa9\xb4\xe3\x81\x82\xe3\x81\x91\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe7\x82\xb9\xe3\x82\x92\xe9\xbb\x92\xe3\x81\x8f\xe5\xa1\x97\xe3\x81\xa3\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe7\x94\xa8\xe7\xb4\x99\xe5\xb9\x85 "
+    b"\xe3\x83\x91\xe3\x83\xbc\xe3\x83\x84"
+    b"N\xe3\x81\xae\xe3\x83\x91\xe3\x83\xbc\xe3\x83\x88M"
+    b"\xe3\x83\x91\xe3\x83\xbc\xe3\x83\x84\xe3\x82\xb5\xe3\x82\xa4\xe3\x82\xba"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xae\xe9\x95\xb7\xe3\x81\x95"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x81\xae\xe4\xb8\x8d\xe4\xb8\x80\xe8\x87\xb4"
+    b"\xe3\x83\x91\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\xb3\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f!"
+    b"\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x81\x8b\xe3\x82\x89\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe3\x81\xae\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96mnemonics\xe3\x81\xa8\xe8\xa8\xad\xe5\xae\x9a\xe3\x82\x92\xe6\xb0\xb8\xe4\xb9\x85\xe3\x81\xab\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe6\xb0\xb8\xe7\xb6\x9a\xe3\x81\x95\xe3\x81\x9b\xe3\x82\x8b"
+    b"\xe3\x83\x94\xe3\x82\xaf\xe3\x82\xbb\xe3\x83\xab\xe5\x81\x8f\xe5\xb7\xae\xe6\x8c\x87\xe6\x95\xb0:"
+    b"\xe3\x83\x97\xe3\x83\xac\xe3\x83\xbc\xe3\x83\xb3\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88QR"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\xae\xe5\x87\xba\xe5\x8a\x9b\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe6\xb2\x88\xe4\xb8\x8b\xe7\x8e\x87"
+    b"\xe8\xa8\xbc\xe5\x88\xb8\xe3\x81\xae\xe7\xa8\xae\xe9\xa1\x9e"
+    b"\xe4\xbd\x8e\xe5\x93\x81\xe8\xb3\xaa\xe3\x81\xaa\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc!"
+    b"\xe5\x87\xba\xe5\x8a\x9b"
+    b"PAGE\xe3\x82\x92\xe6\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xab\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"PAGE\xe3\x82\x92\xe6\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\x88\x87\xe3\x82\x8a\xe6\x9b\xbf\xe3\x81\x88\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88QR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7"
+    b"Tinyseed\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"QR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7"
+    b"QR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe5\x8d\xb0\xe5\x88\xb7?"
+    b"\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc "
+    b"\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\x89\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\x90\xe3\x83\xbc\xe3\x81\x8c\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93!"
+    b"\xe5\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe3\x81\x9d\xe3\x81\xae\xe3\x81\xbe\xe3\x81\xbe\xe9\x80\xb2\xe3\x81\xbf\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe9\x80\xb2\xe3\x81\xbf\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe5\x87\xa6\xe7\x90\x86\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe8\xa8\xbc\xe6\x98\x8e\xe5\x8f\xaf\xe8\x83\xbd\xe3\x81\xab\xe4\xbd\xbf\xe7\x94\xa8\xe4\xb8\x8d\xe8\x83\xbd"
+    b"QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"QR\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab"
+    b"\xe6\x95\xb0\xe9\x87\x8f"
+    b"RX\xe3\x83\x94\xe3\x83\xb3"
+    b"\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95"
+    b"\xe5\x8f\x97\xe3\x81\x91\xe5\x8f\x96\xe3\x82\x8b"
+    b"\xe5\x9c\xb0\xe5\x9f\x9f:"
+    b"%s\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\x95\xe3\x82\xa1\xe3\x83\xbc\xe3\x83\xa0\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"Res. - \xe3\x83\x95\xe3\x82\xa9\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x88"
+    b"\xe5\x88\x9d\xe6\x9c\x9f\xe5\x8c\x96\xe3\x82\x92\xe5\xbe\xa9\xe5\x85\x83\xe3\x81\x97\xe3\x81\xa6\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe7\xb5\x90\xe6\x9e\x9c"
+    b"QR\xe3\x83\x93\xe3\x83\xa5\xe3\x83\xbc\xe3\x83\xaf\xe3\x83\xbc\xe3\x81\xab\xe6\x88\xbb\xe3\x82\x8b"
+    b"\xe3\x82\x82\xe3\x81\x86\xe4\xb8\x80\xe5\xba\xa6\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\x97\xe3\x81\x9f\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x80\x81\xe5\xbf\x85\xe8\xa6\x81\xe3\x81\xab\xe5\xbf\x9c\xe3\x81\x98\xe3\x81\xa6\xe7\xb7\xa8\xe9\x9b\x86\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe5\x8f\xb3"
+    b"mnemonic\xe3\x82\x92\xe7\x94\x9f\xe6\x88\x90\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xab\xe3\x81\xaf\xe3\x80\x81\xe5\xb0\x91\xe3\x81\xaa\xe3\x81\x8f\xe3\x81\xa8\xe3\x82\x82%d\xe5\x9b\x9e\xe3\x82\xb5\xe3\x82\xa4\xe3\x82\xb3\xe3\x83\xad\xe3\x82\x92\xe6\x8c\xaf\xe3\x81\xa3\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\xae\xe5\x88\x86\xe5\xb8\x83:"
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab:"
+    b"180\xc2\xb0\xe5\x9b\x9e\xe8\xbb\xa2"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93."
+    b"\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\xaeSHA256:"
+    b"\xe7\x94\xbb\xe5\x83\x8f\xe3\x81\xaeSHA256:"
+    b"QR\xe7\x94\xbb\xe5\x83\x8f\xe3\x82\x92SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:"
+    b"\xe3\x82\xb9\xe3\x82\xb1\xe3\x83\xbc\xe3\x83\xab"
+    b"\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3"
+    b"BIP39\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xad\xe3\x83\xbc\xe3\x81\xaeQR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\xae\xe3\x83\x97\xe3\x83\xad\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xb0"
+    b"\xe5\x8d\x98\xe8\xaa\x9e1-12\xe3\x82\x92\xe5\x86\x8d\xe5\xba\xa6\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe4\xb8\xad"
+    b"\xe5\x8d\x98\xe8\xaa\x9e13-24\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe4\xb8\xad"
+    b"\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\xbc\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xbc\xe3\x83\x90\xe3\x83\xbc\xe3\x81\xae\xe6\x99\x82\xe9\x96\x93"
+    b"\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97"
+    b"\xe3\x82\xbb\xe3\x82\xad\xe3\x83\xa5\xe3\x83\xaa\xe3\x83\x86\xe3\x82\xa3a"
+    b"\xe8\x87\xaa\xe5\xb7\xb1\xe8\xbb\xa2\xe9\x80\x81\xe3\x81\xbe\xe3\x81\x9f\xe3\x81\xaf\xe5\xa4\x89\xe6\x9b\xb4\xef\xbc\x88%d\xef\xbc\x89:"
+    b"\xe8\x87\xaa\xe5\xb7\xb1\xe8\xbb\xa2\xe9\x80\x81:"
+    b"\xe6\x9c\x80\xe5\x88\x9d\xe3\x81\xab\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe8\xa8\xad\xe5\xae\x9a"
+    b"\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\xaf\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\xa1\xe3\x83\xa2\xe3\x83\xaa\xe3\x81\xab\xe5\x86\x85\xe9\x83\xa8\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\xafSD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x8e\xe3\x83\xb3\xe3\x81\xae\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc:"
+    b"\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xa0\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xba"
+    b"\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3"
+    b"\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe6\x99\x82\xe9\x96\x93"
+    b"\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6"
+    b"\xe7\xbd\xb2\xe5\x90\x8d"
+    b"QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3:"
+    b"\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe4\xbb\x98\xe3\x81\x8d\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8"
+    b"\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9fPSBT"
+    b"\xe7\xbd\xb2\xe5\x90\x8d\xe2\x80\xa6"
+    b"\xe3\x82\xb7\xe3\x83\xb3\xe3\x82\xb0\xe3\x83\xab\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3"
+    b"\xe3\x82\xb5\xe3\x82\xa4\xe3\x82\xba:"
+    b"\xe4\xb8\x80\xe9\x83\xa8\xe3\x81\xae\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe5\xae\x9f\xe8\xa1\x8c\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93."
+    b"\xe4\xb8\x80\xe9\x83\xa8\xe3\x81\xae\xe3\x83\x8e\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xaf\xe7\xa1\xac\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93:"
+    b"\xe6\x94\xaf\xe5\x87\xba\xef\xbc\x88%d\xef\xbc\x89:"
+    b"\xe6\x94\xaf\xe5\x87\xba:"
+    b"\xe6\xa8\x99\xe6\xba\x96\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe9\x9d\x99\xe6\xad\xa2\xe7\x94\xbb"
+    b"\xe3\x82\xaa\xe3\x82\xbf\xe3\x82\xaf\xe3\x81\xae\xe3\x81\x9f\xe3\x82\x81\xe3\x81\xae\xe7\xb5\xb1\xe8\xa8\x88"
+    b"\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe5\xbc\xb7\xe5\xba\xa6"
+    b"\xe5\xbc\xb7\xe5\x8a\x9b"
+    b"\xe3\x82\xb9\xe3\x83\xaf\xe3\x82\xa4\xe3\x83\x97\xe3\x81\x97\xe3\x81\xa6\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\x99\xe3\x82\x8b"
+    b"TC\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x8f\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5"
+    b"\xe8\xb5\xb7\xe5\x8b\x95\xe6\x99\x82\xe3\x81\xaeTC\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x8f\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5"
+    b"\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x81\xe3\x81\xbe\xe3\x81\x9f\xe3\x81\xafENTER\xe3\x81\xa7\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x97\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x8bEnter\xe3\x82\xad\xe3\x83\xbc\xe3\x82\x92\xe6\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x82\xa4\xe3\x83\xb3\xe3\x82\xb9\xe3\x83\x88\xe3\x83\xbc\xe3\x83\xab\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"TR\xe5\x86\x85\xe9\x83\xa8\xe3\x82\xad\xe3\x83\xbc"
+    b"TX\xe3\x83\x94\xe3\x83\xb3"
+    b"\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe6\xad\xa3\xe5\xb8\xb8\xe3\x81\xab\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe4\xb8\x80\xe8\x87\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93"
+    b"\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88\xe3\x82\xb9\xe3\x82\xa4\xe3\x83\xbc\xe3\x83\x88"
+    b"\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88\xe3\x82\xb9\xe3\x82\xa4\xe3\x83\xbc\xe3\x83\x88\xe3\x81\xae\xe7\xb5\x90\xe6\x9e\x9c"
+    b"\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88:"
+    b"\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88"
+    b"\xe3\x83\x86\xe3\x83\xbc\xe3\x83\x9e"
+    b"\xe3\x82\xb5\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\xab"
+    b"\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x81\x8c\xe5\xbe\xa9\xe5\x85\x83\xe4\xb8\x8d\xe5\x8f\xaf\xe8\x83\xbd\xe3\x81\xa7\xe3\x81\x82\xe3\x82\x8b\xe3\x81\x93\xe3\x81\xa8\xe3\x82\x92\xe7\xa2\xba\xe5\xae\x9f\xe3\x81\xab\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xab\xe3\x81\xaf\xe3\x80\x81\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa4\xe3\x82\xb9\xe6\xb6\x88\xe5\x8e\xbb\xe6\xa9\x9f\xe8\x83\xbd\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\x82\x92\xe5\x88\x87\xe3\x82\x8a\xe6\x9b\xbf\xe3\x81\x88\xe3\x82\x8b"
+    b"\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xab"
+    b"\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x81\xe3\x82\xb9\xe3\x83\xac\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\xab\xe3\x83\x89"
+    b"\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x81\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\xbc\xe3\x83\xb3"
+    b"\xe3\x82\x82\xe3\x81\xa3\xe3\x81\xa8\xe8\xa9\xa6\xe3\x81\x97\xe3\x81\xa6\xe3\x81\xbf\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"BIP39\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe3\x82\xad\xe3\x83\xbc\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe5\x8f\x96\xe3\x82\x8a\xe6\xb6\x88\xe3\x81\x97"
+    b"\xe3\x83\xa6\xe3\x83\x8b\xe3\x83\x83\xe3\x83\x88"
+    b"KEF ID\xe3\x82\x92\xe6\x9b\xb4\xe6\x96\xb0\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"QR\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x82\x92\xe6\x9b\xb4\xe6\x96\xb0\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xa2\xe3\x83\x83\xe3\x83\x97\xe3\x82\xb0\xe3\x83\xac\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f."
+    b"\xe9\xbb\x92\xe3\x81\x84\xe8\x83\x8c\xe6\x99\xaf\xe9\x9d\xa2\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84."
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\xae\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xa6\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84mnemonic\xe3\x82\x92\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe7\x8f\xbe\xe5\x9c\xa8\xe4\xbe\xa1\xe5\x80\xa4"
+    b"1\xe8\xa1\x8c\xe7\x9b\xae\xe3\x82\x92\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xab\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xaePBKDF 2\xe3\x82\xa4\xe3\x83\x86\xe3\x83\xbc\xe3\x83\xab\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe6\x8c\x87\xe7\xb4\x8b\xe3\x82\x92ID\xe3\x81\xa8\xe3\x81\x97\xe3\x81\xa6\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe6\xb8\x88\xe3\x81\xbf:"
+    b"\xe3\x83\xa6\xe3\x83\xbc\xe3\x82\xb6\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf"
+    b"\xe5\x80\xa4%s\xe3\x81\x8c\xe7\xaf\x84\xe5\x9b\xb2\xe5\xa4\x96\xe3\x81\xa7\xe3\x81\x99: [ %s, %s]"
+    b"\xe8\xaa\x8d\xe8\xa8\xbc\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe3\x83\x90\xe3\x83\xbc\xe3\x82\xb8\xe3\x83\xa7\xe3\x83\xb3"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe7\xb5\x8c\xe7\x94\xb1"
+    b"D20\xe7\xb5\x8c\xe7\x94\xb1"
+    b"D6\xe7\xb5\x8c\xe7\x94\xb1"
+    b"\xe6\x89\x8b\xe5\x8b\x95\xe5\x85\xa5\xe5\x8a\x9b\xe7\xb5\x8c\xe7\x94\xb1"
+    b"\xe8\xa8\x80\xe8\x91\x89\xe7\xb5\x8c\xe7\x94\xb1"
+    b"\xe8\xa1\xa8\xe7\xa4\xba\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab"
+    b"\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x82\x92\xe5\xbe\x85\xe3\x81\xa3\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"\xe3\x83\xaf\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x81\x8c\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xef\xbc\x81"
+    b"\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x81\x8c\xe8\xa6\x8b\xe3\x81\xa4\xe3\x81\x8b\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93."
+    b"\xe8\xad\xa6\xe5\x91\x8a:"
+    b"\xe8\x84\x86\xe5\xbc\xb1"
+    b"\xe5\x8d\x98\xe8\xaa\x9e %d"
+    b"\xe5\x8d\x98\xe8\xaa\x9e\xe7\x95\xaa\xe5\x8f\xb7"
+    b"\xe5\x8d\x98\xe8\xaa\x9e"
+    b"\xe3\x81\xaf\xe3\x81\x84"
+    b"\xe3\x82\xba\xe3\x83\xbc\xe3\x83\xa0\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89"
+    b"\xe3\x83\x90\xe3\x82\xa4\xe3\x83\x8a\xe3\x83\xaa\xef\xbc\x9a {}\xe3\x83\x90\xe3\x82\xa4\xe3\x83\x88"
+    b"\xe5\xa4\xb1\xe6\x95\x97"
+    b"16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\x8b\xe3\x82\x89"
+    b"base 32\xe3\x81\x8b\xe3\x82\x89"
+    b"base 43\xe3\x81\x8b\xe3\x82\x89"
+    b"base 64\xe3\x81\x8b\xe3\x82\x89"
+    b"16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\x8b\xe3\x82\x89"
+    b"utf 8\xe3\x81\x8b\xe3\x82\x89"
+    b"\xe6\x9c\x89\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\xa7\xe3\x81\x99\xef\xbc\x81"
+    b"\xe3\x82\xb7\xe3\x83\x95\xe3\x83\x88\xe3\x82\xb1\xe3\x83\xbc\xe3\x82\xb9"
+    b"\xe6\x88\x90\xe5\x8a\x9f\xe7\x8e\x87:"
+    b"\xe3\x82\xb9\xe3\x83\xaf\xe3\x82\xa4\xe3\x83\x97"
+    b"text: {}\xe6\x96\x87\xe5\xad\x97"
+    b"16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xab"
+    b"base 32\xe3\x81\xab"
+    b"base 43\xe3\x81\xab"
+    b"base 64\xe3\x81\xab"
+    b"16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xab"
+    b"utf 8\xe3\x81\xb8"
+    b"\xe4\xb8\x8d\xe6\x98\x8e"
+    b"\xe6\x9c\x80\xe5\x88\x9d\xe3\x81\xae%d\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\xab\xe8\xa6\x8b\xe3\x81\xa4\xe3\x81\x8b\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "수량: %",
-    "%d의 %d 멀티시그",
-    "%d 부터 %d",
-    "%s 비트 (%s 비트/픽셀)",
-    "%s 제거되었습니다.",
-    "%s: 로드됨!",
-    "(실험적 기능)",
-    "(잔액조회 전용)",
-    "12단어",
-    "24단어",
-    "기본 정보",
-    "가정을 수락하시겠습니까?",
-    "계정",
-    "계정 #0이 가정됩니다",
-    "계정 인덱스",
-    "패스프레이즈를 추가하거나 변경하시겠습니까?",
-    "%s 에 필요한 카메라의 추가 엔트로피",
-    "주소",
-    "카메라와 보조 플레이트를 올바르게 정렬하십시오.",
-    "눈부심 방지 모드",
-    "디스플레이",
-    "계속하시겠습니까?",
-    "BGR 색상",
-    "BIP39 니모닉",
-    "뒤로",
-    "메뉴로 돌아가기",
-    "니모닉 백업",
-    "잘못된 서명",
-    "Base64 비밀번호",
-    "Baudrate",
-    "이진수 그리드",
-    "테두리 여백",
-    "밝기",
-    "버튼",
-    "버튼 바운스 방지",
-    "캡처 취소됨",
-    "잔돈",
-    "테마를 변경하고 재부팅하시겠습니까?",
-    "잔돈:",
-    "변경 사항은 종료될때까지 유지됩니다.",
-    "SD카드 확인",
-    "해당 주소가 이 지갑에 속하는지 확인하시겠습니까?",
-    "일치하는 주소가 없는 %d 개를 확인했습니다.",
-    "SD 카드 확인 중…",
-    "탬퍼 체크 코드 확인",
-    "날짜 변환",
-    "변경 주소를 확인할 수 없습니다.",
-    "QR 코드 생성",
-    "문자 메시지로 QR 코드를 만드시겠어요?",
-    "생성됨:",
-    "현재 탬퍼 체크 코드",
-    "사용자 지정 QR 코드",
-    "사용자 텍스트",
-    "사용자 정의",
-    "지갑을 사용자 정의하면 새 키가 생성되고 설명자가 언로드됩니다.",
-    "Cut Depth",
-    "Cut Method",
-    "Datum Tool",
-    "10진수",
-    "복호화하시겠습니까?",
-    "지갑 기본설정",
-    "이 파일 삭제?",
-    "Depth Per Pass",
-    "파생 경로",
-    "BIP85 엔트로피를 유독하시겠습니까?",
-    "디스크립터 주소",
-    "장치 테스트",
-    "디스플레이",
-    "전원을 끄지 마십시오. 완료하는 데 시간이 걸릴 수 있습니다.",
-    "변환 완료",
-    "완료되었습니까?",
-    "이중 니모닉",
-    "드라이버",
-    "비어 있음",
-    "활성화?",
-    "암호화하다",
-    "암호화 후 저장",
-    "암호화된 QR 코드",
-    "암호화된 니모닉을 다음 아이디와 함께 저장했습니다:",
-    "암호화된 니모닉을 저장하지 못했습니다",
-    "암호화",
-    "암호화 모드",
-    "%d개의 BIP39 단어를 입력하십시오.",
-    "6자 이상의 탬퍼 체크 코드를 입력하세요",
-    "BIP39 니모닉의 각 단어를 1에서 2048 사이의 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 1에서 800 사이의 16진수 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 1에서 4000 사이의 8진수 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 입력하십시오.",
-    "사용자 데이터 지우기",
-    "사용자 데이터 삭제 중…",
-    "오류:",
-    "Esc",
-    "파일을 탐색하시겠습니까?",
-    "주소 내보내기",
-    "%s 을 (를) SD 카드로 내보내는 중…",
-    "XPUB 내보내기",
-    "공장 초기 설정",
-    "카메라 엔트로피 수집 실패",
-    "복호화에 실패했습니다",
-    "로드 실패",
-    "니모닉을 저장하지 못했습니다",
-    "수수료:",
-    "Feed Rate",
-    "파일명",
-    "%s 파일명이 SD카드에 이미 존재합니다.",
-    "카메라의 엔트로피로 플래시를 채우시겠습니까?",
-    "플래시 채우기",
-    "PSBT에서 지문이 설정되지 않았습니다",
-    "플래시 맵",
-    "플래시 도구",
-    "카메라 엔트로피로 가득 찬 플래시",
-    "플루트 직경",
-    "여유 공간:",
-    "저장공간에서 불러오기",
-    "다른 장치에서 데이터 복구가 불가능하도록 SD카드를 완전히 지우십시오",
-    "니모닉 생성",
-    "선택",
-    "엔트로피가 충분합니다",
-    "하드웨어",
-    "헤드 종류",
-    "16진수 공개키:",
-    "16진수",
-    "니모닉 숨기기",
-    "수수료가 높습니다!",
-    "ID",
-    "아이디가 이미 존재합니다",
-    "인덱스",
-    "Input (%d):",
-    "엔트로피가 충분하지 않습니다!",
-    "유효하지 않은 탬퍼 체크 코드",
-    "주소가 잘못되었습니다",
-    "잘못된 파생 경로",
-    "니모닉 길이가 잘못되었습니다",
-    "지갑이 잘못되었습니다:",
-    "반전",
-    "반전된 색상",
-    "KEF 암호화됨",
-    "키",
-    "키가 제공되지 않았습니다",
-    "Krux 프린터 테스트 QR",
-    "LCD 유형",
-    "언어",
-    "마지막 단어를 Krux가 선택하도록 하려면 비워두십시오",
-    "왼쪽",
-    "길이:",
-    "줄 지연",
-    "줄:",
-    "주소 목록",
-    "니모닉 불러오기",
-    "이대로 불러오기",
-    "주소를 보기위해 신뢰할 수 있는 월렛 디스크립터를 불러오시겠습니까?",
-    "SD카드에서 불러오기",
-    "SD카드에서 불러오시겠습니까?",
-    "카메라로 불러오기",
-    "불러오시겠습니까?",
-    "카메라 로드 중…",
-    "변경 주소 로드 중…",
-    "프린터 로드 중…",
-    "수신 주소 로드 중…",
-    "로드 중…",
-    "언어 설정",
-    "기본 저장소",
-    "중간",
-    "메시지",
-    "메시지:",
-    "미니스크립트",
-    "미러 X 좌표",
-    "서명 파일이 누락되었습니다",
-    "니모닉",
-    "니모닉과 암호는 유지됩니다.",
-    "수정되었습니다:",
-    "네이티브 세그윗 - BIP84를 적용합니다",
-    "네트워크",
-    "새로운 니모닉",
-    "새로운 펌웨어가 감지되었습니다.",
-    "아니요",
-    "패스프레이즈 없음",
-    "주사위 횟수가 충분하지 않습니다!",
-    "시드문구 순번",
-    "8진수",
-    "기타 형식",
-    "덮어쓰시겠습니까?",
-    "밝기를 전환하는 PAGE",
-    "PBKDF2 iter.",
-    "카메라가 감지할 수 있도록 펀치된 점을 검게 칠하십시오.",
-    "종이 너비",
-    "파트",
-    "N의 파트 M",
-    "파트 사이즈",
-    "패스프레이즈",
-    "비밀번호 길이",
-    "경로 불일치",
-    "패턴이 감지되었습니다!",
-    "저장된 모든 니모닉 및 설정값을 영구적으로 제거하시겠습니까?",
-    "저장",
-    "픽셀 편차 지수:",
-    "일반텍스트 QR",
-    "지갑 출력 디스크립터를 불러오십시오",
-    "침수율",
-    "정책 유형",
-    "엔트로피가 부족합니다!",
-    "출력",
-    "PAGE로 취소.",
-    "모드를 전환하려면 PAGE를 누르세요",
-    "QR 테스트 인쇄",
-    "Tinyseed를 인쇄하시겠습니까?",
-    "QR로 인쇄",
-    "QR로 인쇄하시겠습니까?",
-    "인쇄하시겠습니까?",
-    "프린터",
-    "프린터 드라이버가 설정되지 않았습니다!",
-    "출력중…",
-    "계속하시겠습니까?",
-    "계속하시겠습니까?",
-    "처리 중…",
-    "충분히 사용할 수 없음",
-    "QR 코드",
-    "QR 라벨",
-    "수량",
-    "RX 핀",
-    "종료",
-    "받기",
-    "지역:",
-    "%s을 제거하시겠습니까?",
-    "니모닉 제거",
-    "SD카드에서 펌웨어 파일을 제거하시겠습니까?",
-    "Res. - 형식",
-    "공장 설정을 복원하고 재부팅하시겠습니까?",
-    "결과",
-    "QR 뷰어로 돌아가기",
-    "다시 검토",
-    "스캔된 데이터를 검토하고 필요한 경우 수정하십시오",
-    "오른쪽",
-    "니모닉을 생성하려면 주사위를 최소 %d번 굴리십시오.",
-    "주사위값 분포:",
-    "주사위 횟수:",
-    "180° 회전",
-    "SD카드",
-    "SD카드가 감지되지 않았습니다.",
-    "주사위의 SHA256:",
-    "SHA256 스냅샷:",
-    "QR 이미지를 SD카드에 저장",
-    "SD카드에 저장",
-    "SD카드에 저장하시겠습니까?",
-    "SD카드에 저장됨:",
-    "스케일",
-    "주소 스캔하기",
-    "BIP39 패스프레이즈 스캔하기",
-    "비밀번호 QR 스캔",
-    "1번째부터 12번째 단어를 스캔 중입니다",
-    "13번째부터 24번째 단어를 스캔 중입니다",
-    "화면보호기 시간",
-    "지갑 형식",
-    "보안",
-    "본인주소 전송 또는 잔돈 (%d):",
-    "자가 이체:",
-    "먼저 탬퍼 체크 코드를 설정하세요",
-    "설정",
-    "설정은 플래시에서 내부적으로 저장됩니다.",
-    "SD 카드에 저장된 설정.",
-    "Shannon의 엔트로피:",
-    "대추 표시",
-    "종료",
-    "자동 종료시간",
-    "종료 준비 중…",
-    "서명하기",
-    "QR코드로 내보내기",
-    "SD카드로 내보내기",
-    "서명하시겠습니까?",
-    "서명:",
-    "서명된 메시지",
-    "서명된 PSBT",
-    "서명…",
-    "단일서명",
-    "크기:",
-    "일부 검사를 수행할 수 없습니다.",
-    "일부 노드가 경화되지 않습니다:",
-    "Spend (%d):",
-    "지출:",
-    "표준 모드",
-    "Static",
-    "전문가를 위한 통계",
-    "플래시 메모리에 저장",
-    "SD카드에 저장",
-    "강력",
-    "강한",
-    "모드를 변경하려면 화면을 옆으로 쓸어내리세요",
-    "TC Flash Hash",
-    "부팅 시 플래시 탬퍼 확인 해시",
-    "터치하거나 엔터를 눌러 캡처하십시오",
-    "설치하려면 터치하거나 입력하세요.",
-    "TR 내부 키",
-    "TX 핀",
-    "탬퍼 체크 코드",
-    "탬퍼 검사 코드가 성공적으로 설정되었습니다",
-    "탬퍼 검사 코드가 일치하지 않습니다",
-    "테스트 스위트",
-    "테스트 제품군 결과",
-    "Test:",
-    "텍스트",
-    "테마",
-    "Thermal",
-    "데이터 복구가 불가능하도록 장치 전체지우기 기능을 사용하십시오",
-    "밝기 전환",
-    "도구",
-    "터치 민감도",
-    "터치스크린",
-    "더 하시겠습니까?",
-    "BIP39 패스프레이즈 입력",
-    "비밀번호 입력",
-    "실행 취소",
-    "단위",
-    "KEF ID를 업데이트하시겠습니까?",
-    "QR 레이블을 업데이트하시겠습니까?",
-    "업그레이드가 완료되었습니다.",
-    "검은색 배경 화면을 사용하십시오.",
-    "카메라의 엔트로피를 사용하여 새로운 니모닉을 생성하십시오",
-    "현재 수치",
-    "기본 모드를 사용하시겠습니까?",
-    "기본 PBKDF2 반복문을 사용하십시오.?",
-    "지문을 신분증으로 사용하시겠어요?",
-    "이미 사용됨:",
-    "사용자 데이터",
-    "%s는 [%s, %s] 범위를 벗어났습니다",
-    "확인…",
-    "버전",
-    "카메라",
-    "20면체 주사위",
-    "일반 주사위",
-    "직접 입력",
-    "니모닉 단어 입력",
-    "표시 레이블",
-    "캡처될때까지 기다리십시오",
-    "지갑 설정",
-    "지갑 디스크립터",
-    "지갑 출력 디스크립터",
-    "지갑 출력 디스크립터가 로드되었습니다!",
-    "지갑 출력 디스크립터를 찾을 수 없습니다.",
-    "경고:",
-    "약한",
-    "%d 단어",
-    "단어 번호(1-2048)",
-    "시드문구",
-    "예",
-    "확대 모드",
-    "바이너리: {} 바이트",
-    "실패",
-    "16진수부터",
-    "base32에서",
-    "base43에서",
-    "base64에서",
-    "16진수부터",
-    "utf8에서",
-    "는 유효한 주소입니다!",
-    "시프트 케이스",
-    "성공률:",
-    "스와이프",
-    "text: {} chars",
-    "16진수로",
-    "base32로",
-    "to base43",
-    "base64로",
-    "16진수로",
-    "utf8로",
-    "알 수 없음",
-    "첫 번째 %d개의 주소에서 찾을 수 없습니다",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\t\x00*\x00f\x00{\x00\x87\x00\xa3\x00\xbc\x00\xca\x00\xdc\x00\xf1\x00\xf9\x00\x01\x01\x0e\x011\x01"
+    b"7\x01S\x01c\x01\xa2\x01\xd3\x01\xd9\x01\xe9\x01-\x02D\x02S\x02l\x02v\x02\x85\x02\x8b\x02\xa1\x02\xb1\x02"
+    b'\xc1\x02\xd4\x02\xdc\x02\xef\x02\xff\x02\x05\x03\x0b\x03"\x038\x03H\x03N\x03\x81\x03\x88\x03\xbc\x03\xd0\x03\xdf\x03'
+    b"$\x04_\x04v\x04\x91\x04\x9e\x04\xca\x04\xda\x04\x0e\x05\x18\x053\x05M\x05`\x05p\x05\xc9\x05\xd2\x05\xdc\x05"
+    b"\xe6\x05\xee\x05\n\x06\x1d\x06/\x06=\x06J\x06y\x06\x8f\x06\x9f\x06\xae\x06\x00\x07\r\x07#\x073\x07?\x07"
+    b"L\x07V\x07e\x07y\x07\x8f\x07\xd7\x07\r\x08\x16\x08&\x08R\x08\x88\x08\xdd\x08:\t\x97\t\xcb\t\xe8\t"
+    b"\t\n\x10\n\x13\n6\nI\nv\n\x87\n\x9b\n\xbf\n\xde\n\xeb\n\x14\x0b\x1e\x0b'\x0b0\x0bc\x0b"
+    b"\xa3\x0b\xb6\x0b\xe7\x0b\xf4\x0b\x04\x0c2\x0cB\x0cP\x0co\x0c\xcf\x0c\xd9\x0c\xe9\x0c\xef\x0c\x0e\r\x1a\r'\r"
+    b":\rB\rU\ro\rq\r\x94\r\x9d\r\xa8\r\xd2\r\xfa\r\x19\x0e0\x0eY\x0ey\x0e\x7f\x0e\x8f\x0e"
+    b"\x9f\x0e\xa2\x0e\xc5\x0e\xe0\x0e\xea\x0e\xf0\x0e8\x0f>\x0fE\x0fO\x0fS\x0f`\x0fv\x0f\x8c\x0f\xeb\x0f\x06\x10"
+    b".\x10G\x10`\x10w\x10\x92\x10\xa9\x10\xc4\x10\xd1\x10\xde\x10\xee\x10\xf4\x10\xfd\x10\x07\x11\x19\x11(\x11N\x11"
+    b"W\x11~\x11\x94\x11\xc5\x11\xd1\x11\xe4\x11\x11\x12\x1a\x123\x12a\x12s\x12\x86\x12\x8d\x12\x9a\x12\xb3\x12\xce\x12"
+    b"\xda\x12'\x134\x13:\x13G\x13W\x13i\x13|\x13\x8c\x13\xac\x13\x01\x14\x07\x14\x1c\x14.\x14a\x14j\x14"
+    b"w\x14\x97\x14\x9d\x14\xac\x14\xda\x14\xed\x14\x12\x15\x1e\x15=\x15V\x15_\x15\x96\x15\xa2\x15\xbb\x15\xd4\x15\xe1\x15"
+    b"\xff\x15\x08\x16\x11\x16\x17\x16\x1d\x16#\x16)\x160\x16O\x16_\x16\x9b\x16\xa8\x16\xe2\x16\xe8\x16\x01\x17\x0e\x17"
+    b"U\x17^\x17\xa5\x17\xb9\x17\xca\x17\xd6\x17\xde\x17\x07\x18\x1b\x18,\x18N\x18`\x18\x85\x18\x9b\x18\xa4\x18\xb7\x18"
+    b"\xdc\x18\xf2\x18\x08\x19<\x19q\x19\x87\x19\x94\x19\x9a\x19\xc1\x19\xcf\x19\xfd\x19\x03\x1a=\x1a[\x1as\x1a\x80\x1a"
+    b"\x86\x1a\x99\x1a\xad\x1a\xb9\x1a\xd1\x1a\xe9\x1a\x02\x1b\t\x1b\x1c\x1b*\x1b3\x1b?\x1bF\x1br\x1b\x9d\x1b\xa8\x1b"
+    b"\xaf\x1b\xbc\x1b\xc2\x1b\xdc\x1b\xf9\x1b\x0b\x1c\x11\x1c\x17\x1cW\x1cd\x1c\x8d\x1c\xc0\x1c\xf0\x1c\xfd\x1c\x03\x1d\x17\x1d"
+    b"T\x1d\x85\x1d\x98\x1d\xb2\x1d\xb7\x1d\xc0\x1d\xc6\x1d\xcd\x1d'\x1e4\x1e:\x1eJ\x1eY\x1ep\x1e\x8f\x1e\xa2\x1e"
+    b"\xaf\x1e\xb5\x1e\xde\x1e\r\x1f6\x1fd\x1f\xb7\x1f\xc4\x1f\xee\x1f\x1d M ^ q \x9c \xa5 \xab "
+    b'\xb4 \xc6 \xd6 \xe3 \xfa \n!/!<!R!o!\xa6!\xdf!\xe6!\xec!\xf5!\n"'
+    b'\x16"\x19"&"@"F"T"`"l"x"\x86"\x90"\xae"\xc1"\xcb"\xd7"\xe5"'
+    b'\xf0"\xf9"\x02#\x0b#\x16#\x1d#+#c#'
+    b"\xec\x88\x98\xeb\x9f\x89: %"
+    b"QR \xec\xbd\x94\xeb\x93\x9c %d\xea\xb0\x9c, \xed\x95\x9c \xeb\xb0\x94\xed\x80\xb4 %d\xec\xb4\x88"
+    b"%d\xea\xb0\x9c\xec\x9d\x98 \xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x9d\xb4 \xec\xa7\x80\xea\xb0\x91\xec\x97\x90 \xec\x86\x8d\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4 (\xec\xa0\x84\xec\xb2\xb4 %d\xea\xb0\x9c)"
+    b"%d\xec\x9d\x98 %d \xeb\xa9\x80\xed\x8b\xb0\xec\x8b\x9c\xea\xb7\xb8"
+    b"%d \xeb\xb6\x80\xed\x84\xb0 %d"
+    b"%s \xeb\xb9\x84\xed\x8a\xb8 (%s \xeb\xb9\x84\xed\x8a\xb8/\xed\x94\xbd\xec\x85\x80)"
+    b"%s \xec\xa0\x9c\xea\xb1\xb0\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"%s: \xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\xa8!"
+    b"(\xec\x8b\xa4\xed\x97\x98\xec\xa0\x81 \xea\xb8\xb0\xeb\x8a\xa5)"
+    b"(\xec\x9e\x94\xec\x95\xa1\xec\xa1\xb0\xed\x9a\x8c \xec\xa0\x84\xec\x9a\xa9)"
+    b"12\xeb\x8b\xa8\xec\x96\xb4"
+    b"24\xeb\x8b\xa8\xec\x96\xb4"
+    b"\xea\xb8\xb0\xeb\xb3\xb8 \xec\xa0\x95\xeb\xb3\xb4"
+    b"\xea\xb0\x80\xec\xa0\x95\xec\x9d\x84 \xec\x88\x98\xeb\x9d\xbd\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xea\xb3\x84\xec\xa0\x95"
+    b"\xea\xb3\x84\xec\xa0\x95 #0\xec\x9d\xb4 \xea\xb0\x80\xec\xa0\x95\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xea\xb3\x84\xec\xa0\x95 \xec\x9d\xb8\xeb\x8d\xb1\xec\x8a\xa4"
+    b"\xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88\xeb\xa5\xbc \xec\xb6\x94\xea\xb0\x80\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"%s \xec\x97\x90 \xed\x95\x84\xec\x9a\x94\xed\x95\x9c \xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\xb6\x94\xea\xb0\x80 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc"
+    b"\xec\xa3\xbc\xec\x86\x8c"
+    b"\xec\xa3\xbc\xec\x86\x8c \xec\x9d\xb8\xeb\x8d\xb1\xec\x8a\xa4"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x99\x80 \xeb\xb3\xb4\xec\xa1\xb0 \xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4\xed\x8a\xb8\xeb\xa5\xbc \xec\x98\xac\xeb\xb0\x94\xeb\xa5\xb4\xea\xb2\x8c \xec\xa0\x95\xeb\xa0\xac\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"\xeb\x88\x88\xeb\xb6\x80\xec\x8b\xac \xeb\xb0\xa9\xec\xa7\x80 \xeb\xaa\xa8\xeb\x93\x9c"
+    b"\xeb\x94\x94\xec\x8a\xa4\xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4"
+    b"\xea\xb3\x84\xec\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"BGR \xec\x83\x89\xec\x83\x81"
+    b"BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b"\xeb\x92\xa4\xeb\xa1\x9c"
+    b"\xeb\xa9\x94\xeb\x89\xb4\xeb\xa1\x9c \xeb\x8f\x8c\xec\x95\x84\xea\xb0\x80\xea\xb8\xb0"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\xb0\xb1\xec\x97\x85"
+    b"\xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x9c \xec\x84\x9c\xeb\xaa\x85"
+    b"Base64 \xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8"
+    b"Baudrate"
+    b"\xec\x9d\xb4\xec\xa7\x84\xec\x88\x98 \xea\xb7\xb8\xeb\xa6\xac\xeb\x93\x9c"
+    b"\xed\x85\x8c\xeb\x91\x90\xeb\xa6\xac \xec\x97\xac\xeb\xb0\xb1"
+    b"\xeb\xb0\x9d\xea\xb8\xb0"
+    b"\xeb\xb2\x84\xed\x8a\xbc"
+    b"\xeb\xb2\x84\xed\x8a\xbc \xeb\xb0\x94\xec\x9a\xb4\xec\x8a\xa4 \xeb\xb0\xa9\xec\xa7\x80"
+    b"\xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0 \xec\xba\x90\xec\x8b\x9c"
+    b"\xec\xba\xa1\xec\xb2\x98 \xec\xb7\xa8\xec\x86\x8c\xeb\x90\xa8"
+    b"\xec\x9e\x94\xeb\x8f\x88"
+    b"\xed\x85\x8c\xeb\xa7\x88\xeb\xa5\xbc \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xea\xb3\xa0 \xec\x9e\xac\xeb\xb6\x80\xed\x8c\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x9e\x94\xeb\x8f\x88:"
+    b"\xeb\xb3\x80\xea\xb2\xbd \xec\x82\xac\xed\x95\xad\xec\x9d\x80 \xec\xa2\x85\xeb\xa3\x8c\xeb\x90\xa0\xeb\x95\x8c\xea\xb9\x8c\xec\xa7\x80 \xec\x9c\xa0\xec\xa7\x80\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\xa3\xbc\xec\x86\x8c \xeb\xaa\xa9\xeb\xa1\x9d \xed\x99\x95\xec\x9d\xb8"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c \xed\x99\x95\xec\x9d\xb8"
+    b"\xed\x95\xb4\xeb\x8b\xb9 \xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x9d\xb4 \xec\xa7\x80\xea\xb0\x91\xec\x97\x90 \xec\x86\x8d\xed\x95\x98\xeb\x8a\x94\xec\xa7\x80 \xed\x99\x95\xec\x9d\xb8\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x9d\xbc\xec\xb9\x98\xed\x95\x98\xeb\x8a\x94 \xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x97\x86\xeb\x8a\x94 %d \xea\xb0\x9c\xeb\xa5\xbc \xed\x99\x95\xec\x9d\xb8\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"SD \xec\xb9\xb4\xeb\x93\x9c \xed\x99\x95\xec\x9d\xb8 \xec\xa4\x91\xe2\x80\xa6"
+    b"\xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c \xed\x99\x95\xec\x9d\xb8"
+    b"\xeb\x82\xa0\xec\xa7\x9c \xeb\xb3\x80\xed\x99\x98"
+    b"\xeb\xb3\x80\xea\xb2\xbd \xec\xa3\xbc\xec\x86\x8c\xeb\xa5\xbc \xed\x99\x95\xec\x9d\xb8\xed\x95\xa0 \xec\x88\x98 \xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"QR \xec\xbd\x94\xeb\x93\x9c \xec\x83\x9d\xec\x84\xb1"
+    b"\xeb\xac\xb8\xec\x9e\x90 \xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80\xeb\xa1\x9c QR \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc \xeb\xa7\x8c\xeb\x93\x9c\xec\x8b\x9c\xea\xb2\xa0\xec\x96\xb4\xec\x9a\x94?"
+    b"\xec\x83\x9d\xec\x84\xb1\xeb\x90\xa8:"
+    b"\xed\x98\x84\xec\x9e\xac \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c"
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xec\xa7\x80\xec\xa0\x95 QR \xec\xbd\x94\xeb\x93\x9c"
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8"
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xec\xa0\x95\xec\x9d\x98"
+    b"\xec\xa7\x80\xea\xb0\x91\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xec\xa0\x95\xec\x9d\x98\xed\x95\x98\xeb\xa9\xb4 \xec\x83\x88 \xed\x82\xa4\xea\xb0\x80 \xec\x83\x9d\xec\x84\xb1\xeb\x90\x98\xea\xb3\xa0 \xec\x84\xa4\xeb\xaa\x85\xec\x9e\x90\xea\xb0\x80 \xec\x96\xb8\xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4."
+    b"Cut Depth"
+    b"Cut Method"
+    b"Datum Tool"
+    b"10\xec\xa7\x84\xec\x88\x98"
+    b"\xeb\xb3\xb5\xed\x98\xb8\xed\x99\x94\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xa7\x80\xea\xb0\x91 \xea\xb8\xb0\xeb\xb3\xb8\xec\x84\xa4\xec\xa0\x95"
+    b"\xec\x9d\xb4 \xed\x8c\x8c\xec\x9d\xbc \xec\x82\xad\xec\xa0\x9c?"
+    b"Depth Per Pass"
+    b"\xed\x8c\x8c\xec\x83\x9d \xea\xb2\xbd\xeb\xa1\x9c"
+    b"BIP85 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa5\xbc \xec\x9c\xa0\xeb\x8f\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0 \xec\xa3\xbc\xec\x86\x8c"
+    b"\xec\x9e\xa5\xec\xb9\x98 \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8"
+    b"\xeb\x94\x94\xec\x8a\xa4\xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4"
+    b"\xec\xa0\x84\xec\x9b\x90\xec\x9d\x84 \xeb\x81\x84\xec\xa7\x80 \xeb\xa7\x88\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4. \xec\x99\x84\xeb\xa3\x8c\xed\x95\x98\xeb\x8a\x94 \xeb\x8d\xb0 \xec\x8b\x9c\xea\xb0\x84\xec\x9d\xb4 \xea\xb1\xb8\xeb\xa6\xb4 \xec\x88\x98 \xec\x9e\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xeb\xb3\x80\xed\x99\x98 \xec\x99\x84\xeb\xa3\x8c"
+    b"\xec\x99\x84\xeb\xa3\x8c\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x9d\xb4\xec\xa4\x91 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b"\xeb\x93\x9c\xeb\x9d\xbc\xec\x9d\xb4\xeb\xb2\x84"
+    b"\xeb\xb9\x84\xec\x96\xb4 \xec\x9e\x88\xec\x9d\x8c"
+    b"\xed\x99\x9c\xec\x84\xb1\xed\x99\x94?"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xed\x95\x98\xeb\x8b\xa4"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94 \xed\x9b\x84 \xec\xa0\x80\xec\x9e\xa5"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c QR \xec\xbd\x94\xeb\x93\x9c"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xeb\x8b\xa4\xec\x9d\x8c \xec\x95\x84\xec\x9d\xb4\xeb\x94\x94\xec\x99\x80 \xed\x95\xa8\xea\xbb\x98 \xec\xa0\x80\xec\x9e\xa5\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\xa7\x80 \xeb\xaa\xbb\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94"
+    b"\xec\x95\x94\xed\x98\xb8\xed\x99\x94 \xeb\xaa\xa8\xeb\x93\x9c"
+    b"%d\xea\xb0\x9c\xec\x9d\x98 BIP39 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"6\xec\x9e\x90 \xec\x9d\xb4\xec\x83\x81\xec\x9d\x98 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x84\xb8\xec\x9a\x94"
+    b"BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc 1\xec\x97\x90\xec\x84\x9c 2048 \xec\x82\xac\xec\x9d\xb4\xec\x9d\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc 1\xec\x97\x90\xec\x84\x9c 800 \xec\x82\xac\xec\x9d\xb4\xec\x9d\x98 16\xec\xa7\x84\xec\x88\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc 1\xec\x97\x90\xec\x84\x9c 4000 \xec\x82\xac\xec\x9d\xb4\xec\x9d\x98 8\xec\xa7\x84\xec\x88\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xec\xa7\x80\xec\x9a\xb0\xea\xb8\xb0"
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xec\x82\xad\xec\xa0\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\x98\xa4\xeb\xa5\x98:"
+    b"Esc"
+    b"\xed\x8c\x8c\xec\x9d\xbc\xec\x9d\x84 \xed\x83\x90\xec\x83\x89\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xa3\xbc\xec\x86\x8c \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0"
+    b"%s \xec\x9d\x84 (\xeb\xa5\xbc) SD \xec\xb9\xb4\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xeb\x8a\x94 \xec\xa4\x91\xe2\x80\xa6"
+    b"XPUB \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0"
+    b"\xea\xb3\xb5\xec\x9e\xa5 \xec\xb4\x88\xea\xb8\xb0 \xec\x84\xa4\xec\xa0\x95"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc \xec\x88\x98\xec\xa7\x91 \xec\x8b\xa4\xed\x8c\xa8"
+    b"\xeb\xb3\xb5\xed\x98\xb8\xed\x99\x94\xec\x97\x90 \xec\x8b\xa4\xed\x8c\xa8\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xeb\xa1\x9c\xeb\x93\x9c \xec\x8b\xa4\xed\x8c\xa8"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\xa7\x80 \xeb\xaa\xbb\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xec\x88\x98\xec\x88\x98\xeb\xa3\x8c:"
+    b"Feed Rate"
+    b"\xed\x8c\x8c\xec\x9d\xbc\xeb\xaa\x85"
+    b"%s \xed\x8c\x8c\xec\x9d\xbc\xeb\xaa\x85\xec\x9d\xb4 SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\x9d\xb4\xeb\xaf\xb8 \xec\xa1\xb4\xec\x9e\xac\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa1\x9c \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c\xeb\xa5\xbc \xec\xb1\x84\xec\x9a\xb0\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xec\xb1\x84\xec\x9a\xb0\xea\xb8\xb0"
+    b"PSBT\xec\x97\x90\xec\x84\x9c \xec\xa7\x80\xeb\xac\xb8\xec\x9d\xb4 \xec\x84\xa4\xec\xa0\x95\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\xa7\xb5"
+    b"\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\x8f\x84\xea\xb5\xac"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa1\x9c \xea\xb0\x80\xeb\x93\x9d \xec\xb0\xac \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c"
+    b"\xed\x94\x8c\xeb\xa3\xa8\xed\x8a\xb8 \xec\xa7\x81\xea\xb2\xbd"
+    b"\xec\x97\xac\xec\x9c\xa0 \xea\xb3\xb5\xea\xb0\x84:"
+    b"\xec\xa0\x80\xec\x9e\xa5\xea\xb3\xb5\xea\xb0\x84\xec\x97\x90\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0"
+    b"\xeb\x8b\xa4\xeb\xa5\xb8 \xec\x9e\xa5\xec\xb9\x98\xec\x97\x90\xec\x84\x9c \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xeb\xb3\xb5\xea\xb5\xac\xea\xb0\x80 \xeb\xb6\x88\xea\xb0\x80\xeb\x8a\xa5\xed\x95\x98\xeb\x8f\x84\xeb\xa1\x9d SD\xec\xb9\xb4\xeb\x93\x9c\xeb\xa5\xbc \xec\x99\x84\xec\xa0\x84\xed\x9e\x88 \xec\xa7\x80\xec\x9a\xb0\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xea\xb0\xad \xed\x95\x9c\xeb\x8f\x84"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xec\x83\x9d\xec\x84\xb1"
+    b"\xec\x84\xa0\xed\x83\x9d"
+    b"\xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x95\x98\xeb\x93\x9c\xec\x9b\xa8\xec\x96\xb4"
+    b"\xed\x97\xa4\xeb\x93\x9c \xec\xa2\x85\xeb\xa5\x98"
+    b"16\xec\xa7\x84\xec\x88\x98 \xea\xb3\xb5\xea\xb0\x9c\xed\x82\xa4:"
+    b"16\xec\xa7\x84\xec\x88\x98"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xec\x88\xa8\xea\xb8\xb0\xea\xb8\xb0"
+    b"\xec\x88\x98\xec\x88\x98\xeb\xa3\x8c\xea\xb0\x80 \xeb\x86\x92\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"ID"
+    b"\xec\x95\x84\xec\x9d\xb4\xeb\x94\x94\xea\xb0\x80 \xec\x9d\xb4\xeb\xaf\xb8 \xec\xa1\xb4\xec\x9e\xac\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xec\x9d\xb8\xeb\x8d\xb1\xec\x8a\xa4"
+    b"Input (%d):"
+    b"\xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\x9c\xa0\xed\x9a\xa8\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x9d\x80 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c"
+    b"\xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x9c \xed\x8c\x8c\xec\x83\x9d \xea\xb2\xbd\xeb\xa1\x9c"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xea\xb8\xb8\xec\x9d\xb4\xea\xb0\x80 \xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xec\xa7\x80\xea\xb0\x91\xec\x9d\xb4 \xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:"
+    b"\xeb\xb0\x98\xec\xa0\x84"
+    b"\xeb\xb0\x98\xec\xa0\x84\xeb\x90\x9c \xec\x83\x89\xec\x83\x81"
+    b"KEF \xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\xa8"
+    b"\xed\x82\xa4"
+    b"\xed\x82\xa4\xea\xb0\x80 \xec\xa0\x9c\xea\xb3\xb5\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"Krux \xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 QR"
+    b"LCD \xec\x9c\xa0\xed\x98\x95"
+    b"\xec\x96\xb8\xec\x96\xb4"
+    b"\xeb\xa7\x88\xec\xa7\x80\xeb\xa7\x89 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc Krux\xea\xb0\x80 \xec\x84\xa0\xed\x83\x9d\xed\x95\x98\xeb\x8f\x84\xeb\xa1\x9d \xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xeb\xb9\x84\xec\x9b\x8c\xeb\x91\x90\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xec\x99\xbc\xec\xaa\xbd"
+    b"\xea\xb8\xb8\xec\x9d\xb4:"
+    b"\xec\xa4\x84 \xec\xa7\x80\xec\x97\xb0"
+    b"\xec\xa4\x84:"
+    b"\xec\xa3\xbc\xec\x86\x8c \xeb\xaa\xa9\xeb\xa1\x9d"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0"
+    b"\xec\x9d\xb4\xeb\x8c\x80\xeb\xa1\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0"
+    b"\xec\xa3\xbc\xec\x86\x8c\xeb\xa5\xbc \xeb\xb3\xb4\xea\xb8\xb0\xec\x9c\x84\xed\x95\xb4 \xec\x8b\xa0\xeb\xa2\xb0\xed\x95\xa0 \xec\x88\x98 \xec\x9e\x88\xeb\x8a\x94 \xec\x9b\x94\xeb\xa0\x9b \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xeb\xa1\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0"
+    b"\xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xeb\xb3\x80\xea\xb2\xbd \xec\xa3\xbc\xec\x86\x8c \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\x88\x98\xec\x8b\xa0 \xec\xa3\xbc\xec\x86\x8c \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\x96\xb8\xec\x96\xb4 \xec\x84\xa4\xec\xa0\x95"
+    b"\xea\xb8\xb0\xeb\xb3\xb8 \xec\xa0\x80\xec\x9e\xa5\xec\x86\x8c"
+    b"\xec\xa4\x91\xea\xb0\x84"
+    b"\xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80"
+    b"\xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80:"
+    b"\xeb\xaf\xb8\xeb\x8b\x88\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x8a\xb8"
+    b"\xeb\xaf\xb8\xeb\x9f\xac X \xec\xa2\x8c\xed\x91\x9c"
+    b"\xec\x84\x9c\xeb\xaa\x85 \xed\x8c\x8c\xec\x9d\xbc\xec\x9d\xb4 \xeb\x88\x84\xeb\x9d\xbd\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xea\xb3\xbc \xec\x95\x94\xed\x98\xb8\xeb\x8a\x94 \xec\x9c\xa0\xec\xa7\x80\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\x88\x98\xec\xa0\x95\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:"
+    b"\xeb\x84\xa4\xec\x9d\xb4\xed\x8b\xb0\xeb\xb8\x8c \xec\x84\xb8\xea\xb7\xb8\xec\x9c\x97 - BIP84\xeb\xa5\xbc \xec\xa0\x81\xec\x9a\xa9\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xeb\x84\xa4\xed\x8a\xb8\xec\x9b\x8c\xed\x81\xac"
+    b"\xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b"\xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xed\x8e\x8c\xec\x9b\xa8\xec\x96\xb4\xea\xb0\x80 \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\x95\x84\xeb\x8b\x88\xec\x9a\x94"
+    b"\xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x97\x86\xec\x9d\x8c"
+    b"\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84 \xed\x9a\x9f\xec\x88\x98\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\xb0\xbe\xec\x9d\x84 \xec\x88\x98 \xec\x97\x86\xec\x9d\x8c:"
+    b"\xec\x8b\x9c\xeb\x93\x9c\xeb\xac\xb8\xea\xb5\xac \xec\x88\x9c\xeb\xb2\x88"
+    b"8\xec\xa7\x84\xec\x88\x98"
+    b"\xea\xb8\xb0\xed\x83\x80 \xed\x98\x95\xec\x8b\x9d"
+    b"\xeb\x8d\xae\xec\x96\xb4\xec\x93\xb0\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xeb\xb0\x9d\xea\xb8\xb0\xeb\xa5\xbc \xec\xa0\x84\xed\x99\x98\xed\x95\x98\xeb\x8a\x94 PAGE"
+    b"PBKDF2 iter."
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xea\xb0\x80 \xea\xb0\x90\xec\xa7\x80\xed\x95\xa0 \xec\x88\x98 \xec\x9e\x88\xeb\x8f\x84\xeb\xa1\x9d \xed\x8e\x80\xec\xb9\x98\xeb\x90\x9c \xec\xa0\x90\xec\x9d\x84 \xea\xb2\x80\xea\xb2\x8c \xec\xb9\xa0\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"\xec\xa2\x85\xec\x9d\xb4 \xeb\x84\x88\xeb\xb9\x84"
+    b"\xed\x8c\x8c\xed\x8a\xb8"
+    b"N\xec\x9d\x98 \xed\x8c\x8c\xed\x8a\xb8 M"
+    b"\xed\x8c\x8c\xed\x8a\xb8 \xec\x82\xac\xec\x9d\xb4\xec\xa6\x88"
+    b"\xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88"
+    b"\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8 \xea\xb8\xb8\xec\x9d\xb4"
+    b"\xea\xb2\xbd\xeb\xa1\x9c \xeb\xb6\x88\xec\x9d\xbc\xec\xb9\x98"
+    b"\xed\x8c\xa8\xed\x84\xb4\xec\x9d\xb4 \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\xa0\x80\xec\x9e\xa5\xeb\x90\x9c \xeb\xaa\xa8\xeb\x93\xa0 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\xb0\x8f \xec\x84\xa4\xec\xa0\x95\xea\xb0\x92\xec\x9d\x84 \xec\x98\x81\xea\xb5\xac\xec\xa0\x81\xec\x9c\xbc\xeb\xa1\x9c \xec\xa0\x9c\xea\xb1\xb0\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xa0\x80\xec\x9e\xa5"
+    b"\xed\x94\xbd\xec\x85\x80 \xed\x8e\xb8\xec\xb0\xa8 \xec\xa7\x80\xec\x88\x98:"
+    b"\xec\x9d\xbc\xeb\xb0\x98\xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8 QR"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xec\xb9\xa8\xec\x88\x98\xec\x9c\xa8"
+    b"\xec\xa0\x95\xec\xb1\x85 \xec\x9c\xa0\xed\x98\x95"
+    b"\xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xea\xb0\x80 \xeb\xb6\x80\xec\xa1\xb1\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\xb6\x9c\xeb\xa0\xa5"
+    b"PAGE\xeb\xa1\x9c \xec\xb7\xa8\xec\x86\x8c."
+    b"\xeb\xaa\xa8\xeb\x93\x9c\xeb\xa5\xbc \xec\xa0\x84\xed\x99\x98\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 PAGE\xeb\xa5\xbc \xeb\x88\x84\xeb\xa5\xb4\xec\x84\xb8\xec\x9a\x94"
+    b"QR \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 \xec\x9d\xb8\xec\x87\x84"
+    b"Tinyseed\xeb\xa5\xbc \xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"QR\xeb\xa1\x9c \xec\x9d\xb8\xec\x87\x84"
+    b"QR\xeb\xa1\x9c \xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0"
+    b"\xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xeb\x93\x9c\xeb\x9d\xbc\xec\x9d\xb4\xeb\xb2\x84\xea\xb0\x80 \xec\x84\xa4\xec\xa0\x95\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\xb6\x9c\xeb\xa0\xa5\xec\xa4\x91\xe2\x80\xa6"
+    b"\xea\xb3\x84\xec\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xea\xb3\x84\xec\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\xb2\x98\xeb\xa6\xac \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\xb6\xa9\xeb\xb6\x84\xed\x9e\x88 \xec\x82\xac\xec\x9a\xa9\xed\x95\xa0 \xec\x88\x98 \xec\x97\x86\xec\x9d\x8c"
+    b"QR \xec\xbd\x94\xeb\x93\x9c"
+    b"QR \xeb\x9d\xbc\xeb\xb2\xa8"
+    b"\xec\x88\x98\xeb\x9f\x89"
+    b"RX \xed\x95\x80"
+    b"\xec\xa2\x85\xeb\xa3\x8c"
+    b"\xeb\xb0\x9b\xea\xb8\xb0"
+    b"\xec\xa7\x80\xec\x97\xad:"
+    b"%s\xec\x9d\x84 \xec\xa0\x9c\xea\xb1\xb0\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xec\xa0\x9c\xea\xb1\xb0"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90\xec\x84\x9c \xed\x8e\x8c\xec\x9b\xa8\xec\x96\xb4 \xed\x8c\x8c\xec\x9d\xbc\xec\x9d\x84 \xec\xa0\x9c\xea\xb1\xb0\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"Res. - \xed\x98\x95\xec\x8b\x9d"
+    b"\xea\xb3\xb5\xec\x9e\xa5 \xec\x84\xa4\xec\xa0\x95\xec\x9d\x84 \xeb\xb3\xb5\xec\x9b\x90\xed\x95\x98\xea\xb3\xa0 \xec\x9e\xac\xeb\xb6\x80\xed\x8c\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xea\xb2\xb0\xea\xb3\xbc"
+    b"QR \xeb\xb7\xb0\xec\x96\xb4\xeb\xa1\x9c \xeb\x8f\x8c\xec\x95\x84\xea\xb0\x80\xea\xb8\xb0"
+    b"\xeb\x8b\xa4\xec\x8b\x9c \xea\xb2\x80\xed\x86\xa0"
+    b"\xec\x8a\xa4\xec\xba\x94\xeb\x90\x9c \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0\xeb\xa5\xbc \xea\xb2\x80\xed\x86\xa0\xed\x95\x98\xea\xb3\xa0 \xed\x95\x84\xec\x9a\x94\xed\x95\x9c \xea\xb2\xbd\xec\x9a\xb0 \xec\x88\x98\xec\xa0\x95\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xec\x98\xa4\xeb\xa5\xb8\xec\xaa\xbd"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xec\x83\x9d\xec\x84\xb1\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xeb\xa5\xbc \xec\xb5\x9c\xec\x86\x8c %d\xeb\xb2\x88 \xea\xb5\xb4\xeb\xa6\xac\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xea\xb0\x92 \xeb\xb6\x84\xed\x8f\xac:"
+    b"\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84 \xed\x9a\x9f\xec\x88\x98:"
+    b"180\xc2\xb0 \xed\x9a\x8c\xec\xa0\x84"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xea\xb0\x80 \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xec\x9d\x98 SHA256:"
+    b"SHA256 \xec\x8a\xa4\xeb\x83\x85\xec\x83\xb7:"
+    b"QR \xec\x9d\xb4\xeb\xaf\xb8\xec\xa7\x80\xeb\xa5\xbc SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xeb\x90\xa8:"
+    b"\xec\x8a\xa4\xec\xbc\x80\xec\x9d\xbc"
+    b"\xec\xa3\xbc\xec\x86\x8c \xec\x8a\xa4\xec\xba\x94\xed\x95\x98\xea\xb8\xb0"
+    b"BIP39 \xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x8a\xa4\xec\xba\x94\xed\x95\x98\xea\xb8\xb0"
+    b"\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8 QR \xec\x8a\xa4\xec\xba\x94"
+    b"\xec\x8a\xa4\xec\xba\x94 \xed\x94\x84\xeb\xa1\x9c\xed\x8c\x8c\xec\x9d\xbc\xeb\xa7\x81"
+    b"1\xeb\xb2\x88\xec\xa7\xb8\xeb\xb6\x80\xed\x84\xb0 12\xeb\xb2\x88\xec\xa7\xb8 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x8a\xa4\xec\xba\x94 \xec\xa4\x91\xec\x9e\x85\xeb\x8b\x88\xeb\x8b\xa4"
+    b"13\xeb\xb2\x88\xec\xa7\xb8\xeb\xb6\x80\xed\x84\xb0 24\xeb\xb2\x88\xec\xa7\xb8 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x8a\xa4\xec\xba\x94 \xec\xa4\x91\xec\x9e\x85\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x99\x94\xeb\xa9\xb4\xeb\xb3\xb4\xed\x98\xb8\xea\xb8\xb0 \xec\x8b\x9c\xea\xb0\x84"
+    b"\xec\xa7\x80\xea\xb0\x91 \xed\x98\x95\xec\x8b\x9d"
+    b"\xeb\xb3\xb4\xec\x95\x88"
+    b"\xeb\xb3\xb8\xec\x9d\xb8\xec\xa3\xbc\xec\x86\x8c \xec\xa0\x84\xec\x86\xa1 \xeb\x98\x90\xeb\x8a\x94 \xec\x9e\x94\xeb\x8f\x88 (%d):"
+    b"\xec\x9e\x90\xea\xb0\x80 \xec\x9d\xb4\xec\xb2\xb4:"
+    b"\xeb\xa8\xbc\xec\xa0\x80 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc \xec\x84\xa4\xec\xa0\x95\xed\x95\x98\xec\x84\xb8\xec\x9a\x94"
+    b"\xec\x84\xa4\xec\xa0\x95"
+    b"\xec\x84\xa4\xec\xa0\x95\xec\x9d\x80 \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c\xec\x97\x90\xec\x84\x9c \xeb\x82\xb4\xeb\xb6\x80\xec\xa0\x81\xec\x9c\xbc\xeb\xa1\x9c \xec\xa0\x80\xec\x9e\xa5\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4."
+    b"SD \xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xeb\x90\x9c \xec\x84\xa4\xec\xa0\x95."
+    b"Shannon\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc:"
+    b"\xeb\x8c\x80\xec\xb6\x94 \xed\x91\x9c\xec\x8b\x9c"
+    b"\xec\xa2\x85\xeb\xa3\x8c"
+    b"\xec\x9e\x90\xeb\x8f\x99 \xec\xa2\x85\xeb\xa3\x8c\xec\x8b\x9c\xea\xb0\x84"
+    b"\xec\xa2\x85\xeb\xa3\x8c \xec\xa4\x80\xeb\xb9\x84 \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\x84\x9c\xeb\xaa\x85\xed\x95\x98\xea\xb8\xb0"
+    b"QR\xec\xbd\x94\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0"
+    b"\xec\x84\x9c\xeb\xaa\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x84\x9c\xeb\xaa\x85:"
+    b"\xec\x84\x9c\xeb\xaa\x85\xeb\x90\x9c \xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80"
+    b"\xec\x84\x9c\xeb\xaa\x85\xeb\x90\x9c PSBT"
+    b"\xec\x84\x9c\xeb\xaa\x85\xe2\x80\xa6"
+    b"\xeb\x8b\xa8\xec\x9d\xbc\xec\x84\x9c\xeb\xaa\x85"
+    b"\xed\x81\xac\xea\xb8\xb0:"
+    b"\xec\x9d\xbc\xeb\xb6\x80 \xea\xb2\x80\xec\x82\xac\xeb\xa5\xbc \xec\x88\x98\xed\x96\x89\xed\x95\xa0 \xec\x88\x98 \xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xec\x9d\xbc\xeb\xb6\x80 \xeb\x85\xb8\xeb\x93\x9c\xea\xb0\x80 \xea\xb2\xbd\xed\x99\x94\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:"
+    b"Spend (%d):"
+    b"\xec\xa7\x80\xec\xb6\x9c:"
+    b"\xed\x91\x9c\xec\xa4\x80 \xeb\xaa\xa8\xeb\x93\x9c"
+    b"Static"
+    b"\xec\xa0\x84\xeb\xac\xb8\xea\xb0\x80\xeb\xa5\xbc \xec\x9c\x84\xed\x95\x9c \xed\x86\xb5\xea\xb3\x84"
+    b"\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\xa9\x94\xeb\xaa\xa8\xeb\xa6\xac\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5"
+    b"SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5"
+    b"\xea\xb0\x95\xeb\xa0\xa5"
+    b"\xea\xb0\x95\xed\x95\x9c"
+    b"\xeb\xaa\xa8\xeb\x93\x9c\xeb\xa5\xbc \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xed\x99\x94\xeb\xa9\xb4\xec\x9d\x84 \xec\x98\x86\xec\x9c\xbc\xeb\xa1\x9c \xec\x93\xb8\xec\x96\xb4\xeb\x82\xb4\xeb\xa6\xac\xec\x84\xb8\xec\x9a\x94"
+    b"TC Flash Hash"
+    b"\xeb\xb6\x80\xed\x8c\x85 \xec\x8b\x9c \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xed\x83\xac\xed\x8d\xbc \xed\x99\x95\xec\x9d\xb8 \xed\x95\xb4\xec\x8b\x9c"
+    b"\xed\x84\xb0\xec\xb9\x98\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xec\x97\x94\xed\x84\xb0\xeb\xa5\xbc \xeb\x88\x8c\xeb\x9f\xac \xec\xba\xa1\xec\xb2\x98\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xec\x84\xa4\xec\xb9\x98\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xed\x84\xb0\xec\xb9\x98\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x84\xb8\xec\x9a\x94."
+    b"TR \xeb\x82\xb4\xeb\xb6\x80 \xed\x82\xa4"
+    b"TX \xed\x95\x80"
+    b"\xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c"
+    b"\xed\x83\xac\xed\x8d\xbc \xea\xb2\x80\xec\x82\xac \xec\xbd\x94\xeb\x93\x9c\xea\xb0\x80 \xec\x84\xb1\xea\xb3\xb5\xec\xa0\x81\xec\x9c\xbc\xeb\xa1\x9c \xec\x84\xa4\xec\xa0\x95\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x83\xac\xed\x8d\xbc \xea\xb2\x80\xec\x82\xac \xec\xbd\x94\xeb\x93\x9c\xea\xb0\x80 \xec\x9d\xbc\xec\xb9\x98\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 \xec\x8a\xa4\xec\x9c\x84\xed\x8a\xb8"
+    b"\xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 \xec\xa0\x9c\xed\x92\x88\xea\xb5\xb0 \xea\xb2\xb0\xea\xb3\xbc"
+    b"Test:"
+    b"\xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8"
+    b"\xed\x85\x8c\xeb\xa7\x88"
+    b"Thermal"
+    b"\xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xeb\xb3\xb5\xea\xb5\xac\xea\xb0\x80 \xeb\xb6\x88\xea\xb0\x80\xeb\x8a\xa5\xed\x95\x98\xeb\x8f\x84\xeb\xa1\x9d \xec\x9e\xa5\xec\xb9\x98 \xec\xa0\x84\xec\xb2\xb4\xec\xa7\x80\xec\x9a\xb0\xea\xb8\xb0 \xea\xb8\xb0\xeb\x8a\xa5\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xeb\xb0\x9d\xea\xb8\xb0 \xec\xa0\x84\xed\x99\x98"
+    b"\xeb\x8f\x84\xea\xb5\xac"
+    b"\xed\x84\xb0\xec\xb9\x98 \xeb\xaf\xbc\xea\xb0\x90\xeb\x8f\x84"
+    b"\xed\x84\xb0\xec\xb9\x98\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xb0"
+    b"\xeb\x8d\x94 \xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"BIP39 \xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x9e\x85\xeb\xa0\xa5"
+    b"\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8 \xec\x9e\x85\xeb\xa0\xa5"
+    b"\xec\x8b\xa4\xed\x96\x89 \xec\xb7\xa8\xec\x86\x8c"
+    b"\xeb\x8b\xa8\xec\x9c\x84"
+    b"KEF ID\xeb\xa5\xbc \xec\x97\x85\xeb\x8d\xb0\xec\x9d\xb4\xed\x8a\xb8\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"QR \xeb\xa0\x88\xec\x9d\xb4\xeb\xb8\x94\xec\x9d\x84 \xec\x97\x85\xeb\x8d\xb0\xec\x9d\xb4\xed\x8a\xb8\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xec\x97\x85\xea\xb7\xb8\xeb\xa0\x88\xec\x9d\xb4\xeb\x93\x9c\xea\xb0\x80 \xec\x99\x84\xeb\xa3\x8c\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xea\xb2\x80\xec\x9d\x80\xec\x83\x89 \xeb\xb0\xb0\xea\xb2\xbd \xed\x99\x94\xeb\xa9\xb4\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4."
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa5\xbc \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x97\xac \xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xec\x83\x9d\xec\x84\xb1\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xed\x98\x84\xec\x9e\xac \xec\x88\x98\xec\xb9\x98"
+    b"\xea\xb8\xb0\xeb\xb3\xb8 \xeb\xaa\xa8\xeb\x93\x9c\xeb\xa5\xbc \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xea\xb8\xb0\xeb\xb3\xb8 PBKDF2 \xeb\xb0\x98\xeb\xb3\xb5\xeb\xac\xb8\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.?"
+    b"\xec\xa7\x80\xeb\xac\xb8\xec\x9d\x84 \xec\x8b\xa0\xeb\xb6\x84\xec\xa6\x9d\xec\x9c\xbc\xeb\xa1\x9c \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x96\xb4\xec\x9a\x94?"
+    b"\xec\x9d\xb4\xeb\xaf\xb8 \xec\x82\xac\xec\x9a\xa9\xeb\x90\xa8:"
+    b"\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0"
+    b"%s\xeb\x8a\x94 [%s, %s] \xeb\xb2\x94\xec\x9c\x84\xeb\xa5\xbc \xeb\xb2\x97\xec\x96\xb4\xeb\x82\xac\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+    b"\xed\x99\x95\xec\x9d\xb8\xe2\x80\xa6"
+    b"\xeb\xb2\x84\xec\xa0\x84"
+    b"\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc"
+    b"20\xeb\xa9\xb4\xec\xb2\xb4 \xec\xa3\xbc\xec\x82\xac\xec\x9c\x84"
+    b"\xec\x9d\xbc\xeb\xb0\x98 \xec\xa3\xbc\xec\x82\xac\xec\x9c\x84"
+    b"\xec\xa7\x81\xec\xa0\x91 \xec\x9e\x85\xeb\xa0\xa5"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\x8b\xa8\xec\x96\xb4 \xec\x9e\x85\xeb\xa0\xa5"
+    b"\xed\x91\x9c\xec\x8b\x9c \xeb\xa0\x88\xec\x9d\xb4\xeb\xb8\x94"
+    b"\xec\xba\xa1\xec\xb2\x98\xeb\x90\xa0\xeb\x95\x8c\xea\xb9\x8c\xec\xa7\x80 \xea\xb8\xb0\xeb\x8b\xa4\xeb\xa6\xac\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\x84\xa4\xec\xa0\x95"
+    b"\xec\xa7\x80\xea\xb0\x91 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xea\xb0\x80 \xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc \xec\xb0\xbe\xec\x9d\x84 \xec\x88\x98 \xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xea\xb2\xbd\xea\xb3\xa0:"
+    b"\xec\x95\xbd\xed\x95\x9c"
+    b"%d \xeb\x8b\xa8\xec\x96\xb4"
+    b"\xeb\x8b\xa8\xec\x96\xb4 \xeb\xb2\x88\xed\x98\xb8(1-2048)"
+    b"\xec\x8b\x9c\xeb\x93\x9c\xeb\xac\xb8\xea\xb5\xac"
+    b"\xec\x98\x88"
+    b"\xed\x99\x95\xeb\x8c\x80 \xeb\xaa\xa8\xeb\x93\x9c"
+    b"\xeb\xb0\x94\xec\x9d\xb4\xeb\x84\x88\xeb\xa6\xac: {} \xeb\xb0\x94\xec\x9d\xb4\xed\x8a\xb8"
+    b"\xec\x8b\xa4\xed\x8c\xa8"
+    b"16\xec\xa7\x84\xec\x88\x98\xeb\xb6\x80\xed\x84\xb0"
+    b"base32\xec\x97\x90\xec\x84\x9c"
+    b"base43\xec\x97\x90\xec\x84\x9c"
+    b"base64\xec\x97\x90\xec\x84\x9c"
+    b"16\xec\xa7\x84\xec\x88\x98\xeb\xb6\x80\xed\x84\xb0"
+    b"utf8\xec\x97\x90\xec\x84\x9c"
+    b"\xeb\x8a\x94 \xec\x9c\xa0\xed\x9a\xa8\xed\x95\x9c \xec\xa3\xbc\xec\x86\x8c\xec\x9e\x85\xeb\x8b\x88\xeb\x8b\xa4!"
+    b"\xec\x8b\x9c\xed\x94\x84\xed\x8a\xb8 \xec\xbc\x80\xec\x9d\xb4\xec\x8a\xa4"
+    b"\xec\x84\xb1\xea\xb3\xb5\xeb\xa5\xa0:"
+    b"\xec\x8a\xa4\xec\x99\x80\xec\x9d\xb4\xed\x94\x84"
+    b"text: {} chars"
+    b"16\xec\xa7\x84\xec\x88\x98\xeb\xa1\x9c"
+    b"base32\xeb\xa1\x9c"
+    b"to base43"
+    b"base64\xeb\xa1\x9c"
+    b"16\xec\xa7\x84\xec\x88\x98\xeb\xa1\x9c"
+    b"utf8\xeb\xa1\x9c"
+    b"\xec\x95\x8c \xec\x88\x98 \xec\x97\x86\xec\x9d\x8c"
+    b"\xec\xb2\xab \xeb\xb2\x88\xec\xa7\xb8 %d\xea\xb0\x9c\xec\x9d\x98 \xec\xa3\xbc\xec\x86\x8c\xec\x97\x90\xec\x84\x9c \xec\xb0\xbe\xec\x9d\x84 \xec\x88\x98 \xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% van het bedrag.",
-    "%d van %d multisig",
-    "%d tot %d",
-    "%s bits (%s bits/px)",
-    "%s verwijderd.",
-    "%s: geladen!",
-    "(Experimenteel)",
-    "(alleen inzien)",
-    "12 woorden",
-    "24 woorden",
-    "Over",
-    "Aanname accepteren?",
-    "Account",
-    "Account #0 zou worden aangenomen",
-    "Accountindex",
-    "Wachtwoordzin voor portemonnee toevoegen of wijzigen?",
-    "Extra entropie van camera vereist voor %s",
-    "Adres",
-    "Richt de camera en back-upplaat op de juiste manier.",
-    "Anti-verblindingsmodus",
-    "Uiterlijk",
-    "Weet je het zeker?",
-    "BGR-kleuren",
-    "BIP39 Mnemonic",
-    "Terug",
-    "Terug naar menu",
-    "Backup geheugensteun",
-    "Ongeldige handtekening",
-    "Base64-wachtwoord",
-    "Baudratio",
-    "Binair raster",
-    "Rand opvulling",
-    "Helderheid",
-    "Knoppen",
-    "Debounce van knoppen",
-    "Opname geannuleerd",
-    "Change",
-    "Thema veranderen en opnieuw opstarten?",
-    "Wisselgeld:",
-    "Wijzigingen blijven van kracht tot afsluiten.",
-    "Controleer SD kaart",
-    "Controleer of dit adres bij deze portemonnee hoort?",
-    "%d adressen gecontroleerd zonder overeenkomsten.",
-    "Controleren op SD-kaart…",
-    "Bevestig de sabotagecontrolecode",
-    "Datum converteren",
-    "Kan adreswijziging niet bepalen.",
-    "QR-code aanmaken",
-    "QR-code maken van tekst?",
-    "Aangemaakt:",
-    "Huidige sabotagecontrolecode",
-    "Aangepaste QR-code",
-    "Aangepaste tekst",
-    "Aanpassen",
-    "Bij aanpassen van de portemonnee zal er een nieuwe sleutel gegenereerd worden en ontlaadt de Descriptor.",
-    "Snijdiepte",
-    "Snijmethode",
-    "Datum Tool",
-    "Decimaal",
-    "Ontsleutelen?",
-    "Standaard portemonnee",
-    "Dit bestand verwijderen?",
-    "Diepte per pas",
-    "Afleidingspad",
-    "BIP85-entropie afleiden?",
-    "Descriptoradressen",
-    "Apparaattests",
-    "Weergave",
-    "Schakel het apparaat niet uit, het kan even duren voordat het klaar is.",
-    "Converteren gedaan.\r",
-    "Klaar?",
-    "Dubbel geheugensteuntje",
-    "Driver",
-    "Leeg",
-    "Inschakelen?",
-    "Versleutelen",
-    "Versleuteld",
-    "Versleutelde QR code",
-    "Versleutelde geheugensteun is opgeslagen met ID:",
-    "Versleutelde geheugensteun was niet opgeslagen",
-    "Versleutelen",
-    "Versleutel modus",
-    "Voer %d BIP39 woorden in.",
-    "Voer een sabotagecontrolecode van 6 of meer tekens in",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een nummer van 1 tot 2048.",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een hexadecimaal van 1 tot 800.",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een octaal van 1 tot 4000.",
-    "Voer elk woord van jouw BIP39 geheugensteun in.",
-    "Gegevens van gebruiker wissen",
-    "Gebruikersgegevens worden gewist…",
-    "Fout:",
-    "Esc",
-    "Bestanden verkennen?",
-    "Adressen exporteren",
-    "Exporteren van %s naar SD-kaart…",
-    "Uitgebreide publieke sleutel",
-    "Fabrieksinstellingen",
-    "Verzamelen van camera entropie mislukt",
-    "Ontsleutelen is niet gelukt",
-    "Laden mislukt",
-    "Geheugensteun opslaan is niet gelukt",
-    "Tarief:",
-    "Voedingssnelheid",
-    "Bestandsnaam",
-    "Bestandsnaam %s bestaat op SD kaart.",
-    "De flash vullen met entropie van de camera?",
-    "Flash vullen",
-    "Vingerafdruk niet ingesteld in PSBT",
-    "Flash Map",
-    "Flash Tools",
-    "Flash gevuld met camera-entropie",
-    "Fluit diameter",
-    "Vrij:",
-    "Uit data-opslag",
-    "Wis uw SD kaart volledig in een ander apparaat om te zorgen dat de gegevens onherstelbaar zijn",
-    "Geheugensteun genereren",
-    "Ga",
-    "Goede entropie",
-    "Hardware",
-    "Type gereedschapskop",
-    "Hex publieke sleutel:",
-    "Hexadecimaal",
-    "Verberg geheugensteunen",
-    "Hoge kosten!",
-    "ID",
-    "ID bestaat al",
-    "Index",
-    "Invoer (%d):",
-    "Onvoldoende Entropie!",
-    "Ongeldige sabotagecontrolecode",
-    "Ongeldig adres",
-    "Ongeldige afleidingspad",
-    "Ongeldige geheugensteun lengte",
-    "Ongeldige portemonnee:",
-    "Omkeren",
-    "Omgekeerde kleuren",
-    "KEF versleuteld",
-    "Sleutel",
-    "Sleutel niet verstrekt",
-    "Krux printer test QR",
-    "LCD-type",
-    "Taal",
-    "Laat leeg als je wilt dat Krux een geldig laatste woord kiest",
-    "Links",
-    "Lengte:",
-    "Lijn vertraging",
-    "Lijn:",
-    "Adressenlijst",
-    "Geheugensteun laden",
-    "Portemonnee laden",
-    "Een vertrouwde portemonnee descriptor laden om adressen te bekijken?",
-    "Laden vanaf SD kaart",
-    "Laden vanaf SD kaart?",
-    "Laden van camera",
-    "Laden?",
-    "Camera wordt geladen…",
-    "Wijzigingsadressen worden geladen…",
-    "Printer wordt geladen…",
-    "Ontvangstadressen worden geladen…",
-    "Laden…",
-    "Taal",
-    "Opslaglocatie",
-    "Gemiddeld",
-    "Bericht",
-    "Bericht:",
-    "Miniscript",
-    "X-coördinaten spiegelen",
-    "Handtekening bestand mist",
-    "Geheugensteun",
-    "Geheugensteun en wachtwoord worden bewaard.",
-    "Aangepast:",
-    "Native Segwit - 84 zal worden gebruikt",
-    "Netwerk",
-    "Geheugensteun aanmaken",
-    "Nieuwe firmware gevonden.",
-    "Nee",
-    "Geen wachtwoordzin",
-    "Niet genoeg gedobbeld!",
-    "Nummers",
-    "Octaal",
-    "Andere indelingen",
-    "Overschrijven?",
-    "PAGE om de helderheid aan of uit te schakelen",
-    "PBKDF2 iter.",
-    "Maak geperforeerde stippen zwart zodat ze worden gedetecteerd.",
-    "Papier breedte",
-    "Deel",
-    "Deel M van N",
-    "Deel grootte",
-    "Wachtwoord",
-    "Wachtwoordlengte",
-    "Pad komt niet overeen",
-    "Patroon gevonden!",
-    "Alle opgeslagen versleutelde mnemonics en instellingen permanent uit het flashgeheugen verwijderen?",
-    "Opslag",
-    "Pixelafwijkingsindex:",
-    "Platte tekst QR",
-    "Laadt een portemonnee descriptor in",
-    "Duik tarief",
-    "Type beleid",
-    "Slechte entropie!",
-    "Vermogen",
-    "Druk op PAGE om te annuleren.",
-    "PAGINA om de modus te wisselen",
-    "Test QR afdrukken",
-    "Tinyseed afdrukken?",
-    "Afdrukken naar QR",
-    "Afdrukken naar QR?",
-    "Afdrukken?",
-    "Printer",
-    "Printer driver niet ingesteld!",
-    "Bezig met afdrukken…",
-    "Toch doorgaan?",
-    "Doorgaan?",
-    "Verwerken…",
-    "Bewijsbaar niet besteedbaar",
-    "QR code",
-    "QR-label",
-    "Aantal",
-    "RX pin",
-    "Opnieuw opstarten",
-    "Ontvangen",
-    "Regio:",
-    "Verwijderen %s?",
-    "Geheugensteun verwijderen",
-    "Firmwarebestanden van SD kaart verwijderen?",
-    "Res. - Formaat",
-    "Fabrieksinstellingen herstellen en opnieuw opstarten?",
-    "Resultaat",
-    "Terug naar QR-lezer",
-    "Opnieuw Beoordelen",
-    "Controleer gescande gegevens en bewerk indien nodig",
-    "Rechts",
-    "Dobbel een dobbelsteen minstens %d keer voor het genereren van een geheugensteun.",
-    "Roldistributie:",
-    "Gedobbeld:",
-    "Roteer 180°",
-    "SD kaart",
-    "SD kaart niet gedetecteerd.",
-    "Gedobbelde SHA256:",
-    "Momentopname van SHA256:",
-    "QR-afbeelding opslaan op SD kaart",
-    "Opslaan op SD kaart",
-    "Opslaan op SD kaart?",
-    "Opgeslagen op SD kaart:",
-    "Schaal",
-    "Adres scannen",
-    "BIP39 Wachtwoord Scannen",
-    "QR Code Sleutel Scannen",
-    "Woorden 1 t/m 12 opnieuw scannen",
-    "Woorden 13 t/m 24 scannen",
-    "Schermbeveiligingstijd",
-    "Scripttype",
-    "Beveiliging",
-    "Overschrijving naar jezelf, of wisselgeld (%d):",
-    "Zelf overschrijving:",
-    "Stel eerst een sabotagecontrolecode in",
-    "Instellingen",
-    "Instellingen intern opgeslagen op flitser.",
-    "Instellingen opgeslagen op SD kaart.",
-    "Shannon's entropie:",
-    "Toon datum",
-    "Afsluiten",
-    "Uitschakelingstijd",
-    "Uitschakelen…",
-    "Ondertekenen",
-    "Teken op QR-code",
-    "Teken op SD kaart",
-    "Ondertekenen?",
-    "Handtekening:",
-    "Bericht ondertekend",
-    "PSBT ondertekend",
-    "Signing…",
-    "Enkele sleutel",
-    "Grootte:",
-    "Sommige controles kunnen niet worden uitgevoerd.",
-    "Sommige knooppunten zijn niet gehard:",
-    "Uitgaven (%d):",
-    "Uitgaven:",
-    "Standaardmodus",
-    "Statisch",
-    "Statistieken voor nerds",
-    "Opslaan op apparaat",
-    "Opslaan op SD kaart",
-    "Sterkte",
-    "Sterk",
-    "Verander modus",
-    "TC Flash Hash",
-    "Hash Flash bij het opstarten",
-    "TIK of ENTER voor opname",
-    "TIK of ENTER voor installeren.",
-    "TR interne sleutel",
-    "TX pin",
-    "Sabotagecontrolecode",
-    "Sabotagecontrolecode succesvol ingesteld",
-    "Sabotagecontrolecodes komen niet overeen",
-    "testreeks",
-    "Test Suite-resultaten",
-    "Test:",
-    "Tekst",
-    "Thema",
-    "Thermisch",
-    "Gebruik de functie 'Apparaat wissen' om te zorgen dat de gegevens onherstelbaar zijn",
-    "Helderheid schakelen",
-    "Hulpmiddelen",
-    "Aanraak gevoeligheid",
-    "Aanraakscherm",
-    "Meer proberen?",
-    "Voer een BIP39 wachtwoord in",
-    "Voer sleutel in",
-    "Ongedaan maken",
-    "Eenheid",
-    "KEF-ID bijwerken?",
-    "QR-label bijwerken?",
-    "Upgrade afgerond.",
-    "Gebruik een donker achergrond.",
-    "Gebruik de camera als entropie voor het aanmaken van een nieuwe geheugensteun",
-    "Huidige waarde",
-    "Standaard gebruiken?",
-    "Standaard PBKDF2-iter gebruiken.?",
-    "Vingerafdruk gebruiken als ID?",
-    "Gebruikt:",
-    "Gebruiker",
-    "Waarde %s is buiten bereik: [%s, %s]",
-    "Controleren…",
-    "Versie",
-    "Via camera",
-    "Via D20",
-    "Via D6",
-    "Via handmatige invoer",
-    "Via woorden",
-    "Zichtbaar label",
-    "Wacht op opname",
-    "Portemonnee",
-    "Descriptor",
-    "Portemonnee descriptor",
-    "Portemonnee descriptor geladen!",
-    "Portemonnee descriptor niet gevonden.",
-    "Waarschuwing:",
-    "Zwak",
-    "Woord %d",
-    "Woord nummers",
-    "Woorden",
-    "Yes",
-    "Ingezoomde modus",
-    "binair: {} bytes",
-    "mislukt",
-    "van HEX",
-    "vanaf base32",
-    "vanaf basis43",
-    "vanaf base64",
-    "van hex",
-    "van utf8",
-    "is geen geldig adres",
-    "schuifgeval",
-    "Slaagkans:",
-    "veeg",
-    "tekst: {} tekens",
-    "om te HEXEREN",
-    "naar base32",
-    "naar base43",
-    "naar base64",
-    "om te hexeren",
-    "naar utf8",
-    "onbekend",
-    "werd NIET GEVONDEN in de eerste %d adressen",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x11\x00+\x00X\x00j\x00s\x00\x87\x00\x95\x00\xa1\x00\xb0\x00\xbf\x00\xc9\x00\xd3\x00\xd7\x00\xea\x00"
+    b"\xf1\x00\x11\x01\x1d\x01R\x01{\x01\x80\x01\x8a\x01\xbe\x01\xd4\x01\xdd\x01\xef\x01\xfa\x01\x08\x02\r\x02\x1c\x020\x02"
+    b"F\x02W\x02`\x02m\x02{\x02\x85\x02\x8c\x02\xa0\x02\xb1\x02\xc3\x02\xc9\x02\xef\x02\xfa\x02'\x03=\x03P\x03"
+    b"\x83\x03\xb3\x03\xcd\x03\xed\x03\xfe\x03\x1e\x04.\x04F\x04Q\x04m\x04\x7f\x04\x8f\x04\x98\x04\x00\x05\n\x05\x15\x05"
+    b"\x1f\x05'\x054\x05I\x05a\x05o\x05|\x05\x94\x05\xa6\x05\xb3\x05\xbb\x05\x02\x06\x16\x06\x1c\x063\x069\x06"
+    b"=\x06I\x06U\x06`\x06t\x06\xa4\x06\xd2\x06\xde\x06\xee\x06\x07\x07<\x07\x89\x07\xdb\x07(\x08W\x08t\x08"
+    b"\x97\x08\x9c\x08\x9f\x08\xb3\x08\xc6\x08\xe8\x08\x04\t\x18\t>\tY\tf\t\x8a\t\x91\t\xa1\t\xad\t\xd1\t"
+    b"\xfc\t\x08\n+\n4\n?\n_\nm\nr\n\x81\n\xdf\n\xe9\n\x00\x0b\x02\x0b\x10\x0b\x18\x0b,\x0b"
+    b"A\x0bM\x0bd\x0bp\x0br\x0b\x7f\x0b\x84\x0b\x90\x0b\xa5\x0b\xc3\x0b\xd1\x0b\xe8\x0b\x06\x0c\x1c\x0c#\x0c5\x0c"
+    b"D\x0cK\x0ca\x0cu\x0c}\x0c\x81\x0c\xbe\x0c\xc3\x0c\xca\x0c\xd9\x0c\xde\x0c\xeb\x0c\xfe\x0c\x0f\rS\rg\r"
+    b"|\r\x8c\r\x92\r\xa9\r\xcd\r\xe5\r\x08\x0e\x10\x0e\x14\x0e!\x0e*\x0e1\x0e9\x0eC\x0e[\x0et\x0e"
+    b"\x81\x0e\xac\x0e\xb6\x0e\xdc\x0e\xe3\x0e\xf9\x0e\x12\x0f\x15\x0f'\x0f=\x0fK\x0fR\x0fX\x0fi\x0fw\x0f\xa4\x0f"
+    b'\xb0\x0f\xee\x0f\xfc\x0f\x00\x10\x0c\x10\x18\x10"\x102\x10G\x10X\x10\xbb\x10\xc1\x10\xd6\x10\xe5\x10\x08\x11\x13\x11'
+    b"\x1e\x11/\x117\x11T\x11r\x11\x83\x11\x96\x11\xa7\x11\xb9\x11\xc3\x11\xca\x11\xe8\x11\xfe\x11\x0c\x12\x15\x12!\x12"
+    b"<\x12C\x12K\x12Q\x12W\x12h\x12q\x12w\x12\x86\x12\x9f\x12\xca\x12\xd8\x12\r\x13\x16\x13)\x13;\x13"
+    b"n\x13t\x13\xc5\x13\xd4\x13\xde\x13\xea\x13\xf2\x13\r\x14\x1f\x147\x14X\x14k\x14\x7f\x14\x96\x14\x9c\x14\xa9\x14"
+    b"\xc1\x14\xd8\x14\xe7\x14\x07\x15 \x156\x15@\x15K\x15z\x15\x8e\x15\xb4\x15\xc0\x15\xea\x15\x0e\x16!\x16+\x16"
+    b"4\x16F\x16U\x16a\x16q\x16\x82\x16\x8f\x16\x9c\x16\xaf\x16\xbf\x16\xc9\x16\xd7\x16\xdf\x16\x0f\x174\x17B\x17"
+    b"K\x17Y\x17a\x17x\x17\x8b\x17\x9e\x17\xa5\x17\xaa\x17\xb8\x17\xc5\x17\xe1\x17\xf9\x17\x17\x18)\x18/\x18C\x18"
+    b"k\x18\x93\x18\x9c\x18\xb1\x18\xb6\x18\xbb\x18\xc0\x18\xc9\x18\x1d\x191\x19=\x19Q\x19^\x19l\x19\x88\x19\x97\x19"
+    b"\xa5\x19\xac\x19\xbd\x19\xd0\x19\xe1\x19\xff\x19L\x1aZ\x1an\x1a\x8f\x1a\xad\x1a\xb6\x1a\xbf\x1a\xe3\x1a\xf1\x1a\xf7\x1a"
+    b"\x01\x1b\x08\x1b\x0e\x1b#\x1b.\x1b=\x1bL\x1bW\x1ba\x1bw\x1b\x96\x1b\xbb\x1b\xc8\x1b\xcc\x1b\xd4\x1b\xe1\x1b"
+    b"\xe8\x1b\xeb\x1b\xfb\x1b\x0b\x1c\x12\x1c\x19\x1c%\x1c2\x1c>\x1cE\x1cM\x1ca\x1cl\x1cv\x1cz\x1c\x8a\x1c"
+    b"\x97\x1c\xa2\x1c\xad\x1c\xb8\x1c\xc5\x1c\xce\x1c\xd6\x1c\x01\x1d"
+    b"% van het bedrag."
+    b"%d QR-codes, %ds per ronde"
+    b"%d van %d adressen horen bij deze portemonnee"
+    b"%d van %d multisig"
+    b"%d tot %d"
+    b"%s bits (%s bits/px)"
+    b"%s verwijderd."
+    b"%s: geladen!"
+    b"(Experimenteel)"
+    b"(alleen inzien)"
+    b"12 woorden"
+    b"24 woorden"
+    b"Over"
+    b"Aanname accepteren?"
+    b"Account"
+    b"Account #0 zou worden aangenomen"
+    b"Accountindex"
+    b"Wachtwoordzin voor portemonnee toevoegen of wijzigen?"
+    b"Extra entropie van camera vereist voor %s"
+    b"Adres"
+    b"Adresindex"
+    b"Richt de camera en back-upplaat op de juiste manier."
+    b"Anti-verblindingsmodus"
+    b"Uiterlijk"
+    b"Weet je het zeker?"
+    b"BGR-kleuren"
+    b"BIP39 Mnemonic"
+    b"Terug"
+    b"Terug naar menu"
+    b"Backup geheugensteun"
+    b"Ongeldige handtekening"
+    b"Base64-wachtwoord"
+    b"Baudratio"
+    b"Binair raster"
+    b"Rand opvulling"
+    b"Helderheid"
+    b"Knoppen"
+    b"Debounce van knoppen"
+    b"Descriptor cachen"
+    b"Opname geannuleerd"
+    b"Change"
+    b"Thema veranderen en opnieuw opstarten?"
+    b"Wisselgeld:"
+    b"Wijzigingen blijven van kracht tot afsluiten."
+    b"Adreslijst controleren"
+    b"Controleer SD kaart"
+    b"Controleer of dit adres bij deze portemonnee hoort?"
+    b"%d adressen gecontroleerd zonder overeenkomsten."
+    b"Controleren op SD-kaart\xe2\x80\xa6"
+    b"Bevestig de sabotagecontrolecode"
+    b"Datum converteren"
+    b"Kan adreswijziging niet bepalen."
+    b"QR-code aanmaken"
+    b"QR-code maken van tekst?"
+    b"Aangemaakt:"
+    b"Huidige sabotagecontrolecode"
+    b"Aangepaste QR-code"
+    b"Aangepaste tekst"
+    b"Aanpassen"
+    b"Bij aanpassen van de portemonnee zal er een nieuwe sleutel gegenereerd worden en ontlaadt de Descriptor."
+    b"Snijdiepte"
+    b"Snijmethode"
+    b"Datum Tool"
+    b"Decimaal"
+    b"Ontsleutelen?"
+    b"Standaard portemonnee"
+    b"Dit bestand verwijderen?"
+    b"Diepte per pas"
+    b"Afleidingspad"
+    b"BIP85-entropie afleiden?"
+    b"Descriptoradressen"
+    b"Apparaattests"
+    b"Weergave"
+    b"Schakel het apparaat niet uit, het kan even duren voordat het klaar is."
+    b"Converteren gedaan.\r"
+    b"Klaar?"
+    b"Dubbel geheugensteuntje"
+    b"Driver"
+    b"Leeg"
+    b"Inschakelen?"
+    b"Versleutelen"
+    b"Versleuteld"
+    b"Versleutelde QR code"
+    b"Versleutelde geheugensteun is opgeslagen met ID:"
+    b"Versleutelde geheugensteun was niet opgeslagen"
+    b"Versleutelen"
+    b"Versleutel modus"
+    b"Voer %d BIP39 woorden in."
+    b"Voer een sabotagecontrolecode van 6 of meer tekens in"
+    b"Voer elk woord van jouw BIP39 geheugensteun in als een nummer van 1 tot 2048."
+    b"Voer elk woord van jouw BIP39 geheugensteun in als een hexadecimaal van 1 tot 800."
+    b"Voer elk woord van jouw BIP39 geheugensteun in als een octaal van 1 tot 4000."
+    b"Voer elk woord van jouw BIP39 geheugensteun in."
+    b"Gegevens van gebruiker wissen"
+    b"Gebruikersgegevens worden gewist\xe2\x80\xa6"
+    b"Fout:"
+    b"Esc"
+    b"Bestanden verkennen?"
+    b"Adressen exporteren"
+    b"Exporteren van %s naar SD-kaart\xe2\x80\xa6"
+    b"Uitgebreide publieke sleutel"
+    b"Fabrieksinstellingen"
+    b"Verzamelen van camera entropie mislukt"
+    b"Ontsleutelen is niet gelukt"
+    b"Laden mislukt"
+    b"Geheugensteun opslaan is niet gelukt"
+    b"Tarief:"
+    b"Voedingssnelheid"
+    b"Bestandsnaam"
+    b"Bestandsnaam %s bestaat op SD kaart."
+    b"De flash vullen met entropie van de camera?"
+    b"Flash vullen"
+    b"Vingerafdruk niet ingesteld in PSBT"
+    b"Flash Map"
+    b"Flash Tools"
+    b"Flash gevuld met camera-entropie"
+    b"Fluit diameter"
+    b"Vrij:"
+    b"Uit data-opslag"
+    b"Wis uw SD kaart volledig in een ander apparaat om te zorgen dat de gegevens onherstelbaar zijn"
+    b"Gap-limiet"
+    b"Geheugensteun genereren"
+    b"Ga"
+    b"Goede entropie"
+    b"Hardware"
+    b"Type gereedschapskop"
+    b"Hex publieke sleutel:"
+    b"Hexadecimaal"
+    b"Verberg geheugensteunen"
+    b"Hoge kosten!"
+    b"ID"
+    b"ID bestaat al"
+    b"Index"
+    b"Invoer (%d):"
+    b"Onvoldoende Entropie!"
+    b"Ongeldige sabotagecontrolecode"
+    b"Ongeldig adres"
+    b"Ongeldige afleidingspad"
+    b"Ongeldige geheugensteun lengte"
+    b"Ongeldige portemonnee:"
+    b"Omkeren"
+    b"Omgekeerde kleuren"
+    b"KEF versleuteld"
+    b"Sleutel"
+    b"Sleutel niet verstrekt"
+    b"Krux printer test QR"
+    b"LCD-type"
+    b"Taal"
+    b"Laat leeg als je wilt dat Krux een geldig laatste woord kiest"
+    b"Links"
+    b"Lengte:"
+    b"Lijn vertraging"
+    b"Lijn:"
+    b"Adressenlijst"
+    b"Geheugensteun laden"
+    b"Portemonnee laden"
+    b"Een vertrouwde portemonnee descriptor laden om adressen te bekijken?"
+    b"Laden vanaf SD kaart"
+    b"Laden vanaf SD kaart?"
+    b"Laden van camera"
+    b"Laden?"
+    b"Camera wordt geladen\xe2\x80\xa6"
+    b"Wijzigingsadressen worden geladen\xe2\x80\xa6"
+    b"Printer wordt geladen\xe2\x80\xa6"
+    b"Ontvangstadressen worden geladen\xe2\x80\xa6"
+    b"Laden\xe2\x80\xa6"
+    b"Taal"
+    b"Opslaglocatie"
+    b"Gemiddeld"
+    b"Bericht"
+    b"Bericht:"
+    b"Miniscript"
+    b"X-co\xc3\xb6rdinaten spiegelen"
+    b"Handtekening bestand mist"
+    b"Geheugensteun"
+    b"Geheugensteun en wachtwoord worden bewaard."
+    b"Aangepast:"
+    b"Native Segwit - 84 zal worden gebruikt"
+    b"Netwerk"
+    b"Geheugensteun aanmaken"
+    b"Nieuwe firmware gevonden."
+    b"Nee"
+    b"Geen wachtwoordzin"
+    b"Niet genoeg gedobbeld!"
+    b"Niet gevonden:"
+    b"Nummers"
+    b"Octaal"
+    b"Andere indelingen"
+    b"Overschrijven?"
+    b"PAGE om de helderheid aan of uit te schakelen"
+    b"PBKDF2 iter."
+    b"Maak geperforeerde stippen zwart zodat ze worden gedetecteerd."
+    b"Papier breedte"
+    b"Deel"
+    b"Deel M van N"
+    b"Deel grootte"
+    b"Wachtwoord"
+    b"Wachtwoordlengte"
+    b"Pad komt niet overeen"
+    b"Patroon gevonden!"
+    b"Alle opgeslagen versleutelde mnemonics en instellingen permanent uit het flashgeheugen verwijderen?"
+    b"Opslag"
+    b"Pixelafwijkingsindex:"
+    b"Platte tekst QR"
+    b"Laadt een portemonnee descriptor in"
+    b"Duik tarief"
+    b"Type beleid"
+    b"Slechte entropie!"
+    b"Vermogen"
+    b"Druk op PAGE om te annuleren."
+    b"PAGINA om de modus te wisselen"
+    b"Test QR afdrukken"
+    b"Tinyseed afdrukken?"
+    b"Afdrukken naar QR"
+    b"Afdrukken naar QR?"
+    b"Afdrukken?"
+    b"Printer"
+    b"Printer driver niet ingesteld!"
+    b"Bezig met afdrukken\xe2\x80\xa6"
+    b"Toch doorgaan?"
+    b"Doorgaan?"
+    b"Verwerken\xe2\x80\xa6"
+    b"Bewijsbaar niet besteedbaar"
+    b"QR code"
+    b"QR-label"
+    b"Aantal"
+    b"RX pin"
+    b"Opnieuw opstarten"
+    b"Ontvangen"
+    b"Regio:"
+    b"Verwijderen %s?"
+    b"Geheugensteun verwijderen"
+    b"Firmwarebestanden van SD kaart verwijderen?"
+    b"Res. - Formaat"
+    b"Fabrieksinstellingen herstellen en opnieuw opstarten?"
+    b"Resultaat"
+    b"Terug naar QR-lezer"
+    b"Opnieuw Beoordelen"
+    b"Controleer gescande gegevens en bewerk indien nodig"
+    b"Rechts"
+    b"Dobbel een dobbelsteen minstens %d keer voor het genereren van een geheugensteun."
+    b"Roldistributie:"
+    b"Gedobbeld:"
+    b"Roteer 180\xc2\xb0"
+    b"SD kaart"
+    b"SD kaart niet gedetecteerd."
+    b"Gedobbelde SHA256:"
+    b"Momentopname van SHA256:"
+    b"QR-afbeelding opslaan op SD kaart"
+    b"Opslaan op SD kaart"
+    b"Opslaan op SD kaart?"
+    b"Opgeslagen op SD kaart:"
+    b"Schaal"
+    b"Adres scannen"
+    b"BIP39 Wachtwoord Scannen"
+    b"QR Code Sleutel Scannen"
+    b"Scanprofilering"
+    b"Woorden 1 t/m 12 opnieuw scannen"
+    b"Woorden 13 t/m 24 scannen"
+    b"Schermbeveiligingstijd"
+    b"Scripttype"
+    b"Beveiliging"
+    b"Overschrijving naar jezelf, of wisselgeld (%d):"
+    b"Zelf overschrijving:"
+    b"Stel eerst een sabotagecontrolecode in"
+    b"Instellingen"
+    b"Instellingen intern opgeslagen op flitser."
+    b"Instellingen opgeslagen op SD kaart."
+    b"Shannon's entropie:"
+    b"Toon datum"
+    b"Afsluiten"
+    b"Uitschakelingstijd"
+    b"Uitschakelen\xe2\x80\xa6"
+    b"Ondertekenen"
+    b"Teken op QR-code"
+    b"Teken op SD kaart"
+    b"Ondertekenen?"
+    b"Handtekening:"
+    b"Bericht ondertekend"
+    b"PSBT ondertekend"
+    b"Signing\xe2\x80\xa6"
+    b"Enkele sleutel"
+    b"Grootte:"
+    b"Sommige controles kunnen niet worden uitgevoerd."
+    b"Sommige knooppunten zijn niet gehard:"
+    b"Uitgaven (%d):"
+    b"Uitgaven:"
+    b"Standaardmodus"
+    b"Statisch"
+    b"Statistieken voor nerds"
+    b"Opslaan op apparaat"
+    b"Opslaan op SD kaart"
+    b"Sterkte"
+    b"Sterk"
+    b"Verander modus"
+    b"TC Flash Hash"
+    b"Hash Flash bij het opstarten"
+    b"TIK of ENTER voor opname"
+    b"TIK of ENTER voor installeren."
+    b"TR interne sleutel"
+    b"TX pin"
+    b"Sabotagecontrolecode"
+    b"Sabotagecontrolecode succesvol ingesteld"
+    b"Sabotagecontrolecodes komen niet overeen"
+    b"testreeks"
+    b"Test Suite-resultaten"
+    b"Test:"
+    b"Tekst"
+    b"Thema"
+    b"Thermisch"
+    b"Gebruik de functie 'Apparaat wissen' om te zorgen dat de gegevens onherstelbaar zijn"
+    b"Helderheid schakelen"
+    b"Hulpmiddelen"
+    b"Aanraak gevoeligheid"
+    b"Aanraakscherm"
+    b"Meer proberen?"
+    b"Voer een BIP39 wachtwoord in"
+    b"Voer sleutel in"
+    b"Ongedaan maken"
+    b"Eenheid"
+    b"KEF-ID bijwerken?"
+    b"QR-label bijwerken?"
+    b"Upgrade afgerond."
+    b"Gebruik een donker achergrond."
+    b"Gebruik de camera als entropie voor het aanmaken van een nieuwe geheugensteun"
+    b"Huidige waarde"
+    b"Standaard gebruiken?"
+    b"Standaard PBKDF2-iter gebruiken.?"
+    b"Vingerafdruk gebruiken als ID?"
+    b"Gebruikt:"
+    b"Gebruiker"
+    b"Waarde %s is buiten bereik: [%s, %s]"
+    b"Controleren\xe2\x80\xa6"
+    b"Versie"
+    b"Via camera"
+    b"Via D20"
+    b"Via D6"
+    b"Via handmatige invoer"
+    b"Via woorden"
+    b"Zichtbaar label"
+    b"Wacht op opname"
+    b"Portemonnee"
+    b"Descriptor"
+    b"Portemonnee descriptor"
+    b"Portemonnee descriptor geladen!"
+    b"Portemonnee descriptor niet gevonden."
+    b"Waarschuwing:"
+    b"Zwak"
+    b"Woord %d"
+    b"Woord nummers"
+    b"Woorden"
+    b"Yes"
+    b"Ingezoomde modus"
+    b"binair: {} bytes"
+    b"mislukt"
+    b"van HEX"
+    b"vanaf base32"
+    b"vanaf basis43"
+    b"vanaf base64"
+    b"van hex"
+    b"van utf8"
+    b"is geen geldig adres"
+    b"schuifgeval"
+    b"Slaagkans:"
+    b"veeg"
+    b"tekst: {} tekens"
+    b"om te HEXEREN"
+    b"naar base32"
+    b"naar base43"
+    b"naar base64"
+    b"om te hexeren"
+    b"naar utf8"
+    b"onbekend"
+    b"werd NIET GEVONDEN in de eerste %d adressen"
+)
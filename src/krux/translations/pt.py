@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% do total.",
-    "%d de %d multisig",
-    "%d a %d",
-    "%s bits (%s bits/px)",
-    "%s excluído.",
-    "%s: carregado!",
-    "(Experimental)",
-    "(Somente visualização)",
-    "12 palavras",
-    "24 palavras",
-    "Sobre",
-    "Aceitar suposições?",
-    "Conta",
-    "A conta #0 seria assumida",
-    "Índice da Conta",
-    "Adicionar ou alterar a senha da carteira?",
-    "Entropia adicional da câmera é necessária para %s",
-    "Endereço",
-    "Alinhe a câmera e a placa de backup corretamente.",
-    "Modo antirreflexo",
-    "Aparência",
-    "Tem certeza?",
-    "Cores BGR",
-    "Mnemônico BIP39",
-    "Voltar",
-    "Voltar ao Menu",
-    "Mnemônico Backup",
-    "Assinatura inválida",
-    "Senha em Base64",
-    "Baudrate",
-    "Grade binária",
-    "Espaçamento da borda",
-    "Brilho",
-    "Botões",
-    "Debounce dos botões",
-    "Captura cancelada",
-    "Troco",
-    "Mudar o tema e reiniciar?",
-    "Troco:",
-    "As alterações só durarão até o desligamento.",
-    "Explorar o cartão SD",
-    "Checar se o endereço pertence a esta carteira?",
-    "%d endereços checados sem correspondência.",
-    "Procurando por cartão SD…",
-    "Confirmar código de verificação de integridade",
-    "Converter dados",
-    "Não foi possível determinar endereços de troco.",
-    "Criar Código QR",
-    "Criar código QR a partir de texto?",
-    "Criado:",
-    "Código atual de verificação de integridade",
-    "Código QR personalizado",
-    "Texto Personalizado",
-    "Personalizar",
-    "Personalizar sua carteira gerará uma nova Chave e descarregará o Descritor.",
-    "Profundidade do corte",
-    "Método de corte",
-    "Datum",
-    "Decimal",
-    "Descriptografar?",
-    "Carteira Padrão",
-    "Excluir este arquivo?",
-    "Profundidade por passe",
-    "Caminho de Derivação",
-    "Derivar entropia BIP85?",
-    "Endereços do descritor",
-    "Testes do Dispositivo",
-    "Display",
-    "Não desligue, pode demorar um pouco para concluir.",
-    "Concluída a conversão",
-    "Concluído?",
-    "Mnemônico duplo",
-    "Driver",
-    "Vazio",
-    "Ativar?",
-    "Criptografar",
-    "Criptografado",
-    "Código QR Criptografado",
-    "Mnemônico criptografado armazenado com ID:",
-    "O mnemônico criptografado não foi armazenado",
-    "Criptografia",
-    "Modo de criptografia",
-    "Insira %d palavras BIP39.",
-    "Insira um código de verificação de integridade com mais de 6 caracteres",
-    "Digite o número de cada palavra do seu mnemônico BIP39, de 1 a 2048.",
-    "Digite o número em hexadecimal de cada palavra do seu mnemônico BIP39, de 1 a 800.",
-    "Digite o número em octal de cada palavra do seu mnemônico BIP39, de 1 a 4000.",
-    "Digite cada palavra do seu mnemônico BIP39.",
-    "Apagar Dados do Usuário",
-    "Apagando dados do usuário…",
-    "Erro:",
-    "Esc",
-    "Explorar arquivos?",
-    "Exportar endereços",
-    "Exportando %s para o cartão SD…",
-    "Chave Pública Estendida",
-    "Configurações de Fábrica",
-    "Falha ao capturar entropia da câmera",
-    "Falha ao descriptografar",
-    "Falha ao carregar",
-    "Falha ao armazenar mnemônico",
-    "Taxa:",
-    "Taxa de alimentação",
-    "Nome do arquivo",
-    "O nome do arquivo %s já existe no cartão SD.",
-    "Preencher a memória flash com entropia da câmera?",
-    "Preenchendo a memória flash",
-    "Fingerprint não definida no PSBT",
-    "Mapa da Flash",
-    "Ferramentas da Flash",
-    "Memória flash preenchida com entropia da câmera",
-    "Diâmetro da Fresa",
-    "Livre:",
-    "Do armazenamento",
-    "Apague totalmente seu cartão SD em outro dispositivo para garantir que os dados sejam irrecuperáveis",
-    "Gerar Mnemônico",
-    "Ir",
-    "Boa entropia",
-    "Hardware",
-    "Tipo de cabeçote",
-    "Chave pública hexadecimal:",
-    "Hexadecimal",
-    "Ocultar Mnemônicos",
-    "Taxas altas!",
-    "ID",
-    "ID já existe",
-    "Índice",
-    "Entradas (%d):",
-    "Entropia insuficiente!",
-    "Código de verificação de integridade inválido",
-    "Endereço inválido",
-    "Caminho de derivação inválido",
-    "Comprimento de mnemônico inválido",
-    "Carteira inválida:",
-    "Inverter",
-    "Cores invertidas",
-    "KEF criptografado",
-    "Chave",
-    "A chave não foi fornecida",
-    "Teste de impressão QR Krux",
-    "Tipo de LCD",
-    "Idioma",
-    "Deixe em branco se quiser que seja escolhida uma palavra final válida",
-    "Esquerda",
-    "Comprimento:",
-    "Atraso de Linha",
-    "Linha:",
-    "Listar Endereços",
-    "Carregar Mnemônico",
-    "Carregar Carteira",
-    "Carregar um descritor de carteira para visualizar endereços?",
-    "Carregar do cartão SD",
-    "Carregar do cartão SD?",
-    "Carregar da câmera",
-    "Carregar?",
-    "Carregando câmera…",
-    "Carregando endereços de alteração…",
-    "Carregando impressora…",
-    "Carregando endereços de recebimento…",
-    "Carregando…",
-    "Região",
-    "Salvar em",
-    "Média",
-    "Mensagem",
-    "Mensagem:",
-    "Miniscript",
-    "Coordenadas X espelhadas",
-    "Arquivo de assinatura não encontrado",
-    "Mnemônico",
-    "Mnemônico e senha serão mantidos.",
-    "Alterado:",
-    "Segwit nativo - 84 seria assumido",
-    "Rede",
-    "Novo Mnemônico",
-    "Novo firmware detectado.",
-    "Não",
-    "Sem Senha",
-    "Jogadas insuficientes!",
-    "Números",
-    "Octal",
-    "Outros Formatos",
-    "Substituir?",
-    "PAGE para alternar o brilho",
-    "Iter. do PBKDF2",
-    "Pinte de preto os pontos perfurados para que sejam detectados.",
-    "Largura do papel",
-    "Parte",
-    "Parte M de N",
-    "Tamanho da peça",
-    "Senha",
-    "Comprimento da Senha",
-    "Incompatibilidade de caminho",
-    "Padrão detectado!",
-    "Remover permanentemente todos os mnemônicos criptografados e configurações armazenados na memória flash?",
-    "Salvar",
-    "Índice de desvio de pixels:",
-    "QR de texto simples",
-    "Carregue um descritor da carteira",
-    "Taxa de Mergulho",
-    "Tipo de Política",
-    "Entropia fraca!",
-    "Potência",
-    "Pressione PAGE para cancelar.",
-    "Pressione PAGE para alternar o modo",
-    "Imprimir QR de teste",
-    "Imprimir Tinyseed?",
-    "Imprimir QR",
-    "Imprimir QR?",
-    "Imprimir?",
-    "Impressora",
-    "Driver da impressora não definido!",
-    "Imprimindo…",
-    "Continuar mesmo assim?",
-    "Prosseguir?",
-    "Processando…",
-    "Não se pode gastar",
-    "Código QR",
-    "Etiqueta QR",
-    "Quantidade",
-    "Pino RX",
-    "Reiniciar",
-    "Recebimento",
-    "Região:",
-    "Excluir %s?",
-    "Excluir Mnemônico",
-    "Excluir arquivos de firmware do cartão SD?",
-    "Res. - Formato",
-    "Restaurar as configurações de fábrica e reiniciar?",
-    "Resultado",
-    "Retornar ao Visualizador de QR",
-    "Revisar Novamente",
-    "Revise os dados, edite se necessário",
-    "Direita",
-    "Role o dado pelo menos %d vezes para gerar um mnemônico.",
-    "Distribuição de jogadas:",
-    "Jogadas:",
-    "Rotacionar 180°",
-    "Cartão SD",
-    "Cartão SD não detectado.",
-    "SHA256 das jogadas:",
-    "SHA256 da imagem:",
-    "Salvar imagem do QR no cartão SD",
-    "Salvar no cartão SD",
-    "Salvar no cartão SD?",
-    "Salvo no cartão SD:",
-    "Escala",
-    "Escanear Endereço",
-    "Escanear a senha BIP39",
-    "Escanear Código QR da Chave",
-    "Escaneando as palavras de 1-12 novamente",
-    "Escaneando as palavras de 13-24",
-    "Tempo para proteção de tela",
-    "Tipo de Script",
-    "Segurança",
-    "Autotransferência ou Troco (%d):",
-    "Autotransferência:",
-    "Primeiro, defina um código de verificação de integridade",
-    "Configurações",
-    "Configurações armazenadas internamente na flash.",
-    "Configurações armazenadas no cartão SD.",
-    "Entropia de Shannon:",
-    "Mostrar dados",
-    "Desligar",
-    "Tempo de desligamento",
-    "Desligando…",
-    "Assinar",
-    "Assinar para código QR",
-    "Assinar no cartão SD",
-    "Assinar?",
-    "Assinatura:",
-    "Mensagem assinada",
-    "PSBT assinada",
-    "Assinando…",
-    "Single-sig",
-    "Tamanho:",
-    "Algumas verificações não serão realizadas.",
-    "Alguns nós não são hardened:",
-    "Gastos (%d):",
-    "Gasto:",
-    "Modo padrão",
-    "Estático",
-    "Estatísticas para nerds",
-    "Armazenar na memória flash",
-    "Armazenar no cartão SD",
-    "Força",
-    "Forte",
-    "Deslize para mudar de modo",
-    "TC Flash Hash",
-    "TC Flash Hash na Inicialização",
-    "TOQUE ou ENTER para capturar",
-    "TOQUE ou ENTER para instalar.",
-    "Chave interna TR",
-    "Pino TX",
-    "Código de verificação de integridade",
-    "Código de verificação de integridade definido com sucesso",
-    "Os códigos de verificação de integridade não correspondem",
-    "Suíte de testes",
-    "Resultados da suíte de testes",
-    "Teste:",
-    "Texto",
-    "Tema",
-    "Térmica",
-    "Para garantir que os dados sejam irrecuperáveis, use o recurso Limpar Dispositivo",
-    "Alternar brilho",
-    "Ferramentas",
-    "Limiar de Toque",
-    "Touchscreen",
-    "Tentar mais?",
-    "Digitar a senha BIP39",
-    "Digite a Chave",
-    "Desfazer",
-    "Unidade",
-    "Atualizar KEF ID?",
-    "Atualizar etiqueta QR?",
-    "Atualização concluída.",
-    "Use uma superfície de fundo preta.",
-    "Use a entropia da câmera para criar um novo mnemônico",
-    "Usar valor atual?",
-    "Usar o modo padrão?",
-    "Use o iter de chave padrão.?",
-    "Usar fingerprint como ID?",
-    "Usado:",
-    "Usuário",
-    "Valor %s fora do intervalo: [%s, %s]",
-    "Checando…",
-    "Versão",
-    "Pela Câmera",
-    "Via D20",
-    "Via D6",
-    "Por entrada manual",
-    "Via Palavras",
-    "Etiqueta visível",
-    "Aguarde a captura",
-    "Carteira",
-    "Descritor da Carteira",
-    "Descritor da carteira",
-    "Descritor da carteira carregado!",
-    "O descritor da carteira não foi encontrado.",
-    "Aviso:",
-    "Fraca",
-    "Palavra %d",
-    "Números das Palavras",
-    "Palavras",
-    "Sim",
-    "Modo ampliado",
-    "binary: {} bytes",
-    "falha",
-    "from HEX",
-    "da base32",
-    "da base43",
-    "da base64",
-    "from hex",
-    "de utf8",
-    "é um endereço válido!",
-    "Trocar caixa",
-    "Taxa de sucesso:",
-    "deslize",
-    "text: {} caracteres",
-    "para HEXADECIMAL",
-    "para base32",
-    "para base43",
-    "para base64",
-    "para hexadecimal",
-    "para utf8",
-    "desconhecida",
-    "NÃO FOI ENCONTRADO nos primeiros %d endereços",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0b\x00%\x00R\x00c\x00j\x00~\x00\x8b\x00\x99\x00\xa7\x00\xbf\x00\xca\x00\xd5\x00\xda\x00\xef\x00"
+    b"\xf4\x00\r\x01\x1d\x01F\x01z\x01\x83\x01\x98\x01\xca\x01\xdb\x01\xe5\x01\xf1\x01\xfa\x01\n\x02\x10\x02\x1e\x02/\x02"
+    b"C\x02R\x02Z\x02h\x02}\x02\x83\x02\x8a\x02\x9e\x02\xb0\x02\xc1\x02\xc6\x02\xdf\x02\xe5\x02\x16\x030\x03E\x03"
+    b"t\x03\xa0\x03\xbc\x03\xed\x03\xfc\x03.\x04>\x04a\x04h\x04\x95\x04\xad\x04\xc0\x04\xcc\x04\x19\x05.\x05>\x05"
+    b"C\x05J\x05Z\x05j\x05\x7f\x05\x95\x05\xab\x05\xc2\x05\xd9\x05\xee\x05\xf5\x05(\x06?\x06J\x06Z\x06`\x06"
+    b"e\x06l\x06x\x06\x85\x06\x9d\x06\xc8\x06\xf6\x06\x02\x07\x16\x07/\x07y\x07\xbf\x07\x13\x08b\x08\x8e\x08\xa6\x08"
+    b"\xc3\x08\xc8\x08\xcb\x08\xdd\x08\xf0\x08\x12\t*\tE\tj\t\x82\t\x93\t\xb0\t\xb5\t\xca\t\xd9\t\x07\n"
+    b":\nV\nw\n\x84\n\x98\n\xc9\n\xdb\n\xe1\n\xf1\nW\x0bg\x0bw\x0by\x0b\x85\x0b\x8d\x0b\x9e\x0b"
+    b"\xb9\x0b\xc4\x0b\xd7\x0b\xe3\x0b\xe5\x0b\xf2\x0b\xf9\x0b\x07\x0c\x1d\x0cN\x0ca\x0c\x81\x0c\xa4\x0c\xb7\x0c\xbf\x0c\xcf\x0c"
+    b'\xe0\x0c\xe5\x0c\xff\x0c\x1a\r%\r+\rq\ry\r\x85\r\x94\r\x9a\r\xab\r\xbe\r\xcf\r\x0c\x0e"\x0e'
+    b"9\x0eL\x0eU\x0ej\x0e\x91\x0e\xa9\x0e\xd0\x0e\xdd\x0e\xe4\x0e\xed\x0e\xf3\x0e\xfb\x0e\x04\x0f\x0e\x0f&\x0fK\x0f"
+    b"U\x0fx\x0f\x81\x0f\xa2\x0f\xa6\x0f\xb5\x0f\xcd\x0f\xd1\x0f\xda\x0f\xf0\x0f\x01\x10\t\x10\x0e\x10\x1d\x10(\x10C\x10"
+    b"R\x10\x90\x10\xa0\x10\xa5\x10\xb1\x10\xc1\x10\xc6\x10\xda\x10\xf6\x10\x08\x11t\x11z\x11\x96\x11\xa9\x11\xca\x11\xda\x11"
+    b"\xeb\x11\xfa\x11\x03\x12 \x12C\x12W\x12i\x12t\x12\x80\x12\x89\x12\x93\x12\xb6\x12\xc3\x12\xd9\x12\xe4\x12\xf2\x12"
+    b"\x05\x13\x0f\x13\x1a\x13$\x13+\x134\x13?\x13G\x13R\x13d\x13\x8f\x13\x9d\x13\xd2\x13\xdb\x13\xf9\x13\n\x14"
+    b"/\x146\x14o\x14\x89\x14\x91\x14\xa1\x14\xab\x14\xc5\x14\xd8\x14\xe9\x14\n\x15\x1e\x153\x15G\x15M\x15_\x15"
+    b"u\x15\x91\x15\xa7\x15\xcf\x15\xee\x15\x0b\x16\x19\x16#\x16D\x16W\x16\x92\x16\xa1\x16\xd3\x16\xfd\x16\x11\x17\x1e\x17"
+    b"&\x17;\x17H\x17O\x17f\x17{\x17\x83\x17\x8e\x17\x9f\x17\xac\x17\xb8\x17\xc2\x17\xca\x17\xf8\x17\x17\x18#\x18"
+    b")\x185\x18>\x18V\x18q\x18\x88\x18\x8e\x18\x93\x18\xad\x18\xba\x18\xda\x18\xf6\x18\x13\x19#\x19*\x19Q\x19"
+    b"\x8d\x19\xca\x19\xda\x19\xf8\x19\xfe\x19\x03\x1a\x07\x1a\x0f\x1aa\x1ap\x1a{\x1a\x8a\x1a\x95\x1a\xa1\x1a\xb6\x1a\xc4\x1a"
+    b"\xcc\x1a\xd3\x1a\xe4\x1a\xfa\x1a\x13\x1b6\x1bm\x1b~\x1b\x92\x1b\xaf\x1b\xc8\x1b\xce\x1b\xd6\x1b\xfa\x1b\x05\x1c\x0c\x1c"
+    b"\x18\x1c\x1f\x1c%\x1c7\x1cC\x1cT\x1ce\x1cm\x1c\x82\x1c\x97\x1c\xb7\x1c\xe3\x1c\xe9\x1c\xee\x1c\xf8\x1c\r\x1d"
+    b"\x15\x1d\x18\x1d%\x1d5\x1d:\x1dB\x1dK\x1dT\x1d]\x1de\x1dl\x1d\x84\x1d\x90\x1d\xa0\x1d\xa7\x1d\xba\x1d"
+    b"\xca\x1d\xd5\x1d\xe0\x1d\xeb\x1d\xfb\x1d\x04\x1e\x10\x1e?\x1e"
+    b"% do total."
+    b"%d QR codes, %ds por ciclo"
+    b"%d de %d endere\xc3\xa7os pertencem a esta carteira"
+    b"%d de %d multisig"
+    b"%d a %d"
+    b"%s bits (%s bits/px)"
+    b"%s exclu\xc3\xaddo."
+    b"%s: carregado!"
+    b"(Experimental)"
+    b"(Somente visualiza\xc3\xa7\xc3\xa3o)"
+    b"12 palavras"
+    b"24 palavras"
+    b"Sobre"
+    b"Aceitar suposi\xc3\xa7\xc3\xb5es?"
+    b"Conta"
+    b"A conta #0 seria assumida"
+    b"\xc3\x8dndice da Conta"
+    b"Adicionar ou alterar a senha da carteira?"
+    b"Entropia adicional da c\xc3\xa2mera \xc3\xa9 necess\xc3\xa1ria para %s"
+    b"Endere\xc3\xa7o"
+    b"\xc3\x8dndice de Endere\xc3\xa7os"
+    b"Alinhe a c\xc3\xa2mera e a placa de backup corretamente."
+    b"Modo antirreflexo"
+    b"Apar\xc3\xaancia"
+    b"Tem certeza?"
+    b"Cores BGR"
+    b"Mnem\xc3\xb4nico BIP39"
+    b"Voltar"
+    b"Voltar ao Menu"
+    b"Mnem\xc3\xb4nico Backup"
+    b"Assinatura inv\xc3\xa1lida"
+    b"Senha em Base64"
+    b"Baudrate"
+    b"Grade bin\xc3\xa1ria"
+    b"Espa\xc3\xa7amento da borda"
+    b"Brilho"
+    b"Bot\xc3\xb5es"
+    b"Debounce dos bot\xc3\xb5es"
+    b"Cache do Descritor"
+    b"Captura cancelada"
+    b"Troco"
+    b"Mudar o tema e reiniciar?"
+    b"Troco:"
+    b"As altera\xc3\xa7\xc3\xb5es s\xc3\xb3 durar\xc3\xa3o at\xc3\xa9 o desligamento."
+    b"Checar Lista de Endere\xc3\xa7os"
+    b"Explorar o cart\xc3\xa3o SD"
+    b"Checar se o endere\xc3\xa7o pertence a esta carteira?"
+    b"%d endere\xc3\xa7os checados sem correspond\xc3\xaancia."
+    b"Procurando por cart\xc3\xa3o SD\xe2\x80\xa6"
+    b"Confirmar c\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade"
+    b"Converter dados"
+    b"N\xc3\xa3o foi poss\xc3\xadvel determinar endere\xc3\xa7os de troco."
+    b"Criar C\xc3\xb3digo QR"
+    b"Criar c\xc3\xb3digo QR a partir de texto?"
+    b"Criado:"
+    b"C\xc3\xb3digo atual de verifica\xc3\xa7\xc3\xa3o de integridade"
+    b"C\xc3\xb3digo QR personalizado"
+    b"Texto Personalizado"
+    b"Personalizar"
+    b"Personalizar sua carteira gerar\xc3\xa1 uma nova Chave e descarregar\xc3\xa1 o Descritor."
+    b"Profundidade do corte"
+    b"M\xc3\xa9todo de corte"
+    b"Datum"
+    b"Decimal"
+    b"Descriptografar?"
+    b"Carteira Padr\xc3\xa3o"
+    b"Excluir este arquivo?"
+    b"Profundidade por passe"
+    b"Caminho de Deriva\xc3\xa7\xc3\xa3o"
+    b"Derivar entropia BIP85?"
+    b"Endere\xc3\xa7os do descritor"
+    b"Testes do Dispositivo"
+    b"Display"
+    b"N\xc3\xa3o desligue, pode demorar um pouco para concluir."
+    b"Conclu\xc3\xadda a convers\xc3\xa3o"
+    b"Conclu\xc3\xaddo?"
+    b"Mnem\xc3\xb4nico duplo"
+    b"Driver"
+    b"Vazio"
+    b"Ativar?"
+    b"Criptografar"
+    b"Criptografado"
+    b"C\xc3\xb3digo QR Criptografado"
+    b"Mnem\xc3\xb4nico criptografado armazenado com ID:"
+    b"O mnem\xc3\xb4nico criptografado n\xc3\xa3o foi armazenado"
+    b"Criptografia"
+    b"Modo de criptografia"
+    b"Insira %d palavras BIP39."
+    b"Insira um c\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade com mais de 6 caracteres"
+    b"Digite o n\xc3\xbamero de cada palavra do seu mnem\xc3\xb4nico BIP39, de 1 a 2048."
+    b"Digite o n\xc3\xbamero em hexadecimal de cada palavra do seu mnem\xc3\xb4nico BIP39, de 1 a 800."
+    b"Digite o n\xc3\xbamero em octal de cada palavra do seu mnem\xc3\xb4nico BIP39, de 1 a 4000."
+    b"Digite cada palavra do seu mnem\xc3\xb4nico BIP39."
+    b"Apagar Dados do Usu\xc3\xa1rio"
+    b"Apagando dados do usu\xc3\xa1rio\xe2\x80\xa6"
+    b"Erro:"
+    b"Esc"
+    b"Explorar arquivos?"
+    b"Exportar endere\xc3\xa7os"
+    b"Exportando %s para o cart\xc3\xa3o SD\xe2\x80\xa6"
+    b"Chave P\xc3\xbablica Estendida"
+    b"Configura\xc3\xa7\xc3\xb5es de F\xc3\xa1brica"
+    b"Falha ao capturar entropia da c\xc3\xa2mera"
+    b"Falha ao descriptografar"
+    b"Falha ao carregar"
+    b"Falha ao armazenar mnem\xc3\xb4nico"
+    b"Taxa:"
+    b"Taxa de alimenta\xc3\xa7\xc3\xa3o"
+    b"Nome do arquivo"
+    b"O nome do arquivo %s j\xc3\xa1 existe no cart\xc3\xa3o SD."
+    b"Preencher a mem\xc3\xb3ria flash com entropia da c\xc3\xa2mera?"
+    b"Preenchendo a mem\xc3\xb3ria flash"
+    b"Fingerprint n\xc3\xa3o definida no PSBT"
+    b"Mapa da Flash"
+    b"Ferramentas da Flash"
+    b"Mem\xc3\xb3ria flash preenchida com entropia da c\xc3\xa2mera"
+    b"Di\xc3\xa2metro da Fresa"
+    b"Livre:"
+    b"Do armazenamento"
+    b"Apague totalmente seu cart\xc3\xa3o SD em outro dispositivo para garantir que os dados sejam irrecuper\xc3\xa1veis"
+    b"Limite de Lacuna"
+    b"Gerar Mnem\xc3\xb4nico"
+    b"Ir"
+    b"Boa entropia"
+    b"Hardware"
+    b"Tipo de cabe\xc3\xa7ote"
+    b"Chave p\xc3\xbablica hexadecimal:"
+    b"Hexadecimal"
+    b"Ocultar Mnem\xc3\xb4nicos"
+    b"Taxas altas!"
+    b"ID"
+    b"ID j\xc3\xa1 existe"
+    b"\xc3\x8dndice"
+    b"Entradas (%d):"
+    b"Entropia insuficiente!"
+    b"C\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade inv\xc3\xa1lido"
+    b"Endere\xc3\xa7o inv\xc3\xa1lido"
+    b"Caminho de deriva\xc3\xa7\xc3\xa3o inv\xc3\xa1lido"
+    b"Comprimento de mnem\xc3\xb4nico inv\xc3\xa1lido"
+    b"Carteira inv\xc3\xa1lida:"
+    b"Inverter"
+    b"Cores invertidas"
+    b"KEF criptografado"
+    b"Chave"
+    b"A chave n\xc3\xa3o foi fornecida"
+    b"Teste de impress\xc3\xa3o QR Krux"
+    b"Tipo de LCD"
+    b"Idioma"
+    b"Deixe em branco se quiser que seja escolhida uma palavra final v\xc3\xa1lida"
+    b"Esquerda"
+    b"Comprimento:"
+    b"Atraso de Linha"
+    b"Linha:"
+    b"Listar Endere\xc3\xa7os"
+    b"Carregar Mnem\xc3\xb4nico"
+    b"Carregar Carteira"
+    b"Carregar um descritor de carteira para visualizar endere\xc3\xa7os?"
+    b"Carregar do cart\xc3\xa3o SD"
+    b"Carregar do cart\xc3\xa3o SD?"
+    b"Carregar da c\xc3\xa2mera"
+    b"Carregar?"
+    b"Carregando c\xc3\xa2mera\xe2\x80\xa6"
+    b"Carregando endere\xc3\xa7os de altera\xc3\xa7\xc3\xa3o\xe2\x80\xa6"
+    b"Carregando impressora\xe2\x80\xa6"
+    b"Carregando endere\xc3\xa7os de recebimento\xe2\x80\xa6"
+    b"Carregando\xe2\x80\xa6"
+    b"Regi\xc3\xa3o"
+    b"Salvar em"
+    b"M\xc3\xa9dia"
+    b"Mensagem"
+    b"Mensagem:"
+    b"Miniscript"
+    b"Coordenadas X espelhadas"
+    b"Arquivo de assinatura n\xc3\xa3o encontrado"
+    b"Mnem\xc3\xb4nico"
+    b"Mnem\xc3\xb4nico e senha ser\xc3\xa3o mantidos."
+    b"Alterado:"
+    b"Segwit nativo - 84 seria assumido"
+    b"Rede"
+    b"Novo Mnem\xc3\xb4nico"
+    b"Novo firmware detectado."
+    b"N\xc3\xa3o"
+    b"Sem Senha"
+    b"Jogadas insuficientes!"
+    b"N\xc3\xa3o encontrados:"
+    b"N\xc3\xbameros"
+    b"Octal"
+    b"Outros Formatos"
+    b"Substituir?"
+    b"PAGE para alternar o brilho"
+    b"Iter. do PBKDF2"
+    b"Pinte de preto os pontos perfurados para que sejam detectados."
+    b"Largura do papel"
+    b"Parte"
+    b"Parte M de N"
+    b"Tamanho da pe\xc3\xa7a"
+    b"Senha"
+    b"Comprimento da Senha"
+    b"Incompatibilidade de caminho"
+    b"Padr\xc3\xa3o detectado!"
+    b"Remover permanentemente todos os mnem\xc3\xb4nicos criptografados e configura\xc3\xa7\xc3\xb5es armazenados na mem\xc3\xb3ria flash?"
+    b"Salvar"
+    b"\xc3\x8dndice de desvio de pixels:"
+    b"QR de texto simples"
+    b"Carregue um descritor da carteira"
+    b"Taxa de Mergulho"
+    b"Tipo de Pol\xc3\xadtica"
+    b"Entropia fraca!"
+    b"Pot\xc3\xaancia"
+    b"Pressione PAGE para cancelar."
+    b"Pressione PAGE para alternar o modo"
+    b"Imprimir QR de teste"
+    b"Imprimir Tinyseed?"
+    b"Imprimir QR"
+    b"Imprimir QR?"
+    b"Imprimir?"
+    b"Impressora"
+    b"Driver da impressora n\xc3\xa3o definido!"
+    b"Imprimindo\xe2\x80\xa6"
+    b"Continuar mesmo assim?"
+    b"Prosseguir?"
+    b"Processando\xe2\x80\xa6"
+    b"N\xc3\xa3o se pode gastar"
+    b"C\xc3\xb3digo QR"
+    b"Etiqueta QR"
+    b"Quantidade"
+    b"Pino RX"
+    b"Reiniciar"
+    b"Recebimento"
+    b"Regi\xc3\xa3o:"
+    b"Excluir %s?"
+    b"Excluir Mnem\xc3\xb4nico"
+    b"Excluir arquivos de firmware do cart\xc3\xa3o SD?"
+    b"Res. - Formato"
+    b"Restaurar as configura\xc3\xa7\xc3\xb5es de f\xc3\xa1brica e reiniciar?"
+    b"Resultado"
+    b"Retornar ao Visualizador de QR"
+    b"Revisar Novamente"
+    b"Revise os dados, edite se necess\xc3\xa1rio"
+    b"Direita"
+    b"Role o dado pelo menos %d vezes para gerar um mnem\xc3\xb4nico."
+    b"Distribui\xc3\xa7\xc3\xa3o de jogadas:"
+    b"Jogadas:"
+    b"Rotacionar 180\xc2\xb0"
+    b"Cart\xc3\xa3o SD"
+    b"Cart\xc3\xa3o SD n\xc3\xa3o detectado."
+    b"SHA256 das jogadas:"
+    b"SHA256 da imagem:"
+    b"Salvar imagem do QR no cart\xc3\xa3o SD"
+    b"Salvar no cart\xc3\xa3o SD"
+    b"Salvar no cart\xc3\xa3o SD?"
+    b"Salvo no cart\xc3\xa3o SD:"
+    b"Escala"
+    b"Escanear Endere\xc3\xa7o"
+    b"Escanear a senha BIP39"
+    b"Escanear C\xc3\xb3digo QR da Chave"
+    b"Perfil de Escaneamento"
+    b"Escaneando as palavras de 1-12 novamente"
+    b"Escaneando as palavras de 13-24"
+    b"Tempo para prote\xc3\xa7\xc3\xa3o de tela"
+    b"Tipo de Script"
+    b"Seguran\xc3\xa7a"
+    b"Autotransfer\xc3\xaancia ou Troco (%d):"
+    b"Autotransfer\xc3\xaancia:"
+    b"Primeiro, defina um c\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade"
+    b"Configura\xc3\xa7\xc3\xb5es"
+    b"Configura\xc3\xa7\xc3\xb5es armazenadas internamente na flash."
+    b"Configura\xc3\xa7\xc3\xb5es armazenadas no cart\xc3\xa3o SD."
+    b"Entropia de Shannon:"
+    b"Mostrar dados"
+    b"Desligar"
+    b"Tempo de desligamento"
+    b"Desligando\xe2\x80\xa6"
+    b"Assinar"
+    b"Assinar para c\xc3\xb3digo QR"
+    b"Assinar no cart\xc3\xa3o SD"
+    b"Assinar?"
+    b"Assinatura:"
+    b"Mensagem assinada"
+    b"PSBT assinada"
+    b"Assinando\xe2\x80\xa6"
+    b"Single-sig"
+    b"Tamanho:"
+    b"Algumas verifica\xc3\xa7\xc3\xb5es n\xc3\xa3o ser\xc3\xa3o realizadas."
+    b"Alguns n\xc3\xb3s n\xc3\xa3o s\xc3\xa3o hardened:"
+    b"Gastos (%d):"
+    b"Gasto:"
+    b"Modo padr\xc3\xa3o"
+    b"Est\xc3\xa1tico"
+    b"Estat\xc3\xadsticas para nerds"
+    b"Armazenar na mem\xc3\xb3ria flash"
+    b"Armazenar no cart\xc3\xa3o SD"
+    b"For\xc3\xa7a"
+    b"Forte"
+    b"Deslize para mudar de modo"
+    b"TC Flash Hash"
+    b"TC Flash Hash na Inicializa\xc3\xa7\xc3\xa3o"
+    b"TOQUE ou ENTER para capturar"
+    b"TOQUE ou ENTER para instalar."
+    b"Chave interna TR"
+    b"Pino TX"
+    b"C\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade"
+    b"C\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integridade definido com sucesso"
+    b"Os c\xc3\xb3digos de verifica\xc3\xa7\xc3\xa3o de integridade n\xc3\xa3o correspondem"
+    b"Su\xc3\xadte de testes"
+    b"Resultados da su\xc3\xadte de testes"
+    b"Teste:"
+    b"Texto"
+    b"Tema"
+    b"T\xc3\xa9rmica"
+    b"Para garantir que os dados sejam irrecuper\xc3\xa1veis, use o recurso Limpar Dispositivo"
+    b"Alternar brilho"
+    b"Ferramentas"
+    b"Limiar de Toque"
+    b"Touchscreen"
+    b"Tentar mais?"
+    b"Digitar a senha BIP39"
+    b"Digite a Chave"
+    b"Desfazer"
+    b"Unidade"
+    b"Atualizar KEF ID?"
+    b"Atualizar etiqueta QR?"
+    b"Atualiza\xc3\xa7\xc3\xa3o conclu\xc3\xadda."
+    b"Use uma superf\xc3\xadcie de fundo preta."
+    b"Use a entropia da c\xc3\xa2mera para criar um novo mnem\xc3\xb4nico"
+    b"Usar valor atual?"
+    b"Usar o modo padr\xc3\xa3o?"
+    b"Use o iter de chave padr\xc3\xa3o.?"
+    b"Usar fingerprint como ID?"
+    b"Usado:"
+    b"Usu\xc3\xa1rio"
+    b"Valor %s fora do intervalo: [%s, %s]"
+    b"Checando\xe2\x80\xa6"
+    b"Vers\xc3\xa3o"
+    b"Pela C\xc3\xa2mera"
+    b"Via D20"
+    b"Via D6"
+    b"Por entrada manual"
+    b"Via Palavras"
+    b"Etiqueta vis\xc3\xadvel"
+    b"Aguarde a captura"
+    b"Carteira"
+    b"Descritor da Carteira"
+    b"Descritor da carteira"
+    b"Descritor da carteira carregado!"
+    b"O descritor da carteira n\xc3\xa3o foi encontrado."
+    b"Aviso:"
+    b"Fraca"
+    b"Palavra %d"
+    b"N\xc3\xbameros das Palavras"
+    b"Palavras"
+    b"Sim"
+    b"Modo ampliado"
+    b"binary: {} bytes"
+    b"falha"
+    b"from HEX"
+    b"da base32"
+    b"da base43"
+    b"da base64"
+    b"from hex"
+    b"de utf8"
+    b"\xc3\xa9 um endere\xc3\xa7o v\xc3\xa1lido!"
+    b"Trocar caixa"
+    b"Taxa de sucesso:"
+    b"deslize"
+    b"text: {} caracteres"
+    b"para HEXADECIMAL"
+    b"para base32"
+    b"para base43"
+    b"para base64"
+    b"para hexadecimal"
+    b"para utf8"
+    b"desconhecida"
+    b"N\xc3\x83O FOI ENCONTRADO nos primeiros %d endere\xc3\xa7os"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% от суммы.",
-    "%d из %d мультиподпись",
-    "%d к %d",
-    "%s бит (%s бит/px)",
-    "%s удален.",
-    "%s: загружено!",
-    "(Эксперементальный)",
-    "(Только часы)",
-    "12 слов",
-    "24 слова",
-    "О Программе",
-    "Принять предположение?",
-    "Учетная запись",
-    "Будет принят счет №0",
-    "Индекс счета",
-    "Добавить или изменить пароль кошелька?",
-    "Требуется дополнительная энтропия от камеры для %s",
-    "Адрес",
-    "Правильно совместите камеру и резервную пластину.",
-    "Антибликовый режим",
-    "Внешний Вид",
-    "Вы уверены?",
-    "Цвета BGR",
-    "BIP39 Мнемоника",
-    "Назад",
-    "Назад в Mеню",
-    "Резервная мнемоника",
-    "Плохая подпись",
-    "Пароль Base64",
-    "Скорость Передачи Данных",
-    "Двоичная сетка",
-    "Заполнение Границ",
-    "Яркость",
-    "Кнопки",
-    "Антидребезг кнопок",
-    "Захват отменен",
-    "Сдача",
-    "Сменить тему и перезагрузить?",
-    "Сдача:",
-    "Изменения будут храниться до выключения.",
-    "Проверить SD Карту",
-    "Проверить, что адрес принадлежит этому кошельку?",
-    "Проверено %d адресов без совпадений.",
-    "Проверка SD-карты…",
-    "Подтвердите код проверки вскрытия",
-    "Преобразовать датум",
-    "Не удалось определить адрес изменения.",
-    "Создать QR-код",
-    "Создать QR-код из текста?",
-    "Создано:",
-    "Текущий код проверки вскрытия",
-    "Пользовательский QR-код",
-    "Произвольный текст",
-    "Настроить",
-    "Настройка вашего кошелька создаст новый ключ и выгрузит дескриптор.",
-    "Глубина Резки",
-    "Метод Резки",
-    "Datum Tool",
-    "Десятичный",
-    "Расшифровать?",
-    "Кошелек по умолчанию",
-    "Удалить этот файл?",
-    "Глубина за Проход",
-    "Путь деривации",
-    "Вывести энтропию BIP85?",
-    "Адреса дескрипторов",
-    "Испытания устройства",
-    "Дисплеи",
-    "Не выключайте питание, это может занять некоторое время.",
-    "Конвертация завершена",
-    "Готово?",
-    "Двойная мнемоника",
-    "Драйвер",
-    "Пустой",
-    "Включить?",
-    "Зашифровать",
-    "Зашифровано",
-    "Зашифрованный QR Код",
-    "Зашифрованная мнемоника была сохранена с ID:",
-    "Зашифрованная мнемоника не была сохранена",
-    "Шифрование",
-    "Метод Шифрования",
-    "Введите %d слов BIP39.",
-    "Введите более 6 символов кода проверки вскрытия",
-    "Введите каждое слово вашей мнемоники BIP39 в виде числа от 1 до 2048.",
-    "Введите каждое слово вашей мнемоники BIP39 в виде шестнадцатеричного числа от 1 до 800.",
-    "Введите каждое слово вашей мнемоники BIP39 в виде восьмеричного числа от 1 до 4000.",
-    "Введите каждое слово вашей BIP39 мнемоники.",
-    "Удалить данные пользователя",
-    "Удаление данных пользователя…",
-    "Ошибка:",
-    "Выйти",
-    "Исследовать файлы?",
-    "Экспорт адресов",
-    "Экспорт %s на SD-карту…",
-    "Расширенный Публичный Ключ",
-    "Заводские Настройки",
-    "Не удалось собрать энтропию камеры",
-    "Не удалось расшифровать",
-    "Не удалось ничего загрузить",
-    "Не удалось сохранить мнемонику",
-    "Комиссия:",
-    "Скорость Подачи",
-    "Имя файла",
-    "Файл %s существует на SD карте.",
-    "Заполнить флэш энтропией с камеры?",
-    "Заполнение флэша",
-    "Отпечаток пальца не установлен в PSBT",
-    "Карта флэша",
-    "Flash Tools",
-    "Флэш заполнен энтропией камеры",
-    "Диаметр Флюта",
-    "Свободно:",
-    "Из Памяти",
-    "Полностью стерите SD-карту в другом устройстве, чтобы убедиться, что данные не восстановимы",
-    "Создать Мнемонику",
-    "OK",
-    "Хорошая энтропия",
-    "Аппаратное Обеспечение",
-    "Тип головки",
-    "Шестнадцатеричный Публичный Ключ:",
-    "Шестнадцатеричный",
-    "Скрыть мнемоники",
-    "Высокие комиссии!",
-    "Идентификатор",
-    "ID уже существует",
-    "Индекс",
-    "Входы (%d):",
-    "Недостаточная Энтропия!",
-    "Недействительный код проверки вскрытия",
-    "Неверный адрес",
-    "Недопустимый путь деривации",
-    "Неверная длина мнемоники",
-    "Неверный кошелек:",
-    "Инвертировать",
-    "Перевернутые цвета",
-    "Зашифровано KEF",
-    "Ключ",
-    "Ключ не предоставлен",
-    "Тестовый QR Принтера Krux",
-    "Тип ЖК-дисплея",
-    "Язык",
-    "Оставьте пустым, если хотите, чтобы Krux выбрал подходящее последнее слово",
-    "Влево",
-    "Длина:",
-    "Задержка Линии",
-    "Линия:",
-    "Список адресов",
-    "Загрузить Мнемонику",
-    "Загрузить кошелек",
-    "Загрузить дескриптор доверенного кошелька для просмотра адресов?",
-    "Загрузка с SD-карты",
-    "Загрузить с SD карты?",
-    "Из камеры",
-    "Загрузить?",
-    "Загрузка списка камер…",
-    "Загрузка адресов изменения…",
-    "Загрузка принтера…",
-    "Загрузка адресов приема…",
-    "Идет загрузка…",
-    "Локаль",
-    "Расположение",
-    "Средний",
-    "Сообщение",
-    "Сообщение:",
-    "Минискрипт",
-    "Координаты зеркала X",
-    "Отсутствует файл подписи",
-    "Мнемоника",
-    "Мнемоника и парольная фраза будут сохранены.",
-    "Изменено:",
-    "Native Segwit - 84 будет принято",
-    "Сеть",
-    "Новая Мнемоника",
-    "Обнаружена новая прошивка.",
-    "Нет",
-    "Нет Фраза-пароль",
-    "Недостаточно бросков!",
-    "Числа",
-    "Восьмеричный",
-    "Другие форматы",
-    "Перезаписать?",
-    "PAGE для переключения яркости",
-    "Итератор PBKDF2.",
-    "Закрасьте перфорированные точки черным цветом, чтобы их можно было обнаружить.",
-    "Ширина Бумаги",
-    "Часть",
-    "Часть M из N",
-    "Размер Части",
-    "Фраза-пароль",
-    "Длина пароля",
-    "Несоответствие пути",
-    "Образец обнаружен!",
-    "Окончательно удалить все сохраненные зашифрованные мнемоники и настройки из флеш-памяти?",
-    "Постоянная Память",
-    "Индекс отклонения пикселей:",
-    "QR Открытым Текстом",
-    "Пожалуйста загрузите выходной дескриптор кошелька",
-    "Скорость Погружения",
-    "Тип политики",
-    "Плохая энтропия!",
-    "Мощность",
-    "Нажмите PAGE, чтобы отменить.",
-    "PAGE, чтобы переключить режим",
-    "Напечатать Тестовый QR",
-    "Распечатать Tinyseed?",
-    "Печать в QR",
-    "Напечатать в виде QR?",
-    "Печатать?",
-    "Принтер",
-    "Драйвер Принтера не установлен!",
-    "Печать…",
-    "Все равно продолжить?",
-    "Продолжить?",
-    "Обработка…",
-    "Доказуемо непотратимый",
-    "QR Код",
-    "QR-метка",
-    "Кол-во",
-    "RX Пин",
-    "Перезагрузить",
-    "Получить",
-    "Регион:",
-    "Удалить %s?",
-    "Удалить Мнемонику",
-    "Удалить файлы прошивки с SD-карты?",
-    "Разреш. - Формат",
-    "Восстановить заводские настройки и перезагрузить?",
-    "Результат",
-    "Вернуться к QR-просмотрщику",
-    "Проверить снова",
-    "Просмотрите отсканированные данные, отредактируйте при необходимости",
-    "Вправо",
-    "Бросьте кубик не менее %d раз, чтобы сгенерировать мнемонику.",
-    "Распределение бросков:",
-    "Броски:",
-    "Поворот на 180°",
-    "SD карта",
-    "SD карта не обнаружена.",
-    "SHA256 бросков:",
-    "SHA256 снэпшота:",
-    "Сохранить QR-изображение на SD-карту",
-    "Сохранить на SD-карту",
-    "Сохранить на SD карту?",
-    "Сохранено на SD карту:",
-    "Шкала",
-    "Отсканировать Адрес",
-    "Отсканировать BIP39 фразу-пароль",
-    "Отсканировать Ключ QR код",
-    "Сканирование слов 1-12 снова",
-    "Сканирование слов 13-24",
-    "Время Экранной Заставки",
-    "Тип скрипта",
-    "Охрана",
-    "Трансфер самому себе или Сдача (%d):",
-    "Перевод самому себе:",
-    "Сначала установите код проверки вскрытия",
-    "Настройки",
-    "Настройки хранятся во флэш-памяти.",
-    "Настройки сохранены на SD-карте.",
-    "Энтропия Шеннона:",
-    "Показать датум",
-    "Выключить",
-    "Время выключения",
-    "Отключение…",
-    "Подписать",
-    "Подписать QR-код",
-    "Подписать на SD-карте",
-    "Подписать?",
-    "Подпись:",
-    "Подписанное Сообщение",
-    "Подписанное PSBT",
-    "Подпись…",
-    "Одна подпись",
-    "Размер:",
-    "Некоторые проверки не могут быть выполнены.",
-    "Некоторые узлы не укреплены:",
-    "Расход (%d):",
-    "Расход:",
-    "Стандартный режим",
-    "Static / Статическое оборудование",
-    "Статистика для Гиков",
-    "Сохранить на Флэш Память",
-    "Сохранить на SD Карту",
-    "Сила",
-    "Сильный",
-    "Свайпните, чтобы сменить режим",
-    "TC Flash Hash",
-    "Проверка хэша Flash при загрузке",
-    "ПРИКОСНИТЕСЬ или нажмите ВВОД, чтобы захватить",
-    "ПРИКОСНИТЕСЬ или нажмите ВВОД, для Установить.",
-    "внутренний ключ",
-    "TX Пин",
-    "Код проверки вскрытия",
-    "Код проверки вскрытия успешно установлен",
-    "Коды проверки вскрытия не совпадают",
-    "набор тестов",
-    "Результаты набора тестов",
-    "Испыт.:",
-    "Текст",
-    "Тема",
-    "Термальный",
-    "Для гарантии невосстановления данных используйте функцию Очистки Устройства",
-    "Регулировка Яркости",
-    "Инструменты",
-    "Чувствительность",
-    "Тачскрин",
-    "Попробовать ещё?",
-    "Ввести BIP39 фразу-пароль",
-    "Ввести Ключ",
-    "Отменить",
-    "Единица Измерения",
-    "Обновить идентификатор KEF?",
-    "Обновить QR-метку?",
-    "Обновление завершено.",
-    "Использовать черную фоновую поверхность.",
-    "Использовать энтропию камеры, чтобы создать новую мнемонику",
-    "Текущее значение",
-    "Использовать по умолчанию?",
-    "Использовать итер PBKDF2 по умолчанию.?",
-    "Использовать отпечаток пальца как ID?",
-    "Использовано:",
-    "Пользователь",
-    "Значение %s вне диапозона: [%s, %s]",
-    "Верификация…",
-    "Версия",
-    "С Помощью Камеры",
-    "С Помощью D20",
-    "С Помощью D6",
-    "С Помощью Ручного Ввода",
-    "Через Слово",
-    "Видимая метка",
-    "Дождитесь Захвата",
-    "Кошелек",
-    "Дескриптор Кошелька",
-    "Выходной дескриптор кошелька",
-    "Выходной дескриптор кошелька загружен!",
-    "Выходной дескриптор кошелька не найден.",
-    "Предупреждение:",
-    "Слабый",
-    "Слово %d",
-    "Числа Слов",
-    "Слова",
-    "Да",
-    "Режим масштабирования",
-    "binary: {} байт",
-    "неудачно",
-    "от ШЕСТИГРАННИКА",
-    "от базы32",
-    "от основания43",
-    "от base64",
-    "от шестигранника",
-    "от utf8",
-    "корректный адрес",
-    "случай смены",
-    "Коэффициент успеха:",
-    "проведите",
-    "text: {} символы",
-    "к ШЕСТИГРАННОЙ",
-    "к основанию32",
-    "к основанию43",
-    "к base64",
-    "к шестигранной",
-    "to utf8",
-    "неизвестный",
-    "нЕ НАЙДЕНО в первых %d адресах",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x12\x007\x00\x83\x00\xa8\x00\xb0\x00\xc8\x00\xd8\x00\xef\x00\x13\x01*\x015\x01B\x01W\x01\x81\x01"
+    b"\x9c\x01\xc1\x01\xd8\x01\x1f\x02{\x02\x85\x02\xa0\x02\xfc\x02\x1f\x034\x03H\x03V\x03n\x03x\x03\x8d\x03\xb2\x03"
+    b"\xcd\x03\xe0\x03\x0e\x04)\x04J\x04X\x04d\x04\x87\x04\xb0\x04\xcb\x04\xd5\x04\x0b\x05\x16\x05a\x05\x8f\x05\xaf\x05"
+    b"\x08\x06I\x06j\x06\xa9\x06\xce\x06\x15\x07-\x07X\x07g\x07\x9e\x07\xc8\x07\xeb\x07\xfd\x07z\x08\x93\x08\xa8\x08"
+    b"\xb2\x08\xc6\x08\xdf\x08\x05\t&\tF\ta\t\x87\t\xac\t\xd3\t\xe1\tH\nq\n~\n\x9f\n\xad\n"
+    b"\xb9\n\xca\n\xe0\n\xf6\n\x1a\x0bj\x0b\xb8\x0b\xcc\x0b\xeb\x0b\x0c\x0cc\x0c\xd6\x0cm\r\xfb\rF\x0ez\x0e"
+    b"\xb3\x0e\xc0\x0e\xca\x0e\xec\x0e\t\x0f0\x0fb\x0f\x87\x0f\xc7\x0f\xf3\x0f&\x10_\x10p\x10\x8d\x10\x9e\x10\xd2\x10"
+    b"\x11\x110\x11q\x11\x86\x11\x91\x11\xca\x11\xe3\x11\xf4\x11\x05\x12\xab\x12\xc8\x12\xe9\x12\xeb\x12\n\x135\x13J\x13"
+    b'\x89\x13\xab\x13\xca\x13\xea\x13\x04\x14"\x14.\x14>\x14j\x14\xb3\x14\xce\x14\x02\x150\x15P\x15j\x15\x8d\x15'
+    b"\xa7\x15\xaf\x15\xd5\x15\xfe\x15\x18\x16 \x16\xa5\x16\xaf\x16\xba\x16\xd5\x16\xe0\x16\xfb\x16 \x17A\x17\xba\x17\xdb\x17"
+    b"\xff\x17\x10\x18#\x18N\x18\x83\x18\xa7\x18\xd6\x18\xf2\x18\xfe\x18\x16\x19$\x196\x19I\x19]\x19\x82\x19\xb0\x19"
+    b"\xc2\x19\x14\x1a%\x1aQ\x1aY\x1av\x1a\xa7\x1a\xad\x1a\xcb\x1a\xf3\x1a\x07\x1b\x11\x1b)\x1bD\x1b]\x1b\x90\x1b"
+    b"\xa8\x1b9\x1cR\x1c\\\x1co\x1c\x86\x1c\x9d\x1c\xb4\x1c\xd9\x1c\xfb\x1c\xa0\x1d\xc1\x1d\xf4\x1d\x16\x1et\x1e\x99\x1e"
+    b"\xb0\x1e\xce\x1e\xde\x1e\x0f\x1fA\x1fi\x1f\x89\x1f\x9b\x1f\xbf\x1f\xd0\x1f\xde\x1f\x18 ' N c x "
+    b'\xa3 \xac \xb9 \xc4 \xcd \xe7 \xf7 \x04!\x16!7!s!\x8f!\xec!\xfe!/"L"'
+    b'\xce"\xda"H#r#\x7f#\x98#\xa5#\xcd#\xe3#\xfb#:$_$\x85$\xab$\xb5$\xda$'
+    b"\x12%?%t%\xa5%\xcc%\xf8%\r&\x19&W&|&\xc8&\xda&\x19'R'r'\x8d'"
+    b"\x9f'\xbe'\xd5'\xe7'\x03(((;(J(s(\x8e(\x9f(\xb6(\xc3(\x13)G)Y)"
+    b"f)\x87)\xbf)\xe5)\x12*7*?*M*\x85*\x92*\xc9*\x1f+t+\x91+\x9a+\xc2+"
+    b"\x0e,P,g,\x95,\xa1,\xab,\xb3,\xc7,V-{-\x91-\xb1-\xc1-\xdf-\t.\x1e."
+    b"..O.\x7f.\x9e.\xc6.\x12/\x81/\xa0/\xd1/\x130V0o0\x870\xbe0\xd70\xe30"
+    b"\x011\x161*1U1j1\x831\xa41\xb21\xd71\r2U2\x9e2\xbb2\xc72\xd42\xe72"
+    b"\xf12\xf52\x1e313A3`3o3\x883\x933\xb23\xbb3\xda3\xf13\x154'4>4"
+    b"Y4p4\x874\x904\xab4\xb24\xc84\xfd4"
+    b"% \xd0\xbe\xd1\x82 \xd1\x81\xd1\x83\xd0\xbc\xd0\xbc\xd1\x8b."
+    b"%d QR-\xd0\xba\xd0\xbe\xd0\xb4\xd0\xbe\xd0\xb2, %d \xd1\x81 \xd0\xb7\xd0\xb0 \xd1\x86\xd0\xb8\xd0\xba\xd0\xbb"
+    b"%d \xd0\xb8\xd0\xb7 %d \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd0\xb0\xd0\xb4\xd0\xbb\xd0\xb5\xd0\xb6\xd0\xb0\xd1\x82 \xd1\x8d\xd1\x82\xd0\xbe\xd0\xbc\xd1\x83 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd1\x83"
+    b"%d \xd0\xb8\xd0\xb7 %d \xd0\xbc\xd1\x83\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb8\xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c"
+    b"%d \xd0\xba %d"
+    b"%s \xd0\xb1\xd0\xb8\xd1\x82 (%s \xd0\xb1\xd0\xb8\xd1\x82/px)"
+    b"%s \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb5\xd0\xbd."
+    b"%s: \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xbe!"
+    b"(\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82\xd0\xb0\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9)"
+    b"(\xd0\xa2\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xba\xd0\xbe \xd1\x87\xd0\xb0\xd1\x81\xd1\x8b)"
+    b"12 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2"
+    b"24 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xb0"
+    b"\xd0\x9e \xd0\x9f\xd1\x80\xd0\xbe\xd0\xb3\xd1\x80\xd0\xb0\xd0\xbc\xd0\xbc\xd0\xb5"
+    b"\xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd\xd1\x8f\xd1\x82\xd1\x8c \xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5?"
+    b"\xd0\xa3\xd1\x87\xd0\xb5\xd1\x82\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xb7\xd0\xb0\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c"
+    b"\xd0\x91\xd1\x83\xd0\xb4\xd0\xb5\xd1\x82 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd1\x8f\xd1\x82 \xd1\x81\xd1\x87\xd0\xb5\xd1\x82 \xe2\x84\x960"
+    b"\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81 \xd1\x81\xd1\x87\xd0\xb5\xd1\x82\xd0\xb0"
+    b"\xd0\x94\xd0\xbe\xd0\xb1\xd0\xb0\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xb8\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0?"
+    b"\xd0\xa2\xd1\x80\xd0\xb5\xd0\xb1\xd1\x83\xd0\xb5\xd1\x82\xd1\x81\xd1\x8f \xd0\xb4\xd0\xbe\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f \xd0\xbe\xd1\x82 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b \xd0\xb4\xd0\xbb\xd1\x8f %s"
+    b"\xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81"
+    b"\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2"
+    b"\xd0\x9f\xd1\x80\xd0\xb0\xd0\xb2\xd0\xb8\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe \xd1\x81\xd0\xbe\xd0\xb2\xd0\xbc\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x83 \xd0\xb8 \xd1\x80\xd0\xb5\xd0\xb7\xd0\xb5\xd1\x80\xd0\xb2\xd0\xbd\xd1\x83\xd1\x8e \xd0\xbf\xd0\xbb\xd0\xb0\xd1\x81\xd1\x82\xd0\xb8\xd0\xbd\xd1\x83."
+    b"\xd0\x90\xd0\xbd\xd1\x82\xd0\xb8\xd0\xb1\xd0\xbb\xd0\xb8\xd0\xba\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc"
+    b"\xd0\x92\xd0\xbd\xd0\xb5\xd1\x88\xd0\xbd\xd0\xb8\xd0\xb9 \xd0\x92\xd0\xb8\xd0\xb4"
+    b"\xd0\x92\xd1\x8b \xd1\x83\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd1\x8b?"
+    b"\xd0\xa6\xd0\xb2\xd0\xb5\xd1\x82\xd0\xb0 BGR"
+    b"BIP39 \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\x9d\xd0\xb0\xd0\xb7\xd0\xb0\xd0\xb4"
+    b"\xd0\x9d\xd0\xb0\xd0\xb7\xd0\xb0\xd0\xb4 \xd0\xb2 M\xd0\xb5\xd0\xbd\xd1\x8e"
+    b"\xd0\xa0\xd0\xb5\xd0\xb7\xd0\xb5\xd1\x80\xd0\xb2\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\x9f\xd0\xbb\xd0\xbe\xd1\x85\xd0\xb0\xd1\x8f \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c"
+    b"\xd0\x9f\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c Base64"
+    b"\xd0\xa1\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c \xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb8 \xd0\x94\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85"
+    b"\xd0\x94\xd0\xb2\xd0\xbe\xd0\xb8\xd1\x87\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x81\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0"
+    b"\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\x93\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x86"
+    b"\xd0\xaf\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c"
+    b"\xd0\x9a\xd0\xbd\xd0\xbe\xd0\xbf\xd0\xba\xd0\xb8"
+    b"\xd0\x90\xd0\xbd\xd1\x82\xd0\xb8\xd0\xb4\xd1\x80\xd0\xb5\xd0\xb1\xd0\xb5\xd0\xb7\xd0\xb3 \xd0\xba\xd0\xbd\xd0\xbe\xd0\xbf\xd0\xbe\xd0\xba"
+    b"\xd0\x9a\xd1\x8d\xd1\x88\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80"
+    b"\xd0\x97\xd0\xb0\xd1\x85\xd0\xb2\xd0\xb0\xd1\x82 \xd0\xbe\xd1\x82\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd"
+    b"\xd0\xa1\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb0"
+    b"\xd0\xa1\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x82\xd0\xb5\xd0\xbc\xd1\x83 \xd0\xb8 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\xa1\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb0:"
+    b"\xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xb1\xd1\x83\xd0\xb4\xd1\x83\xd1\x82 \xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c\xd1\x81\xd1\x8f \xd0\xb4\xd0\xbe \xd0\xb2\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f."
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c \xd1\x81\xd0\xbf\xd0\xb8\xd1\x81\xd0\xbe\xd0\xba \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c SD \xd0\x9a\xd0\xb0\xd1\x80\xd1\x82\xd1\x83"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c, \xd1\x87\xd1\x82\xd0\xbe \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd0\xb0\xd0\xb4\xd0\xbb\xd0\xb5\xd0\xb6\xd0\xb8\xd1\x82 \xd1\x8d\xd1\x82\xd0\xbe\xd0\xbc\xd1\x83 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd1\x83?"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbe %d \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xb1\xd0\xb5\xd0\xb7 \xd1\x81\xd0\xbe\xd0\xb2\xd0\xbf\xd0\xb0\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb9."
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b\xe2\x80\xa6"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd1\x82\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x9f\xd1\x80\xd0\xb5\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0\xd1\x82\xd1\x83\xd0\xbc"
+    b"\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd0\xbe\xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81 \xd0\xb8\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f."
+    b"\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4"
+    b"\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4 \xd0\xb8\xd0\xb7 \xd1\x82\xd0\xb5\xd0\xba\xd1\x81\xd1\x82\xd0\xb0?"
+    b"\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbe:"
+    b"\xd0\xa2\xd0\xb5\xd0\xba\xd1\x83\xd1\x89\xd0\xb8\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x9f\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd1\x81\xd0\xba\xd0\xb8\xd0\xb9 QR-\xd0\xba\xd0\xbe\xd0\xb4"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb8\xd0\xb7\xd0\xb2\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x82\xd0\xb5\xd0\xba\xd1\x81\xd1\x82"
+    b"\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb0 \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb3\xd0\xbe \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd1\x81\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x81\xd1\x82 \xd0\xbd\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbb\xd1\x8e\xd1\x87 \xd0\xb8 \xd0\xb2\xd1\x8b\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80."
+    b"\xd0\x93\xd0\xbb\xd1\x83\xd0\xb1\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xa0\xd0\xb5\xd0\xb7\xd0\xba\xd0\xb8"
+    b"\xd0\x9c\xd0\xb5\xd1\x82\xd0\xbe\xd0\xb4 \xd0\xa0\xd0\xb5\xd0\xb7\xd0\xba\xd0\xb8"
+    b"Datum Tool"
+    b"\xd0\x94\xd0\xb5\xd1\x81\xd1\x8f\xd1\x82\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c?"
+    b"\xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e"
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd1\x8d\xd1\x82\xd0\xbe\xd1\x82 \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb?"
+    b"\xd0\x93\xd0\xbb\xd1\x83\xd0\xb1\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xb7\xd0\xb0 \xd0\x9f\xd1\x80\xd0\xbe\xd1\x85\xd0\xbe\xd0\xb4"
+    b"\xd0\x9f\xd1\x83\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x80\xd0\xb8\xd0\xb2\xd0\xb0\xd1\x86\xd0\xb8\xd0\xb8"
+    b"\xd0\x92\xd1\x8b\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8 \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8e BIP85?"
+    b"\xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xb0 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80\xd0\xbe\xd0\xb2"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd1\x8b\xd1\x82\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f \xd1\x83\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb0"
+    b"\xd0\x94\xd0\xb8\xd1\x81\xd0\xbf\xd0\xbb\xd0\xb5\xd0\xb8"
+    b"\xd0\x9d\xd0\xb5 \xd0\xb2\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb0\xd0\xb9\xd1\x82\xd0\xb5 \xd0\xbf\xd0\xb8\xd1\x82\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5, \xd1\x8d\xd1\x82\xd0\xbe \xd0\xbc\xd0\xbe\xd0\xb6\xd0\xb5\xd1\x82 \xd0\xb7\xd0\xb0\xd0\xbd\xd1\x8f\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd0\xbe\xd0\xb5 \xd0\xb2\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f."
+    b"\xd0\x9a\xd0\xbe\xd0\xbd\xd0\xb2\xd0\xb5\xd1\x80\xd1\x82\xd0\xb0\xd1\x86\xd0\xb8\xd1\x8f \xd0\xb7\xd0\xb0\xd0\xb2\xd0\xb5\xd1\x80\xd1\x88\xd0\xb5\xd0\xbd\xd0\xb0"
+    b"\xd0\x93\xd0\xbe\xd1\x82\xd0\xbe\xd0\xb2\xd0\xbe?"
+    b"\xd0\x94\xd0\xb2\xd0\xbe\xd0\xb9\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\x94\xd1\x80\xd0\xb0\xd0\xb9\xd0\xb2\xd0\xb5\xd1\x80"
+    b"\xd0\x9f\xd1\x83\xd1\x81\xd1\x82\xd0\xbe\xd0\xb9"
+    b"\xd0\x92\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb9 QR \xd0\x9a\xd0\xbe\xd0\xb4"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xb0 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb0 \xd1\x81 ID:"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xbd\xd0\xb5 \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xb0 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb0"
+    b"\xd0\xa8\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\x9c\xd0\xb5\xd1\x82\xd0\xbe\xd0\xb4 \xd0\xa8\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 %d \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 BIP39."
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xb1\xd0\xbe\xd0\xbb\xd0\xb5\xd0\xb5 6 \xd1\x81\xd0\xb8\xd0\xbc\xd0\xb2\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb2 \xd0\xba\xd0\xbe\xd0\xb4\xd0\xb0 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 BIP39 \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 \xd1\x87\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 2048."
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 BIP39 \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd0\xb0\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd1\x87\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 800."
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 BIP39 \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 \xd0\xb2\xd0\xbe\xd1\x81\xd1\x8c\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd1\x87\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 4000."
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 BIP39 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8."
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8f"
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85 \xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8f\xe2\x80\xa6"
+    b"\xd0\x9e\xd1\x88\xd0\xb8\xd0\xb1\xd0\xba\xd0\xb0:"
+    b"\xd0\x92\xd1\x8b\xd0\xb9\xd1\x82\xd0\xb8"
+    b"\xd0\x98\xd1\x81\xd1\x81\xd0\xbb\xd0\xb5\xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd1\x8b?"
+    b"\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0\xbe\xd1\x80\xd1\x82 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2"
+    b"\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0\xbe\xd1\x80\xd1\x82 %s \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83\xe2\x80\xa6"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd1\x88\xd0\xb8\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9f\xd1\x83\xd0\xb1\xd0\xbb\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87"
+    b"\xd0\x97\xd0\xb0\xd0\xb2\xd0\xbe\xd0\xb4\xd1\x81\xd0\xba\xd0\xb8\xd0\xb5 \xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8"
+    b"\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd1\x81\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0\xd1\x82\xd1\x8c \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8e \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b"
+    b"\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd1\x80\xd0\xb0\xd1\x81\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c"
+    b"\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd0\xbd\xd0\xb8\xd1\x87\xd0\xb5\xd0\xb3\xd0\xbe \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83"
+    b"\xd0\x9a\xd0\xbe\xd0\xbc\xd0\xb8\xd1\x81\xd1\x81\xd0\xb8\xd1\x8f:"
+    b"\xd0\xa1\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c \xd0\x9f\xd0\xbe\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb8"
+    b"\xd0\x98\xd0\xbc\xd1\x8f \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd0\xb0"
+    b"\xd0\xa4\xd0\xb0\xd0\xb9\xd0\xbb %s \xd1\x81\xd1\x83\xd1\x89\xd0\xb5\xd1\x81\xd1\x82\xd0\xb2\xd1\x83\xd0\xb5\xd1\x82 \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb5."
+    b"\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88 \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd0\xb5\xd0\xb9 \xd1\x81 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b?"
+    b"\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88\xd0\xb0"
+    b"\xd0\x9e\xd1\x82\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xbe\xd0\xba \xd0\xbf\xd0\xb0\xd0\xbb\xd1\x8c\xd1\x86\xd0\xb0 \xd0\xbd\xd0\xb5 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd \xd0\xb2 PSBT"
+    b"\xd0\x9a\xd0\xb0\xd1\x80\xd1\x82\xd0\xb0 \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88\xd0\xb0"
+    b"Flash Tools"
+    b"\xd0\xa4\xd0\xbb\xd1\x8d\xd1\x88 \xd0\xb7\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd0\xb5\xd0\xb9 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b"
+    b"\xd0\x94\xd0\xb8\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x82\xd1\x80 \xd0\xa4\xd0\xbb\xd1\x8e\xd1\x82\xd0\xb0"
+    b"\xd0\xa1\xd0\xb2\xd0\xbe\xd0\xb1\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe:"
+    b"\xd0\x98\xd0\xb7 \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0\xb8"
+    b"\xd0\x9f\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c\xd1\x8e \xd1\x81\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd0\xb5 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83 \xd0\xb2 \xd0\xb4\xd1\x80\xd1\x83\xd0\xb3\xd0\xbe\xd0\xbc \xd1\x83\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb5, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x83\xd0\xb1\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd1\x8c\xd1\x81\xd1\x8f, \xd1\x87\xd1\x82\xd0\xbe \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbd\xd0\xb5 \xd0\xb2\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd0\xbc\xd1\x8b"
+    b"\xd0\x9b\xd0\xb8\xd0\xbc\xd0\xb8\xd1\x82 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xbf\xd1\x83\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2"
+    b"\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83"
+    b"OK"
+    b"\xd0\xa5\xd0\xbe\xd1\x80\xd0\xbe\xd1\x88\xd0\xb0\xd1\x8f \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f"
+    b"\xd0\x90\xd0\xbf\xd0\xbf\xd0\xb0\xd1\x80\xd0\xb0\xd1\x82\xd0\xbd\xd0\xbe\xd0\xb5 \xd0\x9e\xd0\xb1\xd0\xb5\xd1\x81\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\xa2\xd0\xb8\xd0\xbf \xd0\xb3\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xba\xd0\xb8"
+    b"\xd0\xa8\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd0\xb0\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9f\xd1\x83\xd0\xb1\xd0\xbb\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87:"
+    b"\xd0\xa8\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd0\xb0\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\xa1\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8"
+    b"\xd0\x92\xd1\x8b\xd1\x81\xd0\xbe\xd0\xba\xd0\xb8\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xbc\xd0\xb8\xd1\x81\xd1\x81\xd0\xb8\xd0\xb8!"
+    b"\xd0\x98\xd0\xb4\xd0\xb5\xd0\xbd\xd1\x82\xd0\xb8\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x82\xd0\xbe\xd1\x80"
+    b"ID \xd1\x83\xd0\xb6\xd0\xb5 \xd1\x81\xd1\x83\xd1\x89\xd0\xb5\xd1\x81\xd1\x82\xd0\xb2\xd1\x83\xd0\xb5\xd1\x82"
+    b"\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81"
+    b"\xd0\x92\xd1\x85\xd0\xbe\xd0\xb4\xd1\x8b (%d):"
+    b"\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xbe\xd1\x81\xd1\x82\xd0\xb0\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xad\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f!"
+    b"\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81"
+    b"\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xbe\xd0\xbf\xd1\x83\xd1\x81\xd1\x82\xd0\xb8\xd0\xbc\xd1\x8b\xd0\xb9 \xd0\xbf\xd1\x83\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x80\xd0\xb8\xd0\xb2\xd0\xb0\xd1\x86\xd0\xb8\xd0\xb8"
+    b"\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xb4\xd0\xbb\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8"
+    b"\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba:"
+    b"\xd0\x98\xd0\xbd\xd0\xb2\xd0\xb5\xd1\x80\xd1\x82\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c"
+    b"\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd1\x8b\xd0\xb5 \xd1\x86\xd0\xb2\xd0\xb5\xd1\x82\xd0\xb0"
+    b"\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe KEF"
+    b"\xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87"
+    b"\xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87 \xd0\xbd\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd0\xbe\xd1\x81\xd1\x82\xd0\xb0\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd"
+    b"\xd0\xa2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 QR \xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1\x80\xd0\xb0 Krux"
+    b"\xd0\xa2\xd0\xb8\xd0\xbf \xd0\x96\xd0\x9a-\xd0\xb4\xd0\xb8\xd1\x81\xd0\xbf\xd0\xbb\xd0\xb5\xd1\x8f"
+    b"\xd0\xaf\xd0\xb7\xd1\x8b\xd0\xba"
+    b"\xd0\x9e\xd1\x81\xd1\x82\xd0\xb0\xd0\xb2\xd1\x8c\xd1\x82\xd0\xb5 \xd0\xbf\xd1\x83\xd1\x81\xd1\x82\xd1\x8b\xd0\xbc, \xd0\xb5\xd1\x81\xd0\xbb\xd0\xb8 \xd1\x85\xd0\xbe\xd1\x82\xd0\xb8\xd1\x82\xd0\xb5, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b Krux \xd0\xb2\xd1\x8b\xd0\xb1\xd1\x80\xd0\xb0\xd0\xbb \xd0\xbf\xd0\xbe\xd0\xb4\xd1\x85\xd0\xbe\xd0\xb4\xd1\x8f\xd1\x89\xd0\xb5\xd0\xb5 \xd0\xbf\xd0\xbe\xd1\x81\xd0\xbb\xd0\xb5\xd0\xb4\xd0\xbd\xd0\xb5\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe"
+    b"\xd0\x92\xd0\xbb\xd0\xb5\xd0\xb2\xd0\xbe"
+    b"\xd0\x94\xd0\xbb\xd0\xb8\xd0\xbd\xd0\xb0:"
+    b"\xd0\x97\xd0\xb0\xd0\xb4\xd0\xb5\xd1\x80\xd0\xb6\xd0\xba\xd0\xb0 \xd0\x9b\xd0\xb8\xd0\xbd\xd0\xb8\xd0\xb8"
+    b"\xd0\x9b\xd0\xb8\xd0\xbd\xd0\xb8\xd1\x8f:"
+    b"\xd0\xa1\xd0\xbf\xd0\xb8\xd1\x81\xd0\xbe\xd0\xba \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xbf\xd1\x80\xd0\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1\x82\xd1\x80\xd0\xb0 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2?"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd1\x81 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd1\x81 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b?"
+    b"\xd0\x98\xd0\xb7 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd1\x81\xd0\xbf\xd0\xb8\xd1\x81\xd0\xba\xd0\xb0 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xe2\x80\xa6"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xb8\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f\xe2\x80\xa6"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1\x80\xd0\xb0\xe2\x80\xa6"
+    b"\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xb5\xd0\xbc\xd0\xb0\xe2\x80\xa6"
+    b"\xd0\x98\xd0\xb4\xd0\xb5\xd1\x82 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0\xe2\x80\xa6"
+    b"\xd0\x9b\xd0\xbe\xd0\xba\xd0\xb0\xd0\xbb\xd1\x8c"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\xa1\xd1\x80\xd0\xb5\xd0\xb4\xd0\xbd\xd0\xb8\xd0\xb9"
+    b"\xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5:"
+    b"\xd0\x9c\xd0\xb8\xd0\xbd\xd0\xb8\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82"
+    b"\xd0\x9a\xd0\xbe\xd0\xbe\xd1\x80\xd0\xb4\xd0\xb8\xd0\xbd\xd0\xb0\xd1\x82\xd1\x8b \xd0\xb7\xd0\xb5\xd1\x80\xd0\xba\xd0\xb0\xd0\xbb\xd0\xb0 X"
+    b"\xd0\x9e\xd1\x82\xd1\x81\xd1\x83\xd1\x82\xd1\x81\xd1\x82\xd0\xb2\xd1\x83\xd0\xb5\xd1\x82 \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb8"
+    b"\xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb8 \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb0 \xd0\xb1\xd1\x83\xd0\xb4\xd1\x83\xd1\x82 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b."
+    b"\xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbe:"
+    b"Native Segwit - 84 \xd0\xb1\xd1\x83\xd0\xb4\xd0\xb5\xd1\x82 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd1\x8f\xd1\x82\xd0\xbe"
+    b"\xd0\xa1\xd0\xb5\xd1\x82\xd1\x8c"
+    b"\xd0\x9d\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x8f \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb0 \xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x8f \xd0\xbf\xd1\x80\xd0\xbe\xd1\x88\xd0\xb8\xd0\xb2\xd0\xba\xd0\xb0."
+    b"\xd0\x9d\xd0\xb5\xd1\x82"
+    b"\xd0\x9d\xd0\xb5\xd1\x82 \xd0\xa4\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb0-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c"
+    b"\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xbe\xd1\x81\xd1\x82\xd0\xb0\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xbe \xd0\xb1\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2!"
+    b"\xd0\x9d\xd0\xb5 \xd0\xbd\xd0\xb0\xd0\xb9\xd0\xb4\xd0\xb5\xd0\xbd\xd1\x8b:"
+    b"\xd0\xa7\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0"
+    b"\xd0\x92\xd0\xbe\xd1\x81\xd1\x8c\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\x94\xd1\x80\xd1\x83\xd0\xb3\xd0\xb8\xd0\xb5 \xd1\x84\xd0\xbe\xd1\x80\xd0\xbc\xd0\xb0\xd1\x82\xd1\x8b"
+    b"\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c?"
+    b"PAGE \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd1\x8f\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8"
+    b"\xd0\x98\xd1\x82\xd0\xb5\xd1\x80\xd0\xb0\xd1\x82\xd0\xbe\xd1\x80 PBKDF2."
+    b"\xd0\x97\xd0\xb0\xd0\xba\xd1\x80\xd0\xb0\xd1\x81\xd1\x8c\xd1\x82\xd0\xb5 \xd0\xbf\xd0\xb5\xd1\x80\xd1\x84\xd0\xbe\xd1\x80\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd1\x82\xd0\xbe\xd1\x87\xd0\xba\xd0\xb8 \xd1\x87\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b\xd0\xbc \xd1\x86\xd0\xb2\xd0\xb5\xd1\x82\xd0\xbe\xd0\xbc, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xb8\xd1\x85 \xd0\xbc\xd0\xbe\xd0\xb6\xd0\xbd\xd0\xbe \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xbe \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb8\xd1\x82\xd1\x8c."
+    b"\xd0\xa8\xd0\xb8\xd1\x80\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\x91\xd1\x83\xd0\xbc\xd0\xb0\xd0\xb3\xd0\xb8"
+    b"\xd0\xa7\xd0\xb0\xd1\x81\xd1\x82\xd1\x8c"
+    b"\xd0\xa7\xd0\xb0\xd1\x81\xd1\x82\xd1\x8c M \xd0\xb8\xd0\xb7 N"
+    b"\xd0\xa0\xd0\xb0\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80 \xd0\xa7\xd0\xb0\xd1\x81\xd1\x82\xd0\xb8"
+    b"\xd0\xa4\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb0-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c"
+    b"\xd0\x94\xd0\xbb\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8f"
+    b"\xd0\x9d\xd0\xb5\xd1\x81\xd0\xbe\xd0\xbe\xd1\x82\xd0\xb2\xd0\xb5\xd1\x82\xd1\x81\xd1\x82\xd0\xb2\xd0\xb8\xd0\xb5 \xd0\xbf\xd1\x83\xd1\x82\xd0\xb8"
+    b"\xd0\x9e\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb5\xd1\x86 \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd!"
+    b"\xd0\x9e\xd0\xba\xd0\xbe\xd0\xbd\xd1\x87\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb2\xd1\x81\xd0\xb5 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xb7\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 \xd0\xb8 \xd0\xbd\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd0\xb8\xd0\xb7 \xd1\x84\xd0\xbb\xd0\xb5\xd1\x88-\xd0\xbf\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0\xb8?"
+    b"\xd0\x9f\xd0\xbe\xd1\x81\xd1\x82\xd0\xbe\xd1\x8f\xd0\xbd\xd0\xbd\xd0\xb0\xd1\x8f \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd1\x8c"
+    b"\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81 \xd0\xbe\xd1\x82\xd0\xba\xd0\xbb\xd0\xbe\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xbf\xd0\xb8\xd0\xba\xd1\x81\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xb9:"
+    b"QR \xd0\x9e\xd1\x82\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd1\x8b\xd0\xbc \xd0\xa2\xd0\xb5\xd0\xba\xd1\x81\xd1\x82\xd0\xbe\xd0\xbc"
+    b"\xd0\x9f\xd0\xbe\xd0\xb6\xd0\xb0\xd0\xbb\xd1\x83\xd0\xb9\xd1\x81\xd1\x82\xd0\xb0 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xb2\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0"
+    b"\xd0\xa1\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c \xd0\x9f\xd0\xbe\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"\xd0\xa2\xd0\xb8\xd0\xbf \xd0\xbf\xd0\xbe\xd0\xbb\xd0\xb8\xd1\x82\xd0\xb8\xd0\xba\xd0\xb8"
+    b"\xd0\x9f\xd0\xbb\xd0\xbe\xd1\x85\xd0\xb0\xd1\x8f \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f!"
+    b"\xd0\x9c\xd0\xbe\xd1\x89\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c"
+    b"\xd0\x9d\xd0\xb0\xd0\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0\xb5 PAGE, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xbe\xd1\x82\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c."
+    b"PAGE, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc"
+    b"\xd0\x9d\xd0\xb0\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c \xd0\xa2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 QR"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c Tinyseed?"
+    b"\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb2 QR"
+    b"\xd0\x9d\xd0\xb0\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 QR?"
+    b"\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c?"
+    b"\xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1\x80"
+    b"\xd0\x94\xd1\x80\xd0\xb0\xd0\xb9\xd0\xb2\xd0\xb5\xd1\x80 \xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1\x80\xd0\xb0 \xd0\xbd\xd0\xb5 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd!"
+    b"\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd1\x8c\xe2\x80\xa6"
+    b"\xd0\x92\xd1\x81\xd0\xb5 \xd1\x80\xd0\xb0\xd0\xb2\xd0\xbd\xd0\xbe \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb4\xd0\xbe\xd0\xbb\xd0\xb6\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb4\xd0\xbe\xd0\xbb\xd0\xb6\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\x9e\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x82\xd0\xba\xd0\xb0\xe2\x80\xa6"
+    b"\xd0\x94\xd0\xbe\xd0\xba\xd0\xb0\xd0\xb7\xd1\x83\xd0\xb5\xd0\xbc\xd0\xbe \xd0\xbd\xd0\xb5\xd0\xbf\xd0\xbe\xd1\x82\xd1\x80\xd0\xb0\xd1\x82\xd0\xb8\xd0\xbc\xd1\x8b\xd0\xb9"
+    b"QR \xd0\x9a\xd0\xbe\xd0\xb4"
+    b"QR-\xd0\xbc\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0"
+    b"\xd0\x9a\xd0\xbe\xd0\xbb-\xd0\xb2\xd0\xbe"
+    b"RX \xd0\x9f\xd0\xb8\xd0\xbd"
+    b"\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x9f\xd0\xbe\xd0\xbb\xd1\x83\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\xa0\xd0\xb5\xd0\xb3\xd0\xb8\xd0\xbe\xd0\xbd:"
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c %s?"
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83"
+    b"\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd1\x8b \xd0\xbf\xd1\x80\xd0\xbe\xd1\x88\xd0\xb8\xd0\xb2\xd0\xba\xd0\xb8 \xd1\x81 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b?"
+    b"\xd0\xa0\xd0\xb0\xd0\xb7\xd1\x80\xd0\xb5\xd1\x88. - \xd0\xa4\xd0\xbe\xd1\x80\xd0\xbc\xd0\xb0\xd1\x82"
+    b"\xd0\x92\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb7\xd0\xb0\xd0\xb2\xd0\xbe\xd0\xb4\xd1\x81\xd0\xba\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd0\xb8 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c?"
+    b"\xd0\xa0\xd0\xb5\xd0\xb7\xd1\x83\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb0\xd1\x82"
+    b"\xd0\x92\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd1\x8c\xd1\x81\xd1\x8f \xd0\xba QR-\xd0\xbf\xd1\x80\xd0\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1\x82\xd1\x80\xd1\x89\xd0\xb8\xd0\xba\xd1\x83"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c \xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1\x82\xd1\x80\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xbe\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5, \xd0\xbe\xd1\x82\xd1\x80\xd0\xb5\xd0\xb4\xd0\xb0\xd0\xba\xd1\x82\xd0\xb8\xd1\x80\xd1\x83\xd0\xb9\xd1\x82\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xb8 \xd0\xbd\xd0\xb5\xd0\xbe\xd0\xb1\xd1\x85\xd0\xbe\xd0\xb4\xd0\xb8\xd0\xbc\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8"
+    b"\xd0\x92\xd0\xbf\xd1\x80\xd0\xb0\xd0\xb2\xd0\xbe"
+    b"\xd0\x91\xd1\x80\xd0\xbe\xd1\x81\xd1\x8c\xd1\x82\xd0\xb5 \xd0\xba\xd1\x83\xd0\xb1\xd0\xb8\xd0\xba \xd0\xbd\xd0\xb5 \xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xb5 %d \xd1\x80\xd0\xb0\xd0\xb7, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xb3\xd0\xb5\xd0\xbd\xd0\xb5\xd1\x80\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83."
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb1\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2:"
+    b"\xd0\x91\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xb8:"
+    b"\xd0\x9f\xd0\xbe\xd0\xb2\xd0\xbe\xd1\x80\xd0\xbe\xd1\x82 \xd0\xbd\xd0\xb0 180\xc2\xb0"
+    b"SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb0"
+    b"SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb0 \xd0\xbd\xd0\xb5 \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb0."
+    b"SHA256 \xd0\xb1\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2:"
+    b"SHA256 \xd1\x81\xd0\xbd\xd1\x8d\xd0\xbf\xd1\x88\xd0\xbe\xd1\x82\xd0\xb0:"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c QR-\xd0\xb8\xd0\xb7\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83?"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbe \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83:"
+    b"\xd0\xa8\xd0\xba\xd0\xb0\xd0\xbb\xd0\xb0"
+    b"\xd0\x9e\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81"
+    b"\xd0\x9e\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c BIP39 \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd1\x83-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c"
+    b"\xd0\x9e\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87 QR \xd0\xba\xd0\xbe\xd0\xb4"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd1\x84\xd0\xb8\xd0\xbb\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"\xd0\xa1\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 1-12 \xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0"
+    b"\xd0\xa1\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 13-24"
+    b"\xd0\x92\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f \xd0\xad\xd0\xba\xd1\x80\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\x97\xd0\xb0\xd1\x81\xd1\x82\xd0\xb0\xd0\xb2\xd0\xba\xd0\xb8"
+    b"\xd0\xa2\xd0\xb8\xd0\xbf \xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xb0"
+    b"\xd0\x9e\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb0"
+    b"\xd0\xa2\xd1\x80\xd0\xb0\xd0\xbd\xd1\x81\xd1\x84\xd0\xb5\xd1\x80 \xd1\x81\xd0\xb0\xd0\xbc\xd0\xbe\xd0\xbc\xd1\x83 \xd1\x81\xd0\xb5\xd0\xb1\xd0\xb5 \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xa1\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb0 (%d):"
+    b"\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb2\xd0\xbe\xd0\xb4 \xd1\x81\xd0\xb0\xd0\xbc\xd0\xbe\xd0\xbc\xd1\x83 \xd1\x81\xd0\xb5\xd0\xb1\xd0\xb5:"
+    b"\xd0\xa1\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb0\xd0\xbb\xd0\xb0 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8"
+    b"\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd1\x8f\xd1\x82\xd1\x81\xd1\x8f \xd0\xb2\xd0\xbe \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88-\xd0\xbf\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0\xb8."
+    b"\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb5."
+    b"\xd0\xad\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f \xd0\xa8\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xbd\xd0\xb0:"
+    b"\xd0\x9f\xd0\xbe\xd0\xba\xd0\xb0\xd0\xb7\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0\xd1\x82\xd1\x83\xd0\xbc"
+    b"\xd0\x92\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x92\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f \xd0\xb2\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"\xd0\x9e\xd1\x82\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5\xe2\x80\xa6"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb5"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c?"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c:"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb5 \xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb5 PSBT"
+    b"\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c\xe2\x80\xa6"
+    b"\xd0\x9e\xd0\xb4\xd0\xbd\xd0\xb0 \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c"
+    b"\xd0\xa0\xd0\xb0\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80:"
+    b"\xd0\x9d\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd1\x8b\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xbd\xd0\xb5 \xd0\xbc\xd0\xbe\xd0\xb3\xd1\x83\xd1\x82 \xd0\xb1\xd1\x8b\xd1\x82\xd1\x8c \xd0\xb2\xd1\x8b\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b."
+    b"\xd0\x9d\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd1\x8b\xd0\xb5 \xd1\x83\xd0\xb7\xd0\xbb\xd1\x8b \xd0\xbd\xd0\xb5 \xd1\x83\xd0\xba\xd1\x80\xd0\xb5\xd0\xbf\xd0\xbb\xd0\xb5\xd0\xbd\xd1\x8b:"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd1\x85\xd0\xbe\xd0\xb4 (%d):"
+    b"\xd0\xa0\xd0\xb0\xd1\x81\xd1\x85\xd0\xbe\xd0\xb4:"
+    b"\xd0\xa1\xd1\x82\xd0\xb0\xd0\xbd\xd0\xb4\xd0\xb0\xd1\x80\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc"
+    b"Static / \xd0\xa1\xd1\x82\xd0\xb0\xd1\x82\xd0\xb8\xd1\x87\xd0\xb5\xd1\x81\xd0\xba\xd0\xbe\xd0\xb5 \xd0\xbe\xd0\xb1\xd0\xbe\xd1\x80\xd1\x83\xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\xa1\xd1\x82\xd0\xb0\xd1\x82\xd0\xb8\xd1\x81\xd1\x82\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb4\xd0\xbb\xd1\x8f \xd0\x93\xd0\xb8\xd0\xba\xd0\xbe\xd0\xb2"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 \xd0\xa4\xd0\xbb\xd1\x8d\xd1\x88 \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd1\x8c"
+    b"\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD \xd0\x9a\xd0\xb0\xd1\x80\xd1\x82\xd1\x83"
+    b"\xd0\xa1\xd0\xb8\xd0\xbb\xd0\xb0"
+    b"\xd0\xa1\xd0\xb8\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\xa1\xd0\xb2\xd0\xb0\xd0\xb9\xd0\xbf\xd0\xbd\xd0\xb8\xd1\x82\xd0\xb5, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc"
+    b"TC Flash Hash"
+    b"\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb0 \xd1\x85\xd1\x8d\xd1\x88\xd0\xb0 Flash \xd0\xbf\xd1\x80\xd0\xb8 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb5"
+    b"\xd0\x9f\xd0\xa0\xd0\x98\xd0\x9a\xd0\x9e\xd0\xa1\xd0\x9d\xd0\x98\xd0\xa2\xd0\x95\xd0\xa1\xd0\xac \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0\xb5 \xd0\x92\xd0\x92\xd0\x9e\xd0\x94, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xb7\xd0\xb0\xd1\x85\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x9f\xd0\xa0\xd0\x98\xd0\x9a\xd0\x9e\xd0\xa1\xd0\x9d\xd0\x98\xd0\xa2\xd0\x95\xd0\xa1\xd0\xac \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0\xb5 \xd0\x92\xd0\x92\xd0\x9e\xd0\x94, \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xa3\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c."
+    b"\xd0\xb2\xd0\xbd\xd1\x83\xd1\x82\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xb8\xd0\xb9 \xd0\xba\xd0\xbb\xd1\x8e\xd1\x87"
+    b"TX \xd0\x9f\xd0\xb8\xd0\xbd"
+    b"\xd0\x9a\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f"
+    b"\xd0\x9a\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f \xd1\x83\xd1\x81\xd0\xbf\xd0\xb5\xd1\x88\xd0\xbd\xd0\xbe \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd"
+    b"\xd0\x9a\xd0\xbe\xd0\xb4\xd1\x8b \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f \xd0\xbd\xd0\xb5 \xd1\x81\xd0\xbe\xd0\xb2\xd0\xbf\xd0\xb0\xd0\xb4\xd0\xb0\xd1\x8e\xd1\x82"
+    b"\xd0\xbd\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x80 \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2"
+    b"\xd0\xa0\xd0\xb5\xd0\xb7\xd1\x83\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb0\xd1\x82\xd1\x8b \xd0\xbd\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x80\xd0\xb0 \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd1\x8b\xd1\x82.:"
+    b"\xd0\xa2\xd0\xb5\xd0\xba\xd1\x81\xd1\x82"
+    b"\xd0\xa2\xd0\xb5\xd0\xbc\xd0\xb0"
+    b"\xd0\xa2\xd0\xb5\xd1\x80\xd0\xbc\xd0\xb0\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\x94\xd0\xbb\xd1\x8f \xd0\xb3\xd0\xb0\xd1\x80\xd0\xb0\xd0\xbd\xd1\x82\xd0\xb8\xd0\xb8 \xd0\xbd\xd0\xb5\xd0\xb2\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85 \xd0\xb8\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd1\x83\xd0\xb9\xd1\x82\xd0\xb5 \xd1\x84\xd1\x83\xd0\xbd\xd0\xba\xd1\x86\xd0\xb8\xd1\x8e \xd0\x9e\xd1\x87\xd0\xb8\xd1\x81\xd1\x82\xd0\xba\xd0\xb8 \xd0\xa3\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb0"
+    b"\xd0\xa0\xd0\xb5\xd0\xb3\xd1\x83\xd0\xbb\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xba\xd0\xb0 \xd0\xaf\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8"
+    b"\xd0\x98\xd0\xbd\xd1\x81\xd1\x82\xd1\x80\xd1\x83\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82\xd1\x8b"
+    b"\xd0\xa7\xd1\x83\xd0\xb2\xd1\x81\xd1\x82\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c"
+    b"\xd0\xa2\xd0\xb0\xd1\x87\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbd"
+    b"\xd0\x9f\xd0\xbe\xd0\xbf\xd1\x80\xd0\xbe\xd0\xb1\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb5\xd1\x89\xd1\x91?"
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8 BIP39 \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd1\x83-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c"
+    b"\xd0\x92\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87"
+    b"\xd0\x9e\xd1\x82\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c"
+    b"\xd0\x95\xd0\xb4\xd0\xb8\xd0\xbd\xd0\xb8\xd1\x86\xd0\xb0 \xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb8\xd0\xb4\xd0\xb5\xd0\xbd\xd1\x82\xd0\xb8\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x82\xd0\xbe\xd1\x80 KEF?"
+    b"\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c QR-\xd0\xbc\xd0\xb5\xd1\x82\xd0\xba\xd1\x83?"
+    b"\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb7\xd0\xb0\xd0\xb2\xd0\xb5\xd1\x80\xd1\x88\xd0\xb5\xd0\xbd\xd0\xbe."
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd1\x87\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x8e \xd1\x84\xd0\xbe\xd0\xbd\xd0\xbe\xd0\xb2\xd1\x83\xd1\x8e \xd0\xbf\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd1\x85\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c."
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8e \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbd\xd0\xbe\xd0\xb2\xd1\x83\xd1\x8e \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83"
+    b"\xd0\xa2\xd0\xb5\xd0\xba\xd1\x83\xd1\x89\xd0\xb5\xd0\xb5 \xd0\xb7\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e?"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb8\xd1\x82\xd0\xb5\xd1\x80 PBKDF2 \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e.?"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbe\xd1\x82\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xbe\xd0\xba \xd0\xbf\xd0\xb0\xd0\xbb\xd1\x8c\xd1\x86\xd0\xb0 \xd0\xba\xd0\xb0\xd0\xba ID?"
+    b"\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe:"
+    b"\xd0\x9f\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c"
+    b"\xd0\x97\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 %s \xd0\xb2\xd0\xbd\xd0\xb5 \xd0\xb4\xd0\xb8\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xb7\xd0\xbe\xd0\xbd\xd0\xb0: [%s, %s]"
+    b"\xd0\x92\xd0\xb5\xd1\x80\xd0\xb8\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x86\xd0\xb8\xd1\x8f\xe2\x80\xa6"
+    b"\xd0\x92\xd0\xb5\xd1\x80\xd1\x81\xd0\xb8\xd1\x8f"
+    b"\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e \xd0\x9a\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b"
+    b"\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e D20"
+    b"\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e D6"
+    b"\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e \xd0\xa0\xd1\x83\xd1\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd0\x92\xd0\xb2\xd0\xbe\xd0\xb4\xd0\xb0"
+    b"\xd0\xa7\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7 \xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe"
+    b"\xd0\x92\xd0\xb8\xd0\xb4\xd0\xb8\xd0\xbc\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0"
+    b"\xd0\x94\xd0\xbe\xd0\xb6\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5\xd1\x81\xd1\x8c \xd0\x97\xd0\xb0\xd1\x85\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb0"
+    b"\xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba"
+    b"\xd0\x94\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0"
+    b"\xd0\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0"
+    b"\xd0\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd!"
+    b"\xd0\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd0\xbd\xd0\xb5 \xd0\xbd\xd0\xb0\xd0\xb9\xd0\xb4\xd0\xb5\xd0\xbd."
+    b"\xd0\x9f\xd1\x80\xd0\xb5\xd0\xb4\xd1\x83\xd0\xbf\xd1\x80\xd0\xb5\xd0\xb6\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5:"
+    b"\xd0\xa1\xd0\xbb\xd0\xb0\xd0\xb1\xd1\x8b\xd0\xb9"
+    b"\xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe %d"
+    b"\xd0\xa7\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2"
+    b"\xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xb0"
+    b"\xd0\x94\xd0\xb0"
+    b"\xd0\xa0\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc \xd0\xbc\xd0\xb0\xd1\x81\xd1\x88\xd1\x82\xd0\xb0\xd0\xb1\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f"
+    b"binary: {} \xd0\xb1\xd0\xb0\xd0\xb9\xd1\x82"
+    b"\xd0\xbd\xd0\xb5\xd1\x83\xd0\xb4\xd0\xb0\xd1\x87\xd0\xbd\xd0\xbe"
+    b"\xd0\xbe\xd1\x82 \xd0\xa8\xd0\x95\xd0\xa1\xd0\xa2\xd0\x98\xd0\x93\xd0\xa0\xd0\x90\xd0\x9d\xd0\x9d\xd0\x98\xd0\x9a\xd0\x90"
+    b"\xd0\xbe\xd1\x82 \xd0\xb1\xd0\xb0\xd0\xb7\xd1\x8b32"
+    b"\xd0\xbe\xd1\x82 \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f43"
+    b"\xd0\xbe\xd1\x82 base64"
+    b"\xd0\xbe\xd1\x82 \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd0\xb3\xd1\x80\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0"
+    b"\xd0\xbe\xd1\x82 utf8"
+    b"\xd0\xba\xd0\xbe\xd1\x80\xd1\x80\xd0\xb5\xd0\xba\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81"
+    b"\xd1\x81\xd0\xbb\xd1\x83\xd1\x87\xd0\xb0\xd0\xb9 \xd1\x81\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x8b"
+    b"\xd0\x9a\xd0\xbe\xd1\x8d\xd1\x84\xd1\x84\xd0\xb8\xd1\x86\xd0\xb8\xd0\xb5\xd0\xbd\xd1\x82 \xd1\x83\xd1\x81\xd0\xbf\xd0\xb5\xd1\x85\xd0\xb0:"
+    b"\xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5"
+    b"text: {} \xd1\x81\xd0\xb8\xd0\xbc\xd0\xb2\xd0\xbe\xd0\xbb\xd1\x8b"
+    b"\xd0\xba \xd0\xa8\xd0\x95\xd0\xa1\xd0\xa2\xd0\x98\xd0\x93\xd0\xa0\xd0\x90\xd0\x9d\xd0\x9d\xd0\x9e\xd0\x99"
+    b"\xd0\xba \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e32"
+    b"\xd0\xba \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e43"
+    b"\xd0\xba base64"
+    b"\xd0\xba \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd0\xb3\xd1\x80\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb9"
+    b"to utf8"
+    b"\xd0\xbd\xd0\xb5\xd0\xb8\xd0\xb7\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9"
+    b"\xd0\xbd\xd0\x95 \xd0\x9d\xd0\x90\xd0\x99\xd0\x94\xd0\x95\xd0\x9d\xd0\x9e \xd0\xb2 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb2\xd1\x8b\xd1\x85 %d \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xb0\xd1\x85"
+)
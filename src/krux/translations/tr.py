@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "tutarın %'si.",
-    "%d / %d çoklu imza",
-    "%d to %d",
-    "%s bit (%s bit/piksel)",
-    "%s kaldırıldı.",
-    "%s: yüklendi!",
-    "(Deneysel)",
-    "(sadece izle)",
-    "12 kelime",
-    "24 kelime",
-    "Hakkında",
-    "Varsayım kabul edilsin mi?",
-    "Hesap",
-    "#0 numaralı hesap varsayılacaktır",
-    "Hesap Endeksi",
-    "Cüzdan parolası eklensin mi veya değiştirilsin mi?",
-    "%s için kameradan gelen ek entropi gerekli",
-    "Adres",
-    "Kamerayı ve yedek plakay'ı düzgün bir şekilde hizalayın.",
-    "Parlama Önleyici Mod",
-    "Görünüm",
-    "Emin misiniz?",
-    "BGR Renkleri",
-    "BIP39 Anımsatıcı",
-    "Geri",
-    "Menüye Dön",
-    "Yedek Mnemonic",
-    "Geçersiz imza",
-    "Base64 Parola",
-    "Baud Hızı",
-    "İkili Izgara",
-    "Kenarlık Dolgusu",
-    "Parlaklık",
-    "Butonlar",
-    "Buton Geri-sekmesi",
-    "Yakalama iptal edildi",
-    "Para Üstü",
-    "Temayı değiştir ve yeniden başlat?",
-    "Para Üstü:",
-    "Değişiklikler kapanışa kadar devam edecek.",
-    "SD Kartı Kontrol Et",
-    "Bu adresin, bu cüzdana ait olduğunu kontrol et?",
-    "Eşleşmeyen %d adres kontrol edildi.",
-    "SD kart kontrol ediliyor…",
-    "Kurcalama Kontrol Kodunu Onayla",
-    "Veriyi Dönüştür",
-    "Değişiklik adresi belirlenemedi.",
-    "QR Kodu Oluştur",
-    "Metinden QR kodu oluşturulsun mu?",
-    "Oluşturuldu:",
-    "Mevcut Kurcalama Kontrol Kodu",
-    "Özel QR Kodu",
-    "Özel metin",
-    "Özelleştir",
-    "Cüzdanınızı özelleştirmek yeni bir Anahtar oluşturacaktır ve Tanımlayıcısı kaldıracaktır.",
-    "Kesim Derinliği",
-    "Kesim Yöntemi",
-    "Referans Aracı",
-    "Ondalık",
-    "Şifre çözülsün mü?",
-    "Varsayılan Cüzdan",
-    "Bu dosyayı sil?",
-    "Geçiş Başına Derinlik",
-    "Türetim Yolu",
-    "BIP85 entropisi türetilsin mi?",
-    "Tanımlayıcı Adresler",
-    "Cihaz Testleri",
-    "Ekran",
-    "Kapatmayın, tamamlanması biraz zaman alabilir.",
-    "Dönüştürme Tamamlandı",
-    "Tamamlandı mı?",
-    "Çifte anımsatıcı",
-    "Sürücü",
-    "Boş",
-    "Etkinleştir?",
-    "Şifrele",
-    "Şifrelenmiş",
-    "Şifrelenmiş QR Kodu",
-    "Şifrelenmiş mnemonic ID ile depolandı:",
-    "Şifrelenmiş mnemonic depolanmadı",
-    "Şifreleme",
-    "Şifreleme Modu",
-    "%d BIP39 kelime girin.",
-    "6+ karakterlik bir Kurcalama Kontrol Kodu girin",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 2048'e kadar bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 800'e kadar onaltılık bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 4000'e kadar sekizlik bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini girin.",
-    "Kullanıcı Verilerini Sil",
-    "Kullanıcının verileri siliniyor…",
-    "Hata:",
-    "Çıkış",
-    "Dosyaları ara?",
-    "Adresleri Dışa Aktar",
-    "%s SD karta aktarılıyor…",
-    "Genişletilmiş Public Key",
-    "Fabrika Ayarları",
-    "Kamera entropisi toplanamadı",
-    "Şifre çözme başarısız",
-    "Yüklenemedi",
-    "Mnemonic depolama başarısız",
-    "Ücret:",
-    "Besleme Hızı",
-    "Dosya adı",
-    "%s dosya adı SD kartta var.",
-    "Flash'ı kameradan gelen entropi ile doldur?",
-    "Flash Dolduruluyor",
-    "PSBT'de parmak izi ayarı kaldırıldı",
-    "Flash Haritası",
-    "Flash Araçları",
-    "Flash kamera entropisi ile dolduruldu",
-    "Flute Çapı",
-    "Boş:",
-    "Depolamadan Seç",
-    "Verilerin geri kullanılamaz olduğundan emin olmak için SD kartınızı başka bir cihazda tamamen silin",
-    "Mnemonic Oluştur",
-    "Seç",
-    "Yeterli entropi",
-    "Donanım",
-    "Başlık türü",
-    "Hex Public Key:",
-    "Onaltılık",
-    "Mnemonic'leri Gizle",
-    "Yüksek ücret!",
-    "ID",
-    "ID zaten var",
-    "Dizin",
-    "Girişler (%d):",
-    "Yetersiz entropi!",
-    "Geçersiz Kurcalama Kontrol Kodu",
-    "Geçersiz adres",
-    "Geçersiz türetim yolu",
-    "Geçersiz mnemonic uzunluğu",
-    "Geçersiz cüzdan:",
-    "Ters Çevir",
-    "Ters Renkler",
-    "Kef Şifreli",
-    "Anahtar",
-    "Anahtar sağlanmadı",
-    "Krux Yazıcı Test QR'ı",
-    "LCD Tipi",
-    "Dil",
-    "Krux'un geçerli bir son kelime seçmesini istiyorsanız boş bırakın",
-    "Sol",
-    "Uzunluk:",
-    "Satır Gecikmesi",
-    "Satır:",
-    "Adresleri Listele",
-    "Mnemonic Yükle",
-    "Cüzdan Yükle",
-    "Adresleri görüntülemek için güvenilir bir cüzdan tanımlayıcısı yüklensin mi?",
-    "SD karttan yükle",
-    "SD karttan yüklensin mi?",
-    "Kameradan yükle",
-    "Yüklensin mi?",
-    "Kamera Yükleniyor…",
-    "Değişiklik adresleri yükleniyor…",
-    "Yazıcı yükleniyor…",
-    "Alma adresleri yükleniyor…",
-    "Yükleniyor…",
-    "Yerel",
-    "Konum",
-    "Orta",
-    "Mesaj",
-    "Mesaj:",
-    "Mini senaryo",
-    "Ayna X Koordinatları",
-    "İmza dosyası eksik",
-    "Mnemonic",
-    "Mnemonik ve parola tutulacaktır.",
-    "Değiştirildi:",
-    "Yerel Segwit - 84 varsayılacaktır",
-    "Ağ",
-    "Yeni Mnemonic",
-    "Yeni donanım yazılımı tespit edildi.",
-    "Hayır",
-    "Parola Yok",
-    "Yeterli zar atışı yok!",
-    "Numaralar",
-    "Sekizlik",
-    "Diğer Formatlar",
-    "Üzerine yazılsın mı?",
-    "Parlaklığı değiştirmek için PAGE",
-    "PBKDF2 iter.",
-    "İşaretlenmiş noktaları siyaha boyayın ki tespit edilebilsinler.",
-    "Kağıt Genişliği",
-    "Parça",
-    "N'nin M Bölümü",
-    "Parça Boyutu",
-    "Parola",
-    "Parola Uzunluğu",
-    "Yol uyuşmazlığı",
-    "Örüntü algılandı!",
-    "Tüm depolanmış ve şifrelenmiş mnemonic'ler ve ayarlar flash'tan kalıcı olarak kaldırılsın mı?",
-    "Kalıcı Depolama",
-    "Piksel sapma indeksi:",
-    "Düz Metin QR'ı",
-    "Lütfen bir cüzdan çıktı tanımlayıcısı yükleyin",
-    "Dalış Hızı",
-    "Politika türü",
-    "Düşük entropi!",
-    "Güç",
-    "İptal etmek için PAGE tuşuna basın.",
-    "PAGE modunu değiştir",
-    "Test QR'ını Yazdır",
-    "Tinyseed yazdırılsın mı?",
-    "QR'a Yazdır",
-    "QR'a yazdırılsın mı?",
-    "Yazdırılsın mı?",
-    "Yazıcı",
-    "Yazıcı Sürücüsü ayarlanmadı!",
-    "Baskı…",
-    "Yine de devam edilsin mi?",
-    "Devam edilsin mi?",
-    "İşleniyor…",
-    "Kanıtlanabilir harcanamaz",
-    "QR Kodu",
-    "QR Etiket",
-    "Miktar",
-    "RX Pini",
-    "Yeniden Başlat",
-    "Al",
-    "Bölge:",
-    "%s kaldırılsın mı?",
-    "Mnemonic'i Kaldır",
-    "SD Karttan donanım yazılımı dosyaları kaldırılsın mı?",
-    "Çözünürlüğü Sıfırla",
-    "Fabrika ayarlarına geri dönüp ve yeniden başlatılsın mı?",
-    "Sonuç",
-    "QR Görüntüleyiciye Dön",
-    "Tekrar İncele",
-    "Taranan verileri gözden geçirin, gerekirse düzenleyin",
-    "Sağ",
-    "Bir mnemonic oluşturmak için zarı en az %d kez atın.",
-    "Zar atış dağılımı:",
-    "Zar atışları:",
-    "180° döndür",
-    "SD kart",
-    "SD kart algılanmadı.",
-    "Zar atışlarının SHA256'sı:",
-    "Snapshot'ın SHA256'sı:",
-    "QR Görüntüsünü SD Karta Kaydet",
-    "SD karta kaydet",
-    "SD karta kaydedilsin mi?",
-    "SD karta kaydedildi:",
-    "Ölçek",
-    "Adresi Tara",
-    "BIP39 Parolasını Tara",
-    "Anahtar QR Kodunu Tara",
-    "1-12 kelimeleri tekrar taranıyor",
-    "13-24 kelimeleri taranıyor",
-    "Ekran Koruyucu Süresi",
-    "Betik Türü",
-    "Güvenlik",
-    "Kendine-transfer veya Para Üstü (%d):",
-    "Kendine-transfer:",
-    "Önce bir kurcalama kontrol kodu ayarlayın",
-    "Ayarlar",
-    "Ayarlar dahili olarak flaşta saklanır.",
-    "Ayarlar SD karta kaydedildi.",
-    "Shannon entropisi:",
-    "Referans Noktasını Göster",
-    "Kapat",
-    "Kapanma Süresi",
-    "Kapatma…",
-    "İmzala",
-    "QR koduna imzala",
-    "SD karta imzala",
-    "İmzalansın mı?",
-    "İmza:",
-    "İmzalı Mesaj",
-    "İmzalı PSBT",
-    "İmzalama…",
-    "Tek-imza",
-    "Boyut:",
-    "Bazı kontroller yerine getirilemedi.",
-    "Bazı düğümler sertleştirilmemiş:",
-    "Harcama (%d):",
-    "Harcama:",
-    "Standart Mod",
-    "Statik",
-    "İnekler İçin İstatistikler",
-    "Flash'ta Sakla",
-    "SD Kartta Sakla",
-    "Güç",
-    "Güçlü",
-    "Modu değiştirmek için kaydırın",
-    "TC Flash Hash",
-    "Önyüklemede TC Flash Hash",
-    "Yakalamak için DOKUN veya GİR",
-    "Yüklemek için DOKUN veya GİR.",
-    "TR iç anahtar",
-    "TX Pini",
-    "Kurcalama Kontrol Kodu",
-    "Kurcalama kontrol kodu başarıyla ayarlandı",
-    "Kurcalama kontrol kodları eşleşmiyor",
-    "Test Grubu:",
-    "Test Paketi Sonuçları",
-    "Test:",
-    "Metin",
-    "Tema",
-    "Termal",
-    "Verilerin geri kullanılamaz olduğundan emin olmak için Cihazı Sil özelliğini kullanın",
-    "Parlaklığı Değiştir",
-    "Araçlar",
-    "Dokunma Eşiği",
-    "Dokunmatik ekran",
-    "Daha fazla kez denensin mi?",
-    "BIP39 parolasını yazın",
-    "Anahtar Yaz",
-    "Geri Al",
-    "Birim",
-    "Kef Kimliği Güncellensin mi?",
-    "QR Etiketi Güncellensin mi",
-    "Güncelleme tamamlandı.",
-    "Siyah bir arka plan yüzeyi kullanın.",
-    "Yeni bir mnemonic oluşturmak için kameranın entropisini kullanın",
-    "Mevcut Değer",
-    "Varsayılanı Kullan?",
-    "Varsayılan PBKDF2 yinelemesini kullan.?",
-    "Parmak izi ID olarak kullanılmalı mı?",
-    "Kullanılan:",
-    "Kullanıcı",
-    "%s değeri aralık dışında: [%s, %s]",
-    "Doğrulanıyor…",
-    "Sürüm",
-    "Kamera Aracılığıyla",
-    "D20 Aracılığıyla",
-    "D6 Aracılığıyla",
-    "Manuel Giriş Aracılığıyla",
-    "Sözcüklerle",
-    "Görünür Etiket",
-    "Yakalamanın tamamlanmasını bekleyin",
-    "Cüzdan",
-    "Cüzdan Tanımlayıcısı",
-    "Cüzdan çıktı tanımlayıcısı",
-    "Cüzdan çıktı tanımlayıcısı yüklendi!",
-    "Cüzdan çıktı tanımlayıcısı bulunamadı.",
-    "Uyarı:",
-    "Zayıf",
-    "Kelime %d",
-    "Kelime Numaraları",
-    "Kelimeler",
-    "Evet",
-    "Zoom Mod",
-    "ikili: {} bayt",
-    "Kalınan: ",
-    "oNALTILIKTAN",
-    "base32 'den",
-    "tabandan43",
-    "base64 'ten",
-    "onaltılıktan",
-    "utf8 'den",
-    "geçerli bir adres!",
-    "vites kutusu",
-    "Başarı Puanı:",
-    "kaydırın",
-    "metin: {} karakter",
-    "to HEX",
-    "üsse32",
-    "üsse43",
-    "base64 'e",
-    "to hex",
-    "utf8 'e",
-    "bilinmiyor",
-    "ilk %d adreste BULUNAMADI",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0e\x00-\x00J\x00]\x00e\x00{\x00\x8c\x00\x9a\x00\xa4\x00\xb1\x00\xba\x00\xc3\x00\xcc\x00\xe7\x00"
+    b"\xec\x00\x10\x01\x1d\x01S\x01~\x01\x83\x01\x8f\x01\xcd\x01\xe2\x01\xec\x01\xf9\x01\x05\x02\x18\x02\x1c\x02(\x026\x02"
+    b"D\x02Q\x02\\\x02i\x02z\x02\x84\x02\x8c\x02\x9e\x02\xbe\x02\xd3\x02\xde\x02\x04\x03\x10\x03>\x03X\x03l\x03"
+    b"\x9d\x03\xc2\x03\xdd\x03\xfc\x03\x0f\x041\x04A\x04c\x04p\x04\x8d\x04\x9a\x04\xa5\x04\xb1\x04\x18\x05(\x056\x05"
+    b"E\x05M\x05e\x05x\x05\x88\x05\xa1\x05\xae\x05\xcd\x05\xe4\x05\xf2\x05\xf7\x05'\x06A\x06Q\x06e\x06n\x06"
+    b"r\x06\x7f\x06\x87\x06\x94\x06\xa9\x06\xd2\x06\xf5\x06\xff\x06\x0e\x07$\x07S\x07\xa2\x07\xfc\x07T\x08\x7f\x08\x99\x08"
+    b"\xbe\x08\xc3\x08\xcc\x08\xdb\x08\xf1\x08\r\t'\t8\tU\tp\t|\t\x9a\t\xa1\t\xaf\t\xb9\t\xd5\t"
+    b"\x01\n\x13\n:\nI\nY\n~\n\x8a\n\x8f\n\x9f\n\t\x0b\x17\x0b(\x0b,\x0b;\x0bC\x0bR\x0b"
+    b"a\x0bl\x0b\x7f\x0b\x8e\x0b\x90\x0b\x9c\x0b\xa1\x0b\xb0\x0b\xc1\x0b\xe1\x0b\xf0\x0b\x07\x0c#\x0c5\x0c@\x0cL\x0c"
+    b"X\x0c_\x0cs\x0c\x8b\x0c\x93\x0c\x96\x0c\xdd\x0c\xe0\x0c\xe8\x0c\xf8\x0c\xff\x0c\x10\r\x1f\r-\r\x84\r\x95\r"
+    b"\xae\r\xbe\r\xcc\r\xe1\r\x06\x0e\x1d\x0e:\x0eH\x0eM\x0eR\x0eV\x0e[\x0ea\x0em\x0e\x82\x0e\x96\x0e"
+    b"\x9e\x0e\xbf\x0e\xce\x0e\xf1\x0e\xf4\x0e\x01\x0f)\x0f/\x0f9\x0fR\x0f^\x0fg\x0fo\x0f\x7f\x0f\x97\x0f\xbd\x0f"
+    b"\xc9\x0f\r\x10 \x10&\x107\x10D\x10J\x10Z\x10m\x10\x83\x10\xeb\x10\xfc\x10\x11\x11!\x11Y\x11g\x11"
+    b"v\x11\x87\x11\x8c\x11\xb3\x11\xc9\x11\xde\x11\xfa\x11\x06\x12\x1e\x121\x129\x12\\\x12e\x12~\x12\x8f\x12\x9d\x12"
+    b"\xb7\x12\xbe\x12\xc7\x12\xcd\x12\xd4\x12\xe3\x12\xe5\x12\xec\x12\x02\x13\x14\x13R\x13n\x13\xad\x13\xb3\x13\xcd\x13\xdb\x13"
+    b"\x13\x14\x17\x14O\x14g\x14w\x14\x85\x14\x8c\x14\xa2\x14\xc1\x14\xd9\x14\xfc\x14\x0b\x15#\x157\x15>\x15I\x15"
+    b"`\x15v\x15\x8f\x15\xb0\x15\xcb\x15\xe1\x15\xed\x15\xf6\x15\x1d\x16.\x16Y\x16`\x16\x88\x16\xa4\x16\xb6\x16\xd2\x16"
+    b"\xd7\x16\xe6\x16\xf0\x16\xf7\x16\x07\x17\x16\x17'\x17-\x17;\x17H\x17T\x17\\\x17b\x17\x87\x17\xad\x17\xba\x17"
+    b"\xc2\x17\xce\x17\xd4\x17\xf2\x17\x00\x18\x0f\x18\x14\x18\x1c\x18?\x18L\x18g\x18\x86\x18\xa6\x18\xb4\x18\xbb\x18\xd1\x18"
+    b"\xfe\x18%\x190\x19G\x19L\x19Q\x19U\x19[\x19\xb7\x19\xcf\x19\xd7\x19\xe6\x19\xf6\x19\x11\x1a*\x1a5\x1a"
+    b"<\x1aA\x1a_\x1az\x1a\x92\x1a\xb8\x1a\xfc\x1a\t\x1b\x1e\x1bF\x1bn\x1bz\x1b\x85\x1b\xac\x1b\xbd\x1b\xc4\x1b"
+    b"\xdb\x1b\xef\x1b\x02\x1c \x1c-\x1c>\x1cd\x1ck\x1c\x84\x1c\xa6\x1c\xd3\x1c\x02\x1d\t\x1d\x0f\x1d\x18\x1d*\x1d"
+    b"3\x1d7\x1d?\x1dM\x1dW\x1dc\x1dn\x1dx\x1d\x83\x1d\x91\x1d\x9a\x1d\xad\x1d\xb9\x1d\xc9\x1d\xd3\x1d\xe5\x1d"
+    b"\xeb\x1d\xf2\x1d\xf9\x1d\x02\x1e\x08\x1e\x0f\x1e\x19\x1e2\x1e"
+    b"tutar\xc4\xb1n %'si."
+    b"%d QR kod, d\xc3\xb6ng\xc3\xbc ba\xc5\x9f\xc4\xb1na %ds"
+    b"%d / %d adres bu c\xc3\xbczdana ait"
+    b"%d / %d \xc3\xa7oklu imza"
+    b"%d to %d"
+    b"%s bit (%s bit/piksel)"
+    b"%s kald\xc4\xb1r\xc4\xb1ld\xc4\xb1."
+    b"%s: y\xc3\xbcklendi!"
+    b"(Deneysel)"
+    b"(sadece izle)"
+    b"12 kelime"
+    b"24 kelime"
+    b"Hakk\xc4\xb1nda"
+    b"Varsay\xc4\xb1m kabul edilsin mi?"
+    b"Hesap"
+    b"#0 numaral\xc4\xb1 hesap varsay\xc4\xb1lacakt\xc4\xb1r"
+    b"Hesap Endeksi"
+    b"C\xc3\xbczdan parolas\xc4\xb1 eklensin mi veya de\xc4\x9fi\xc5\x9ftirilsin mi?"
+    b"%s i\xc3\xa7in kameradan gelen ek entropi gerekli"
+    b"Adres"
+    b"Adres Dizini"
+    b"Kameray\xc4\xb1 ve yedek plakay'\xc4\xb1 d\xc3\xbczg\xc3\xbcn bir \xc5\x9fekilde hizalay\xc4\xb1n."
+    b"Parlama \xc3\x96nleyici Mod"
+    b"G\xc3\xb6r\xc3\xbcn\xc3\xbcm"
+    b"Emin misiniz?"
+    b"BGR Renkleri"
+    b"BIP39 An\xc4\xb1msat\xc4\xb1c\xc4\xb1"
+    b"Geri"
+    b"Men\xc3\xbcye D\xc3\xb6n"
+    b"Yedek Mnemonic"
+    b"Ge\xc3\xa7ersiz imza"
+    b"Base64 Parola"
+    b"Baud H\xc4\xb1z\xc4\xb1"
+    b"\xc4\xb0kili Izgara"
+    b"Kenarl\xc4\xb1k Dolgusu"
+    b"Parlakl\xc4\xb1k"
+    b"Butonlar"
+    b"Buton Geri-sekmesi"
+    b"Tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1y\xc4\xb1 \xc3\x96nbelle\xc4\x9fe Al"
+    b"Yakalama iptal edildi"
+    b"Para \xc3\x9cst\xc3\xbc"
+    b"Temay\xc4\xb1 de\xc4\x9fi\xc5\x9ftir ve yeniden ba\xc5\x9flat?"
+    b"Para \xc3\x9cst\xc3\xbc:"
+    b"De\xc4\x9fi\xc5\x9fiklikler kapan\xc4\xb1\xc5\x9fa kadar devam edecek."
+    b"Adres Listesini Kontrol Et"
+    b"SD Kart\xc4\xb1 Kontrol Et"
+    b"Bu adresin, bu c\xc3\xbczdana ait oldu\xc4\x9funu kontrol et?"
+    b"E\xc5\x9fle\xc5\x9fmeyen %d adres kontrol edildi."
+    b"SD kart kontrol ediliyor\xe2\x80\xa6"
+    b"Kurcalama Kontrol Kodunu Onayla"
+    b"Veriyi D\xc3\xb6n\xc3\xbc\xc5\x9ft\xc3\xbcr"
+    b"De\xc4\x9fi\xc5\x9fiklik adresi belirlenemedi."
+    b"QR Kodu Olu\xc5\x9ftur"
+    b"Metinden QR kodu olu\xc5\x9fturulsun mu?"
+    b"Olu\xc5\x9fturuldu:"
+    b"Mevcut Kurcalama Kontrol Kodu"
+    b"\xc3\x96zel QR Kodu"
+    b"\xc3\x96zel metin"
+    b"\xc3\x96zelle\xc5\x9ftir"
+    b"C\xc3\xbczdan\xc4\xb1n\xc4\xb1z\xc4\xb1 \xc3\xb6zelle\xc5\x9ftirmek yeni bir Anahtar olu\xc5\x9fturacakt\xc4\xb1r ve Tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 kald\xc4\xb1racakt\xc4\xb1r."
+    b"Kesim Derinli\xc4\x9fi"
+    b"Kesim Y\xc3\xb6ntemi"
+    b"Referans Arac\xc4\xb1"
+    b"Ondal\xc4\xb1k"
+    b"\xc5\x9eifre \xc3\xa7\xc3\xb6z\xc3\xbcls\xc3\xbcn m\xc3\xbc?"
+    b"Varsay\xc4\xb1lan C\xc3\xbczdan"
+    b"Bu dosyay\xc4\xb1 sil?"
+    b"Ge\xc3\xa7i\xc5\x9f Ba\xc5\x9f\xc4\xb1na Derinlik"
+    b"T\xc3\xbcretim Yolu"
+    b"BIP85 entropisi t\xc3\xbcretilsin mi?"
+    b"Tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1 Adresler"
+    b"Cihaz Testleri"
+    b"Ekran"
+    b"Kapatmay\xc4\xb1n, tamamlanmas\xc4\xb1 biraz zaman alabilir."
+    b"D\xc3\xb6n\xc3\xbc\xc5\x9ft\xc3\xbcrme Tamamland\xc4\xb1"
+    b"Tamamland\xc4\xb1 m\xc4\xb1?"
+    b"\xc3\x87ifte an\xc4\xb1msat\xc4\xb1c\xc4\xb1"
+    b"S\xc3\xbcr\xc3\xbcc\xc3\xbc"
+    b"Bo\xc5\x9f"
+    b"Etkinle\xc5\x9ftir?"
+    b"\xc5\x9eifrele"
+    b"\xc5\x9eifrelenmi\xc5\x9f"
+    b"\xc5\x9eifrelenmi\xc5\x9f QR Kodu"
+    b"\xc5\x9eifrelenmi\xc5\x9f mnemonic ID ile depoland\xc4\xb1:"
+    b"\xc5\x9eifrelenmi\xc5\x9f mnemonic depolanmad\xc4\xb1"
+    b"\xc5\x9eifreleme"
+    b"\xc5\x9eifreleme Modu"
+    b"%d BIP39 kelime girin."
+    b"6+ karakterlik bir Kurcalama Kontrol Kodu girin"
+    b"BIP39 mnemonic'inizin her kelimesini 1'den 2048'e kadar bir say\xc4\xb1 olarak girin."
+    b"BIP39 mnemonic'inizin her kelimesini 1'den 800'e kadar onalt\xc4\xb1l\xc4\xb1k bir say\xc4\xb1 olarak girin."
+    b"BIP39 mnemonic'inizin her kelimesini 1'den 4000'e kadar sekizlik bir say\xc4\xb1 olarak girin."
+    b"BIP39 mnemonic'inizin her kelimesini girin."
+    b"Kullan\xc4\xb1c\xc4\xb1 Verilerini Sil"
+    b"Kullan\xc4\xb1c\xc4\xb1n\xc4\xb1n verileri siliniyor\xe2\x80\xa6"
+    b"Hata:"
+    b"\xc3\x87\xc4\xb1k\xc4\xb1\xc5\x9f"
+    b"Dosyalar\xc4\xb1 ara?"
+    b"Adresleri D\xc4\xb1\xc5\x9fa Aktar"
+    b"%s SD karta aktar\xc4\xb1l\xc4\xb1yor\xe2\x80\xa6"
+    b"Geni\xc5\x9fletilmi\xc5\x9f Public Key"
+    b"Fabrika Ayarlar\xc4\xb1"
+    b"Kamera entropisi toplanamad\xc4\xb1"
+    b"\xc5\x9eifre \xc3\xa7\xc3\xb6zme ba\xc5\x9far\xc4\xb1s\xc4\xb1z"
+    b"Y\xc3\xbcklenemedi"
+    b"Mnemonic depolama ba\xc5\x9far\xc4\xb1s\xc4\xb1z"
+    b"\xc3\x9ccret:"
+    b"Besleme H\xc4\xb1z\xc4\xb1"
+    b"Dosya ad\xc4\xb1"
+    b"%s dosya ad\xc4\xb1 SD kartta var."
+    b"Flash'\xc4\xb1 kameradan gelen entropi ile doldur?"
+    b"Flash Dolduruluyor"
+    b"PSBT'de parmak izi ayar\xc4\xb1 kald\xc4\xb1r\xc4\xb1ld\xc4\xb1"
+    b"Flash Haritas\xc4\xb1"
+    b"Flash Ara\xc3\xa7lar\xc4\xb1"
+    b"Flash kamera entropisi ile dolduruldu"
+    b"Flute \xc3\x87ap\xc4\xb1"
+    b"Bo\xc5\x9f:"
+    b"Depolamadan Se\xc3\xa7"
+    b"Verilerin geri kullan\xc4\xb1lamaz oldu\xc4\x9fundan emin olmak i\xc3\xa7in SD kart\xc4\xb1n\xc4\xb1z\xc4\xb1 ba\xc5\x9fka bir cihazda tamamen silin"
+    b"Bo\xc5\x9fluk Limiti"
+    b"Mnemonic Olu\xc5\x9ftur"
+    b"Se\xc3\xa7"
+    b"Yeterli entropi"
+    b"Donan\xc4\xb1m"
+    b"Ba\xc5\x9fl\xc4\xb1k t\xc3\xbcr\xc3\xbc"
+    b"Hex Public Key:"
+    b"Onalt\xc4\xb1l\xc4\xb1k"
+    b"Mnemonic'leri Gizle"
+    b"Y\xc3\xbcksek \xc3\xbccret!"
+    b"ID"
+    b"ID zaten var"
+    b"Dizin"
+    b"Giri\xc5\x9fler (%d):"
+    b"Yetersiz entropi!"
+    b"Ge\xc3\xa7ersiz Kurcalama Kontrol Kodu"
+    b"Ge\xc3\xa7ersiz adres"
+    b"Ge\xc3\xa7ersiz t\xc3\xbcretim yolu"
+    b"Ge\xc3\xa7ersiz mnemonic uzunlu\xc4\x9fu"
+    b"Ge\xc3\xa7ersiz c\xc3\xbczdan:"
+    b"Ters \xc3\x87evir"
+    b"Ters Renkler"
+    b"Kef \xc5\x9eifreli"
+    b"Anahtar"
+    b"Anahtar sa\xc4\x9flanmad\xc4\xb1"
+    b"Krux Yaz\xc4\xb1c\xc4\xb1 Test QR'\xc4\xb1"
+    b"LCD Tipi"
+    b"Dil"
+    b"Krux'un ge\xc3\xa7erli bir son kelime se\xc3\xa7mesini istiyorsan\xc4\xb1z bo\xc5\x9f b\xc4\xb1rak\xc4\xb1n"
+    b"Sol"
+    b"Uzunluk:"
+    b"Sat\xc4\xb1r Gecikmesi"
+    b"Sat\xc4\xb1r:"
+    b"Adresleri Listele"
+    b"Mnemonic Y\xc3\xbckle"
+    b"C\xc3\xbczdan Y\xc3\xbckle"
+    b"Adresleri g\xc3\xb6r\xc3\xbcnt\xc3\xbclemek i\xc3\xa7in g\xc3\xbcvenilir bir c\xc3\xbczdan tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbcklensin mi?"
+    b"SD karttan y\xc3\xbckle"
+    b"SD karttan y\xc3\xbcklensin mi?"
+    b"Kameradan y\xc3\xbckle"
+    b"Y\xc3\xbcklensin mi?"
+    b"Kamera Y\xc3\xbckleniyor\xe2\x80\xa6"
+    b"De\xc4\x9fi\xc5\x9fiklik adresleri y\xc3\xbckleniyor\xe2\x80\xa6"
+    b"Yaz\xc4\xb1c\xc4\xb1 y\xc3\xbckleniyor\xe2\x80\xa6"
+    b"Alma adresleri y\xc3\xbckleniyor\xe2\x80\xa6"
+    b"Y\xc3\xbckleniyor\xe2\x80\xa6"
+    b"Yerel"
+    b"Konum"
+    b"Orta"
+    b"Mesaj"
+    b"Mesaj:"
+    b"Mini senaryo"
+    b"Ayna X Koordinatlar\xc4\xb1"
+    b"\xc4\xb0mza dosyas\xc4\xb1 eksik"
+    b"Mnemonic"
+    b"Mnemonik ve parola tutulacakt\xc4\xb1r."
+    b"De\xc4\x9fi\xc5\x9ftirildi:"
+    b"Yerel Segwit - 84 varsay\xc4\xb1lacakt\xc4\xb1r"
+    b"A\xc4\x9f"
+    b"Yeni Mnemonic"
+    b"Yeni donan\xc4\xb1m yaz\xc4\xb1l\xc4\xb1m\xc4\xb1 tespit edildi."
+    b"Hay\xc4\xb1r"
+    b"Parola Yok"
+    b"Yeterli zar at\xc4\xb1\xc5\x9f\xc4\xb1 yok!"
+    b"Bulunamad\xc4\xb1:"
+    b"Numaralar"
+    b"Sekizlik"
+    b"Di\xc4\x9fer Formatlar"
+    b"\xc3\x9czerine yaz\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Parlakl\xc4\xb1\xc4\x9f\xc4\xb1 de\xc4\x9fi\xc5\x9ftirmek i\xc3\xa7in PAGE"
+    b"PBKDF2 iter."
+    b"\xc4\xb0\xc5\x9faretlenmi\xc5\x9f noktalar\xc4\xb1 siyaha boyay\xc4\xb1n ki tespit edilebilsinler."
+    b"Ka\xc4\x9f\xc4\xb1t Geni\xc5\x9fli\xc4\x9fi"
+    b"Par\xc3\xa7a"
+    b"N'nin M B\xc3\xb6l\xc3\xbcm\xc3\xbc"
+    b"Par\xc3\xa7a Boyutu"
+    b"Parola"
+    b"Parola Uzunlu\xc4\x9fu"
+    b"Yol uyu\xc5\x9fmazl\xc4\xb1\xc4\x9f\xc4\xb1"
+    b"\xc3\x96r\xc3\xbcnt\xc3\xbc alg\xc4\xb1land\xc4\xb1!"
+    b"T\xc3\xbcm depolanm\xc4\xb1\xc5\x9f ve \xc5\x9fifrelenmi\xc5\x9f mnemonic'ler ve ayarlar flash'tan kal\xc4\xb1c\xc4\xb1 olarak kald\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Kal\xc4\xb1c\xc4\xb1 Depolama"
+    b"Piksel sapma indeksi:"
+    b"D\xc3\xbcz Metin QR'\xc4\xb1"
+    b"L\xc3\xbctfen bir c\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbckleyin"
+    b"Dal\xc4\xb1\xc5\x9f H\xc4\xb1z\xc4\xb1"
+    b"Politika t\xc3\xbcr\xc3\xbc"
+    b"D\xc3\xbc\xc5\x9f\xc3\xbck entropi!"
+    b"G\xc3\xbc\xc3\xa7"
+    b"\xc4\xb0ptal etmek i\xc3\xa7in PAGE tu\xc5\x9funa bas\xc4\xb1n."
+    b"PAGE modunu de\xc4\x9fi\xc5\x9ftir"
+    b"Test QR'\xc4\xb1n\xc4\xb1 Yazd\xc4\xb1r"
+    b"Tinyseed yazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"QR'a Yazd\xc4\xb1r"
+    b"QR'a yazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Yazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Yaz\xc4\xb1c\xc4\xb1"
+    b"Yaz\xc4\xb1c\xc4\xb1 S\xc3\xbcr\xc3\xbcc\xc3\xbcs\xc3\xbc ayarlanmad\xc4\xb1!"
+    b"Bask\xc4\xb1\xe2\x80\xa6"
+    b"Yine de devam edilsin mi?"
+    b"Devam edilsin mi?"
+    b"\xc4\xb0\xc5\x9fleniyor\xe2\x80\xa6"
+    b"Kan\xc4\xb1tlanabilir harcanamaz"
+    b"QR Kodu"
+    b"QR Etiket"
+    b"Miktar"
+    b"RX Pini"
+    b"Yeniden Ba\xc5\x9flat"
+    b"Al"
+    b"B\xc3\xb6lge:"
+    b"%s kald\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Mnemonic'i Kald\xc4\xb1r"
+    b"SD Karttan donan\xc4\xb1m yaz\xc4\xb1l\xc4\xb1m\xc4\xb1 dosyalar\xc4\xb1 kald\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"\xc3\x87\xc3\xb6z\xc3\xbcn\xc3\xbcrl\xc3\xbc\xc4\x9f\xc3\xbc S\xc4\xb1f\xc4\xb1rla"
+    b"Fabrika ayarlar\xc4\xb1na geri d\xc3\xb6n\xc3\xbcp ve yeniden ba\xc5\x9flat\xc4\xb1ls\xc4\xb1n m\xc4\xb1?"
+    b"Sonu\xc3\xa7"
+    b"QR G\xc3\xb6r\xc3\xbcnt\xc3\xbcleyiciye D\xc3\xb6n"
+    b"Tekrar \xc4\xb0ncele"
+    b"Taranan verileri g\xc3\xb6zden ge\xc3\xa7irin, gerekirse d\xc3\xbczenleyin"
+    b"Sa\xc4\x9f"
+    b"Bir mnemonic olu\xc5\x9fturmak i\xc3\xa7in zar\xc4\xb1 en az %d kez at\xc4\xb1n."
+    b"Zar at\xc4\xb1\xc5\x9f da\xc4\x9f\xc4\xb1l\xc4\xb1m\xc4\xb1:"
+    b"Zar at\xc4\xb1\xc5\x9flar\xc4\xb1:"
+    b"180\xc2\xb0 d\xc3\xb6nd\xc3\xbcr"
+    b"SD kart"
+    b"SD kart alg\xc4\xb1lanmad\xc4\xb1."
+    b"Zar at\xc4\xb1\xc5\x9flar\xc4\xb1n\xc4\xb1n SHA256's\xc4\xb1:"
+    b"Snapshot'\xc4\xb1n SHA256's\xc4\xb1:"
+    b"QR G\xc3\xb6r\xc3\xbcnt\xc3\xbcs\xc3\xbcn\xc3\xbc SD Karta Kaydet"
+    b"SD karta kaydet"
+    b"SD karta kaydedilsin mi?"
+    b"SD karta kaydedildi:"
+    b"\xc3\x96l\xc3\xa7ek"
+    b"Adresi Tara"
+    b"BIP39 Parolas\xc4\xb1n\xc4\xb1 Tara"
+    b"Anahtar QR Kodunu Tara"
+    b"Tarama Profili Olu\xc5\x9fturma"
+    b"1-12 kelimeleri tekrar taran\xc4\xb1yor"
+    b"13-24 kelimeleri taran\xc4\xb1yor"
+    b"Ekran Koruyucu S\xc3\xbcresi"
+    b"Betik T\xc3\xbcr\xc3\xbc"
+    b"G\xc3\xbcvenlik"
+    b"Kendine-transfer veya Para \xc3\x9cst\xc3\xbc (%d):"
+    b"Kendine-transfer:"
+    b"\xc3\x96nce bir kurcalama kontrol kodu ayarlay\xc4\xb1n"
+    b"Ayarlar"
+    b"Ayarlar dahili olarak fla\xc5\x9fta saklan\xc4\xb1r."
+    b"Ayarlar SD karta kaydedildi."
+    b"Shannon entropisi:"
+    b"Referans Noktas\xc4\xb1n\xc4\xb1 G\xc3\xb6ster"
+    b"Kapat"
+    b"Kapanma S\xc3\xbcresi"
+    b"Kapatma\xe2\x80\xa6"
+    b"\xc4\xb0mzala"
+    b"QR koduna imzala"
+    b"SD karta imzala"
+    b"\xc4\xb0mzalans\xc4\xb1n m\xc4\xb1?"
+    b"\xc4\xb0mza:"
+    b"\xc4\xb0mzal\xc4\xb1 Mesaj"
+    b"\xc4\xb0mzal\xc4\xb1 PSBT"
+    b"\xc4\xb0mzalama\xe2\x80\xa6"
+    b"Tek-imza"
+    b"Boyut:"
+    b"Baz\xc4\xb1 kontroller yerine getirilemedi."
+    b"Baz\xc4\xb1 d\xc3\xbc\xc4\x9f\xc3\xbcmler sertle\xc5\x9ftirilmemi\xc5\x9f:"
+    b"Harcama (%d):"
+    b"Harcama:"
+    b"Standart Mod"
+    b"Statik"
+    b"\xc4\xb0nekler \xc4\xb0\xc3\xa7in \xc4\xb0statistikler"
+    b"Flash'ta Sakla"
+    b"SD Kartta Sakla"
+    b"G\xc3\xbc\xc3\xa7"
+    b"G\xc3\xbc\xc3\xa7l\xc3\xbc"
+    b"Modu de\xc4\x9fi\xc5\x9ftirmek i\xc3\xa7in kayd\xc4\xb1r\xc4\xb1n"
+    b"TC Flash Hash"
+    b"\xc3\x96ny\xc3\xbcklemede TC Flash Hash"
+    b"Yakalamak i\xc3\xa7in DOKUN veya G\xc4\xb0R"
+    b"Y\xc3\xbcklemek i\xc3\xa7in DOKUN veya G\xc4\xb0R."
+    b"TR i\xc3\xa7 anahtar"
+    b"TX Pini"
+    b"Kurcalama Kontrol Kodu"
+    b"Kurcalama kontrol kodu ba\xc5\x9far\xc4\xb1yla ayarland\xc4\xb1"
+    b"Kurcalama kontrol kodlar\xc4\xb1 e\xc5\x9fle\xc5\x9fmiyor"
+    b"Test Grubu:"
+    b"Test Paketi Sonu\xc3\xa7lar\xc4\xb1"
+    b"Test:"
+    b"Metin"
+    b"Tema"
+    b"Termal"
+    b"Verilerin geri kullan\xc4\xb1lamaz oldu\xc4\x9fundan emin olmak i\xc3\xa7in Cihaz\xc4\xb1 Sil \xc3\xb6zelli\xc4\x9fini kullan\xc4\xb1n"
+    b"Parlakl\xc4\xb1\xc4\x9f\xc4\xb1 De\xc4\x9fi\xc5\x9ftir"
+    b"Ara\xc3\xa7lar"
+    b"Dokunma E\xc5\x9fi\xc4\x9fi"
+    b"Dokunmatik ekran"
+    b"Daha fazla kez denensin mi?"
+    b"BIP39 parolas\xc4\xb1n\xc4\xb1 yaz\xc4\xb1n"
+    b"Anahtar Yaz"
+    b"Geri Al"
+    b"Birim"
+    b"Kef Kimli\xc4\x9fi G\xc3\xbcncellensin mi?"
+    b"QR Etiketi G\xc3\xbcncellensin mi"
+    b"G\xc3\xbcncelleme tamamland\xc4\xb1."
+    b"Siyah bir arka plan y\xc3\xbczeyi kullan\xc4\xb1n."
+    b"Yeni bir mnemonic olu\xc5\x9fturmak i\xc3\xa7in kameran\xc4\xb1n entropisini kullan\xc4\xb1n"
+    b"Mevcut De\xc4\x9fer"
+    b"Varsay\xc4\xb1lan\xc4\xb1 Kullan?"
+    b"Varsay\xc4\xb1lan PBKDF2 yinelemesini kullan.?"
+    b"Parmak izi ID olarak kullan\xc4\xb1lmal\xc4\xb1 m\xc4\xb1?"
+    b"Kullan\xc4\xb1lan:"
+    b"Kullan\xc4\xb1c\xc4\xb1"
+    b"%s de\xc4\x9feri aral\xc4\xb1k d\xc4\xb1\xc5\x9f\xc4\xb1nda: [%s, %s]"
+    b"Do\xc4\x9frulan\xc4\xb1yor\xe2\x80\xa6"
+    b"S\xc3\xbcr\xc3\xbcm"
+    b"Kamera Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1yla"
+    b"D20 Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1yla"
+    b"D6 Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1yla"
+    b"Manuel Giri\xc5\x9f Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1yla"
+    b"S\xc3\xb6zc\xc3\xbcklerle"
+    b"G\xc3\xb6r\xc3\xbcn\xc3\xbcr Etiket"
+    b"Yakalaman\xc4\xb1n tamamlanmas\xc4\xb1n\xc4\xb1 bekleyin"
+    b"C\xc3\xbczdan"
+    b"C\xc3\xbczdan Tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1"
+    b"C\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1"
+    b"C\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbcklendi!"
+    b"C\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 bulunamad\xc4\xb1."
+    b"Uyar\xc4\xb1:"
+    b"Zay\xc4\xb1f"
+    b"Kelime %d"
+    b"Kelime Numaralar\xc4\xb1"
+    b"Kelimeler"
+    b"Evet"
+    b"Zoom Mod"
+    b"ikili: {} bayt"
+    b"Kal\xc4\xb1nan: "
+    b"oNALTILIKTAN"
+    b"base32 'den"
+    b"tabandan43"
+    b"base64 'ten"
+    b"onalt\xc4\xb1l\xc4\xb1ktan"
+    b"utf8 'den"
+    b"ge\xc3\xa7erli bir adres!"
+    b"vites kutusu"
+    b"Ba\xc5\x9far\xc4\xb1 Puan\xc4\xb1:"
+    b"kayd\xc4\xb1r\xc4\xb1n"
+    b"metin: {} karakter"
+    b"to HEX"
+    b"\xc3\xbcsse32"
+    b"\xc3\xbcsse43"
+    b"base64 'e"
+    b"to hex"
+    b"utf8 'e"
+    b"bilinmiyor"
+    b"ilk %d adreste BULUNAMADI"
+)
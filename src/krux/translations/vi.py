@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% của số tiền.",
-    "%d của %d đa chữ kí",
-    "%d đến %d",
-    "%s bit (%s bit/px)",
-    "%s Đã bỏ.",
-    "%s: đã tải!",
-    "(Thực nghiệm)",
-    "(chỉ xem)",
-    "12 từ",
-    "24 từ",
-    "Về chúng tôi",
-    "Chấp nhận giả định?",
-    "Tài khoản",
-    "Tài khoản #0 sẽ được giả định",
-    "Chỉ mục tài khoản",
-    "Thêm hoặc thay đổi cụm mật khẩu ví?",
-    "Entropy bổ sung từ máy ảnh cần thiết cho %s",
-    "Địa chỉ",
-    "Căn chỉnh camera và tấm dự phòng đúng cách.",
-    "Chế độ chống lóa",
-    "Giao diện",
-    "Bạn có chắc không?",
-    "Màu BGR",
-    "Từ gợi nhớ BIP39",
-    "Trở lại",
-    "Quay lại Menu",
-    "Sao lưu Mnemonic",
-    "Chữ ký xấu",
-    "Mật khẩu Base64",
-    "Tốc độ baud",
-    "Lưới nhị phân",
-    "Đệm viền",
-    "Độ sáng",
-    "Nút",
-    "Loại bỏ nhiễu nút",
-    "Hủy chụp hình",
-    "Thay đổi",
-    "Thay đổi giao diện và khởi động lại?",
-    "Thay đổi:",
-    "Thay đổi sẽ kéo dài cho đến khi tắt máy.",
-    "Kiểm tra thẻ SD",
-    "Kiểm tra địa chỉ đó có thuộc về ví này không?",
-    "Đã kiểm tra %d địa chỉ không khớp.",
-    "Đang kiểm tra thẻ SD…",
-    "Xác nhận mã kiểm tra giả mạo",
-    "Chuyển đổi dữ liệu",
-    "Không thể xác định địa chỉ thay đổi.",
-    "Tạo mã QR",
-    "Tạo mã QR từ văn bản?",
-    "Tạo:",
-    "Mã kiểm tra giả mạo hiện tại",
-    "Mã QR tùy chỉnh",
-    "Văn bản tùy chọn",
-    "Tùy chỉnh",
-    "Tùy chỉnh ví của bạn sẽ tạo một Khóa mới và dỡ bỏ Bộ mô tả.",
-    "Chiều sâu cắt",
-    "Phương pháp cắt",
-    "Công cụ Datum",
-    "Số thập phân",
-    "Giải mã?",
-    "Ví mặc định",
-    "Xóa tập tin này?",
-    "Độ sâu mỗi lần cắt CNC",
-    "Đường dẫn phái sinh",
-    "Suy ra entropy BIP85?",
-    "Địa chỉ người mô tả",
-    "Kiểm tra thiết bị",
-    "Hiển thị",
-    "Không được tắt máy, có thể mất một lúc để hoàn thành.",
-    "Hoàn tất chuyển đổi",
-    "Hoàn tất?",
-    "Từ gợi nhớ kép",
-    "Driver",
-    "Trống",
-    "Kích hoạt?",
-    "Mã hóa",
-    "Đã mã hóa",
-    "Mã QR được mã hóa",
-    "Mnemonic được mã hóa không được lưu trữ với ID:",
-    "Mnemonic được mã hóa không được lưu trữ",
-    "Mã hóa",
-    "Chế độ mã hóa",
-    "Nhập %d từ BIP39.",
-    "Nhập mã kiểm tra giả mạo gồm hơn 6 ký tự",
-    "Nhập từng từ của Mnemonic BIP39 của bạn dưới dạng số từ 1 đến 2048.",
-    "Nhập từng từ trong Mnemonic BIP39 của bạn dưới dạng số thập lục phân từ 1 đến 800.",
-    "Nhập từng từ trong Mnemonic BIP39 của bạn dưới dạng số bát phân từ 1 đến 4000.",
-    "Nhập từng từ của Mnemonic BIP39 của bạn.",
-    "Xóa dữ liệu của người dùng",
-    "Đang xóa dữ liệu của người dùng…",
-    "Lỗi:",
-    "Esc",
-    "Khám phá các tập tin?",
-    "Xuất báo cáo",
-    "Đang xuất %s sang thẻ SD…",
-    "Khóa công cộng",
-    "Cài đặt Gốc",
-    "Không thể thu thập entropy của máy ảnh",
-    "Không giải mã được",
-    "Tải thất bại",
-    "Không lưu trữ Mnemonic được",
-    "Phí:",
-    "Tốc độ cắt CNC",
-    "Tên tệp",
-    "Tên tệp %s tồn tại trên thẻ SD.",
-    "Điền vào flash với entropy từ máy ảnh?",
-    "Đèn Flash Đổ Đầy",
-    "Bỏ dấu vân tay trong PSBT",
-    "Bản đồ Flash",
-    "Công cụ Flash",
-    "Đèn flash chứa đầy entropy của máy ảnh",
-    "Đường kính mũi cắt CNC",
-    "Khả dụng:",
-    "Từ bộ lưu trữ",
-    "Xóa hoàn toàn thẻ SD trong một thiết bị khác để đảm bảo dữ liệu không thể phục hồi",
-    "Tạo Mnemonic",
-    "Chọn",
-    "Entropy tốt",
-    "Phần cứng",
-    "Loại đầu",
-    "Khóa công cộng Hex:",
-    "Thập lục phân",
-    "Ẩn Mnemonics",
-    "Phí cao!",
-    "ID",
-    "Id đã tồn tại",
-    "Chỉ mục",
-    "Đầu vào (%d):",
-    "Entropy không đủ!",
-    "Mã kiểm tra giả mạo không hợp lệ",
-    "Địa chỉ không hợp lệ",
-    "Đường dẫn phái sinh không hợp lệ",
-    "Độ dài mã Mnemonic không hợp lệ",
-    "Ví không hợp lệ:",
-    "Đảo ngược",
-    "Màu đảo ngược",
-    "Đã mã hóa KEF",
-    "Chìa khóa",
-    "Khóa không được cung cấp",
-    "QR kiểm tra máy in Krux",
-    "Loại LCD",
-    "Ngôn ngữ",
-    "Để trống nếu bạn muốn Krux chọn một từ cuối cùng hợp lệ",
-    "Trái",
-    "Độ dài:",
-    "Độ trễ Dòng",
-    "Đường kẻ:",
-    "danh sách địa chỉ",
-    "Tải mã mnemonic",
-    "Nạp Ví",
-    "Tải mô tả ví đáng tin cậy để xem địa chỉ?",
-    "Tải từ thẻ SD",
-    "Tải từ thẻ SD?",
-    "Tải từ máy ảnh",
-    "Tải?",
-    "Đang tải camera…",
-    "Đang tải địa chỉ thay đổi…",
-    "Đang tải máy in…",
-    "Đang tải địa chỉ nhận…",
-    "Đang tải…",
-    "Ngôn ngữ",
-    "Vị trí lưu",
-    "Trung bình",
-    "Tin nhắn",
-    "Tin nhắn:",
-    "Chi tiết nhỏ",
-    "Tọa độ gương X",
-    "Thiếu tập tin chữ ký",
-    "Mã mnemonic",
-    "Từ gợi nhớ và cụm mật khẩu sẽ được lưu giữ.",
-    "Đã sửa đổi:",
-    "Native Segwit - 84 sẽ được giả định",
-    "Mạng lưới",
-    "Mnemonic mới",
-    "Phát hiện phần sụn mới.",
-    "Không",
-    "Không có cụm mật khẩu",
-    "Không đủ số lần quay!",
-    "Số",
-    "Bát phân",
-    "Các định dạng khác",
-    "Ghi đè?",
-    "PAGE để chuyển đổi độ sáng",
-    "PBKDF2 iter.",
-    "Tô các chấm đục lỗ màu đen để chúng có thể được phát hiện.",
-    "Chiều rộng giấy",
-    "Phần",
-    "Phần M/N",
-    "Kích thước một phần",
-    "Cụm mật khẩu",
-    "Độ dài mật khẩu tối thiểu",
-    "Đường dẫn không khớp",
-    "Đã phát hiện mẫu!",
-    "Xóa vĩnh viễn mọi Mnemonics và cài đặt được mã hóa lưu trữ trong flash?",
-    "Vị trí lưu",
-    "Chỉ số độ lệch điểm ảnh:",
-    "QR dạng văn bản",
-    "Vui lòng tải bộ mô tả đầu ra ví",
-    "Tỷ lệ sụt giảm",
-    "Loại Chính sách",
-    "Entropy kém!",
-    "Công suất",
-    "Nhấn PAGE để hủy.",
-    "PAGE để chuyển chế độ",
-    "In kiểm tra QR",
-    "In Tinyseed?",
-    "In ra QR",
-    "In ra mã QR?",
-    "In?",
-    "Máy in",
-    "Trình điều khiển máy in chưa được cài đặt!",
-    "In ấn…",
-    "Vẫn tiếp tục?",
-    "Thực hiện?",
-    "Đang xử lý…",
-    "Chắc chắn không thể chi tiêu",
-    "Mã QR",
-    "Nhãn QR",
-    "Số lượng",
-    "RX Pin",
-    "Khởi động lại",
-    "Nhận được",
-    "Vùng:",
-    "Xóa %s?",
-    "Xóa Mnemonic",
-    "Xóa các tệp firmware khỏi Thẻ SD?",
-    "Độ phân giải - Định dạng",
-    "Khôi phục cài đặt gốc và khởi động lại?",
-    "Kết quả",
-    "Quay lại Trình xem QR",
-    "Xem lại lần nữa",
-    "Xem lại dữ liệu đã quét, chỉnh sửa nếu cần",
-    "Phải",
-    "Lăn xúc xắc ít nhất %d lần để tạo Mnemonic.",
-    "Phân bổ xúc xắc:",
-    "Tổng số lần quay xúc xắc:",
-    "Xoay Chiều 180º",
-    "Thẻ SD",
-    "Thẻ SD không được phát hiện.",
-    "SHA256 của xúc xắc:",
-    "Sha256 của ảnh chụp:",
-    "Lưu Ảnh QR vào Thẻ SD",
-    "Lưu vào thẻ SD",
-    "Lưu vào thẻ SD?",
-    "Đã lưu vào thẻ SD:",
-    "Tỉ lệ",
-    "Quét địa chỉ",
-    "Quét cụm mật khẩu BIP39",
-    "Quét mã QR khóa",
-    "Đang quét lại từ 1-12",
-    "Đang quét từ 13-24",
-    "Thời gian chế độ bảo vệ màn hình",
-    "Kiểu văn lệnh",
-    "Bảo mật",
-    "Tự chuyển nhượng hoặc giao dịch (%d):",
-    "Tự chuyển nhượng:",
-    "Đặt mã kiểm tra giả mạo trước",
-    "Cài đặt",
-    "Cài đặt được lưu trữ nội bộ trên đèn flash.",
-    "Cài đặt được lưu trên thẻ SD.",
-    "Entropy của Shannon:",
-    "Hiển thị dữ liệu",
-    "Tắt máy",
-    "Thời gian tắt máy",
-    "Đang tắt…",
-    "Chữ kí",
-    "Ký vào mã QR",
-    "Ký vào thẻ SD",
-    "Kí?",
-    "Chữ ký:",
-    "Tin nhắn đã ký",
-    "Đã ký PSBT",
-    "Biển báo…",
-    "Khóa đơn",
-    "Dung lượng:",
-    "Một số kiểm tra không thể được thực hiện.",
-    "Một số nút không được làm cứng:",
-    "Chi tiêu (%d):",
-    "Chi tiêu:",
-    "Chế độ Tiêu chuẩn",
-    "Tĩnh",
-    "Số liệu thống kê cho Mọt sách",
-    "Lưu trữ trên flash",
-    "Lưu trữ trên thẻ SD",
-    "Độ mạnh",
-    "Mạnh",
-    "Vuốt để thay đổi chế độ",
-    "TC Flash Hash",
-    "Hash Flash TC khi khởi động",
-    "Chạm màn hình hoặc nhấn nút ENTER để chụp",
-    "Chạm màn hình hoặc nhấn nút ENTER để cài đặt phần mềm.",
-    "Khóa nội bộ TR",
-    "TX Pin",
-    "Mã kiểm tra giả mạo",
-    "Đã đặt mã kiểm tra giả mạo thành công",
-    "Mã kiểm tra giả mạo không khớp",
-    "Bộ thử nghiệm",
-    "Kết quả bộ thử nghiệm",
-    "Kiểm tra bài cũ:",
-    "Chữ",
-    "Chủ đề",
-    "Nhiệt",
-    "Sử dụng tính năng Xóa dữ liệu trên thiết bị để đảm bảo dữ liệu không thể phục hồi",
-    "Chuyển đổi độ sáng",
-    "Công cụ",
-    "Ngưỡng cảm ứng",
-    "Màn hình cảm ứng",
-    "Thử thêm nữa?",
-    "Nhập cụm mật khẩu BIP39",
-    "Nhập khóa",
-    "Hoàn tác",
-    "Đơn vị",
-    "Cập nhật ID KEF?",
-    "Cập nhật nhãn QR?",
-    "Nâng cấp hoàn tất.",
-    "Sử dụng bề mặt nền đen.",
-    "Sử dụng sự ngẫu nhiên của máy ảnh để tạo ra một Mnemonic mới",
-    "Giá trị hiện tại",
-    "Sử dụng Chế độ mặc định?",
-    "Sử dụng trình lặp PBKDF2 mặc định.?",
-    "Dùng vân tay làm ID?",
-    "Đã sử dụng:",
-    "Người dùng",
-    "Giá trị %s ngoài phạm vi: [ %s, %s]",
-    "Xác minh…",
-    "Phiên Bản",
-    "Qua máy ảnh",
-    "Qua xúc xắc 20 mặt",
-    "Qua xúc xắc 6 mặt",
-    "Thông qua đầu vào thủ công",
-    "Thông qua từ ngữ",
-    "Nhãn có thể nhìn thấy",
-    "Chờ bắt",
-    "Ví",
-    "Trình mô tả ví",
-    "Ví đầu ra mô tả",
-    "Đã tải bộ mô tả đầu ra của ví!",
-    "Không tìm thấy bộ mô tả đầu ra ví.",
-    "Cảnh báo:",
-    "Yếu",
-    "Kí tự %d",
-    "Từ số",
-    "Từ ngữ",
-    "Đúng",
-    "Chế độ thu phóng",
-    "nhị phân: {} byte",
-    "trượt",
-    "từ HEX",
-    "từ base32",
-    "từ base43",
-    "từ base64",
-    "từ hex",
-    "từ utf8",
-    "là một địa chỉ hợp lệ!",
-    "trường hợp ca làm việc",
-    "Tỉ lệ thành công:",
-    "vuốt",
-    "text: {} ký tự",
-    "thành HEX",
-    "đến base32",
-    "đến base43",
-    "đến base64",
-    "thành hex",
-    "đến utf8",
-    "không rõ",
-    "kHÔNG TÌM THẤY trong %d địa chỉ đầu tiên",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x14\x00.\x00\\\x00u\x00\x81\x00\x93\x00\xa0\x00\xaf\x00\xc0\x00\xcb\x00\xd2\x00\xd9\x00\xe9\x00\x05\x01"
+    b"\x11\x01<\x01T\x01\x84\x01\xba\x01\xc6\x01\xde\x01\x15\x02-\x028\x02P\x02X\x02n\x02y\x02\x88\x02\x99\x02"
+    b"\xa8\x02\xbb\x02\xcb\x02\xde\x02\xeb\x02\xf6\x02\xfa\x02\x12\x03-\x03?\x03J\x03{\x03\x87\x03\xbc\x03\xde\x03\xf1\x03"
+    b"/\x04]\x04y\x04\x9f\x04\xba\x04\xed\x04\xf9\x04\x16\x05\x1c\x05C\x05V\x05l\x05x\x05\xce\x05\xe0\x05\xf4\x05"
+    b"\x04\x06\x15\x06 \x061\x06E\x06e\x06\x7f\x06\x94\x06\xb2\x06\xc9\x06\xd5\x06\x1f\x07:\x07F\x07[\x07a\x07"
+    b"h\x07u\x07}\x07\x8a\x07\xa2\x07\xe1\x07\x16\x08\x1e\x082\x08G\x08~\x08\xd9\x08F\t\xac\t\xe0\t\x05\n"
+    b"3\n9\n<\nV\nf\n\x86\n\x98\n\xa9\n\xd9\n\xf3\n\x05\x0b(\x0b-\x0bB\x0bL\x0bu\x0b"
+    b"\xa6\x0b\xbe\x0b\xdc\x0b\xed\x0b\xfd\x0b/\x0cM\x0cZ\x0cn\x0c\xdf\x0c\xfc\x0c\n\r\x10\r\x1d\r*\r7\r"
+    b"N\r`\rn\rw\ry\r\x8c\r\x97\r\xa8\r\xbd\r\xe9\r\x07\x0e3\x0e\\\x0er\x0e\x81\x0e\x95\x0e"
+    b"\xa6\x0e\xb1\x0e\xd1\x0e\xeb\x0e\xf5\x0e\x00\x0fO\x0fT\x0f_\x0fp\x0f\x7f\x0f\x96\x0f\xa8\x0f\xb1\x0f\xec\x0f\xff\x0f"
+    b"\x13\x10(\x10.\x10C\x10j\x10\x80\x10\xa2\x10\xb0\x10\xbb\x10\xc9\x10\xd4\x10\xde\x10\xe9\x10\xf9\x10\x0e\x11)\x11"
+    b"5\x11v\x11\x88\x11\xb6\x11\xc4\x11\xd2\x11\xf2\x11\xf8\x11\x15\x122\x12E\x12I\x12S\x12l\x12u\x12\x9b\x12"
+    b"\xa7\x12\xfa\x12\x0f\x13\x15\x13\x1f\x13:\x13L\x13q\x13\x8e\x13\xa6\x13\x01\x14\x0f\x145\x14I\x14t\x14\x8a\x14"
+    b"\x9d\x14\xaa\x14\xb6\x14\xce\x14\xed\x14\xfd\x14\t\x15\x11\x15\x1e\x15!\x15(\x15b\x15l\x15\x7f\x15\x8d\x15\x9e\x15"
+    b"\xc2\x15\xc8\x15\xd0\x15\xdd\x15\xe3\x15\xf7\x15\x06\x16\x0c\x16\x14\x16!\x16J\x16m\x16\xa5\x16\xb0\x16\xc8\x16\xdd\x16"
+    b"\x18\x17\x1e\x17W\x17m\x17\x8f\x17\xa1\x17\xa9\x17\xcf\x17\xe7\x17\x01\x18\x1c\x18.\x18A\x18Y\x18b\x18t\x18"
+    b"\x92\x18\xa4\x18\xba\x18\xd5\x18\xeb\x18\x18\x19*\x195\x19e\x19}\x19\xa7\x19\xb2\x19\xef\x19\x18\x1a.\x1aF\x1a"
+    b"P\x1af\x1at\x1a}\x1a\x8c\x1a\x9d\x1a\xa1\x1a\xab\x1a\xbe\x1a\xcb\x1a\xd9\x1a\xe4\x1a\xf2\x1a,\x1bX\x1bg\x1b"
+    b"q\x1b\x8a\x1b\x8f\x1b\xb6\x1b\xcc\x1b\xe5\x1b\xf1\x1b\xf7\x1b\x1b\x1c(\x1cH\x1c\x7f\x1c\xc9\x1c\xdc\x1c\xe2\x1c\xfc\x1c"
+    b"/\x1dW\x1dj\x1d\x89\x1d\x9d\x1d\xa2\x1d\xad\x1d\xb4\x1d(\x1eC\x1eM\x1eb\x1ex\x1e\x8a\x1e\xa9\x1e\xb5\x1e"
+    b'\xbf\x1e\xc9\x1e\xdd\x1e\xf3\x1e\x0b\x1f-\x1f\x80\x1f\x97\x1f\xbd\x1f\xec\x1f\x03 \x14 " K W c '
+    b"q \x88 \x9e \xc0 \xd5 \xf1 \xfc \xff \x12!(!U!\x84!\x90!\x95!\xa0!\xa9!"
+    b'\xb3!\xb9!\xcf!\xe3!\xeb!\xf3!\xfe!\t"\x14"\x1c"%"G"e"|"\x82"\x93"'
+    b'\x9d"\xaa"\xb7"\xc4"\xce"\xd9"\xe3"\x18#'
+    b"% c\xe1\xbb\xa7a s\xe1\xbb\x91 ti\xe1\xbb\x81n."
+    b"%d m\xc3\xa3 QR, %ds m\xe1\xbb\x97i v\xc3\xb2ng"
+    b"%d tr\xc3\xaan %d \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 thu\xe1\xbb\x99c v\xe1\xbb\x81 v\xc3\xad n\xc3\xa0y"
+    b"%d c\xe1\xbb\xa7a %d \xc4\x91a ch\xe1\xbb\xaf k\xc3\xad"
+    b"%d \xc4\x91\xe1\xba\xbfn %d"
+    b"%s bit (%s bit/px)"
+    b"%s \xc4\x90\xc3\xa3 b\xe1\xbb\x8f."
+    b"%s: \xc4\x91\xc3\xa3 t\xe1\xba\xa3i!"
+    b"(Th\xe1\xbb\xb1c nghi\xe1\xbb\x87m)"
+    b"(ch\xe1\xbb\x89 xem)"
+    b"12 t\xe1\xbb\xab"
+    b"24 t\xe1\xbb\xab"
+    b"V\xe1\xbb\x81 ch\xc3\xbang t\xc3\xb4i"
+    b"Ch\xe1\xba\xa5p nh\xe1\xba\xadn gi\xe1\xba\xa3 \xc4\x91\xe1\xbb\x8bnh?"
+    b"T\xc3\xa0i kho\xe1\xba\xa3n"
+    b"T\xc3\xa0i kho\xe1\xba\xa3n #0 s\xe1\xba\xbd \xc4\x91\xc6\xb0\xe1\xbb\xa3c gi\xe1\xba\xa3 \xc4\x91\xe1\xbb\x8bnh"
+    b"Ch\xe1\xbb\x89 m\xe1\xbb\xa5c t\xc3\xa0i kho\xe1\xba\xa3n"
+    b"Th\xc3\xaam ho\xe1\xba\xb7c thay \xc4\x91\xe1\xbb\x95i c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u v\xc3\xad?"
+    b"Entropy b\xe1\xbb\x95 sung t\xe1\xbb\xab m\xc3\xa1y \xe1\xba\xa3nh c\xe1\xba\xa7n thi\xe1\xba\xbft cho %s"
+    b"\xc4\x90\xe1\xbb\x8ba ch\xe1\xbb\x89"
+    b"Ch\xe1\xbb\x89 m\xe1\xbb\xa5c \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89"
+    b"C\xc4\x83n ch\xe1\xbb\x89nh camera v\xc3\xa0 t\xe1\xba\xa5m d\xe1\xbb\xb1 ph\xc3\xb2ng \xc4\x91\xc3\xbang c\xc3\xa1ch."
+    b"Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 ch\xe1\xbb\x91ng l\xc3\xb3a"
+    b"Giao di\xe1\xbb\x87n"
+    b"B\xe1\xba\xa1n c\xc3\xb3 ch\xe1\xba\xafc kh\xc3\xb4ng?"
+    b"M\xc3\xa0u BGR"
+    b"T\xe1\xbb\xab g\xe1\xbb\xa3i nh\xe1\xbb\x9b BIP39"
+    b"Tr\xe1\xbb\x9f l\xe1\xba\xa1i"
+    b"Quay l\xe1\xba\xa1i Menu"
+    b"Sao l\xc6\xb0u Mnemonic"
+    b"Ch\xe1\xbb\xaf k\xc3\xbd x\xe1\xba\xa5u"
+    b"M\xe1\xba\xadt kh\xe1\xba\xa9u Base64"
+    b"T\xe1\xbb\x91c \xc4\x91\xe1\xbb\x99 baud"
+    b"L\xc6\xb0\xe1\xbb\x9bi nh\xe1\xbb\x8b ph\xc3\xa2n"
+    b"\xc4\x90\xe1\xbb\x87m vi\xe1\xbb\x81n"
+    b"\xc4\x90\xe1\xbb\x99 s\xc3\xa1ng"
+    b"N\xc3\xbat"
+    b"Lo\xe1\xba\xa1i b\xe1\xbb\x8f nhi\xe1\xbb\x85u n\xc3\xbat"
+    b"L\xc6\xb0u \xc4\x91\xe1\xbb\x87m tr\xc3\xacnh m\xc3\xb4 t\xe1\xba\xa3"
+    b"H\xe1\xbb\xa7y ch\xe1\xbb\xa5p h\xc3\xacnh"
+    b"Thay \xc4\x91\xe1\xbb\x95i"
+    b"Thay \xc4\x91\xe1\xbb\x95i giao di\xe1\xbb\x87n v\xc3\xa0 kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i?"
+    b"Thay \xc4\x91\xe1\xbb\x95i:"
+    b"Thay \xc4\x91\xe1\xbb\x95i s\xe1\xba\xbd k\xc3\xa9o d\xc3\xa0i cho \xc4\x91\xe1\xba\xbfn khi t\xe1\xba\xaft m\xc3\xa1y."
+    b"Ki\xe1\xbb\x83m tra danh s\xc3\xa1ch \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89"
+    b"Ki\xe1\xbb\x83m tra th\xe1\xba\xbb SD"
+    b"Ki\xe1\xbb\x83m tra \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 \xc4\x91\xc3\xb3 c\xc3\xb3 thu\xe1\xbb\x99c v\xe1\xbb\x81 v\xc3\xad n\xc3\xa0y kh\xc3\xb4ng?"
+    b"\xc4\x90\xc3\xa3 ki\xe1\xbb\x83m tra %d \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 kh\xc3\xb4ng kh\xe1\xbb\x9bp."
+    b"\xc4\x90ang ki\xe1\xbb\x83m tra th\xe1\xba\xbb SD\xe2\x80\xa6"
+    b"X\xc3\xa1c nh\xe1\xba\xadn m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o"
+    b"Chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i d\xe1\xbb\xaf li\xe1\xbb\x87u"
+    b"Kh\xc3\xb4ng th\xe1\xbb\x83 x\xc3\xa1c \xc4\x91\xe1\xbb\x8bnh \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 thay \xc4\x91\xe1\xbb\x95i."
+    b"T\xe1\xba\xa1o m\xc3\xa3 QR"
+    b"T\xe1\xba\xa1o m\xc3\xa3 QR t\xe1\xbb\xab v\xc4\x83n b\xe1\xba\xa3n?"
+    b"T\xe1\xba\xa1o:"
+    b"M\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o hi\xe1\xbb\x87n t\xe1\xba\xa1i"
+    b"M\xc3\xa3 QR t\xc3\xb9y ch\xe1\xbb\x89nh"
+    b"V\xc4\x83n b\xe1\xba\xa3n t\xc3\xb9y ch\xe1\xbb\x8dn"
+    b"T\xc3\xb9y ch\xe1\xbb\x89nh"
+    b"T\xc3\xb9y ch\xe1\xbb\x89nh v\xc3\xad c\xe1\xbb\xa7a b\xe1\xba\xa1n s\xe1\xba\xbd t\xe1\xba\xa1o m\xe1\xbb\x99t Kh\xc3\xb3a m\xe1\xbb\x9bi v\xc3\xa0 d\xe1\xbb\xa1 b\xe1\xbb\x8f B\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3."
+    b"Chi\xe1\xbb\x81u s\xc3\xa2u c\xe1\xba\xaft"
+    b"Ph\xc6\xb0\xc6\xa1ng ph\xc3\xa1p c\xe1\xba\xaft"
+    b"C\xc3\xb4ng c\xe1\xbb\xa5 Datum"
+    b"S\xe1\xbb\x91 th\xe1\xba\xadp ph\xc3\xa2n"
+    b"Gi\xe1\xba\xa3i m\xc3\xa3?"
+    b"V\xc3\xad m\xe1\xba\xb7c \xc4\x91\xe1\xbb\x8bnh"
+    b"X\xc3\xb3a t\xe1\xba\xadp tin n\xc3\xa0y?"
+    b"\xc4\x90\xe1\xbb\x99 s\xc3\xa2u m\xe1\xbb\x97i l\xe1\xba\xa7n c\xe1\xba\xaft CNC"
+    b"\xc4\x90\xc6\xb0\xe1\xbb\x9dng d\xe1\xba\xabn ph\xc3\xa1i sinh"
+    b"Suy ra entropy BIP85?"
+    b"\xc4\x90\xe1\xbb\x8ba ch\xe1\xbb\x89 ng\xc6\xb0\xe1\xbb\x9di m\xc3\xb4 t\xe1\xba\xa3"
+    b"Ki\xe1\xbb\x83m tra thi\xe1\xba\xbft b\xe1\xbb\x8b"
+    b"Hi\xe1\xbb\x83n th\xe1\xbb\x8b"
+    b"Kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c t\xe1\xba\xaft m\xc3\xa1y, c\xc3\xb3 th\xe1\xbb\x83 m\xe1\xba\xa5t m\xe1\xbb\x99t l\xc3\xbac \xc4\x91\xe1\xbb\x83 ho\xc3\xa0n th\xc3\xa0nh."
+    b"Ho\xc3\xa0n t\xe1\xba\xa5t chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i"
+    b"Ho\xc3\xa0n t\xe1\xba\xa5t?"
+    b"T\xe1\xbb\xab g\xe1\xbb\xa3i nh\xe1\xbb\x9b k\xc3\xa9p"
+    b"Driver"
+    b"Tr\xe1\xbb\x91ng"
+    b"K\xc3\xadch ho\xe1\xba\xa1t?"
+    b"M\xc3\xa3 h\xc3\xb3a"
+    b"\xc4\x90\xc3\xa3 m\xc3\xa3 h\xc3\xb3a"
+    b"M\xc3\xa3 QR \xc4\x91\xc6\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3a"
+    b"Mnemonic \xc4\x91\xc6\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u tr\xe1\xbb\xaf v\xe1\xbb\x9bi ID:"
+    b"Mnemonic \xc4\x91\xc6\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u tr\xe1\xbb\xaf"
+    b"M\xc3\xa3 h\xc3\xb3a"
+    b"Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 m\xc3\xa3 h\xc3\xb3a"
+    b"Nh\xe1\xba\xadp %d t\xe1\xbb\xab BIP39."
+    b"Nh\xe1\xba\xadp m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o g\xe1\xbb\x93m h\xc6\xa1n 6 k\xc3\xbd t\xe1\xbb\xb1"
+    b"Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab c\xe1\xbb\xa7a Mnemonic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1n d\xc6\xb0\xe1\xbb\x9bi d\xe1\xba\xa1ng s\xe1\xbb\x91 t\xe1\xbb\xab 1 \xc4\x91\xe1\xba\xbfn 2048."
+    b"Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab trong Mnemonic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1n d\xc6\xb0\xe1\xbb\x9bi d\xe1\xba\xa1ng s\xe1\xbb\x91 th\xe1\xba\xadp l\xe1\xbb\xa5c ph\xc3\xa2n t\xe1\xbb\xab 1 \xc4\x91\xe1\xba\xbfn 800."
+    b"Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab trong Mnemonic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1n d\xc6\xb0\xe1\xbb\x9bi d\xe1\xba\xa1ng s\xe1\xbb\x91 b\xc3\xa1t ph\xc3\xa2n t\xe1\xbb\xab 1 \xc4\x91\xe1\xba\xbfn 4000."
+    b"Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab c\xe1\xbb\xa7a Mnemonic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1n."
+    b"X\xc3\xb3a d\xe1\xbb\xaf li\xe1\xbb\x87u c\xe1\xbb\xa7a ng\xc6\xb0\xe1\xbb\x9di d\xc3\xb9ng"
+    b"\xc4\x90ang x\xc3\xb3a d\xe1\xbb\xaf li\xe1\xbb\x87u c\xe1\xbb\xa7a ng\xc6\xb0\xe1\xbb\x9di d\xc3\xb9ng\xe2\x80\xa6"
+    b"L\xe1\xbb\x97i:"
+    b"Esc"
+    b"Kh\xc3\xa1m ph\xc3\xa1 c\xc3\xa1c t\xe1\xba\xadp tin?"
+    b"Xu\xe1\xba\xa5t b\xc3\xa1o c\xc3\xa1o"
+    b"\xc4\x90ang xu\xe1\xba\xa5t %s sang th\xe1\xba\xbb SD\xe2\x80\xa6"
+    b"Kh\xc3\xb3a c\xc3\xb4ng c\xe1\xbb\x99ng"
+    b"C\xc3\xa0i \xc4\x91\xe1\xba\xb7t G\xe1\xbb\x91c"
+    b"Kh\xc3\xb4ng th\xe1\xbb\x83 thu th\xe1\xba\xadp entropy c\xe1\xbb\xa7a m\xc3\xa1y \xe1\xba\xa3nh"
+    b"Kh\xc3\xb4ng gi\xe1\xba\xa3i m\xc3\xa3 \xc4\x91\xc6\xb0\xe1\xbb\xa3c"
+    b"T\xe1\xba\xa3i th\xe1\xba\xa5t b\xe1\xba\xa1i"
+    b"Kh\xc3\xb4ng l\xc6\xb0u tr\xe1\xbb\xaf Mnemonic \xc4\x91\xc6\xb0\xe1\xbb\xa3c"
+    b"Ph\xc3\xad:"
+    b"T\xe1\xbb\x91c \xc4\x91\xe1\xbb\x99 c\xe1\xba\xaft CNC"
+    b"T\xc3\xaan t\xe1\xbb\x87p"
+    b"T\xc3\xaan t\xe1\xbb\x87p %s t\xe1\xbb\x93n t\xe1\xba\xa1i tr\xc3\xaan th\xe1\xba\xbb SD."
+    b"\xc4\x90i\xe1\xbb\x81n v\xc3\xa0o flash v\xe1\xbb\x9bi entropy t\xe1\xbb\xab m\xc3\xa1y \xe1\xba\xa3nh?"
+    b"\xc4\x90\xc3\xa8n Flash \xc4\x90\xe1\xbb\x95 \xc4\x90\xe1\xba\xa7y"
+    b"B\xe1\xbb\x8f d\xe1\xba\xa5u v\xc3\xa2n tay trong PSBT"
+    b"B\xe1\xba\xa3n \xc4\x91\xe1\xbb\x93 Flash"
+    b"C\xc3\xb4ng c\xe1\xbb\xa5 Flash"
+    b"\xc4\x90\xc3\xa8n flash ch\xe1\xbb\xa9a \xc4\x91\xe1\xba\xa7y entropy c\xe1\xbb\xa7a m\xc3\xa1y \xe1\xba\xa3nh"
+    b"\xc4\x90\xc6\xb0\xe1\xbb\x9dng k\xc3\xadnh m\xc5\xa9i c\xe1\xba\xaft CNC"
+    b"Kh\xe1\xba\xa3 d\xe1\xbb\xa5ng:"
+    b"T\xe1\xbb\xab b\xe1\xbb\x99 l\xc6\xb0u tr\xe1\xbb\xaf"
+    b"X\xc3\xb3a ho\xc3\xa0n to\xc3\xa0n th\xe1\xba\xbb SD trong m\xe1\xbb\x99t thi\xe1\xba\xbft b\xe1\xbb\x8b kh\xc3\xa1c \xc4\x91\xe1\xbb\x83 \xc4\x91\xe1\xba\xa3m b\xe1\xba\xa3o d\xe1\xbb\xaf li\xe1\xbb\x87u kh\xc3\xb4ng th\xe1\xbb\x83 ph\xe1\xbb\xa5c h\xe1\xbb\x93i"
+    b"Gi\xe1\xbb\x9bi h\xe1\xba\xa1n kho\xe1\xba\xa3ng tr\xe1\xbb\x91ng"
+    b"T\xe1\xba\xa1o Mnemonic"
+    b"Ch\xe1\xbb\x8dn"
+    b"Entropy t\xe1\xbb\x91t"
+    b"Ph\xe1\xba\xa7n c\xe1\xbb\xa9ng"
+    b"Lo\xe1\xba\xa1i \xc4\x91\xe1\xba\xa7u"
+    b"Kh\xc3\xb3a c\xc3\xb4ng c\xe1\xbb\x99ng Hex:"
+    b"Th\xe1\xba\xadp l\xe1\xbb\xa5c ph\xc3\xa2n"
+    b"\xe1\xba\xa8n Mnemonics"
+    b"Ph\xc3\xad cao!"
+    b"ID"
+    b"Id \xc4\x91\xc3\xa3 t\xe1\xbb\x93n t\xe1\xba\xa1i"
+    b"Ch\xe1\xbb\x89 m\xe1\xbb\xa5c"
+    b"\xc4\x90\xe1\xba\xa7u v\xc3\xa0o (%d):"
+    b"Entropy kh\xc3\xb4ng \xc4\x91\xe1\xbb\xa7!"
+    b"M\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o kh\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87"
+    b"\xc4\x90\xe1\xbb\x8ba ch\xe1\xbb\x89 kh\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87"
+    b"\xc4\x90\xc6\xb0\xe1\xbb\x9dng d\xe1\xba\xabn ph\xc3\xa1i sinh kh\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87"
+    b"\xc4\x90\xe1\xbb\x99 d\xc3\xa0i m\xc3\xa3 Mnemonic kh\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87"
+    b"V\xc3\xad kh\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87:"
+    b"\xc4\x90\xe1\xba\xa3o ng\xc6\xb0\xe1\xbb\xa3c"
+    b"M\xc3\xa0u \xc4\x91\xe1\xba\xa3o ng\xc6\xb0\xe1\xbb\xa3c"
+    b"\xc4\x90\xc3\xa3 m\xc3\xa3 h\xc3\xb3a KEF"
+    b"Ch\xc3\xaca kh\xc3\xb3a"
+    b"Kh\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c cung c\xe1\xba\xa5p"
+    b"QR ki\xe1\xbb\x83m tra m\xc3\xa1y in Krux"
+    b"Lo\xe1\xba\xa1i LCD"
+    b"Ng\xc3\xb4n ng\xe1\xbb\xaf"
+    b"\xc4\x90\xe1\xbb\x83 tr\xe1\xbb\x91ng n\xe1\xba\xbfu b\xe1\xba\xa1n mu\xe1\xbb\x91n Krux ch\xe1\xbb\x8dn m\xe1\xbb\x99t t\xe1\xbb\xab cu\xe1\xbb\x91i c\xc3\xb9ng h\xe1\xbb\xa3p l\xe1\xbb\x87"
+    b"Tr\xc3\xa1i"
+    b"\xc4\x90\xe1\xbb\x99 d\xc3\xa0i:"
+    b"\xc4\x90\xe1\xbb\x99 tr\xe1\xbb\x85 D\xc3\xb2ng"
+    b"\xc4\x90\xc6\xb0\xe1\xbb\x9dng k\xe1\xba\xbb:"
+    b"danh s\xc3\xa1ch \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89"
+    b"T\xe1\xba\xa3i m\xc3\xa3 mnemonic"
+    b"N\xe1\xba\xa1p V\xc3\xad"
+    b"T\xe1\xba\xa3i m\xc3\xb4 t\xe1\xba\xa3 v\xc3\xad \xc4\x91\xc3\xa1ng tin c\xe1\xba\xady \xc4\x91\xe1\xbb\x83 xem \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89?"
+    b"T\xe1\xba\xa3i t\xe1\xbb\xab th\xe1\xba\xbb SD"
+    b"T\xe1\xba\xa3i t\xe1\xbb\xab th\xe1\xba\xbb SD?"
+    b"T\xe1\xba\xa3i t\xe1\xbb\xab m\xc3\xa1y \xe1\xba\xa3nh"
+    b"T\xe1\xba\xa3i?"
+    b"\xc4\x90ang t\xe1\xba\xa3i camera\xe2\x80\xa6"
+    b"\xc4\x90ang t\xe1\xba\xa3i \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 thay \xc4\x91\xe1\xbb\x95i\xe2\x80\xa6"
+    b"\xc4\x90ang t\xe1\xba\xa3i m\xc3\xa1y in\xe2\x80\xa6"
+    b"\xc4\x90ang t\xe1\xba\xa3i \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 nh\xe1\xba\xadn\xe2\x80\xa6"
+    b"\xc4\x90ang t\xe1\xba\xa3i\xe2\x80\xa6"
+    b"Ng\xc3\xb4n ng\xe1\xbb\xaf"
+    b"V\xe1\xbb\x8b tr\xc3\xad l\xc6\xb0u"
+    b"Trung b\xc3\xacnh"
+    b"Tin nh\xe1\xba\xafn"
+    b"Tin nh\xe1\xba\xafn:"
+    b"Chi ti\xe1\xba\xbft nh\xe1\xbb\x8f"
+    b"T\xe1\xbb\x8da \xc4\x91\xe1\xbb\x99 g\xc6\xb0\xc6\xa1ng X"
+    b"Thi\xe1\xba\xbfu t\xe1\xba\xadp tin ch\xe1\xbb\xaf k\xc3\xbd"
+    b"M\xc3\xa3 mnemonic"
+    b"T\xe1\xbb\xab g\xe1\xbb\xa3i nh\xe1\xbb\x9b v\xc3\xa0 c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u s\xe1\xba\xbd \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u gi\xe1\xbb\xaf."
+    b"\xc4\x90\xc3\xa3 s\xe1\xbb\xada \xc4\x91\xe1\xbb\x95i:"
+    b"Native Segwit - 84 s\xe1\xba\xbd \xc4\x91\xc6\xb0\xe1\xbb\xa3c gi\xe1\xba\xa3 \xc4\x91\xe1\xbb\x8bnh"
+    b"M\xe1\xba\xa1ng l\xc6\xb0\xe1\xbb\x9bi"
+    b"Mnemonic m\xe1\xbb\x9bi"
+    b"Ph\xc3\xa1t hi\xe1\xbb\x87n ph\xe1\xba\xa7n s\xe1\xbb\xa5n m\xe1\xbb\x9bi."
+    b"Kh\xc3\xb4ng"
+    b"Kh\xc3\xb4ng c\xc3\xb3 c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u"
+    b"Kh\xc3\xb4ng \xc4\x91\xe1\xbb\xa7 s\xe1\xbb\x91 l\xe1\xba\xa7n quay!"
+    b"Kh\xc3\xb4ng t\xc3\xacm th\xe1\xba\xa5y:"
+    b"S\xe1\xbb\x91"
+    b"B\xc3\xa1t ph\xc3\xa2n"
+    b"C\xc3\xa1c \xc4\x91\xe1\xbb\x8bnh d\xe1\xba\xa1ng kh\xc3\xa1c"
+    b"Ghi \xc4\x91\xc3\xa8?"
+    b"PAGE \xc4\x91\xe1\xbb\x83 chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i \xc4\x91\xe1\xbb\x99 s\xc3\xa1ng"
+    b"PBKDF2 iter."
+    b"T\xc3\xb4 c\xc3\xa1c ch\xe1\xba\xa5m \xc4\x91\xe1\xbb\xa5c l\xe1\xbb\x97 m\xc3\xa0u \xc4\x91en \xc4\x91\xe1\xbb\x83 ch\xc3\xbang c\xc3\xb3 th\xe1\xbb\x83 \xc4\x91\xc6\xb0\xe1\xbb\xa3c ph\xc3\xa1t hi\xe1\xbb\x87n."
+    b"Chi\xe1\xbb\x81u r\xe1\xbb\x99ng gi\xe1\xba\xa5y"
+    b"Ph\xe1\xba\xa7n"
+    b"Ph\xe1\xba\xa7n M/N"
+    b"K\xc3\xadch th\xc6\xb0\xe1\xbb\x9bc m\xe1\xbb\x99t ph\xe1\xba\xa7n"
+    b"C\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u"
+    b"\xc4\x90\xe1\xbb\x99 d\xc3\xa0i m\xe1\xba\xadt kh\xe1\xba\xa9u t\xe1\xbb\x91i thi\xe1\xbb\x83u"
+    b"\xc4\x90\xc6\xb0\xe1\xbb\x9dng d\xe1\xba\xabn kh\xc3\xb4ng kh\xe1\xbb\x9bp"
+    b"\xc4\x90\xc3\xa3 ph\xc3\xa1t hi\xe1\xbb\x87n m\xe1\xba\xabu!"
+    b"X\xc3\xb3a v\xc4\xa9nh vi\xe1\xbb\x85n m\xe1\xbb\x8di Mnemonics v\xc3\xa0 c\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3a l\xc6\xb0u tr\xe1\xbb\xaf trong flash?"
+    b"V\xe1\xbb\x8b tr\xc3\xad l\xc6\xb0u"
+    b"Ch\xe1\xbb\x89 s\xe1\xbb\x91 \xc4\x91\xe1\xbb\x99 l\xe1\xbb\x87ch \xc4\x91i\xe1\xbb\x83m \xe1\xba\xa3nh:"
+    b"QR d\xe1\xba\xa1ng v\xc4\x83n b\xe1\xba\xa3n"
+    b"Vui l\xc3\xb2ng t\xe1\xba\xa3i b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3 \xc4\x91\xe1\xba\xa7u ra v\xc3\xad"
+    b"T\xe1\xbb\xb7 l\xe1\xbb\x87 s\xe1\xbb\xa5t gi\xe1\xba\xa3m"
+    b"Lo\xe1\xba\xa1i Ch\xc3\xadnh s\xc3\xa1ch"
+    b"Entropy k\xc3\xa9m!"
+    b"C\xc3\xb4ng su\xe1\xba\xa5t"
+    b"Nh\xe1\xba\xa5n PAGE \xc4\x91\xe1\xbb\x83 h\xe1\xbb\xa7y."
+    b"PAGE \xc4\x91\xe1\xbb\x83 chuy\xe1\xbb\x83n ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99"
+    b"In ki\xe1\xbb\x83m tra QR"
+    b"In Tinyseed?"
+    b"In ra QR"
+    b"In ra m\xc3\xa3 QR?"
+    b"In?"
+    b"M\xc3\xa1y in"
+    b"Tr\xc3\xacnh \xc4\x91i\xe1\xbb\x81u khi\xe1\xbb\x83n m\xc3\xa1y in ch\xc6\xb0a \xc4\x91\xc6\xb0\xe1\xbb\xa3c c\xc3\xa0i \xc4\x91\xe1\xba\xb7t!"
+    b"In \xe1\xba\xa5n\xe2\x80\xa6"
+    b"V\xe1\xba\xabn ti\xe1\xba\xbfp t\xe1\xbb\xa5c?"
+    b"Th\xe1\xbb\xb1c hi\xe1\xbb\x87n?"
+    b"\xc4\x90ang x\xe1\xbb\xad l\xc3\xbd\xe2\x80\xa6"
+    b"Ch\xe1\xba\xafc ch\xe1\xba\xafn kh\xc3\xb4ng th\xe1\xbb\x83 chi ti\xc3\xaau"
+    b"M\xc3\xa3 QR"
+    b"Nh\xc3\xa3n QR"
+    b"S\xe1\xbb\x91 l\xc6\xb0\xe1\xbb\xa3ng"
+    b"RX Pin"
+    b"Kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i"
+    b"Nh\xe1\xba\xadn \xc4\x91\xc6\xb0\xe1\xbb\xa3c"
+    b"V\xc3\xb9ng:"
+    b"X\xc3\xb3a %s?"
+    b"X\xc3\xb3a Mnemonic"
+    b"X\xc3\xb3a c\xc3\xa1c t\xe1\xbb\x87p firmware kh\xe1\xbb\x8fi Th\xe1\xba\xbb SD?"
+    b"\xc4\x90\xe1\xbb\x99 ph\xc3\xa2n gi\xe1\xba\xa3i - \xc4\x90\xe1\xbb\x8bnh d\xe1\xba\xa1ng"
+    b"Kh\xc3\xb4i ph\xe1\xbb\xa5c c\xc3\xa0i \xc4\x91\xe1\xba\xb7t g\xe1\xbb\x91c v\xc3\xa0 kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i?"
+    b"K\xe1\xba\xbft qu\xe1\xba\xa3"
+    b"Quay l\xe1\xba\xa1i Tr\xc3\xacnh xem QR"
+    b"Xem l\xe1\xba\xa1i l\xe1\xba\xa7n n\xe1\xbb\xafa"
+    b"Xem l\xe1\xba\xa1i d\xe1\xbb\xaf li\xe1\xbb\x87u \xc4\x91\xc3\xa3 qu\xc3\xa9t, ch\xe1\xbb\x89nh s\xe1\xbb\xada n\xe1\xba\xbfu c\xe1\xba\xa7n"
+    b"Ph\xe1\xba\xa3i"
+    b"L\xc4\x83n x\xc3\xbac x\xe1\xba\xafc \xc3\xadt nh\xe1\xba\xa5t %d l\xe1\xba\xa7n \xc4\x91\xe1\xbb\x83 t\xe1\xba\xa1o Mnemonic."
+    b"Ph\xc3\xa2n b\xe1\xbb\x95 x\xc3\xbac x\xe1\xba\xafc:"
+    b"T\xe1\xbb\x95ng s\xe1\xbb\x91 l\xe1\xba\xa7n quay x\xc3\xbac x\xe1\xba\xafc:"
+    b"Xoay Chi\xe1\xbb\x81u 180\xc2\xba"
+    b"Th\xe1\xba\xbb SD"
+    b"Th\xe1\xba\xbb SD kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c ph\xc3\xa1t hi\xe1\xbb\x87n."
+    b"SHA256 c\xe1\xbb\xa7a x\xc3\xbac x\xe1\xba\xafc:"
+    b"Sha256 c\xe1\xbb\xa7a \xe1\xba\xa3nh ch\xe1\xbb\xa5p:"
+    b"L\xc6\xb0u \xe1\xba\xa2nh QR v\xc3\xa0o Th\xe1\xba\xbb SD"
+    b"L\xc6\xb0u v\xc3\xa0o th\xe1\xba\xbb SD"
+    b"L\xc6\xb0u v\xc3\xa0o th\xe1\xba\xbb SD?"
+    b"\xc4\x90\xc3\xa3 l\xc6\xb0u v\xc3\xa0o th\xe1\xba\xbb SD:"
+    b"T\xe1\xbb\x89 l\xe1\xbb\x87"
+    b"Qu\xc3\xa9t \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89"
+    b"Qu\xc3\xa9t c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u BIP39"
+    b"Qu\xc3\xa9t m\xc3\xa3 QR kh\xc3\xb3a"
+    b"\xc4\x90o hi\xe1\xbb\x87u n\xc4\x83ng qu\xc3\xa9t"
+    b"\xc4\x90ang qu\xc3\xa9t l\xe1\xba\xa1i t\xe1\xbb\xab 1-12"
+    b"\xc4\x90ang qu\xc3\xa9t t\xe1\xbb\xab 13-24"
+    b"Th\xe1\xbb\x9di gian ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 b\xe1\xba\xa3o v\xe1\xbb\x87 m\xc3\xa0n h\xc3\xacnh"
+    b"Ki\xe1\xbb\x83u v\xc4\x83n l\xe1\xbb\x87nh"
+    b"B\xe1\xba\xa3o m\xe1\xba\xadt"
+    b"T\xe1\xbb\xb1 chuy\xe1\xbb\x83n nh\xc6\xb0\xe1\xbb\xa3ng ho\xe1\xba\xb7c giao d\xe1\xbb\x8bch (%d):"
+    b"T\xe1\xbb\xb1 chuy\xe1\xbb\x83n nh\xc6\xb0\xe1\xbb\xa3ng:"
+    b"\xc4\x90\xe1\xba\xb7t m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o tr\xc6\xb0\xe1\xbb\x9bc"
+    b"C\xc3\xa0i \xc4\x91\xe1\xba\xb7t"
+    b"C\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u tr\xe1\xbb\xaf n\xe1\xbb\x99i b\xe1\xbb\x99 tr\xc3\xaan \xc4\x91\xc3\xa8n flash."
+    b"C\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u tr\xc3\xaan th\xe1\xba\xbb SD."
+    b"Entropy c\xe1\xbb\xa7a Shannon:"
+    b"Hi\xe1\xbb\x83n th\xe1\xbb\x8b d\xe1\xbb\xaf li\xe1\xbb\x87u"
+    b"T\xe1\xba\xaft m\xc3\xa1y"
+    b"Th\xe1\xbb\x9di gian t\xe1\xba\xaft m\xc3\xa1y"
+    b"\xc4\x90ang t\xe1\xba\xaft\xe2\x80\xa6"
+    b"Ch\xe1\xbb\xaf k\xc3\xad"
+    b"K\xc3\xbd v\xc3\xa0o m\xc3\xa3 QR"
+    b"K\xc3\xbd v\xc3\xa0o th\xe1\xba\xbb SD"
+    b"K\xc3\xad?"
+    b"Ch\xe1\xbb\xaf k\xc3\xbd:"
+    b"Tin nh\xe1\xba\xafn \xc4\x91\xc3\xa3 k\xc3\xbd"
+    b"\xc4\x90\xc3\xa3 k\xc3\xbd PSBT"
+    b"Bi\xe1\xbb\x83n b\xc3\xa1o\xe2\x80\xa6"
+    b"Kh\xc3\xb3a \xc4\x91\xc6\xa1n"
+    b"Dung l\xc6\xb0\xe1\xbb\xa3ng:"
+    b"M\xe1\xbb\x99t s\xe1\xbb\x91 ki\xe1\xbb\x83m tra kh\xc3\xb4ng th\xe1\xbb\x83 \xc4\x91\xc6\xb0\xe1\xbb\xa3c th\xe1\xbb\xb1c hi\xe1\xbb\x87n."
+    b"M\xe1\xbb\x99t s\xe1\xbb\x91 n\xc3\xbat kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc3\xa0m c\xe1\xbb\xa9ng:"
+    b"Chi ti\xc3\xaau (%d):"
+    b"Chi ti\xc3\xaau:"
+    b"Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 Ti\xc3\xaau chu\xe1\xba\xa9n"
+    b"T\xc4\xa9nh"
+    b"S\xe1\xbb\x91 li\xe1\xbb\x87u th\xe1\xbb\x91ng k\xc3\xaa cho M\xe1\xbb\x8dt s\xc3\xa1ch"
+    b"L\xc6\xb0u tr\xe1\xbb\xaf tr\xc3\xaan flash"
+    b"L\xc6\xb0u tr\xe1\xbb\xaf tr\xc3\xaan th\xe1\xba\xbb SD"
+    b"\xc4\x90\xe1\xbb\x99 m\xe1\xba\xa1nh"
+    b"M\xe1\xba\xa1nh"
+    b"Vu\xe1\xbb\x91t \xc4\x91\xe1\xbb\x83 thay \xc4\x91\xe1\xbb\x95i ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99"
+    b"TC Flash Hash"
+    b"Hash Flash TC khi kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng"
+    b"Ch\xe1\xba\xa1m m\xc3\xa0n h\xc3\xacnh ho\xe1\xba\xb7c nh\xe1\xba\xa5n n\xc3\xbat ENTER \xc4\x91\xe1\xbb\x83 ch\xe1\xbb\xa5p"
+    b"Ch\xe1\xba\xa1m m\xc3\xa0n h\xc3\xacnh ho\xe1\xba\xb7c nh\xe1\xba\xa5n n\xc3\xbat ENTER \xc4\x91\xe1\xbb\x83 c\xc3\xa0i \xc4\x91\xe1\xba\xb7t ph\xe1\xba\xa7n m\xe1\xbb\x81m."
+    b"Kh\xc3\xb3a n\xe1\xbb\x99i b\xe1\xbb\x99 TR"
+    b"TX Pin"
+    b"M\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o"
+    b"\xc4\x90\xc3\xa3 \xc4\x91\xe1\xba\xb7t m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o th\xc3\xa0nh c\xc3\xb4ng"
+    b"M\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o kh\xc3\xb4ng kh\xe1\xbb\x9bp"
+    b"B\xe1\xbb\x99 th\xe1\xbb\xad nghi\xe1\xbb\x87m"
+    b"K\xe1\xba\xbft qu\xe1\xba\xa3 b\xe1\xbb\x99 th\xe1\xbb\xad nghi\xe1\xbb\x87m"
+    b"Ki\xe1\xbb\x83m tra b\xc3\xa0i c\xc5\xa9:"
+    b"Ch\xe1\xbb\xaf"
+    b"Ch\xe1\xbb\xa7 \xc4\x91\xe1\xbb\x81"
+    b"Nhi\xe1\xbb\x87t"
+    b"S\xe1\xbb\xad d\xe1\xbb\xa5ng t\xc3\xadnh n\xc4\x83ng X\xc3\xb3a d\xe1\xbb\xaf li\xe1\xbb\x87u tr\xc3\xaan thi\xe1\xba\xbft b\xe1\xbb\x8b \xc4\x91\xe1\xbb\x83 \xc4\x91\xe1\xba\xa3m b\xe1\xba\xa3o d\xe1\xbb\xaf li\xe1\xbb\x87u kh\xc3\xb4ng th\xe1\xbb\x83 ph\xe1\xbb\xa5c h\xe1\xbb\x93i"
+    b"Chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i \xc4\x91\xe1\xbb\x99 s\xc3\xa1ng"
+    b"C\xc3\xb4ng c\xe1\xbb\xa5"
+    b"Ng\xc6\xb0\xe1\xbb\xa1ng c\xe1\xba\xa3m \xe1\xbb\xa9ng"
+    b"M\xc3\xa0n h\xc3\xacnh c\xe1\xba\xa3m \xe1\xbb\xa9ng"
+    b"Th\xe1\xbb\xad th\xc3\xaam n\xe1\xbb\xafa?"
+    b"Nh\xe1\xba\xadp c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u BIP39"
+    b"Nh\xe1\xba\xadp kh\xc3\xb3a"
+    b"Ho\xc3\xa0n t\xc3\xa1c"
+    b"\xc4\x90\xc6\xa1n v\xe1\xbb\x8b"
+    b"C\xe1\xba\xadp nh\xe1\xba\xadt ID KEF?"
+    b"C\xe1\xba\xadp nh\xe1\xba\xadt nh\xc3\xa3n QR?"
+    b"N\xc3\xa2ng c\xe1\xba\xa5p ho\xc3\xa0n t\xe1\xba\xa5t."
+    b"S\xe1\xbb\xad d\xe1\xbb\xa5ng b\xe1\xbb\x81 m\xe1\xba\xb7t n\xe1\xbb\x81n \xc4\x91en."
+    b"S\xe1\xbb\xad d\xe1\xbb\xa5ng s\xe1\xbb\xb1 ng\xe1\xba\xabu nhi\xc3\xaan c\xe1\xbb\xa7a m\xc3\xa1y \xe1\xba\xa3nh \xc4\x91\xe1\xbb\x83 t\xe1\xba\xa1o ra m\xe1\xbb\x99t Mnemonic m\xe1\xbb\x9bi"
+    b"Gi\xc3\xa1 tr\xe1\xbb\x8b hi\xe1\xbb\x87n t\xe1\xba\xa1i"
+    b"S\xe1\xbb\xad d\xe1\xbb\xa5ng Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 m\xe1\xba\xb7c \xc4\x91\xe1\xbb\x8bnh?"
+    b"S\xe1\xbb\xad d\xe1\xbb\xa5ng tr\xc3\xacnh l\xe1\xba\xb7p PBKDF2 m\xe1\xba\xb7c \xc4\x91\xe1\xbb\x8bnh.?"
+    b"D\xc3\xb9ng v\xc3\xa2n tay l\xc3\xa0m ID?"
+    b"\xc4\x90\xc3\xa3 s\xe1\xbb\xad d\xe1\xbb\xa5ng:"
+    b"Ng\xc6\xb0\xe1\xbb\x9di d\xc3\xb9ng"
+    b"Gi\xc3\xa1 tr\xe1\xbb\x8b %s ngo\xc3\xa0i ph\xe1\xba\xa1m vi: [ %s, %s]"
+    b"X\xc3\xa1c minh\xe2\x80\xa6"
+    b"Phi\xc3\xaan B\xe1\xba\xa3n"
+    b"Qua m\xc3\xa1y \xe1\xba\xa3nh"
+    b"Qua x\xc3\xbac x\xe1\xba\xafc 20 m\xe1\xba\xb7t"
+    b"Qua x\xc3\xbac x\xe1\xba\xafc 6 m\xe1\xba\xb7t"
+    b"Th\xc3\xb4ng qua \xc4\x91\xe1\xba\xa7u v\xc3\xa0o th\xe1\xbb\xa7 c\xc3\xb4ng"
+    b"Th\xc3\xb4ng qua t\xe1\xbb\xab ng\xe1\xbb\xaf"
+    b"Nh\xc3\xa3n c\xc3\xb3 th\xe1\xbb\x83 nh\xc3\xacn th\xe1\xba\xa5y"
+    b"Ch\xe1\xbb\x9d b\xe1\xba\xaft"
+    b"V\xc3\xad"
+    b"Tr\xc3\xacnh m\xc3\xb4 t\xe1\xba\xa3 v\xc3\xad"
+    b"V\xc3\xad \xc4\x91\xe1\xba\xa7u ra m\xc3\xb4 t\xe1\xba\xa3"
+    b"\xc4\x90\xc3\xa3 t\xe1\xba\xa3i b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3 \xc4\x91\xe1\xba\xa7u ra c\xe1\xbb\xa7a v\xc3\xad!"
+    b"Kh\xc3\xb4ng t\xc3\xacm th\xe1\xba\xa5y b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3 \xc4\x91\xe1\xba\xa7u ra v\xc3\xad."
+    b"C\xe1\xba\xa3nh b\xc3\xa1o:"
+    b"Y\xe1\xba\xbfu"
+    b"K\xc3\xad t\xe1\xbb\xb1 %d"
+    b"T\xe1\xbb\xab s\xe1\xbb\x91"
+    b"T\xe1\xbb\xab ng\xe1\xbb\xaf"
+    b"\xc4\x90\xc3\xbang"
+    b"Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 thu ph\xc3\xb3ng"
+    b"nh\xe1\xbb\x8b ph\xc3\xa2n: {} byte"
+    b"tr\xc6\xb0\xe1\xbb\xa3t"
+    b"t\xe1\xbb\xab HEX"
+    b"t\xe1\xbb\xab base32"
+    b"t\xe1\xbb\xab base43"
+    b"t\xe1\xbb\xab base64"
+    b"t\xe1\xbb\xab hex"
+    b"t\xe1\xbb\xab utf8"
+    b"l\xc3\xa0 m\xe1\xbb\x99t \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 h\xe1\xbb\xa3p l\xe1\xbb\x87!"
+    b"tr\xc6\xb0\xe1\xbb\x9dng h\xe1\xbb\xa3p ca l\xc3\xa0m vi\xe1\xbb\x87c"
+    b"T\xe1\xbb\x89 l\xe1\xbb\x87 th\xc3\xa0nh c\xc3\xb4ng:"
+    b"vu\xe1\xbb\x91t"
+    b"text: {} k\xc3\xbd t\xe1\xbb\xb1"
+    b"th\xc3\xa0nh HEX"
+    b"\xc4\x91\xe1\xba\xbfn base32"
+    b"\xc4\x91\xe1\xba\xbfn base43"
+    b"\xc4\x91\xe1\xba\xbfn base64"
+    b"th\xc3\xa0nh hex"
+    b"\xc4\x91\xe1\xba\xbfn utf8"
+    b"kh\xc3\xb4ng r\xc3\xb5"
+    b"kH\xc3\x94NG T\xc3\x8cM TH\xe1\xba\xa4Y trong %d \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 \xc4\x91\xe1\xba\xa7u ti\xc3\xaan"
+)
@@ -20,371 +20,403 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_array = [
-    "% 的金额.",
-    "%d/%d 多签",
-    "%d到%d",
-    "%s位 (%s位/像素）",
-    "已移除%s",
-    "%s :已加载!",
-    "（实验性）",
-    "（仅观察）",
-    "12 单词",
-    "24 单词",
-    "关于",
-    "接受假设？",
-    "账户",
-    "将假定为账户 #0",
-    "账户索引",
-    "添加或更改钱包密码？",
-    "%s需要摄像头的额外熵",
-    "地址",
-    "正确对齐摄像头和背板.",
-    "防闪模式",
-    "界面",
-    "确定？",
-    "BGR 颜色",
-    "BIP39助记符",
-    "返回",
-    "返回菜单",
-    "备份助记词",
-    "签名无效",
-    "Base64密码",
-    "波特率",
-    "二进制网格",
-    "边框填充",
-    "亮度",
-    "按钮",
-    "按钮去抖动",
-    "截取已取消",
-    "找零",
-    "更改主题并重新启动？",
-    "找零:",
-    "更改将在关机前保持.",
-    "检查 SD 卡",
-    "检查该地址是否属于此钱包？",
-    "已检查 %d 个不匹配的地址.",
-    "检查卡…",
-    "确认防篡改检查码",
-    "转换基准",
-    "无法确定更改地址.",
-    "创建二维码",
-    "从短信创建二维码？",
-    "已创建:",
-    "当前防篡改检查码",
-    "自定义二维码",
-    "自定义文本",
-    "自定义",
-    "自定义您的钱包将生成一个新的密钥并卸载描述符.",
-    "切割深度",
-    "切割方法",
-    "基准工具",
-    "十进制",
-    "解密？",
-    "默认钱包",
-    "是否删除此文件？",
-    "每次通过的深度",
-    "源路径",
-    "导出BIP85熵？",
-    "描述符地址",
-    "设备测试",
-    "显示",
-    "请勿断电，可能需要一段时间完成.",
-    "完成转换",
-    "完成了吗？",
-    "双重助记词",
-    "驱动程序",
-    "为空",
-    "启用？",
-    "加密",
-    "已加密",
-    "加密二维码",
-    "加密助记词已存储，ID 为:",
-    "加密助记词未存储",
-    "加密",
-    "加密模式",
-    "输入 %d 个 BIP39 词.",
-    "输入6个以上字符的防篡改检查码",
-    "将 BIP39 助记词的每个词作为 1 到 2048 的数字输入.",
-    "将 BIP39 助记词的每个词作为 1 到 800 的十六进制数输入.",
-    "将 BIP39 助记词的每个词作为 1 到 4000 的八进制数输入.",
-    "输入每个 BIP39 助记词.",
-    "清除用户数据",
-    "正在删除用户数据…",
-    "错误:",
-    "退出",
-    "浏览文件？",
-    "导出地址",
-    "正在将%s导出到SD卡…",
-    "扩展公钥",
-    "出厂设置",
-    "收集摄像头熵失败",
-    "解密失败",
-    "加载失败",
-    "存储助记词失败",
-    "费用:",
-    "进给速度",
-    "文件名",
-    "文件名 %s 存在于 SD 卡上.",
-    "用摄像头的熵填充Flash？",
-    "填充Flash",
-    "PSBT 中未设置指纹",
-    "Flash地图",
-    "Flash工具",
-    "Flash已用摄像头熵填充",
-    "刀具直径",
-    "空闲:",
-    "从存储中",
-    "在其他设备中完全擦除您的 SD 卡以确保数据不可恢复",
-    "生成助记词",
-    "去",
-    "良好的熵",
-    "硬件",
-    "头部类型",
-    "十六进制公钥:",
-    "十六进制",
-    "隐藏助记词",
-    "高费用！",
-    "ID",
-    "ID 已存在",
-    "索引",
-    "输入 (%d):",
-    "熵不足！",
-    "无效的防篡改检查码",
-    "无效地址",
-    "无效的源路径",
-    "助记词长度无效",
-    "无效钱包:",
-    "反转",
-    "反转颜色",
-    "KEF加密",
-    "密钥",
-    "未提供密钥",
-    "Krux 打印机测试二维码",
-    "LCD 类型",
-    "语言",
-    "如果希望 Krux 自动计算最后一位 Checksum，请留空",
-    "左",
-    "长度:",
-    "行延迟",
-    "行:",
-    "地址",
-    "加载助记词",
-    "加载钱包",
-    "加载受信任的钱包描述符以查看地址？",
-    "从 SD 卡加载",
-    "从 SD 卡加载？",
-    "从相机加载",
-    "加载？",
-    "正在加载摄像头…",
-    "正在加载更改地址…",
-    "正在加载打印机…",
-    "正在加载接收地址…",
-    "加载中…",
-    "语言环境",
-    "位置",
-    "中等",
-    "消息",
-    "消息:",
-    "Miniscript",
-    "镜像X坐标",
-    "缺少签名文件",
-    "助记词",
-    "助记词和密码将被保留.",
-    "修改时间:",
-    "假定为原生 Segwit - 84",
-    "网络",
-    "新助记词",
-    "检测到新固件.",
-    "否",
-    "无 Passphrase ",
-    "投掷次数不足！",
-    "数字",
-    "八进制",
-    "其他格式",
-    "覆盖？",
-    "切换亮度的页面",
-    "PBKDF2迭代.",
-    "将打孔点涂黑，以便它们能被检测到.",
-    "纸张宽度",
-    "部分",
-    "N的M部分",
-    "部件尺寸",
-    "Passphrase",
-    "密码长度:",
-    "路径不匹配",
-    "检测到模式！",
-    "从 Flash 中永久删除所有存储的加密助记词和设置？",
-    "保存",
-    "像素偏差指数:",
-    "明文二维码",
-    "请加载钱包输出描述符",
-    "下刀速度",
-    "政策类型",
-    "熵值低!",
-    "功率",
-    "按PAGE取消.",
-    "按 PAGE 切换模式",
-    "打印测试二维码",
-    "打印Tinyseed ？",
-    "打印到二维码",
-    "打印到二维码？",
-    "打印？",
-    "打印机",
-    "打印机驱动程序未设置！",
-    "打印…",
-    "继续吗？",
-    "继续？",
-    "处理中…",
-    "可证明不可使用",
-    "二维码",
-    "二维码标签",
-    "数量",
-    "RX 引脚",
-    "重启",
-    "接收",
-    "区域:",
-    "删除 %s？",
-    "删除助记词",
-    "从 SD 卡中删除固件文件？",
-    "分辨率 - 格式",
-    "恢复出厂设置并重新设备？",
-    "結果",
-    "返回二维码查看器",
-    "再次审核",
-    "请检查扫描的数据，如有必要请编辑",
-    "右",
-    "掷骰子至少 %d 次以生成助记词.",
-    "掷骰子分布:",
-    "掷骰子:",
-    "旋转 180°",
-    "SD 卡",
-    "未检测到 SD 卡.",
-    "掷骰子的 SHA256:",
-    "快照的 SHA256:",
-    "将二维码图像保存到 SD 卡",
-    "保存到 SD 卡",
-    "保存到 SD 卡？",
-    "保存到 SD 卡:",
-    "缩放",
-    "扫描地址",
-    "扫描 BIP39 Passphrase",
-    "扫描私钥二维码",
-    "重新扫扫描第 1-12 个单词",
-    "扫描第 13-24 个单词",
-    "屏保时间",
-    "脚本类型",
-    "安全",
-    "自转或找零 (%d):",
-    "自行转账:",
-    "请先设置防篡改检查码",
-    "设置",
-    "设置存储在 Flash 内部.",
-    "设置存储在SD卡上.",
-    "香农熵:",
-    "显示基准",
-    "关机",
-    "关机时间",
-    "关闭…",
-    "签名",
-    "二维码签名",
-    " SD 卡签名",
-    "是否签名？",
-    "签名:",
-    "签名消息",
-    "已签名 PSBT",
-    "签名…",
-    "单签",
-    "大小:",
-    "无法执行某些检查.",
-    "有些节点未硬化:",
-    "花费 (%d):",
-    "花费",
-    "标准模式",
-    "Static  静态？",
-    "极客统计数据",
-    "存储到 Flash",
-    "存储到 SD 卡",
-    "强度",
-    "强",
-    "滑动切换模式",
-    "TC Flash Hash",
-    "启动时的 TC Flash Hash",
-    "点击或按下 ENTER 截图",
-    "点击或按下 ENTER 安装.",
-    "TR内部密钥",
-    "TX 引脚",
-    "防篡改检查码",
-    "防篡改检查码设置成功",
-    "防篡改检查码不匹配",
-    "Test Suite",
-    "测试套件结果",
-    "测试:",
-    "文本",
-    "主题",
-    "热敏",
-    "要确保数据不可恢复，请使用擦除设备功能",
-    "调整亮度",
-    "工具",
-    "触摸阈值",
-    "触摸屏",
-    "再次尝试？",
-    "输入 BIP39 Phrasephrase",
-    "输入私钥",
-    "撤销",
-    "单位",
-    "更新KEF ID ？",
-    "更新二维码标签？",
-    "升级已完成.",
-    "使用黑色背景界面.",
-    "使用摄像头的熵创建新助记词",
-    "当前值",
-    "使用默认模式？",
-    "使用默认PBKDF2迭代.?",
-    "使用指纹作为身份证件？",
-    "已用:",
-    "用户数据",
-    "值 %s 超出范围:[ %s,%s ]",
-    "验证中…",
-    "版本",
-    "通过摄像头",
-    "通过 D20",
-    "通过 D6",
-    "通过手动输入",
-    "通过单词",
-    "可见标签",
-    "等待截取",
-    "钱包",
-    "钱包描述",
-    "钱包输出描述符",
-    "钱包输出描述符加载重复！",
-    "未找到钱包输出描述符.",
-    "警告:",
-    "弱",
-    "词 %d",
-    "单词序号",
-    "单词",
-    "是",
-    "放大模式",
-    "二进制： {}字节",
-    "失败",
-    "从十六进制",
-    "从base32",
-    "从base43",
-    "从base64",
-    "从十六进制",
-    "从utf8",
-    " 非有效地址",
-    "移位案例",
-    "成功率：",
-    "滑动",
-    "text: {}个字符",
-    "成为十六进制",
-    "到base32",
-    "到base43",
-    "到base64",
-    "成为十六进制",
-    "to_utf8()",
-    "未知",
-    "在前 %d 个地址中未找到",
-]
+translation_catalog = (
+    b"v\x01\x00\x00\x0c\x00*\x00Q\x00]\x00d\x00z\x00\x85\x00\x93\x00\xa2\x00\xb1\x00\xba\x00\xc3\x00\xc9\x00\xd8\x00"
+    b"\xde\x00\xf3\x00\xff\x00\x1d\x01:\x01@\x01L\x01k\x01w\x01}\x01\x86\x01\x90\x01\x9e\x01\xa4\x01\xb0\x01\xbf\x01"
+    b'\xcb\x01\xd7\x01\xe0\x01\xef\x01\xfb\x01\x01\x02\x07\x02\x16\x02"\x021\x027\x02U\x02\\\x02x\x02\x8a\x02\x97\x02'
+    b"\xbe\x02\xe1\x02\xed\x02\x05\x03\x11\x03*\x039\x03T\x03^\x03v\x03\x88\x03\x97\x03\xa0\x03\xe3\x03\xef\x03\xfb\x03"
+    b"\x07\x04\x10\x04\x19\x04%\x04=\x04R\x04[\x04l\x04{\x04\x87\x04\x8d\x04\xbb\x04\xc7\x04\xd6\x04\xe5\x04\xf1\x04"
+    b"\xf7\x04\x00\x05\x06\x05\x0f\x05\x1e\x05@\x05X\x05^\x05j\x05\x82\x05\xad\x05\xee\x057\x06~\x06\x9b\x06\xad\x06"
+    b"\xc8\x06\xcf\x06\xd5\x06\xe4\x06\xf0\x06\x0c\x07\x18\x07$\x07<\x07H\x07T\x07i\x07p\x07|\x07\x85\x07\xa6\x07"
+    b"\xc6\x07\xd1\x07\xe8\x07\xf3\x07\xfe\x07\x1b\x08'\x08.\x08:\x08\x80\x08\x8c\x08\x9b\x08\x9e\x08\xaa\x08\xb0\x08\xbc\x08"
+    b'\xcf\x08\xdb\x08\xea\x08\xf6\x08\xf8\x08\x04\t\n\t\x16\t"\t=\tI\t[\tp\t}\t\x83\t\x8f\t'
+    b"\x98\t\x9e\t\xad\t\xca\t\xd4\t\xda\t\x19\n\x1c\n#\n,\n0\n6\nE\nQ\n\x84\n\x94\n"
+    b"\xa7\n\xb6\n\xbf\n\xd7\n\xf2\n\n\x0b%\x0b1\x0b=\x0bC\x0bI\x0bO\x0bV\x0b`\x0bm\x0b\x7f\x0b"
+    b"\x88\x0b\xa7\x0b\xb4\x0b\xcf\x0b\xd5\x0b\xe1\x0b\xf4\x0b\xf7\x0b\x06\x0c\x1b\x0c%\x0c+\x0c4\x0c@\x0cI\x0c^\x0c"
+    b"k\x0c\x9c\x0c\xa8\x0c\xae\x0c\xb9\x0c\xc5\x0c\xcf\x0c\xdc\x0c\xeb\x0c\xfd\x0c@\rF\rY\rh\r\x86\r\x92\r"
+    b"\x9e\r\xa8\r\xae\r\xbc\r\xd1\r\xe6\r\xf8\r\n\x0e\x1f\x0e(\x0e1\x0eR\x0e[\x0eg\x0ep\x0e|\x0e"
+    b"\x91\x0e\x9a\x0e\xa9\x0e\xaf\x0e\xb8\x0e\xbe\x0e\xc4\x0e\xcb\x0e\xd7\x0e\xe6\x0e\x08\x0f\x1a\x0f>\x0fD\x0f\\\x0fh\x0f"
+    b"\x98\x0f\x9b\x0f\xc4\x0f\xd4\x0f\xde\x0f\xea\x0f\xf0\x0f\x04\x10\x18\x10)\x10K\x10[\x10n\x10\x7f\x10\x85\x10\x91\x10"
+    b"\xa8\x10\xbd\x10\xcf\x10\xf0\x10\t\x11\x15\x11!\x11'\x11<\x11I\x11g\x11m\x11\x8a\x11\xa2\x11\xac\x11\xb8\x11"
+    b"\xbe\x11\xca\x11\xd3\x11\xd9\x11\xe8\x11\xf5\x11\x04\x12\x0b\x12\x17\x12%\x12.\x124\x12;\x12T\x12j\x12v\x12"
+    b"|\x12\x88\x12\x99\x12\xab\x12\xba\x12\xca\x12\xd0\x12\xd3\x12\xe5\x12\xf2\x12\x0c\x13(\x13E\x13S\x13\\\x13n\x13"
+    b"\x8c\x13\xa7\x13\xb1\x13\xc3\x13\xca\x13\xd0\x13\xd6\x13\xdc\x13\x15\x14!\x14'\x143\x14<\x14K\x14d\x14p\x14"
+    b"v\x14|\x14\x8c\x14\xa4\x14\xb4\x14\xcd\x14\xf4\x14\xfd\x14\x12\x15,\x15M\x15T\x15`\x15}\x15\x89\x15\x8f\x15"
+    b"\x9e\x15\xa8\x15\xb1\x15\xc3\x15\xcf\x15\xdb\x15\xe7\x15\xed\x15\xf9\x15\x0e\x162\x16Q\x16X\x16[\x16a\x16m\x16"
+    b"s\x16v\x16\x82\x16\x97\x16\x9d\x16\xac\x16\xb5\x16\xbe\x16\xc7\x16\xd6\x16\xdd\x16\xed\x16\xf9\x16\x05\x17\x0b\x17\x1c\x17"
+    b".\x177\x17@\x17I\x17[\x17d\x17j\x17\x89\x17"
+    b"% \xe7\x9a\x84\xe9\x87\x91\xe9\xa2\x9d."
+    b"%d \xe4\xb8\xaa\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81, \xe6\xaf\x8f\xe8\xbd\xae %d \xe7\xa7\x92"
+    b"%d \xe4\xb8\xaa\xe5\x9c\xb0\xe5\x9d\x80\xe5\xb1\x9e\xe4\xba\x8e\xe6\xad\xa4\xe9\x92\xb1\xe5\x8c\x85(\xe5\x85\xb1 %d \xe4\xb8\xaa)"
+    b"%d/%d \xe5\xa4\x9a\xe7\xad\xbe"
+    b"%d\xe5\x88\xb0%d"
+    b"%s\xe4\xbd\x8d (%s\xe4\xbd\x8d/\xe5\x83\x8f\xe7\xb4\xa0\xef\xbc\x89"
+    b"\xe5\xb7\xb2\xe7\xa7\xbb\xe9\x99\xa4%s"
+    b"%s :\xe5\xb7\xb2\xe5\x8a\xa0\xe8\xbd\xbd!"
+    b"\xef\xbc\x88\xe5\xae\x9e\xe9\xaa\x8c\xe6\x80\xa7\xef\xbc\x89"
+    b"\xef\xbc\x88\xe4\xbb\x85\xe8\xa7\x82\xe5\xaf\x9f\xef\xbc\x89"
+    b"12 \xe5\x8d\x95\xe8\xaf\x8d"
+    b"24 \xe5\x8d\x95\xe8\xaf\x8d"
+    b"\xe5\x85\xb3\xe4\xba\x8e"
+    b"\xe6\x8e\xa5\xe5\x8f\x97\xe5\x81\x87\xe8\xae\xbe\xef\xbc\x9f"
+    b"\xe8\xb4\xa6\xe6\x88\xb7"
+    b"\xe5\xb0\x86\xe5\x81\x87\xe5\xae\x9a\xe4\xb8\xba\xe8\xb4\xa6\xe6\x88\xb7 #0"
+    b"\xe8\xb4\xa6\xe6\x88\xb7\xe7\xb4\xa2\xe5\xbc\x95"
+    b"\xe6\xb7\xbb\xe5\x8a\xa0\xe6\x88\x96\xe6\x9b\xb4\xe6\x94\xb9\xe9\x92\xb1\xe5\x8c\x85\xe5\xaf\x86\xe7\xa0\x81\xef\xbc\x9f"
+    b"%s\xe9\x9c\x80\xe8\xa6\x81\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe9\xa2\x9d\xe5\xa4\x96\xe7\x86\xb5"
+    b"\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe5\x9c\xb0\xe5\x9d\x80\xe7\xb4\xa2\xe5\xbc\x95"
+    b"\xe6\xad\xa3\xe7\xa1\xae\xe5\xaf\xb9\xe9\xbd\x90\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe5\x92\x8c\xe8\x83\x8c\xe6\x9d\xbf."
+    b"\xe9\x98\xb2\xe9\x97\xaa\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"\xe7\x95\x8c\xe9\x9d\xa2"
+    b"\xe7\xa1\xae\xe5\xae\x9a\xef\xbc\x9f"
+    b"BGR \xe9\xa2\x9c\xe8\x89\xb2"
+    b"BIP39\xe5\x8a\xa9\xe8\xae\xb0\xe7\xac\xa6"
+    b"\xe8\xbf\x94\xe5\x9b\x9e"
+    b"\xe8\xbf\x94\xe5\x9b\x9e\xe8\x8f\x9c\xe5\x8d\x95"
+    b"\xe5\xa4\x87\xe4\xbb\xbd\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe7\xad\xbe\xe5\x90\x8d\xe6\x97\xa0\xe6\x95\x88"
+    b"Base64\xe5\xaf\x86\xe7\xa0\x81"
+    b"\xe6\xb3\xa2\xe7\x89\xb9\xe7\x8e\x87"
+    b"\xe4\xba\x8c\xe8\xbf\x9b\xe5\x88\xb6\xe7\xbd\x91\xe6\xa0\xbc"
+    b"\xe8\xbe\xb9\xe6\xa1\x86\xe5\xa1\xab\xe5\x85\x85"
+    b"\xe4\xba\xae\xe5\xba\xa6"
+    b"\xe6\x8c\x89\xe9\x92\xae"
+    b"\xe6\x8c\x89\xe9\x92\xae\xe5\x8e\xbb\xe6\x8a\x96\xe5\x8a\xa8"
+    b"\xe7\xbc\x93\xe5\xad\x98\xe6\x8f\x8f\xe8\xbf\xb0"
+    b"\xe6\x88\xaa\xe5\x8f\x96\xe5\xb7\xb2\xe5\x8f\x96\xe6\xb6\x88"
+    b"\xe6\x89\xbe\xe9\x9b\xb6"
+    b"\xe6\x9b\xb4\xe6\x94\xb9\xe4\xb8\xbb\xe9\xa2\x98\xe5\xb9\xb6\xe9\x87\x8d\xe6\x96\xb0\xe5\x90\xaf\xe5\x8a\xa8\xef\xbc\x9f"
+    b"\xe6\x89\xbe\xe9\x9b\xb6:"
+    b"\xe6\x9b\xb4\xe6\x94\xb9\xe5\xb0\x86\xe5\x9c\xa8\xe5\x85\xb3\xe6\x9c\xba\xe5\x89\x8d\xe4\xbf\x9d\xe6\x8c\x81."
+    b"\xe6\xa3\x80\xe6\x9f\xa5\xe5\x9c\xb0\xe5\x9d\x80\xe5\x88\x97\xe8\xa1\xa8"
+    b"\xe6\xa3\x80\xe6\x9f\xa5 SD \xe5\x8d\xa1"
+    b"\xe6\xa3\x80\xe6\x9f\xa5\xe8\xaf\xa5\xe5\x9c\xb0\xe5\x9d\x80\xe6\x98\xaf\xe5\x90\xa6\xe5\xb1\x9e\xe4\xba\x8e\xe6\xad\xa4\xe9\x92\xb1\xe5\x8c\x85\xef\xbc\x9f"
+    b"\xe5\xb7\xb2\xe6\xa3\x80\xe6\x9f\xa5 %d \xe4\xb8\xaa\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d\xe7\x9a\x84\xe5\x9c\xb0\xe5\x9d\x80."
+    b"\xe6\xa3\x80\xe6\x9f\xa5\xe5\x8d\xa1\xe2\x80\xa6"
+    b"\xe7\xa1\xae\xe8\xae\xa4\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe8\xbd\xac\xe6\x8d\xa2\xe5\x9f\xba\xe5\x87\x86"
+    b"\xe6\x97\xa0\xe6\xb3\x95\xe7\xa1\xae\xe5\xae\x9a\xe6\x9b\xb4\xe6\x94\xb9\xe5\x9c\xb0\xe5\x9d\x80."
+    b"\xe5\x88\x9b\xe5\xbb\xba\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe4\xbb\x8e\xe7\x9f\xad\xe4\xbf\xa1\xe5\x88\x9b\xe5\xbb\xba\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xef\xbc\x9f"
+    b"\xe5\xb7\xb2\xe5\x88\x9b\xe5\xbb\xba:"
+    b"\xe5\xbd\x93\xe5\x89\x8d\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe6\x96\x87\xe6\x9c\xac"
+    b"\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89"
+    b"\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe6\x82\xa8\xe7\x9a\x84\xe9\x92\xb1\xe5\x8c\x85\xe5\xb0\x86\xe7\x94\x9f\xe6\x88\x90\xe4\xb8\x80\xe4\xb8\xaa\xe6\x96\xb0\xe7\x9a\x84\xe5\xaf\x86\xe9\x92\xa5\xe5\xb9\xb6\xe5\x8d\xb8\xe8\xbd\xbd\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6."
+    b"\xe5\x88\x87\xe5\x89\xb2\xe6\xb7\xb1\xe5\xba\xa6"
+    b"\xe5\x88\x87\xe5\x89\xb2\xe6\x96\xb9\xe6\xb3\x95"
+    b"\xe5\x9f\xba\xe5\x87\x86\xe5\xb7\xa5\xe5\x85\xb7"
+    b"\xe5\x8d\x81\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe8\xa7\xa3\xe5\xaf\x86\xef\xbc\x9f"
+    b"\xe9\xbb\x98\xe8\xae\xa4\xe9\x92\xb1\xe5\x8c\x85"
+    b"\xe6\x98\xaf\xe5\x90\xa6\xe5\x88\xa0\xe9\x99\xa4\xe6\xad\xa4\xe6\x96\x87\xe4\xbb\xb6\xef\xbc\x9f"
+    b"\xe6\xaf\x8f\xe6\xac\xa1\xe9\x80\x9a\xe8\xbf\x87\xe7\x9a\x84\xe6\xb7\xb1\xe5\xba\xa6"
+    b"\xe6\xba\x90\xe8\xb7\xaf\xe5\xbe\x84"
+    b"\xe5\xaf\xbc\xe5\x87\xbaBIP85\xe7\x86\xb5\xef\xbc\x9f"
+    b"\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe8\xae\xbe\xe5\xa4\x87\xe6\xb5\x8b\xe8\xaf\x95"
+    b"\xe6\x98\xbe\xe7\xa4\xba"
+    b"\xe8\xaf\xb7\xe5\x8b\xbf\xe6\x96\xad\xe7\x94\xb5\xef\xbc\x8c\xe5\x8f\xaf\xe8\x83\xbd\xe9\x9c\x80\xe8\xa6\x81\xe4\xb8\x80\xe6\xae\xb5\xe6\x97\xb6\xe9\x97\xb4\xe5\xae\x8c\xe6\x88\x90."
+    b"\xe5\xae\x8c\xe6\x88\x90\xe8\xbd\xac\xe6\x8d\xa2"
+    b"\xe5\xae\x8c\xe6\x88\x90\xe4\xba\x86\xe5\x90\x97\xef\xbc\x9f"
+    b"\xe5\x8f\x8c\xe9\x87\x8d\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe9\xa9\xb1\xe5\x8a\xa8\xe7\xa8\x8b\xe5\xba\x8f"
+    b"\xe4\xb8\xba\xe7\xa9\xba"
+    b"\xe5\x90\xaf\xe7\x94\xa8\xef\xbc\x9f"
+    b"\xe5\x8a\xa0\xe5\xaf\x86"
+    b"\xe5\xb7\xb2\xe5\x8a\xa0\xe5\xaf\x86"
+    b"\xe5\x8a\xa0\xe5\xaf\x86\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\xb7\xb2\xe5\xad\x98\xe5\x82\xa8\xef\xbc\x8cID \xe4\xb8\xba:"
+    b"\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe6\x9c\xaa\xe5\xad\x98\xe5\x82\xa8"
+    b"\xe5\x8a\xa0\xe5\xaf\x86"
+    b"\xe5\x8a\xa0\xe5\xaf\x86\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"\xe8\xbe\x93\xe5\x85\xa5 %d \xe4\xb8\xaa BIP39 \xe8\xaf\x8d."
+    b"\xe8\xbe\x93\xe5\x85\xa56\xe4\xb8\xaa\xe4\xbb\xa5\xe4\xb8\x8a\xe5\xad\x97\xe7\xac\xa6\xe7\x9a\x84\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe5\xb0\x86 BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c\xe4\xb8\xba 1 \xe5\x88\xb0 2048 \xe7\x9a\x84\xe6\x95\xb0\xe5\xad\x97\xe8\xbe\x93\xe5\x85\xa5."
+    b"\xe5\xb0\x86 BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c\xe4\xb8\xba 1 \xe5\x88\xb0 800 \xe7\x9a\x84\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6\xe6\x95\xb0\xe8\xbe\x93\xe5\x85\xa5."
+    b"\xe5\xb0\x86 BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c\xe4\xb8\xba 1 \xe5\x88\xb0 4000 \xe7\x9a\x84\xe5\x85\xab\xe8\xbf\x9b\xe5\x88\xb6\xe6\x95\xb0\xe8\xbe\x93\xe5\x85\xa5."
+    b"\xe8\xbe\x93\xe5\x85\xa5\xe6\xaf\x8f\xe4\xb8\xaa BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d."
+    b"\xe6\xb8\x85\xe9\x99\xa4\xe7\x94\xa8\xe6\x88\xb7\xe6\x95\xb0\xe6\x8d\xae"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x88\xa0\xe9\x99\xa4\xe7\x94\xa8\xe6\x88\xb7\xe6\x95\xb0\xe6\x8d\xae\xe2\x80\xa6"
+    b"\xe9\x94\x99\xe8\xaf\xaf:"
+    b"\xe9\x80\x80\xe5\x87\xba"
+    b"\xe6\xb5\x8f\xe8\xa7\x88\xe6\x96\x87\xe4\xbb\xb6\xef\xbc\x9f"
+    b"\xe5\xaf\xbc\xe5\x87\xba\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\xb0\x86%s\xe5\xaf\xbc\xe5\x87\xba\xe5\x88\xb0SD\xe5\x8d\xa1\xe2\x80\xa6"
+    b"\xe6\x89\xa9\xe5\xb1\x95\xe5\x85\xac\xe9\x92\xa5"
+    b"\xe5\x87\xba\xe5\x8e\x82\xe8\xae\xbe\xe7\xbd\xae"
+    b"\xe6\x94\xb6\xe9\x9b\x86\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x86\xb5\xe5\xa4\xb1\xe8\xb4\xa5"
+    b"\xe8\xa7\xa3\xe5\xaf\x86\xe5\xa4\xb1\xe8\xb4\xa5"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xe5\xa4\xb1\xe8\xb4\xa5"
+    b"\xe5\xad\x98\xe5\x82\xa8\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\xa4\xb1\xe8\xb4\xa5"
+    b"\xe8\xb4\xb9\xe7\x94\xa8:"
+    b"\xe8\xbf\x9b\xe7\xbb\x99\xe9\x80\x9f\xe5\xba\xa6"
+    b"\xe6\x96\x87\xe4\xbb\xb6\xe5\x90\x8d"
+    b"\xe6\x96\x87\xe4\xbb\xb6\xe5\x90\x8d %s \xe5\xad\x98\xe5\x9c\xa8\xe4\xba\x8e SD \xe5\x8d\xa1\xe4\xb8\x8a."
+    b"\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe7\x86\xb5\xe5\xa1\xab\xe5\x85\x85Flash\xef\xbc\x9f"
+    b"\xe5\xa1\xab\xe5\x85\x85Flash"
+    b"PSBT \xe4\xb8\xad\xe6\x9c\xaa\xe8\xae\xbe\xe7\xbd\xae\xe6\x8c\x87\xe7\xba\xb9"
+    b"Flash\xe5\x9c\xb0\xe5\x9b\xbe"
+    b"Flash\xe5\xb7\xa5\xe5\x85\xb7"
+    b"Flash\xe5\xb7\xb2\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x86\xb5\xe5\xa1\xab\xe5\x85\x85"
+    b"\xe5\x88\x80\xe5\x85\xb7\xe7\x9b\xb4\xe5\xbe\x84"
+    b"\xe7\xa9\xba\xe9\x97\xb2:"
+    b"\xe4\xbb\x8e\xe5\xad\x98\xe5\x82\xa8\xe4\xb8\xad"
+    b"\xe5\x9c\xa8\xe5\x85\xb6\xe4\xbb\x96\xe8\xae\xbe\xe5\xa4\x87\xe4\xb8\xad\xe5\xae\x8c\xe5\x85\xa8\xe6\x93\xa6\xe9\x99\xa4\xe6\x82\xa8\xe7\x9a\x84 SD \xe5\x8d\xa1\xe4\xbb\xa5\xe7\xa1\xae\xe4\xbf\x9d\xe6\x95\xb0\xe6\x8d\xae\xe4\xb8\x8d\xe5\x8f\xaf\xe6\x81\xa2\xe5\xa4\x8d"
+    b"\xe9\x97\xb4\xe9\x9a\x94\xe9\x99\x90\xe5\x88\xb6"
+    b"\xe7\x94\x9f\xe6\x88\x90\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe5\x8e\xbb"
+    b"\xe8\x89\xaf\xe5\xa5\xbd\xe7\x9a\x84\xe7\x86\xb5"
+    b"\xe7\xa1\xac\xe4\xbb\xb6"
+    b"\xe5\xa4\xb4\xe9\x83\xa8\xe7\xb1\xbb\xe5\x9e\x8b"
+    b"\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6\xe5\x85\xac\xe9\x92\xa5:"
+    b"\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe9\x9a\x90\xe8\x97\x8f\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe9\xab\x98\xe8\xb4\xb9\xe7\x94\xa8\xef\xbc\x81"
+    b"ID"
+    b"ID \xe5\xb7\xb2\xe5\xad\x98\xe5\x9c\xa8"
+    b"\xe7\xb4\xa2\xe5\xbc\x95"
+    b"\xe8\xbe\x93\xe5\x85\xa5 (%d):"
+    b"\xe7\x86\xb5\xe4\xb8\x8d\xe8\xb6\xb3\xef\xbc\x81"
+    b"\xe6\x97\xa0\xe6\x95\x88\xe7\x9a\x84\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe6\x97\xa0\xe6\x95\x88\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe6\x97\xa0\xe6\x95\x88\xe7\x9a\x84\xe6\xba\x90\xe8\xb7\xaf\xe5\xbe\x84"
+    b"\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe9\x95\xbf\xe5\xba\xa6\xe6\x97\xa0\xe6\x95\x88"
+    b"\xe6\x97\xa0\xe6\x95\x88\xe9\x92\xb1\xe5\x8c\x85:"
+    b"\xe5\x8f\x8d\xe8\xbd\xac"
+    b"\xe5\x8f\x8d\xe8\xbd\xac\xe9\xa2\x9c\xe8\x89\xb2"
+    b"KEF\xe5\x8a\xa0\xe5\xaf\x86"
+    b"\xe5\xaf\x86\xe9\x92\xa5"
+    b"\xe6\x9c\xaa\xe6\x8f\x90\xe4\xbe\x9b\xe5\xaf\x86\xe9\x92\xa5"
+    b"Krux \xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe6\xb5\x8b\xe8\xaf\x95\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"LCD \xe7\xb1\xbb\xe5\x9e\x8b"
+    b"\xe8\xaf\xad\xe8\xa8\x80"
+    b"\xe5\xa6\x82\xe6\x9e\x9c\xe5\xb8\x8c\xe6\x9c\x9b Krux \xe8\x87\xaa\xe5\x8a\xa8\xe8\xae\xa1\xe7\xae\x97\xe6\x9c\x80\xe5\x90\x8e\xe4\xb8\x80\xe4\xbd\x8d Checksum\xef\xbc\x8c\xe8\xaf\xb7\xe7\x95\x99\xe7\xa9\xba"
+    b"\xe5\xb7\xa6"
+    b"\xe9\x95\xbf\xe5\xba\xa6:"
+    b"\xe8\xa1\x8c\xe5\xbb\xb6\xe8\xbf\x9f"
+    b"\xe8\xa1\x8c:"
+    b"\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x92\xb1\xe5\x8c\x85"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xe5\x8f\x97\xe4\xbf\xa1\xe4\xbb\xbb\xe7\x9a\x84\xe9\x92\xb1\xe5\x8c\x85\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe4\xbb\xa5\xe6\x9f\xa5\xe7\x9c\x8b\xe5\x9c\xb0\xe5\x9d\x80\xef\xbc\x9f"
+    b"\xe4\xbb\x8e SD \xe5\x8d\xa1\xe5\x8a\xa0\xe8\xbd\xbd"
+    b"\xe4\xbb\x8e SD \xe5\x8d\xa1\xe5\x8a\xa0\xe8\xbd\xbd\xef\xbc\x9f"
+    b"\xe4\xbb\x8e\xe7\x9b\xb8\xe6\x9c\xba\xe5\x8a\xa0\xe8\xbd\xbd"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xef\xbc\x9f"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe2\x80\xa6"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x9b\xb4\xe6\x94\xb9\xe5\x9c\xb0\xe5\x9d\x80\xe2\x80\xa6"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe2\x80\xa6"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x8e\xa5\xe6\x94\xb6\xe5\x9c\xb0\xe5\x9d\x80\xe2\x80\xa6"
+    b"\xe5\x8a\xa0\xe8\xbd\xbd\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe8\xaf\xad\xe8\xa8\x80\xe7\x8e\xaf\xe5\xa2\x83"
+    b"\xe4\xbd\x8d\xe7\xbd\xae"
+    b"\xe4\xb8\xad\xe7\xad\x89"
+    b"\xe6\xb6\x88\xe6\x81\xaf"
+    b"\xe6\xb6\x88\xe6\x81\xaf:"
+    b"Miniscript"
+    b"\xe9\x95\x9c\xe5\x83\x8fX\xe5\x9d\x90\xe6\xa0\x87"
+    b"\xe7\xbc\xba\xe5\xb0\x91\xe7\xad\xbe\xe5\x90\x8d\xe6\x96\x87\xe4\xbb\xb6"
+    b"\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\x92\x8c\xe5\xaf\x86\xe7\xa0\x81\xe5\xb0\x86\xe8\xa2\xab\xe4\xbf\x9d\xe7\x95\x99."
+    b"\xe4\xbf\xae\xe6\x94\xb9\xe6\x97\xb6\xe9\x97\xb4:"
+    b"\xe5\x81\x87\xe5\xae\x9a\xe4\xb8\xba\xe5\x8e\x9f\xe7\x94\x9f Segwit - 84"
+    b"\xe7\xbd\x91\xe7\xbb\x9c"
+    b"\xe6\x96\xb0\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0\xe6\x96\xb0\xe5\x9b\xba\xe4\xbb\xb6."
+    b"\xe5\x90\xa6"
+    b"\xe6\x97\xa0 Passphrase "
+    b"\xe6\x8a\x95\xe6\x8e\xb7\xe6\xac\xa1\xe6\x95\xb0\xe4\xb8\x8d\xe8\xb6\xb3\xef\xbc\x81"
+    b"\xe6\x9c\xaa\xe6\x89\xbe\xe5\x88\xb0:"
+    b"\xe6\x95\xb0\xe5\xad\x97"
+    b"\xe5\x85\xab\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe5\x85\xb6\xe4\xbb\x96\xe6\xa0\xbc\xe5\xbc\x8f"
+    b"\xe8\xa6\x86\xe7\x9b\x96\xef\xbc\x9f"
+    b"\xe5\x88\x87\xe6\x8d\xa2\xe4\xba\xae\xe5\xba\xa6\xe7\x9a\x84\xe9\xa1\xb5\xe9\x9d\xa2"
+    b"PBKDF2\xe8\xbf\xad\xe4\xbb\xa3."
+    b"\xe5\xb0\x86\xe6\x89\x93\xe5\xad\x94\xe7\x82\xb9\xe6\xb6\x82\xe9\xbb\x91\xef\xbc\x8c\xe4\xbb\xa5\xe4\xbe\xbf\xe5\xae\x83\xe4\xbb\xac\xe8\x83\xbd\xe8\xa2\xab\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0."
+    b"\xe7\xba\xb8\xe5\xbc\xa0\xe5\xae\xbd\xe5\xba\xa6"
+    b"\xe9\x83\xa8\xe5\x88\x86"
+    b"N\xe7\x9a\x84M\xe9\x83\xa8\xe5\x88\x86"
+    b"\xe9\x83\xa8\xe4\xbb\xb6\xe5\xb0\xba\xe5\xaf\xb8"
+    b"Passphrase"
+    b"\xe5\xaf\x86\xe7\xa0\x81\xe9\x95\xbf\xe5\xba\xa6:"
+    b"\xe8\xb7\xaf\xe5\xbe\x84\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d"
+    b"\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0\xe6\xa8\xa1\xe5\xbc\x8f\xef\xbc\x81"
+    b"\xe4\xbb\x8e Flash \xe4\xb8\xad\xe6\xb0\xb8\xe4\xb9\x85\xe5\x88\xa0\xe9\x99\xa4\xe6\x89\x80\xe6\x9c\x89\xe5\xad\x98\xe5\x82\xa8\xe7\x9a\x84\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\x92\x8c\xe8\xae\xbe\xe7\xbd\xae\xef\xbc\x9f"
+    b"\xe4\xbf\x9d\xe5\xad\x98"
+    b"\xe5\x83\x8f\xe7\xb4\xa0\xe5\x81\x8f\xe5\xb7\xae\xe6\x8c\x87\xe6\x95\xb0:"
+    b"\xe6\x98\x8e\xe6\x96\x87\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe8\xaf\xb7\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6"
+    b"\xe4\xb8\x8b\xe5\x88\x80\xe9\x80\x9f\xe5\xba\xa6"
+    b"\xe6\x94\xbf\xe7\xad\x96\xe7\xb1\xbb\xe5\x9e\x8b"
+    b"\xe7\x86\xb5\xe5\x80\xbc\xe4\xbd\x8e!"
+    b"\xe5\x8a\x9f\xe7\x8e\x87"
+    b"\xe6\x8c\x89PAGE\xe5\x8f\x96\xe6\xb6\x88."
+    b"\xe6\x8c\x89 PAGE \xe5\x88\x87\xe6\x8d\xa2\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe6\xb5\x8b\xe8\xaf\x95\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe6\x89\x93\xe5\x8d\xb0Tinyseed \xef\xbc\x9f"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe5\x88\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe5\x88\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xef\xbc\x9f"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xef\xbc\x9f"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe9\xa9\xb1\xe5\x8a\xa8\xe7\xa8\x8b\xe5\xba\x8f\xe6\x9c\xaa\xe8\xae\xbe\xe7\xbd\xae\xef\xbc\x81"
+    b"\xe6\x89\x93\xe5\x8d\xb0\xe2\x80\xa6"
+    b"\xe7\xbb\xa7\xe7\xbb\xad\xe5\x90\x97\xef\xbc\x9f"
+    b"\xe7\xbb\xa7\xe7\xbb\xad\xef\xbc\x9f"
+    b"\xe5\xa4\x84\xe7\x90\x86\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe5\x8f\xaf\xe8\xaf\x81\xe6\x98\x8e\xe4\xb8\x8d\xe5\x8f\xaf\xe4\xbd\xbf\xe7\x94\xa8"
+    b"\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\xa0\x87\xe7\xad\xbe"
+    b"\xe6\x95\xb0\xe9\x87\x8f"
+    b"RX \xe5\xbc\x95\xe8\x84\x9a"
+    b"\xe9\x87\x8d\xe5\x90\xaf"
+    b"\xe6\x8e\xa5\xe6\x94\xb6"
+    b"\xe5\x8c\xba\xe5\x9f\x9f:"
+    b"\xe5\x88\xa0\xe9\x99\xa4 %s\xef\xbc\x9f"
+    b"\xe5\x88\xa0\xe9\x99\xa4\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe4\xbb\x8e SD \xe5\x8d\xa1\xe4\xb8\xad\xe5\x88\xa0\xe9\x99\xa4\xe5\x9b\xba\xe4\xbb\xb6\xe6\x96\x87\xe4\xbb\xb6\xef\xbc\x9f"
+    b"\xe5\x88\x86\xe8\xbe\xa8\xe7\x8e\x87 - \xe6\xa0\xbc\xe5\xbc\x8f"
+    b"\xe6\x81\xa2\xe5\xa4\x8d\xe5\x87\xba\xe5\x8e\x82\xe8\xae\xbe\xe7\xbd\xae\xe5\xb9\xb6\xe9\x87\x8d\xe6\x96\xb0\xe8\xae\xbe\xe5\xa4\x87\xef\xbc\x9f"
+    b"\xe7\xb5\x90\xe6\x9e\x9c"
+    b"\xe8\xbf\x94\xe5\x9b\x9e\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\x9f\xa5\xe7\x9c\x8b\xe5\x99\xa8"
+    b"\xe5\x86\x8d\xe6\xac\xa1\xe5\xae\xa1\xe6\xa0\xb8"
+    b"\xe8\xaf\xb7\xe6\xa3\x80\xe6\x9f\xa5\xe6\x89\xab\xe6\x8f\x8f\xe7\x9a\x84\xe6\x95\xb0\xe6\x8d\xae\xef\xbc\x8c\xe5\xa6\x82\xe6\x9c\x89\xe5\xbf\x85\xe8\xa6\x81\xe8\xaf\xb7\xe7\xbc\x96\xe8\xbe\x91"
+    b"\xe5\x8f\xb3"
+    b"\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe8\x87\xb3\xe5\xb0\x91 %d \xe6\xac\xa1\xe4\xbb\xa5\xe7\x94\x9f\xe6\x88\x90\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d."
+    b"\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe5\x88\x86\xe5\xb8\x83:"
+    b"\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90:"
+    b"\xe6\x97\x8b\xe8\xbd\xac 180\xc2\xb0"
+    b"SD \xe5\x8d\xa1"
+    b"\xe6\x9c\xaa\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0 SD \xe5\x8d\xa1."
+    b"\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe7\x9a\x84 SHA256:"
+    b"\xe5\xbf\xab\xe7\x85\xa7\xe7\x9a\x84 SHA256:"
+    b"\xe5\xb0\x86\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe5\x9b\xbe\xe5\x83\x8f\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1"
+    b"\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1"
+    b"\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1\xef\xbc\x9f"
+    b"\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1:"
+    b"\xe7\xbc\xa9\xe6\x94\xbe"
+    b"\xe6\x89\xab\xe6\x8f\x8f\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe6\x89\xab\xe6\x8f\x8f BIP39 Passphrase"
+    b"\xe6\x89\xab\xe6\x8f\x8f\xe7\xa7\x81\xe9\x92\xa5\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe6\x89\xab\xe6\x8f\x8f\xe6\x80\xa7\xe8\x83\xbd\xe5\x88\x86\xe6\x9e\x90"
+    b"\xe9\x87\x8d\xe6\x96\xb0\xe6\x89\xab\xe6\x89\xab\xe6\x8f\x8f\xe7\xac\xac 1-12 \xe4\xb8\xaa\xe5\x8d\x95\xe8\xaf\x8d"
+    b"\xe6\x89\xab\xe6\x8f\x8f\xe7\xac\xac 13-24 \xe4\xb8\xaa\xe5\x8d\x95\xe8\xaf\x8d"
+    b"\xe5\xb1\x8f\xe4\xbf\x9d\xe6\x97\xb6\xe9\x97\xb4"
+    b"\xe8\x84\x9a\xe6\x9c\xac\xe7\xb1\xbb\xe5\x9e\x8b"
+    b"\xe5\xae\x89\xe5\x85\xa8"
+    b"\xe8\x87\xaa\xe8\xbd\xac\xe6\x88\x96\xe6\x89\xbe\xe9\x9b\xb6 (%d):"
+    b"\xe8\x87\xaa\xe8\xa1\x8c\xe8\xbd\xac\xe8\xb4\xa6:"
+    b"\xe8\xaf\xb7\xe5\x85\x88\xe8\xae\xbe\xe7\xbd\xae\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe8\xae\xbe\xe7\xbd\xae"
+    b"\xe8\xae\xbe\xe7\xbd\xae\xe5\xad\x98\xe5\x82\xa8\xe5\x9c\xa8 Flash \xe5\x86\x85\xe9\x83\xa8."
+    b"\xe8\xae\xbe\xe7\xbd\xae\xe5\xad\x98\xe5\x82\xa8\xe5\x9c\xa8SD\xe5\x8d\xa1\xe4\xb8\x8a."
+    b"\xe9\xa6\x99\xe5\x86\x9c\xe7\x86\xb5:"
+    b"\xe6\x98\xbe\xe7\xa4\xba\xe5\x9f\xba\xe5\x87\x86"
+    b"\xe5\x85\xb3\xe6\x9c\xba"
+    b"\xe5\x85\xb3\xe6\x9c\xba\xe6\x97\xb6\xe9\x97\xb4"
+    b"\xe5\x85\xb3\xe9\x97\xad\xe2\x80\xa6"
+    b"\xe7\xad\xbe\xe5\x90\x8d"
+    b"\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe7\xad\xbe\xe5\x90\x8d"
+    b" SD \xe5\x8d\xa1\xe7\xad\xbe\xe5\x90\x8d"
+    b"\xe6\x98\xaf\xe5\x90\xa6\xe7\xad\xbe\xe5\x90\x8d\xef\xbc\x9f"
+    b"\xe7\xad\xbe\xe5\x90\x8d:"
+    b"\xe7\xad\xbe\xe5\x90\x8d\xe6\xb6\x88\xe6\x81\xaf"
+    b"\xe5\xb7\xb2\xe7\xad\xbe\xe5\x90\x8d PSBT"
+    b"\xe7\xad\xbe\xe5\x90\x8d\xe2\x80\xa6"
+    b"\xe5\x8d\x95\xe7\xad\xbe"
+    b"\xe5\xa4\xa7\xe5\xb0\x8f:"
+    b"\xe6\x97\xa0\xe6\xb3\x95\xe6\x89\xa7\xe8\xa1\x8c\xe6\x9f\x90\xe4\xba\x9b\xe6\xa3\x80\xe6\x9f\xa5."
+    b"\xe6\x9c\x89\xe4\xba\x9b\xe8\x8a\x82\xe7\x82\xb9\xe6\x9c\xaa\xe7\xa1\xac\xe5\x8c\x96:"
+    b"\xe8\x8a\xb1\xe8\xb4\xb9 (%d):"
+    b"\xe8\x8a\xb1\xe8\xb4\xb9"
+    b"\xe6\xa0\x87\xe5\x87\x86\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"Static  \xe9\x9d\x99\xe6\x80\x81\xef\xbc\x9f"
+    b"\xe6\x9e\x81\xe5\xae\xa2\xe7\xbb\x9f\xe8\xae\xa1\xe6\x95\xb0\xe6\x8d\xae"
+    b"\xe5\xad\x98\xe5\x82\xa8\xe5\x88\xb0 Flash"
+    b"\xe5\xad\x98\xe5\x82\xa8\xe5\x88\xb0 SD \xe5\x8d\xa1"
+    b"\xe5\xbc\xba\xe5\xba\xa6"
+    b"\xe5\xbc\xba"
+    b"\xe6\xbb\x91\xe5\x8a\xa8\xe5\x88\x87\xe6\x8d\xa2\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"TC Flash Hash"
+    b"\xe5\x90\xaf\xe5\x8a\xa8\xe6\x97\xb6\xe7\x9a\x84 TC Flash Hash"
+    b"\xe7\x82\xb9\xe5\x87\xbb\xe6\x88\x96\xe6\x8c\x89\xe4\xb8\x8b ENTER \xe6\x88\xaa\xe5\x9b\xbe"
+    b"\xe7\x82\xb9\xe5\x87\xbb\xe6\x88\x96\xe6\x8c\x89\xe4\xb8\x8b ENTER \xe5\xae\x89\xe8\xa3\x85."
+    b"TR\xe5\x86\x85\xe9\x83\xa8\xe5\xaf\x86\xe9\x92\xa5"
+    b"TX \xe5\xbc\x95\xe8\x84\x9a"
+    b"\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe8\xae\xbe\xe7\xbd\xae\xe6\x88\x90\xe5\x8a\x9f"
+    b"\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d"
+    b"Test Suite"
+    b"\xe6\xb5\x8b\xe8\xaf\x95\xe5\xa5\x97\xe4\xbb\xb6\xe7\xbb\x93\xe6\x9e\x9c"
+    b"\xe6\xb5\x8b\xe8\xaf\x95:"
+    b"\xe6\x96\x87\xe6\x9c\xac"
+    b"\xe4\xb8\xbb\xe9\xa2\x98"
+    b"\xe7\x83\xad\xe6\x95\x8f"
+    b"\xe8\xa6\x81\xe7\xa1\xae\xe4\xbf\x9d\xe6\x95\xb0\xe6\x8d\xae\xe4\xb8\x8d\xe5\x8f\xaf\xe6\x81\xa2\xe5\xa4\x8d\xef\xbc\x8c\xe8\xaf\xb7\xe4\xbd\xbf\xe7\x94\xa8\xe6\x93\xa6\xe9\x99\xa4\xe8\xae\xbe\xe5\xa4\x87\xe5\x8a\x9f\xe8\x83\xbd"
+    b"\xe8\xb0\x83\xe6\x95\xb4\xe4\xba\xae\xe5\xba\xa6"
+    b"\xe5\xb7\xa5\xe5\x85\xb7"
+    b"\xe8\xa7\xa6\xe6\x91\xb8\xe9\x98\x88\xe5\x80\xbc"
+    b"\xe8\xa7\xa6\xe6\x91\xb8\xe5\xb1\x8f"
+    b"\xe5\x86\x8d\xe6\xac\xa1\xe5\xb0\x9d\xe8\xaf\x95\xef\xbc\x9f"
+    b"\xe8\xbe\x93\xe5\x85\xa5 BIP39 Phrasephrase"
+    b"\xe8\xbe\x93\xe5\x85\xa5\xe7\xa7\x81\xe9\x92\xa5"
+    b"\xe6\x92\xa4\xe9\x94\x80"
+    b"\xe5\x8d\x95\xe4\xbd\x8d"
+    b"\xe6\x9b\xb4\xe6\x96\xb0KEF ID \xef\xbc\x9f"
+    b"\xe6\x9b\xb4\xe6\x96\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\xa0\x87\xe7\xad\xbe\xef\xbc\x9f"
+    b"\xe5\x8d\x87\xe7\xba\xa7\xe5\xb7\xb2\xe5\xae\x8c\xe6\x88\x90."
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x91\xe8\x89\xb2\xe8\x83\x8c\xe6\x99\xaf\xe7\x95\x8c\xe9\x9d\xa2."
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe7\x86\xb5\xe5\x88\x9b\xe5\xbb\xba\xe6\x96\xb0\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe5\xbd\x93\xe5\x89\x8d\xe5\x80\xbc"
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x98\xe8\xae\xa4\xe6\xa8\xa1\xe5\xbc\x8f\xef\xbc\x9f"
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x98\xe8\xae\xa4PBKDF2\xe8\xbf\xad\xe4\xbb\xa3.?"
+    b"\xe4\xbd\xbf\xe7\x94\xa8\xe6\x8c\x87\xe7\xba\xb9\xe4\xbd\x9c\xe4\xb8\xba\xe8\xba\xab\xe4\xbb\xbd\xe8\xaf\x81\xe4\xbb\xb6\xef\xbc\x9f"
+    b"\xe5\xb7\xb2\xe7\x94\xa8:"
+    b"\xe7\x94\xa8\xe6\x88\xb7\xe6\x95\xb0\xe6\x8d\xae"
+    b"\xe5\x80\xbc %s \xe8\xb6\x85\xe5\x87\xba\xe8\x8c\x83\xe5\x9b\xb4:[ %s,%s ]"
+    b"\xe9\xaa\x8c\xe8\xaf\x81\xe4\xb8\xad\xe2\x80\xa6"
+    b"\xe7\x89\x88\xe6\x9c\xac"
+    b"\xe9\x80\x9a\xe8\xbf\x87\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4"
+    b"\xe9\x80\x9a\xe8\xbf\x87 D20"
+    b"\xe9\x80\x9a\xe8\xbf\x87 D6"
+    b"\xe9\x80\x9a\xe8\xbf\x87\xe6\x89\x8b\xe5\x8a\xa8\xe8\xbe\x93\xe5\x85\xa5"
+    b"\xe9\x80\x9a\xe8\xbf\x87\xe5\x8d\x95\xe8\xaf\x8d"
+    b"\xe5\x8f\xaf\xe8\xa7\x81\xe6\xa0\x87\xe7\xad\xbe"
+    b"\xe7\xad\x89\xe5\xbe\x85\xe6\x88\xaa\xe5\x8f\x96"
+    b"\xe9\x92\xb1\xe5\x8c\x85"
+    b"\xe9\x92\xb1\xe5\x8c\x85\xe6\x8f\x8f\xe8\xbf\xb0"
+    b"\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6"
+    b"\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x87\x8d\xe5\xa4\x8d\xef\xbc\x81"
+    b"\xe6\x9c\xaa\xe6\x89\xbe\xe5\x88\xb0\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6."
+    b"\xe8\xad\xa6\xe5\x91\x8a:"
+    b"\xe5\xbc\xb1"
+    b"\xe8\xaf\x8d %d"
+    b"\xe5\x8d\x95\xe8\xaf\x8d\xe5\xba\x8f\xe5\x8f\xb7"
+    b"\xe5\x8d\x95\xe8\xaf\x8d"
+    b"\xe6\x98\xaf"
+    b"\xe6\x94\xbe\xe5\xa4\xa7\xe6\xa8\xa1\xe5\xbc\x8f"
+    b"\xe4\xba\x8c\xe8\xbf\x9b\xe5\x88\xb6\xef\xbc\x9a {}\xe5\xad\x97\xe8\x8a\x82"
+    b"\xe5\xa4\xb1\xe8\xb4\xa5"
+    b"\xe4\xbb\x8e\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe4\xbb\x8ebase32"
+    b"\xe4\xbb\x8ebase43"
+    b"\xe4\xbb\x8ebase64"
+    b"\xe4\xbb\x8e\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe4\xbb\x8eutf8"
+    b" \xe9\x9d\x9e\xe6\x9c\x89\xe6\x95\x88\xe5\x9c\xb0\xe5\x9d\x80"
+    b"\xe7\xa7\xbb\xe4\xbd\x8d\xe6\xa1\x88\xe4\xbe\x8b"
+    b"\xe6\x88\x90\xe5\x8a\x9f\xe7\x8e\x87\xef\xbc\x9a"
+    b"\xe6\xbb\x91\xe5\x8a\xa8"
+    b"text: {}\xe4\xb8\xaa\xe5\xad\x97\xe7\xac\xa6"
+    b"\xe6\x88\x90\xe4\xb8\xba\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6"
+    b"\xe5\x88\xb0base32"
+    b"\xe5\x88\xb0base43"
+    b"\xe5\x88\xb0base64"
+    b"\xe6\x88\x90\xe4\xb8\xba\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6"
+    b"to_utf8()"
+    b"\xe6\x9c\xaa\xe7\x9f\xa5"
+    b"\xe5\x9c\xa8\xe5\x89\x8d %d \xe4\xb8\xaa\xe5\x9c\xb0\xe5\x9d\x80\xe4\xb8\xad\xe6\x9c\xaa\xe6\x89\xbe\xe5\x88\xb0"
+)
@@ -23,7 +23,8 @@ from embit.descriptor.descriptor import Descriptor
 from embit.descriptor.arguments import Key
 from embit.networks import NETWORKS
 from embit.bip32 import HARDENED_INDEX
-from .krux_settings import t
+from .krux_settings import t, Settings
+from .address_index import AddressIndex
 from .qr import FORMAT_BBQR, FORMAT_NONE
 from .key import (
     P2PKH,
@@ -57,6 +58,8 @@ class Wallet:
         self.policy = None
         self.persisted = False
         self._network = None
+        self._branch_descriptors = {}
+        self._address_indexes = {}
         if self.key and self.key.policy_type == TYPE_SINGLESIG:
             if self.key.script_type == P2PKH:
                 self.descriptor = Descriptor.from_string(
@@ -177,6 +180,8 @@ class Wallet:
         self.wallet_data = wallet_data
         self.wallet_qr_format = qr_format
         self.descriptor = to_unambiguous_descriptor(descriptor)
+        self._branch_descriptors = {}
+        self._address_indexes = {}
         self.label = label
         if self.descriptor.key and not self.descriptor.taptree:
             if not self.label:
@@ -241,6 +246,98 @@ class Wallet:
                 "miniscript": miniscript_type,
             }
 
+    def _cache_mac(self, payload):
+        """Returns the MAC authenticating a descriptor cache payload for this key,
+        keyed by a secret derived from the master key so it can't be forged"""
+        import hashlib
+        import hmac
+
+        secret = hashlib.sha256(b"descriptor cache" + self.key.root.secret).digest()
+        return hmac.new(secret, payload.encode(), digestmod="sha256").hexdigest()
+
+    def _cache_key_id(self):
+        """Returns what, besides the fingerprint, the cached descriptor was
+        validated against"""
+        return [self.key.policy_type, self.key.script_type, self.key.derivation]
+
+    def save_cache(self):
+        """Stores the loaded descriptor, already validated against the key, to be
+        restored on the next login. Returns True if it was stored"""
+        if not Settings().security.cache_descriptor:
+            delete_descriptor_cache()
+            return False
+        if not self.key:
+            return False
+
+        import ujson as json
+
+        wallet_data = self.wallet_data
+        is_bytes = isinstance(wallet_data, bytes)
+        try:
+            if is_bytes:
+                wallet_data = wallet_data.decode()
+            if not isinstance(wallet_data, str):
+                # UR objects are not cached
+                return False
+            payload = json.dumps(
+                {
+                    "fingerprint": self.key.fingerprint_hex_str(),
+                    "key": self._cache_key_id(),
+                    "descriptor": descriptor_cache_form(self.descriptor),
+                    "label": self.label,
+                    "policy": self.policy,
+                    "wallet_data": wallet_data,
+                    "bytes": is_bytes,
+                    "qr_format": self.wallet_qr_format,
+                    "persisted": self.persisted,
+                }
+            )
+            with open(_descriptor_cache_path(), "w") as f:
+                f.write(self._cache_mac(payload) + "\n" + payload)
+        except:
+            return False
+        return True
+
+    def load_cache(self):
+        """Restores the descriptor cached for this key, skipping wallet format
+        detection, base58 parsing, key version conversion and the checks made when
+        it was cached. Returns False if there is no valid cache, so it must be
+        loaded as usual"""
+        if not Settings().security.cache_descriptor:
+            # A cache left from when the setting was enabled must not be restored
+            delete_descriptor_cache()
+            return False
+        if not self.key:
+            return False
+
+        import ujson as json
+
+        try:
+            with open(_descriptor_cache_path(), "r") as f:
+                mac, payload = f.read().split("\n", 1)
+            if mac != self._cache_mac(payload):
+                return False
+            cache = json.loads(payload)
+            if (
+                cache["fingerprint"] != self.key.fingerprint_hex_str()
+                or cache["key"] != self._cache_key_id()
+            ):
+                return False
+            descriptor = descriptor_from_cache_form(*cache["descriptor"])
+        except:
+            return False
+
+        wallet_data = cache["wallet_data"]
+        self.wallet_data = wallet_data.encode() if cache["bytes"] else wallet_data
+        self.wallet_qr_format = cache["qr_format"]
+        self.descriptor = descriptor
+        self._branch_descriptors = {}
+        self._address_indexes = {}
+        self.label = cache["label"]
+        self.policy = cache["policy"]
+        self.persisted = cache["persisted"]
+        return True
+
     def wallet_qr(self):
         """Returns the original wallet data and qr format for display back as a QR code"""
         if self.wallet_qr_format == FORMAT_BBQR:
@@ -258,23 +355,129 @@ class Wallet:
         """Returns an iterator deriving addresses (default branch_index is receive)
         for the wallet up to the provided limit"""
 
+        network = NETWORKS[self.which_network()]
+        for script_pubkey in self.obtain_script_pubkeys(i, limit, branch_index):
+            yield script_pubkey.address(network=network)
+
+    def obtain_script_pubkeys(self, i=0, limit=None, branch_index=0):
+        """Returns an iterator deriving scriptPubKeys for the wallet up to the
+        provided limit, extending the address index if it is enabled"""
+
         if self.descriptor is None:
             raise ValueError("No descriptor to derive addresses from")
 
         starting_index = i
+        descriptor = self.branch_descriptor(branch_index)
+        address_index = self.address_index(branch_index)
 
         while limit is None or i < starting_index + limit:
-            yield self.descriptor.derive(i, branch_index=branch_index).address(
-                network=NETWORKS[self.which_network()]
-            )
+            script_pubkey = descriptor.derive(i).script_pubkey()
+            if address_index is not None:
+                address_index.append(i, script_pubkey)
+            yield script_pubkey
             i += 1
 
+    def branch_descriptor(self, branch_index=0):
+        """Returns the descriptor with its keys already derived to branch_index,
+        cached so each address costs a single child derivation per key"""
+        if branch_index not in self._branch_descriptors:
+            self._branch_descriptors[branch_index] = derive_branch(
+                self.descriptor, branch_index
+            )
+        return self._branch_descriptors[branch_index]
+
+    def address_index(self, branch_index=0):
+        """Returns the persisted address index of branch_index, or None if
+        address indexing is disabled in settings"""
+        if not Settings().security.address_index:
+            return None
+        if branch_index not in self._address_indexes:
+            self._address_indexes[branch_index] = AddressIndex(
+                self.descriptor, branch_index
+            )
+        return self._address_indexes[branch_index]
+
     def has_change_addr(self):
         """Returns if this wallet knows how to derive its change addresses"""
 
         return self.descriptor.num_branches > 1
 
 
+def _descriptor_cache_path():
+    from .settings import Store, DESCRIPTOR_CACHE_FILE
+
+    return Store.get_vfs_location(Settings().persist.location) + DESCRIPTOR_CACHE_FILE
+
+
+def delete_descriptor_cache():
+    """Removes the cached descriptor, if there is one"""
+    import os
+
+    try:
+        os.remove(_descriptor_cache_path())
+    except:
+        pass
+
+
+def descriptor_cache_form(descriptor):
+    """Returns the descriptor as a template, with each extended public key
+    replaced by its bare public key, and the serialized keys to put back, so it
+    can be restored without base58 decoding and re-encoding every key
+    """
+    from binascii import hexlify
+    from embit.bip32 import HDKey
+
+    text = str(descriptor)
+    template = ""
+    keys = []
+    pos = 0
+    for key in descriptor.keys:
+        if not isinstance(key.key, HDKey) or key.key.is_private:
+            raise ValueError("only extended public keys can be cached")
+        key_text = str(key)
+        start = text.index(key_text, pos)
+        template += text[pos:start] + hexlify(key.key.sec()).decode()
+        pos = start + len(key_text)
+        keys.append(
+            [
+                str(key.origin) if key.origin else None,
+                hexlify(key.key.serialize()).decode(),
+                str(key.allowed_derivation)[1:] if key.allowed_derivation else None,
+            ]
+        )
+    return template + text[pos:], keys
+
+
+def descriptor_from_cache_form(template, keys):
+    """Rebuilds a descriptor from descriptor_cache_form() output. Keys are
+    trusted as they were already validated when cached"""
+    from binascii import unhexlify
+    from embit.bip32 import HDKey
+    from embit.ec import PublicKey
+    from embit.descriptor.arguments import KeyOrigin, AllowedDerivation
+
+    descriptor = Descriptor.from_string(template)
+    if len(descriptor.keys) != len(keys):
+        raise ValueError("cached keys don't match the descriptor")
+    for arg, (origin, data, derivation) in zip(descriptor.keys, keys):
+        data = unhexlify(data)
+        # Skips HDKey.__init__, which base58 encodes the key to check its version
+        hdkey = HDKey.__new__(HDKey)
+        hdkey.version = data[:4]
+        hdkey.depth = data[4]
+        hdkey.fingerprint = data[5:9]
+        hdkey.child_number = int.from_bytes(data[9:13], "big")
+        hdkey.chain_code = data[13:45]
+        hdkey.key = PublicKey.parse(data[45:])
+        hdkey._my_fingerprint = b""
+        arg.key = hdkey
+        arg.origin = KeyOrigin.from_string(origin) if origin else None
+        arg.allowed_derivation = (
+            AllowedDerivation.from_string(derivation) if derivation else None
+        )
+    return descriptor
+
+
 def to_unambiguous_descriptor(descriptor):
     """If child derivation info is missing to generate receive addresses,
     use the default scheme
@@ -293,6 +496,35 @@ def to_unambiguous_descriptor(descriptor):
     return descriptor
 
 
+def derive_branch(descriptor, branch_index):
+    """Returns a copy of the descriptor for a single branch, with the fixed
+    derivation steps before the wildcard already applied to its keys
+    """
+    from embit.descriptor.arguments import AllowedDerivation, KeyOrigin
+
+    branch = descriptor.branch(branch_index)
+    for key in branch.keys:
+        if key.allowed_derivation is None or not key.is_extended:
+            continue
+        prefix = []
+        for index in key.allowed_derivation.indexes:
+            if index is None:
+                break
+            prefix.append(index)
+        if not prefix:
+            continue
+        if key.origin:
+            key.origin = KeyOrigin(
+                key.origin.fingerprint, key.origin.derivation + prefix
+            )
+        else:
+            key.origin = KeyOrigin(key.key.my_fingerprint, prefix)
+        key.key = key.key.derive(prefix)
+        rest = key.allowed_derivation.indexes[len(prefix) :]
+        key.allowed_derivation = AllowedDerivation(rest) if rest else None
+    return branch
+
+
 def parse_key_value_file(wallet_data):
     """Tries to parse data as a key-value file"""
     key_vals = []
@@ -485,6 +717,29 @@ def parse_address(address_data):
     return addr
 
 
+def parse_address_list(data):
+    """Returns the distinct addresses found in a list separated by new lines,
+    commas, semicolons or spaces (as in exported CSV files), in their original
+    order. Entries that are not addresses, like indexes or headers, are skipped.
+    """
+    for separator in ",;\r\t ":
+        data = data.replace(separator, "\n")
+
+    addresses = []
+    seen = set()
+    for entry in data.split("\n"):
+        if not entry:
+            continue
+        try:
+            addr = parse_address(entry)
+        except:
+            continue
+        if addr not in seen:
+            seen.add(addr)
+            addresses.append(addr)
+    return addresses
+
+
 def version_to_network_versiontype(hdkey_version):
     """returns embit.networks.NETWORKS[network][versiontype] keys
     based on HDKey's version bytes"""
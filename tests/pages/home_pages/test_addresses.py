@@ -374,6 +374,7 @@ def test_list_disable_change_address(mocker, m5stickv, tdata):
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit menu
         BUTTON_PAGE,  # move to export
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -406,6 +407,7 @@ def test_scan_disable_change_address(mocker, m5stickv, tdata):
         BUTTON_ENTER,  # exit menu
         BUTTON_PAGE,  # move to list addr
         BUTTON_PAGE,  # move to export addr
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -434,6 +436,7 @@ def test_export_disabled(mocker, m5stickv, tdata):
         BUTTON_PAGE,  # move to list addr
         BUTTON_PAGE,  # move to export addr
         BUTTON_ENTER,  # click export (nothing happen - disabled)
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -464,6 +467,7 @@ def test_export_disable_change_address(mocker, m5stickv, tdata):
         BUTTON_ENTER,  # click change addr to enter (nothing happen - disabled)
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit menu
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -527,6 +531,7 @@ def test_export_address(mocker, m5stickv, tdata):
         BUTTON_ENTER,  # enter confirm quantity 50
         BUTTON_PAGE_PREV,  # move to go
         BUTTON_ENTER,  # enter confirm filename Receive-fingerprint
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -571,6 +576,7 @@ def test_export_address_fail(mocker, m5stickv, tdata):
         BUTTON_ENTER,  # enter confirm quantity 50
         BUTTON_PAGE_PREV,  # move to go
         BUTTON_ENTER,  # enter confirm filename Receive-fingerprint (will fail - SD card not detected)
+        BUTTON_PAGE,  # move to check address list
         BUTTON_PAGE,  # move to back
         BUTTON_ENTER,  # exit screen
     ]
@@ -593,6 +599,73 @@ def test_export_address_fail(mocker, m5stickv, tdata):
     assert ctx.input.wait_for_button.call_count == len(btn_seq)
 
 
+def test_check_address_list(mocker, m5stickv, tdata):
+    from krux.pages.home_pages.addresses import Addresses
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE, BUTTON_PAGE_PREV
+    from krux.wallet import Wallet
+
+    btn_seq = [
+        BUTTON_PAGE,  # move to load from SD
+        BUTTON_ENTER,  # load from SD
+        BUTTON_PAGE_PREV,  # move to go
+        BUTTON_ENTER,  # confirm gap limit 100
+        BUTTON_ENTER,  # leave summary
+        BUTTON_PAGE_PREV,  # move to back
+        BUTTON_ENTER,  # exit results
+    ]
+    wallet = Wallet(tdata.SINGLESIG_ACTION_KEY_TEST_P2WPKH)
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses_ui = Addresses(ctx)
+    mocker.patch.object(addresses_ui, "has_sd_card", new=lambda: True)
+    mocker.patch(
+        "krux.pages.utils.Utils.load_file",
+        return_value=(
+            "payouts.csv",
+            b"index,address\n"
+            b"49,tb1q8e9cxkrvg2d3q72wp9t33739pcnygrdyp2dm38\n"
+            b"0,tb1q4fhuxhrmz26kkuxxwataqw323cs2l3mgerz6kp\n"
+            b"x,bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y\n",
+        ),
+    )
+    mocker.spy(addresses_ui, "_match_address_list")
+    mocker.spy(wallet, "obtain_script_pubkeys")
+
+    addresses_ui.check_address_list()
+
+    assert addresses_ui._match_address_list.spy_return == [
+        (0, 0, "tb1q4fhuxhrmz26kkuxxwataqw323cs2l3mgerz6kp"),
+        (0, 49, "tb1q8e9cxkrvg2d3q72wp9t33739pcnygrdyp2dm38"),
+    ]
+    # Each branch is derived once
+    assert wallet.obtain_script_pubkeys.call_count == 2
+    ctx.display.draw_centered_text.assert_any_call(
+        "2 of 3 addresses belong to this wallet"
+    )
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+
+def test_check_address_list_fails_to_load(mocker, m5stickv, tdata):
+    from krux.pages.home_pages.addresses import Addresses
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.input import BUTTON_ENTER
+    from krux.qr import FORMAT_NONE
+    from krux.wallet import Wallet
+
+    btn_seq = [BUTTON_ENTER]  # load from camera
+    wallet = Wallet(tdata.SINGLESIG_ACTION_KEY_TEST_P2WPKH)
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses_ui = Addresses(ctx)
+    mocker.patch.object(
+        QRCodeCapture, "qr_capture_loop", new=lambda self: ("not a list", FORMAT_NONE)
+    )
+    mocker.spy(addresses_ui, "flash_error")
+
+    addresses_ui.check_address_list()
+
+    addresses_ui.flash_error.assert_called_once_with("Failed to load")
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+
 def test_scan_change_address(mocker, m5stickv, tdata):
     from krux.pages.home_pages.addresses import Addresses
     from krux.wallet import Wallet
@@ -666,6 +739,102 @@ def test_scan_change_address(mocker, m5stickv, tdata):
         assert ctx.input.wait_for_button.call_count == len(case[5])
 
 
+def test_scan_address_with_index(mocker, m5stickv, tdata, tmp_path):
+    from krux.pages.home_pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER
+    from krux.qr import FORMAT_NONE
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.format import format_address
+
+    mocker.patch(
+        "krux.address_index.Store.get_vfs_location",
+        return_value=str(tmp_path) + "/",
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.address_index = True
+
+    # An earlier address listing indexed the first 60 receive addresses
+    indexed_wallet = Wallet(tdata.SINGLESIG_12_WORD_KEY)
+    addresses = list(indexed_wallet.obtain_addresses(0, limit=60))
+    indexed_wallet.address_index(0).save()
+
+    wallet = Wallet(tdata.SINGLESIG_12_WORD_KEY)
+    btn_seq = [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses_ui = Addresses(ctx)
+    mocker.patch.object(
+        QRCodeCapture, "qr_capture_loop", new=lambda self: (addresses[55], FORMAT_NONE)
+    )
+    mocker.spy(wallet, "obtain_script_pubkeys")
+
+    addresses_ui.scan_address()
+
+    # Found beyond the first batch without asking to try more
+    ctx.display.draw_centered_text.assert_called_with(
+        "55.\n\n%s\n\nis a valid address!" % format_address(addresses[55])
+    )
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+    # Misses are not trusted, the indexed range is derived again
+    wallet.obtain_script_pubkeys.reset_mock()
+    btn_seq = [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses_ui = Addresses(ctx)
+    new_addr = list(Wallet(tdata.SINGLESIG_12_WORD_KEY).obtain_addresses(70, 1))[0]
+    mocker.patch.object(
+        QRCodeCapture, "qr_capture_loop", new=lambda self: (new_addr, FORMAT_NONE)
+    )
+
+    addresses_ui.scan_address()
+
+    ctx.display.draw_centered_text.assert_called_with(
+        "70.\n\n%s\n\nis a valid address!" % format_address(new_addr)
+    )
+    assert wallet.obtain_script_pubkeys.call_args_list[0] == mocker.call(
+        0, limit=50, branch_index=0
+    )
+    assert len(wallet.address_index(0)) == 71
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+
+def test_scan_address_with_tampered_index(mocker, m5stickv, tdata, tmp_path):
+    from krux.pages.home_pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER
+    from krux.qr import FORMAT_NONE
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.format import format_address
+
+    mocker.patch(
+        "krux.address_index.Store.get_vfs_location",
+        return_value=str(tmp_path) + "/",
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.address_index = True
+
+    # The record of address 5 was altered on storage
+    indexed_wallet = Wallet(tdata.SINGLESIG_12_WORD_KEY)
+    addresses = list(indexed_wallet.obtain_addresses(0, limit=20))
+    address_index = indexed_wallet.address_index(0)
+    address_index.hashes[5 * 4 : 6 * 4] = b"\x00\x00\x00\x00"
+    address_index.save()
+
+    wallet = Wallet(tdata.SINGLESIG_12_WORD_KEY)
+    btn_seq = [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses_ui = Addresses(ctx)
+    mocker.patch.object(
+        QRCodeCapture, "qr_capture_loop", new=lambda self: (addresses[5], FORMAT_NONE)
+    )
+
+    addresses_ui.scan_address()
+
+    ctx.display.draw_centered_text.assert_called_with(
+        "5.\n\n%s\n\nis a valid address!" % format_address(addresses[5])
+    )
+
+
 def test_scan_address_menu(mocker, m5stickv, tdata):
     from krux.input import BUTTON_ENTER, BUTTON_PAGE_PREV
     from krux.pages.home_pages.addresses import Addresses
@@ -714,6 +883,33 @@ def test_scan_address_fails_on_decrypt_kef_key_error(mocker, m5stickv):
     )
 
 
+def test_address_pages(mocker, m5stickv, tdata):
+    from krux.pages.home_pages.addresses import AddressPages
+    from krux.wallet import Wallet
+
+    wallet = Wallet(tdata.SINGLESIG_12_WORD_KEY)
+    addresses = list(wallet.obtain_addresses(0, limit=20))
+    mocker.spy(wallet, "obtain_addresses")
+    pages = AddressPages(wallet, 0, 5)
+
+    assert pages.get(0) == addresses[:5]
+    assert pages.get(0) == addresses[:5]
+    assert wallet.obtain_addresses.call_count == 1
+
+    # Neighbour pages are derived in the background
+    pages.prefetch(5, -5)
+    pages.wait()
+    assert 5 in pages and -5 not in pages
+    assert pages.get(5) == addresses[5:10]
+    assert wallet.obtain_addresses.call_count == 2
+
+    # Only the most recently used pages are kept
+    pages.get(10)
+    pages.get(15)
+    assert 0 not in pages
+    assert sorted(pages.pages) == [5, 10, 15]
+
+
 def test_list_receive_addresses(mocker, m5stickv, tdata):
     from krux.format import format_address
     from krux.input import BUTTON_ENTER, BUTTON_PAGE_PREV
@@ -500,6 +500,7 @@ def test_load_address_view(mocker, amigo, tdata):
         BUTTON_PAGE,  # Go to Back
         BUTTON_ENTER,  # Exit menu
         BUTTON_PAGE,  # Go to export
+        BUTTON_PAGE,  # Go to check address list
         BUTTON_PAGE,  # Go to Back
         BUTTON_ENTER,  # Exit
     ]
@@ -1388,6 +1389,68 @@ def test_sign_wrong_key(mocker, m5stickv, tdata):
     home.display_qr_codes.assert_not_called()
 
 
+def test_sign_streamed_to_sd_over_source(mocker, m5stickv, psbt_tdata, tmp_path):
+    from embit.networks import NETWORKS
+    from krux.pages.home_pages.home import Home
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+    from krux.sd_card import SDHandler
+
+    mocker.patch("krux.psbt.LARGE_PSBT_FILE_SIZE", 0)
+    mocker.patch("krux.settings.SD_PATH", str(tmp_path).lstrip("/"))
+    mocker.patch.object(SDHandler, "PATH_STR", str(tmp_path) + "/%s")
+    wallet = Wallet(Key(psbt_tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    ctx = create_ctx(mocker, [], wallet)
+    home = Home(ctx)
+
+    # A cosigner signs "dummy-signed.psbt" and accepts to overwrite it
+    (tmp_path / "dummy-signed.psbt").write_bytes(psbt_tdata.P2WPKH_PSBT)
+    signer = PSBTSigner(wallet, None, FORMAT_NONE, "dummy-signed.psbt")
+    assert signer.streamed
+    signer.outputs()
+    home._sign_streamed_to_sd(SDHandler(), signer, "dummy-signed.psbt")
+
+    assert (
+        tmp_path / "dummy-signed.psbt"
+    ).read_bytes() == psbt_tdata.SIGNED_P2WPKH_PSBT_SD
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dummy-signed.psbt"]
+
+
+def test_sign_streamed_to_sd_wrong_key(mocker, m5stickv, psbt_tdata, tmp_path):
+    from embit.networks import NETWORKS
+    from krux.pages.home_pages.home import Home
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+    from krux.sd_card import SDHandler
+
+    mocker.patch("krux.psbt.LARGE_PSBT_FILE_SIZE", 0)
+    mocker.patch("krux.settings.SD_PATH", str(tmp_path).lstrip("/"))
+    mocker.patch.object(SDHandler, "PATH_STR", str(tmp_path) + "/%s")
+    wallet = Wallet(
+        Key(
+            "olympic term tissue route sense program under choose bean emerge velvet absurd",
+            TYPE_SINGLESIG,
+            NETWORKS["test"],
+        )
+    )
+    ctx = create_ctx(mocker, [], wallet)
+    home = Home(ctx)
+
+    (tmp_path / "dummy.psbt").write_bytes(psbt_tdata.P2WPKH_PSBT)
+    signer = PSBTSigner(wallet, None, FORMAT_NONE, "dummy.psbt")
+    assert signer.streamed
+
+    # Wrong key, will raise error "cannot sign" and leave no partial file
+    with pytest.raises(ValueError):
+        home._sign_streamed_to_sd(SDHandler(), signer, "dummy-signed.psbt")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dummy.psbt"]
+
+
 def test_sign_review_3_times(mocker, m5stickv, tdata):
     from krux.pages.home_pages.home import Home
     from krux.wallet import Wallet
@@ -1757,6 +1820,62 @@ def test_sign_self(mocker, m5stickv, tdata):
     )
 
 
+def test_sign_bbqr_shows_number_of_parts(mocker, m5stickv, tdata):
+    from krux.pages.home_pages.home import Home
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE, QR_ANIM_PERIOD
+    from krux.qr import FORMAT_BBQR, find_min_num_parts
+    from krux.pages.qr_capture import QRCodeCapture
+
+    psbt_action_key = "cHNidP8BAP1IAQIAAAAHx8+VLZG8q9fE/9TFGaUDMxlyks8pM6wE1sUzUmlPlDsHAAAAAP3////Hz5Utkbyr18T/1MUZpQMzGXKSzykzrATWxTNSaU+UOwEAAAAA/f///8fPlS2RvKvXxP/UxRmlAzMZcpLPKTOsBNbFM1JpT5Q7AAAAAAD9////x8+VLZG8q9fE/9TFGaUDMxlyks8pM6wE1sUzUmlPlDsGAAAAAP3////Hz5Utkbyr18T/1MUZpQMzGXKSzykzrATWxTNSaU+UOwMAAAAA/f///8fPlS2RvKvXxP/UxRmlAzMZcpLPKTOsBNbFM1JpT5Q7AgAAAAD9////x8+VLZG8q9fE/9TFGaUDMxlyks8pM6wE1sUzUmlPlDsFAAAAAP3///8BhAMAAAAAAAAWABSQFsrFI58hEmVY35Grwl6NWQw+EzL4KgBPAQQ1h88DTgGgxoAAAAAOrBNsRwUaHG8Qdpu7Btybwcujx9j/uhVPF89ukyzX/gMfP25mJ+oB2eimOaKU4dgI3/t7CgaWeNLOfWmLXBJ2PhDgxZXFVAAAgAEAAIAAAACAAAEA/X0BAgAAAAMGYdOCRm96yd0SRiDX/+ZTRt0RZPQ0Mn6miiSt9+jnGgEAAAAA/f///6WRO03nK6dxPTuSRki5muA+UwhuTd7g+HXizgwb5LeBAAAAAAD9////pZE7Tecrp3E9O5JGSLma4D5TCG5N3uD4deLODBvkt4EBAAAAAP3///8ILAEAAAAAAAAWABQEW1ViWlSbmIdm9/xxbVN7UPXqAiwBAAAAAAAAFgAU+IEm+ZO/4N2axFy8hxZT/wtdTRQsAQAAAAAAABYAFNODZUmp55aIlsGR7xtbn/Wi9DT6LAEAAAAAAAAWABTQyeXI/+h+9lDU/eZwDi8pV6f0uSwBAAAAAAAAFgAU4/A6nZA96mbo0UUZeB5aVmgA1AcsAQAAAAAAABYAFJjyinLYV7IAZSOQGWybXRFKxXuoLAEAAAAAAAAWABRdZRXGZthP4IwCzShHwbcxjLK7KpkYAAAAAAAAFgAUZPz8S66IM0fzHsrc7tL+9kTIBofO/CQAAQEfmRgAAAAAAAAWABRk/PxLrogzR/Meytzu0v72RMgGhwEDBAEAAAAiBgJaEB9rY25tmsmbSW9hm9I7kjSB/TCKBH19lFtMxN5f0hjgxZXFVAAAgAEAAIAAAACAAAAAAGMAAAAAAQD9fQECAAAAAwZh04JGb3rJ3RJGINf/5lNG3RFk9DQyfqaKJK336OcaAQAAAAD9////pZE7Tecrp3E9O5JGSLma4D5TCG5N3uD4deLODBvkt4EAAAAAAP3///+lkTtN5yuncT07kkZIuZrgPlMIbk3e4Ph14s4MG+S3gQEAAAAA/f///wgsAQAAAAAAABYAFARbVWJaVJuYh2b3/HFtU3tQ9eoCLAEAAAAAAAAWABT4gSb5k7/g3ZrEXLyHFlP/C11NFCwBAAAAAAAAFgAU04NlSannloiWwZHvG1uf9aL0NPosAQAAAAAAABYAFNDJ5cj/6H72UNT95nAOLylXp/S5LAEAAAAAAAAWABTj8DqdkD3qZujRRRl4HlpWaADUBywBAAAAAAAAFgAUmPKKcthXsgBlI5AZbJtdEUrFe6gsAQAAAAAAABYAFF1lFcZm2E/gjALNKEfBtzGMsrsqmRgAAAAAAAAWABRk/PxLrogzR/Meytzu0v72RMgGh878JAABAR8sAQAAAAAAABYAFPiBJvmTv+DdmsRcvIcWU/8LXU0UAQMEAQAAACIGAqRibs9tYLaovuVJttR2FrYhM9OIvFWIxJIYy+uE0k2HGODFlcVUAACAAQAAgAAAAIAAAAAAXAAAAAABAP19AQIAAAADBmHTgkZvesndEkYg1//mU0bdEWT0NDJ+pookrffo5xoBAAAAAP3///+lkTtN5yuncT07kkZIuZrgPlMIbk3e4Ph14s4MG+S3gQAAAAAA/f///6WRO03nK6dxPTuSRki5muA+UwhuTd7g+HXizgwb5LeBAQAAAAD9////CCwBAAAAAAAAFgAUBFtVYlpUm5iHZvf8cW1Te1D16gIsAQAAAAAAABYAFPiBJvmTv+DdmsRcvIcWU/8LXU0ULAEAAAAAAAAWABTTg2VJqeeWiJbBke8bW5/1ovQ0+iwBAAAAAAAAFgAU0MnlyP/ofvZQ1P3mcA4vKVen9LksAQAAAAAAABYAFOPwOp2QPepm6NFFGXgeWlZoANQHLAEAAAAAAAAWABSY8opy2FeyAGUjkBlsm10RSsV7qCwBAAAAAAAAFgAUXWUVxmbYT+CMAs0oR8G3MYyyuyqZGAAAAAAAABYAFGT8/EuuiDNH8x7K3O7S/vZEyAaHzvwkAAEBHywBAAAAAAAAFgAUBFtVYlpUm5iHZvf8cW1Te1D16gIBAwQBAAAAIgYDibJyWP99ah56RHUxDtlZZ6L+W6U1AEQoEYJ4JViQBV0Y4MWVxVQAAIABAACAAAAAgAAAAABfAAAAAAEA/X0BAgAAAAMGYdOCRm96yd0SRiDX/+ZTRt0RZPQ0Mn6miiSt9+jnGgEAAAAA/f///6WRO03nK6dxPTuSRki5muA+UwhuTd7g+HXizgwb5LeBAAAAAAD9////pZE7Tecrp3E9O5JGSLma4D5TCG5N3uD4deLODBvkt4EBAAAAAP3///8ILAEAAAAAAAAWABQEW1ViWlSbmIdm9/xxbVN7UPXqAiwBAAAAAAAAFgAU+IEm+ZO/4N2axFy8hxZT/wtdTRQsAQAAAAAAABYAFNODZUmp55aIlsGR7xtbn/Wi9DT6LAEAAAAAAAAWABTQyeXI/+h+9lDU/eZwDi8pV6f0uSwBAAAAAAAAFgAU4/A6nZA96mbo0UUZeB5aVmgA1AcsAQAAAAAAABYAFJjyinLYV7IAZSOQGWybXRFKxXuoLAEAAAAAAAAWABRdZRXGZthP4IwCzShHwbcxjLK7KpkYAAAAAAAAFgAUZPz8S66IM0fzHsrc7tL+9kTIBofO/CQAAQEfLAEAAAAAAAAWABRdZRXGZthP4IwCzShHwbcxjLK7KgEDBAEAAAAiBgPPcF0EnG/EsPW6WOVVX3GgC+ooH/ZSk1ZZfbgn3f32LxjgxZXFVAAAgAEAAIAAAACAAAAAAF0AAAAAAQD9fQECAAAAAwZh04JGb3rJ3RJGINf/5lNG3RFk9DQyfqaKJK336OcaAQAAAAD9////pZE7Tecrp3E9O5JGSLma4D5TCG5N3uD4deLODBvkt4EAAAAAAP3///+lkTtN5yuncT07kkZIuZrgPlMIbk3e4Ph14s4MG+S3gQEAAAAA/f///wgsAQAAAAAAABYAFARbVWJaVJuYh2b3/HFtU3tQ9eoCLAEAAAAAAAAWABT4gSb5k7/g3ZrEXLyHFlP/C11NFCwBAAAAAAAAFgAU04NlSannloiWwZHvG1uf9aL0NPosAQAAAAAAABYAFNDJ5cj/6H72UNT95nAOLylXp/S5LAEAAAAAAAAWABTj8DqdkD3qZujRRRl4HlpWaADUBywBAAAAAAAAFgAUmPKKcthXsgBlI5AZbJtdEUrFe6gsAQAAAAAAABYAFF1lFcZm2E/gjALNKEfBtzGMsrsqmRgAAAAAAAAWABRk/PxLrogzR/Meytzu0v72RMgGh878JAABAR8sAQAAAAAAABYAFNDJ5cj/6H72UNT95nAOLylXp/S5AQMEAQAAACIGApFgNphi/Y+tOwzEH2UfKClwfJeJJJzSgzTqK01oIqC8GODFlcVUAACAAQAAgAAAAIAAAAAAYAAAAAABAP19AQIAAAADBmHTgkZvesndEkYg1//mU0bdEWT0NDJ+pookrffo5xoBAAAAAP3///+lkTtN5yuncT07kkZIuZrgPlMIbk3e4Ph14s4MG+S3gQAAAAAA/f///6WRO03nK6dxPTuSRki5muA+UwhuTd7g+HXizgwb5LeBAQAAAAD9////CCwBAAAAAAAAFgAUBFtVYlpUm5iHZvf8cW1Te1D16gIsAQAAAAAAABYAFPiBJvmTv+DdmsRcvIcWU/8LXU0ULAEAAAAAAAAWABTTg2VJqeeWiJbBke8bW5/1ovQ0+iwBAAAAAAAAFgAU0MnlyP/ofvZQ1P3mcA4vKVen9LksAQAAAAAAABYAFOPwOp2QPepm6NFFGXgeWlZoANQHLAEAAAAAAAAWABSY8opy2FeyAGUjkBlsm10RSsV7qCwBAAAAAAAAFgAUXWUVxmbYT+CMAs0oR8G3MYyyuyqZGAAAAAAAABYAFGT8/EuuiDNH8x7K3O7S/vZEyAaHzvwkAAEBHywBAAAAAAAAFgAU04NlSannloiWwZHvG1uf9aL0NPoBAwQBAAAAIgYC1sS/lSW4MscM8RNpfaFkTeTr3NEapRcqIRsX0yMSYk0Y4MWVxVQAAIABAACAAAAAgAAAAABeAAAAAAEA/X0BAgAAAAMGYdOCRm96yd0SRiDX/+ZTRt0RZPQ0Mn6miiSt9+jnGgEAAAAA/f///6WRO03nK6dxPTuSRki5muA+UwhuTd7g+HXizgwb5LeBAAAAAAD9////pZE7Tecrp3E9O5JGSLma4D5TCG5N3uD4deLODBvkt4EBAAAAAP3///8ILAEAAAAAAAAWABQEW1ViWlSbmIdm9/xxbVN7UPXqAiwBAAAAAAAAFgAU+IEm+ZO/4N2axFy8hxZT/wtdTRQsAQAAAAAAABYAFNODZUmp55aIlsGR7xtbn/Wi9DT6LAEAAAAAAAAWABTQyeXI/+h+9lDU/eZwDi8pV6f0uSwBAAAAAAAAFgAU4/A6nZA96mbo0UUZeB5aVmgA1AcsAQAAAAAAABYAFJjyinLYV7IAZSOQGWybXRFKxXuoLAEAAAAAAAAWABRdZRXGZthP4IwCzShHwbcxjLK7KpkYAAAAAAAAFgAUZPz8S66IM0fzHsrc7tL+9kTIBofO/CQAAQEfLAEAAAAAAAAWABSY8opy2FeyAGUjkBlsm10RSsV7qAEDBAEAAAAiBgNQvfLUx3WRK2N850DYWku1bP/Yqpr9l2oxrBYuJAUR5RjgxZXFVAAAgAEAAIAAAACAAAAAAGEAAAAAIgIDqqj3vg3ed048VlMTB/N9izXR6C3Xngi9p0h19K6yTDEY4MWVxVQAAIABAACAAAAAgAAAAABoAAAAAA=="
+
+    btn_seq = [
+        BUTTON_ENTER,  # Load from QR code
+        BUTTON_ENTER,  # Path mismatch ACK
+        BUTTON_ENTER,  # High fees ACK
+        BUTTON_ENTER,  # PSBT resume
+        BUTTON_ENTER,  # output 1
+        BUTTON_PAGE,  # move to Sign to QR
+        BUTTON_ENTER,  # Sign to QR code
+        BUTTON_ENTER,  # Dismiss QR
+        BUTTON_ENTER,  # Done?
+    ]
+    wallet = Wallet(tdata.SINGLESIG_ACTION_KEY)
+    ctx = create_ctx(mocker, btn_seq, wallet)
+    ctx.display.qr_data_width.return_value = 45
+    home = Home(ctx)
+    mocker.patch.object(
+        QRCodeCapture,
+        "qr_capture_loop",
+        new=lambda self: (psbt_action_key, FORMAT_BBQR),
+    )
+    displayed = []
+    mocker.patch.object(
+        home,
+        "display_qr_codes",
+        new=lambda data, qr_format, title=None: (
+            displayed.append((data, qr_format)),
+            ctx.input.wait_for_button(),
+        ),
+    )
+
+    home.sign_psbt()
+
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+    bbqr_code, qr_format = displayed[0]
+    assert qr_format == FORMAT_BBQR
+    num_parts, _ = find_min_num_parts(bbqr_code, 45, FORMAT_BBQR)
+    assert num_parts > 1
+    # Number of parts and duration of a loop are shown before the animation
+    ctx.display.flash_text.assert_called_with(
+        "%d QR codes, %ds per loop"
+        % (num_parts, (num_parts * QR_ANIM_PERIOD + 999) // 1000),
+        mocker.ANY,
+        mocker.ANY,
+        highlight_prefix="",
+    )
+
+
 def test_sign_spent_and_self(mocker, m5stickv, tdata):
     from krux.pages.home_pages.home import Home
     from krux.wallet import Wallet
@@ -1,3 +1,4 @@
+import pytest
 from . import create_ctx
 from ..test_qr import tdata
 
@@ -129,6 +130,23 @@ def test_camera_antiglare(mocker, m5stickv):
         ctx.display.draw_centered_text.assert_has_calls([mocker.call("Standard mode")])
 
 
+def test_update_progress_lists_missing_parts(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.qr import QRPartParser
+
+    ctx = mock_context(mocker)
+    qr_capturer = QRCodeCapture(ctx)
+    parser = QRPartParser()
+    parser.parse("p1of5 aa")
+    qr_capturer.update_progress_other(parser, 0, None)
+    ctx.display.draw_hcentered_text.assert_not_called()
+
+    parser.parse("p4of5 dd")
+    parser.parse("p2of5 bb")
+    qr_capturer.update_progress_other(parser, 1, 3)
+    ctx.display.draw_hcentered_text.assert_called_once_with("3, 5", 225, max_lines=1)
+
+
 def test_light_control(mocker, multiple_devices):
     from krux.pages.qr_capture import QRCodeCapture
 
@@ -261,6 +279,220 @@ def test_capture_qr_code_loop_duplicated_frames(mocker, m5stickv, tdata):
     )
 
 
+def test_capture_qr_code_loop_skips_held_frames(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.qr import QRPartParser, FORMAT_BBQR
+    from ..test_bbqr import BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+
+    # Animation holds each frame for three snapshots, and loops back once
+    frames = BBQR_ENCODED_PSBTS[0]
+    held_frames = [part for part in frames[1:] + frames[:2] for _ in range(3)]
+    mocker.patch.object(
+        ctx.camera,
+        "snapshot",
+        new=snapshot_generator(outcome=SNAP_ANIMATED_QR, animated_qr=held_frames),
+    )
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    spy_parse = mocker.spy(QRPartParser, "parse")
+    qr_capturer = QRCodeCapture(ctx)
+
+    qr_code, qr_format = qr_capturer.qr_capture_loop()
+    assert qr_code == BBQR_DECODED_PSBTS[0]
+    assert qr_format == FORMAT_BBQR
+    # Each part was parsed once
+    assert spy_parse.call_count == len(frames)
+
+
+def test_capture_qr_code_loop_parses_every_code_in_frame(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.qr import QRPartParser, FORMAT_BBQR
+    from ..shared_mocks import Mockqrcode
+    from ..test_bbqr import BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+
+    # A sheet with every part printed, seen in two frames
+    frames = BBQR_ENCODED_PSBTS[0]
+    sheet = mocker.MagicMock(
+        width=mocker.MagicMock(return_value=320),
+        height=mocker.MagicMock(return_value=240),
+    )
+    sheet.find_qrcodes.return_value = [Mockqrcode(part) for part in frames[2:]]
+    full_sheet = mocker.MagicMock(
+        width=mocker.MagicMock(return_value=320),
+        height=mocker.MagicMock(return_value=240),
+    )
+    full_sheet.find_qrcodes.return_value = [Mockqrcode(part) for part in frames]
+    mocker.patch.object(ctx.camera, "snapshot", side_effect=[sheet, full_sheet])
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    spy_parse = mocker.spy(QRPartParser, "parse")
+    qr_capturer = QRCodeCapture(ctx)
+    mocker.spy(qr_capturer, "update_progress_other")
+
+    qr_code, qr_format = qr_capturer.qr_capture_loop()
+    assert qr_code == BBQR_DECODED_PSBTS[0]
+    assert qr_format == FORMAT_BBQR
+    assert ctx.camera.snapshot.call_count == 2
+    assert spy_parse.call_count == len(frames)
+    # Progress drawn for the parts of the first frame
+    assert [
+        call.args[1] for call in qr_capturer.update_progress_other.call_args_list
+    ] == [2, 3, 4]
+
+
+def test_capture_qr_code_loop_skips_foreign_codes(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.qr import FORMAT_BBQR
+    from ..shared_mocks import Mockqrcode
+    from ..test_bbqr import BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+
+    # Unrelated QR codes stay in view next to the animation
+    frames = BBQR_ENCODED_PSBTS[0]
+    foreign_bbqr = frames[0][:3] + "U" + frames[0][4:]
+    snapshots = []
+    for part in frames:
+        snapshot = mocker.MagicMock(
+            width=mocker.MagicMock(return_value=320),
+            height=mocker.MagicMock(return_value=240),
+        )
+        snapshot.find_qrcodes.return_value = [
+            Mockqrcode(part),
+            Mockqrcode("not a part of this animation"),
+            Mockqrcode(foreign_bbqr),
+        ]
+        snapshots.append(snapshot)
+    mocker.patch.object(ctx.camera, "snapshot", side_effect=snapshots)
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    qr_capturer = QRCodeCapture(ctx)
+
+    qr_code, qr_format = qr_capturer.qr_capture_loop()
+    assert qr_code == BBQR_DECODED_PSBTS[0]
+    assert qr_format == FORMAT_BBQR
+
+
+def test_capture_qr_code_loop_raises_on_invalid_part(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from ..shared_mocks import Mockqrcode
+    from ..test_bbqr import BBQR_ENCODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+
+    # A part of the scanned code that fails to parse is not skipped
+    frames = BBQR_ENCODED_PSBTS[0]
+    snapshots = []
+    for data in (frames[0], frames[1][:6] + "ZZ" + frames[1][8:]):
+        snapshot = mocker.MagicMock(
+            width=mocker.MagicMock(return_value=320),
+            height=mocker.MagicMock(return_value=240),
+        )
+        snapshot.find_qrcodes.return_value = [Mockqrcode(data)]
+        snapshots.append(snapshot)
+    mocker.patch.object(ctx.camera, "snapshot", side_effect=snapshots)
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    qr_capturer = QRCodeCapture(ctx)
+
+    with pytest.raises(ValueError):
+        qr_capturer.qr_capture_loop()
+
+
+def test_capture_qr_code_loop_resets_roi_on_mode_change(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.qr import FORMAT_BBQR
+    from ..shared_mocks import Mockqrcode
+    from ..test_bbqr import BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+    mocker.patch.object(ctx.camera, "has_antiglare", return_value=True)
+    mocker.patch.object(ctx.camera, "toggle_camera_mode", return_value=0)
+
+    frames = BBQR_ENCODED_PSBTS[0]
+    snapshots = []
+    for part in frames:
+        snapshot = mocker.MagicMock(
+            width=mocker.MagicMock(return_value=320),
+            height=mocker.MagicMock(return_value=240),
+        )
+        snapshot.find_qrcodes.return_value = [Mockqrcode(part, (200, 20, 100, 100))]
+        snapshots.append(snapshot)
+    mocker.patch.object(ctx.camera, "snapshot", side_effect=snapshots)
+    # Mode is toggled after the first part was found
+    ctx.input.page_event = mocker.MagicMock(
+        side_effect=[False, True] + [False] * len(frames)
+    )
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    qr_capturer = QRCodeCapture(ctx)
+
+    qr_code, qr_format = qr_capturer.qr_capture_loop()
+    assert qr_code == BBQR_DECODED_PSBTS[0]
+    assert qr_format == FORMAT_BBQR
+    ctx.camera.toggle_camera_mode.assert_called_once()
+    # Snapshot taken after the mode changed is fully searched
+    snapshots[1].find_qrcodes.assert_called_once_with()
+    snapshots[2].find_qrcodes.assert_called_once_with((150, 0, 170, 170))
+
+
+def test_capture_qr_code_loop_profiling(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.profiler import ScanProfiler
+    from ..test_bbqr import BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS
+
+    ctx = create_ctx(mocker, None)
+    frames = BBQR_ENCODED_PSBTS[0]
+    mocker.patch.object(
+        ctx.camera,
+        "snapshot",
+        new=snapshot_generator(outcome=SNAP_ANIMATED_QR, animated_qr=frames),
+    )
+    time_mocker = TimeMocker(1000)
+    mocker.patch("time.ticks_ms", time_mocker.tick)
+    mocker.patch("time.ticks_us", TimeMocker(1000).tick, create=True)
+    mocker.patch("krux.profiler.SCAN_PROFILING", True)
+    spy_report = mocker.spy(ScanProfiler, "report")
+    qr_capturer = QRCodeCapture(ctx)
+
+    qr_code, _ = qr_capturer.qr_capture_loop()
+    assert qr_code == BBQR_DECODED_PSBTS[0]
+    spy_report.assert_called_once()
+    scan_profiler = spy_report.call_args.args[0]
+    assert scan_profiler.frames == len(frames)
+    assert scan_profiler.frames_to_complete == len(frames)
+    for histogram in scan_profiler.histograms.values():
+        assert sum(histogram) == len(frames)
+    ctx.display.draw_string.assert_called_with(0, 0, scan_profiler.overlay())
+
+
+def test_capture_qr_code_loop_profiling_setting(mocker, m5stickv):
+    from krux.pages.qr_capture import QRCodeCapture
+    from krux.profiler import ScanProfiler
+    from krux.krux_settings import Settings
+    from ..test_bbqr import BBQR_ENCODED_PSBTS
+
+    frames = BBQR_ENCODED_PSBTS[0]
+    mocker.patch("time.ticks_ms", TimeMocker(1000).tick)
+    mocker.patch("time.ticks_us", TimeMocker(1000).tick, create=True)
+    spy_report = mocker.spy(ScanProfiler, "report")
+
+    for enabled in (False, True):
+        Settings().hardware.scan_profiling = enabled
+        ctx = create_ctx(mocker, None)
+        mocker.patch.object(
+            ctx.camera,
+            "snapshot",
+            new=snapshot_generator(outcome=SNAP_ANIMATED_QR, animated_qr=frames),
+        )
+        QRCodeCapture(ctx).qr_capture_loop()
+        assert spy_report.call_count == int(enabled)
+
+
 def test_qr_str_to_bytes(mocker, m5stickv):
     from krux.pages.qr_capture import qr_str_to_bytes
     from ur.ur import UR
@@ -64,7 +64,7 @@ def test_settings_m5stickv(m5stickv, mocker, mocker_printer):
                 *([BUTTON_PAGE] * 2),
                 BUTTON_ENTER,
                 # Back to settings
-                BUTTON_PAGE,
+                *([BUTTON_PAGE] * 2),
                 BUTTON_ENTER,
                 # Leave Settings
                 *([BUTTON_PAGE_PREV] * 3),
@@ -114,7 +114,7 @@ def test_settings_m5stickv(m5stickv, mocker, mocker_printer):
                 *([BUTTON_PAGE] * 2),
                 BUTTON_ENTER,
                 # Back to settings
-                BUTTON_PAGE,
+                *([BUTTON_PAGE] * 2),
                 BUTTON_ENTER,
                 # Leave Settings
                 *([BUTTON_PAGE_PREV] * 3),
@@ -239,18 +239,44 @@ def test_change_flipped_orientation(wonder_mv, mocker):
     assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
 
 
+def test_disable_cache_descriptor(m5stickv, mocker):
+    from krux.pages.settings_page import SettingsPage
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+    from krux.krux_settings import Settings, SecuritySettings
+
+    delete_cache = mocker.patch("krux.wallet.delete_descriptor_cache")
+    Settings().security.cache_descriptor = True
+
+    # Browsing the values doesn't remove the cache
+    ctx = create_ctx(mocker, [BUTTON_PAGE, BUTTON_PAGE, BUTTON_ENTER])
+    SettingsPage(ctx).category_setting(
+        Settings().security, SecuritySettings.cache_descriptor
+    )
+    assert Settings().security.cache_descriptor
+    delete_cache.assert_not_called()
+
+    ctx = create_ctx(mocker, [BUTTON_PAGE, BUTTON_ENTER])
+    SettingsPage(ctx).category_setting(
+        Settings().security, SecuritySettings.cache_descriptor
+    )
+    assert not Settings().security.cache_descriptor
+    delete_cache.assert_called_once()
+
+
 def test_settings_on_amigo_tft(amigo, mocker, mocker_printer):
     import krux
     from krux.pages.settings_page import SettingsPage
     from krux.input import BUTTON_TOUCH
     from krux.krux_settings import Settings, CategorySetting
     from krux.translations import available_languages, ref_array
-    from krux.translations.pt import translation_array as br_array
+    from krux.translations.pt import translation_catalog
+    from ..test_i18n import unpack_catalog
     from krux.themes import WHITE, GREEN, ORANGE
 
     index_pt = available_languages.index("pt-BR")
     index_next = (index_pt + 1) % (len(available_languages))
     slug_index = ref_array.index(1177338798)
+    br_array = unpack_catalog(translation_catalog)
     text_pt = br_array[slug_index] + "\n" + available_languages[index_pt]
 
     # Get translations for the next language
@@ -259,8 +285,8 @@ def test_settings_on_amigo_tft(amigo, mocker, mocker_printer):
     next_module_path = f"krux.translations.{next_language[:2]}"
     # Import the top-level module (krux)
     next_trans_module = __import__(next_module_path, fromlist=[""])
-    # Access the translation_array variable from the nested module
-    next_trans_array = getattr(next_trans_module, "translation_array")
+    # Decode the translation_catalog variable from the nested module
+    next_trans_array = unpack_catalog(getattr(next_trans_module, "translation_catalog"))
     text_next = next_trans_array[slug_index] + "\n" + available_languages[index_next]
 
     PREV_INDEX = 0
@@ -313,7 +339,7 @@ def test_settings_on_amigo_tft(amigo, mocker, mocker_printer):
                 # Back from Printer
                 3,
                 # Back from Hardware
-                4,
+                5,
                 # Leave Settings
                 LEAVE_INDEX,
             ),
@@ -699,6 +725,32 @@ def test_leave_settings_without_changes(amigo, mocker):
         assert persisted_to_flash_call not in settings_page.flash_text.call_args_list
 
 
+def test_leave_settings_on_sd_without_changes(amigo, mocker, mocker_sd_card_ok):
+    import machine
+    from krux.pages.settings_page import SettingsPage
+    from krux.krux_settings import Settings, SD_PATH
+    from krux.settings import store
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE_PREV
+
+    BTN_SEQUENCE = [
+        BUTTON_PAGE_PREV,  # Move to "Back"
+        BUTTON_ENTER,  # Confirm "Back"
+    ]
+
+    Settings().persist.location = SD_PATH
+    store.dirty = False
+    machine.SDCard.remount.reset_mock()
+    ctx = create_ctx(mocker, BTN_SEQUENCE)
+    settings_page = SettingsPage(ctx)
+    settings_page.flash_text = mocker.MagicMock()
+    settings_page.settings()
+
+    assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
+    # Settings were already stored, the SD card is not remounted
+    machine.SDCard.remount.assert_not_called()
+    settings_page.flash_text.assert_not_called()
+
+
 def test_leave_settings_with_changes(amigo, mocker, mocker_sd_card_ok):
     # mocker_sd_card_ok will mock os.listdir so it will also mock flash storage
     from krux.pages.settings_page import SettingsPage
@@ -213,6 +213,9 @@ class MockQRPartParser:
     def processed_parts_count(self):
         return self.parsed_count()
 
+    def missing_count(self):
+        return self.total_count() - len(self.parts)
+
     def parse(self, part):
         if part not in self.parts:
             self.parts.append(part)
@@ -235,12 +238,16 @@ class Mockhistogram:
 
 
 class Mockqrcode:
-    def __init__(self, data):
+    def __init__(self, data, rect=(60, 20, 200, 200)):
         self.data = data
+        self._rect = rect
 
     def payload(self):
         return self.data
 
+    def rect(self):
+        return self._rect
+
 
 class MockBlob:
     def rect(self):
@@ -298,6 +305,8 @@ def snapshot_generator(outcome=SNAP_SUCCESS, animated_qr=[]):
         nonlocal count
         count += 1
         m = mock.MagicMock()
+        m.width.return_value = 320
+        m.height.return_value = 240
         if outcome == SNAP_ANIMATED_QR:
             m.find_qrcodes.return_value = [Mockqrcode(qr_frames[count - 1])]
         elif outcome == SNAP_FIND_ANIMATED_SKIPPING:
@@ -315,8 +324,6 @@ def snapshot_generator(outcome=SNAP_SUCCESS, animated_qr=[]):
             m.find_qrcodes.return_value = [Mockqrcode(str(count))]
             m.to_bytes.return_value = IMAGE_TO_HASH
             m.find_blobs.return_value = [MockBlob()]
-            m.width.return_value = 320
-            m.height.return_value = 240
             m.get_statistics.return_value = MockStats()
         return m
 
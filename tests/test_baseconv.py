@@ -200,6 +200,26 @@ def test_base58_via_electrum_tests(mocker, m5stickv):
         assert base_decode(b58_case, 58) == unhexlify(hex_case)
 
 
+def test_base64_reader(mocker, m5stickv, tdata):
+    from io import BytesIO
+    from krux.baseconv import Base64Reader, base_encode
+
+    encoded = base_encode(tdata.PSBT, 64)
+    # Wrapped in lines, as some coordinators export it
+    wrapped = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+
+    for chunk_size in (4, 7, 64, 1024):
+        reader = Base64Reader(BytesIO(wrapped.encode()), chunk_size)
+        assert reader.read(5) == tdata.PSBT[:5]
+        assert reader.read(0) == b""
+        assert reader.read(100) == tdata.PSBT[5:105]
+        assert reader.read() == tdata.PSBT[105:]
+        assert reader.read(1) == b""
+
+    with pytest.raises(ValueError):
+        Base64Reader(BytesIO(encoded[:-1].encode())).read()
+
+
 def test_hint_encodings_strict_on_input(mocker):
     from krux.baseconv import hint_encodings
 
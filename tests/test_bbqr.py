@@ -359,6 +359,96 @@ def test_decode_non_compressed_bbqr_psbts(m5stickv):
         assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == decoded
 
 
+def test_bbqr_decoder_parts_in_any_order(m5stickv):
+    from krux.qr import detect_format
+    from krux.bbqr import BBQrDecoder, parse_bbqr
+
+    cases = [
+        (BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS),
+        (BBQR_NON_COMPRESSED_ENCODED_PSBTS, BBQR_DECODED_PSBTS),
+        (BBQR_ENCODED_DESCRIPTORS, BBQR_DECODED_DESCRIPTORS),
+        ([HEX_ENCODED_SIGNED_PSBT], [HEX_DECODED_SIGNED_PSBT]),
+    ]
+    for encoded_list, decoded_list in cases:
+        for encoded, decoded in zip(encoded_list, decoded_list):
+            _, bbqr = detect_format(encoded[0])
+            decoder = None
+            # Last part first, it waits for another part to size the buffer
+            for encoded_part in reversed(encoded):
+                part, index, total = parse_bbqr(encoded_part)
+                if decoder is None:
+                    decoder = BBQrDecoder(bbqr.encoding, bbqr.file_type, total)
+                assert not decoder.is_complete()
+                decoder.add(index, part)
+                # Redundant parts are ignored
+                decoder.add(index, part)
+            assert decoder.is_complete()
+            assert decoder.last_part is None
+            assert decoder.result() == decoded
+
+
+def test_bbqr_decoder_decodes_into_buffer(m5stickv):
+    from krux.qr import detect_format
+    from krux.bbqr import BBQrDecoder, parse_bbqr
+
+    encoded = BBQR_ENCODED_PSBTS[0]
+    assert len(encoded) > 2
+    _, bbqr = detect_format(encoded[0])
+    decoder = BBQrDecoder(bbqr.encoding, bbqr.file_type, len(encoded))
+
+    # Last part alone can't tell the buffer size
+    part, index, _ = parse_bbqr(encoded[-1])
+    decoder.add(index, part)
+    assert decoder.buffer is None
+
+    # Buffer is allocated for all parts once any other part is decoded,
+    # then trimmed as the last part is stored
+    part, index, _ = parse_bbqr(encoded[0])
+    decoder.add(index, part)
+    buffer = decoder.buffer
+    assert buffer is not None
+    assert decoder.last_part is None
+    assert len(buffer) < decoder.part_size * len(encoded)
+
+    # Remaining parts go straight to their slot of the same buffer
+    for encoded_part in encoded[1:-1]:
+        part, index, _ = parse_bbqr(encoded_part)
+        decoder.add(index, part)
+        assert decoder.buffer is buffer
+    assert decoder.result() == BBQR_DECODED_PSBTS[0]
+
+
+def test_bbqr_decoder_invalid_parts(m5stickv):
+    from krux.bbqr import BBQrDecoder
+
+    decoder = BBQrDecoder("H", "P", 3)
+    decoder.add(0, "AABB")
+    decoder.add(2, "CC")
+    with pytest.raises(ValueError, match="Invalid BBQR part size"):
+        decoder.add(1, "DDEEFF")
+
+    decoder = BBQrDecoder("H", "P", 2)
+    decoder.add(0, "AABB")
+    with pytest.raises(ValueError, match="Incomplete BBQR"):
+        decoder.result()
+
+    decoder = BBQrDecoder("H", "P", 2)
+    decoder.add(0, "AABB")
+    with pytest.raises(ValueError, match="Invalid BBQR part size"):
+        decoder.add(1, "CCDDEE")
+    with pytest.raises(ValueError, match="Invalid BBQR part index"):
+        decoder.add(2, "FF")
+
+
+def test_decode_bbqr_missing_parts(m5stickv):
+    from krux.bbqr import decode_bbqr
+
+    with pytest.raises(ValueError, match="Incomplete BBQR"):
+        decode_bbqr({0: "AABB", 2: "CC"}, "H", "P")
+    with pytest.raises(ValueError, match="Incomplete BBQR"):
+        decode_bbqr({}, "H", "P")
+
+
 def test_encode_bbqr_descriptors(m5stickv):
     from krux.bbqr import encode_bbqr
 
@@ -431,6 +521,73 @@ def test_encode_bbqr_always_compress_large_data(m5stickv):
     assert bbqr_code.file_type == "U"
 
 
+def test_plan_bbqr_fewest_parts(mocker, m5stickv):
+    from krux.bbqr import plan_bbqr, encode_bbqr, decode_bbqr, parse_bbqr
+    from krux.qr import find_min_num_parts, to_qr_codes, FORMAT_BBQR
+    import krux.qr
+
+    # Compressed PSBT takes fewer parts
+    psbt = BBQR_DECODED_PSBTS[0]
+    bbqr_code, num_parts = plan_bbqr(psbt, 45, file_type="P")
+    assert bbqr_code.encoding == "Z"
+    assert bbqr_code.payload == encode_bbqr(psbt, file_type="P").payload
+    assert num_parts == find_min_num_parts(bbqr_code, 45, FORMAT_BBQR)[0]
+    other_code = encode_bbqr(psbt, encoding="2", file_type="P")
+    assert num_parts < find_min_num_parts(other_code, 45, FORMAT_BBQR)[0]
+
+    # Parts decode back to the data
+    mocker.patch.object(krux.qr.qrcode, "encode", side_effect=lambda part: part)
+    code_generator = to_qr_codes(bbqr_code, 45, FORMAT_BBQR)
+    parts = {}
+    for _ in range(num_parts):
+        part, index, _ = parse_bbqr(next(code_generator)[0])
+        parts[index] = part
+    assert decode_bbqr(parts, "Z", "P") == psbt
+
+    # When compression doesn't save parts, data is kept uncompressed
+    bbqr_code, num_parts = plan_bbqr(b"Small content", 45, file_type="U")
+    assert bbqr_code.encoding == "2"
+    assert num_parts == 1
+
+    # Large data is always compressed
+    bbqr_code, _ = plan_bbqr(b"Large content" * 500, 45, file_type="U")
+    assert bbqr_code.encoding == "Z"
+
+
+def test_encode_bbqr_payload_on_demand(m5stickv):
+    from krux.bbqr import encode_bbqr
+    import base32
+
+    for encoding in ("Z", "2", "H"):
+        for decoded in BBQR_DECODED_PSBTS:
+            bbqr_code = encode_bbqr(decoded, encoding=encoding, file_type="P")
+
+            # Only binary data is kept, text is produced for each slice
+            assert bbqr_code._payload is None
+            if bbqr_code.encoding == "H":
+                full_payload = bbqr_code.data.hex().upper()
+            else:
+                full_payload = base32.encode(bbqr_code.data, False)
+            assert bbqr_code.payload_length() == len(full_payload)
+            assert bbqr_code.payload == full_payload
+
+            length = bbqr_code.payload_length()
+            for part_size in (8, 48, 400):
+                for start in range(0, length, part_size):
+                    assert (
+                        bbqr_code.payload_slice(start, start + part_size)
+                        == full_payload[start : start + part_size]
+                    )
+
+
+def test_bbqr_code_text_payload_slice():
+    bbqr = BBQrCode("ABCDEFGHIJKLMNOP", "2", "P")
+
+    assert bbqr.payload_length() == 16
+    assert bbqr.payload_slice(8, 16) == "IJKLMNOP"
+    assert bbqr.payload_slice(8, 24) == "IJKLMNOP"
+
+
 def test_int2base36():
     from krux.bbqr import int2base36
 
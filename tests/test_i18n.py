@@ -1,6 +1,17 @@
 import pytest
 
 
+def unpack_catalog(catalog):
+    """Decodes every string of a baked translation catalog"""
+    count = int.from_bytes(catalog[:2], "little")
+    offsets = [
+        int.from_bytes(catalog[2 + 2 * i : 4 + 2 * i], "little")
+        for i in range(count + 1)
+    ]
+    blob = catalog[2 + 2 * (count + 1) :]
+    return [blob[offsets[i] : offsets[i + 1]].decode() for i in range(count)]
+
+
 def test_translations(mocker, m5stickv):
     from krux.krux_settings import t, locale_control
     from krux.translations import available_languages, ref_array
@@ -24,7 +35,80 @@ def test_translations(mocker, m5stickv):
         lang_module_path = f"krux.translations.{lang[:2]}"
         # Import the top-level module (krux)
         lang_trans_module = __import__(lang_module_path, fromlist=[""])
-        # Access the translation_array variable from the nested module
-        lang_trans_array = getattr(lang_trans_module, "translation_array")
+        # Decode the translation_catalog variable from the nested module
+        lang_trans_array = unpack_catalog(
+            getattr(lang_trans_module, "translation_catalog")
+        )
         locale_control.load_locale(lang)
         assert t("Load Mnemonic") == lang_trans_array[reference_index]
+
+
+def test_locale_index(mocker, m5stickv):
+    from krux.krux_settings import t, locale_control, DEFAULT_LOCALE
+    from krux.translations import ref_array
+
+    locale_control.load_locale("de-DE")
+    assert len(locale_control.index) == len(ref_array)
+    for i, slug_id in enumerate(ref_array):
+        assert locale_control.index[slug_id] == i
+
+    # Lookups no longer scan the reference list
+    mocker.patch.object(locale_control, "reference", mocker.MagicMock(wraps=ref_array))
+    assert t("Load Mnemonic") == "Mnemonic laden"
+    locale_control.reference.index.assert_not_called()
+
+    # Default locale drops the index
+    locale_control.load_locale(DEFAULT_LOCALE)
+    assert locale_control.index == {}
+    assert t("Load Mnemonic") == "Load Mnemonic"
+
+
+def test_catalogs_match_translation_files(mocker, m5stickv):
+    from krux.krux_settings import t, locale_control
+    from krux.translations import available_languages, ref_array
+    import binascii
+    import json
+    import os
+
+    translations_dir = os.path.join(
+        os.path.dirname(__file__), "..", "i18n", "translations"
+    )
+    for lang in available_languages:
+        with open(
+            os.path.join(translations_dir, lang + ".json"), "r", encoding="utf8"
+        ) as translation_file:
+            translations = json.load(translation_file)
+        locale_control.load_locale(lang)
+        for slug, translation in translations.items():
+            if binascii.crc32(slug.encode("utf-8")) in ref_array:
+                assert t(slug) == translation
+
+
+def test_translation_cache(mocker, m5stickv):
+    from krux.krux_settings import locale_control, TRANSLATION_CACHE_SIZE
+
+    locale_control.load_locale("pt-BR")
+    assert locale_control.cache == {}
+
+    first = locale_control.translation(0)
+    assert locale_control.cache_order == [0]
+
+    # Cached strings are not decoded again
+    locale_control.catalog = None
+    assert locale_control.translation(0) is first
+    locale_control.load_locale("pt-BR")
+
+    # Least recently used strings are evicted
+    for i in range(TRANSLATION_CACHE_SIZE):
+        locale_control.translation(i)
+    locale_control.translation(0)
+    locale_control.translation(TRANSLATION_CACHE_SIZE)
+    assert len(locale_control.cache) == TRANSLATION_CACHE_SIZE
+    assert 0 in locale_control.cache
+    assert 1 not in locale_control.cache
+    assert locale_control.cache_order[-1] == TRANSLATION_CACHE_SIZE
+
+    # Switching locales drops cached strings
+    locale_control.load_locale("de-DE")
+    assert locale_control.cache == {}
+    assert locale_control.translation(0) != first
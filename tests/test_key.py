@@ -609,6 +609,41 @@ def test_sign(mocker, m5stickv, tdata):
     assert signature.serialize() == tdata.TEST_SIG
 
 
+def test_derivation_cache(mocker, m5stickv, tdata):
+    mock_modules(mocker)
+    from embit import bip32
+    from krux.key import Key, TYPE_SINGLESIG, DERIVATION_CACHE_SIZE
+
+    key = Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG)
+    root = bip32.HDKey.parse(key.root.serialize())
+    mocker.spy(bip32.HDKey, "child")
+
+    # The parent of the first key is derived from the root and cached
+    path = [84 + 2**31, 1 + 2**31, 2**31, 0, 0]
+    assert key.root.derive(path) == root.derive(path)
+    assert key.root.derivation_cache[-1][0] == tuple(path[:-1])
+    child_calls = bip32.HDKey.child.call_count
+
+    # Its siblings only derive their last step, in any path notation
+    sibling = key.root.derive(path[:-1] + [1])
+    sibling_xpub = key.get_xpub("m/84h/1h/0h/0/2")
+    assert bip32.HDKey.child.call_count - child_calls == 2
+    assert sibling == root.derive(path[:-1] + [1])
+    assert sibling_xpub == root.derive("m/84h/1h/0h/0/2").to_public()
+
+    # Ancestors and other branches are still derived correctly
+    assert key.root.derive(path[:3]) == root.derive(path[:3])
+    assert key.root.derive(path[:3] + [1, 5]) == root.derive(path[:3] + [1, 5])
+    assert key.root.derive("m") == root
+
+    # The cache is bounded and can be wiped
+    for account in range(DERIVATION_CACHE_SIZE + 2):
+        key.root.derive([84 + 2**31, 1 + 2**31, account + 2**31, 0, 0])
+    assert len(key.root.derivation_cache) == DERIVATION_CACHE_SIZE
+    key.root.wipe_cache()
+    assert key.root.derivation_cache == []
+
+
 def test_sign_fails_with_invalid_hash(mocker, m5stickv, tdata):
     mock_modules(mocker)
     from krux.key import Key, TYPE_SINGLESIG
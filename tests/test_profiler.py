@@ -0,0 +1,75 @@
+import pytest
+
+
+@pytest.fixture
+def ticks_us(mocker, monkeypatch):
+    import time
+
+    ticks = [0]
+
+    def advance(us):
+        ticks[0] += us
+
+    monkeypatch.setattr(time, "ticks_us", lambda: ticks[0], raising=False)
+    return advance
+
+
+def test_scan_profiler_stages(m5stickv, ticks_us):
+    from krux.profiler import ScanProfiler
+
+    profiler = ScanProfiler()
+    for _ in range(4):
+        profiler.frame()
+        ticks_us(500)
+        profiler.mark("snapshot")
+        ticks_us(30000)
+        profiler.mark("find")
+        ticks_us(250000)
+    profiler.complete()
+
+    assert profiler.frames == 4
+    assert profiler.frames_to_complete == 4
+    assert profiler.histograms["snapshot"] == [4, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert profiler.histograms["find"] == [0, 0, 0, 0, 0, 4, 0, 0, 0]
+    assert profiler.histograms["parse"] == [0] * 9
+    assert profiler.maximums["find"] == 30000
+    # 5 frames in the first 1.1s
+    profiler.frame()
+    assert profiler.fps == 4
+    assert profiler.overlay() == "4 fps 5 frames"
+
+
+def test_scan_profiler_csv(m5stickv, ticks_us):
+    from krux.profiler import ScanProfiler
+
+    profiler = ScanProfiler()
+    profiler.frame()
+    ticks_us(1500)
+    profiler.mark("parse")
+    ticks_us(248500)
+
+    lines = profiler.to_csv().splitlines()
+    assert lines[0] == (
+        "stage,count,avg_us,max_us,<1ms,<2ms,<5ms,<10ms,<20ms,<50ms,<100ms,<200ms,"
+        ">=200ms"
+    )
+    assert "parse,1,1500,1500,0,1,0,0,0,0,0,0,0" in lines
+    assert "input,0,0,0,0,0,0,0,0,0,0,0,0" in lines
+    assert lines[-3:] == ["frames,1", "fps,4.0", "frames_to_complete,"]
+
+
+def test_scan_profiler_report(m5stickv, ticks_us, mocker):
+    from krux.profiler import ScanProfiler, PROFILE_FILENAME
+
+    mocker.patch("os.listdir", new=mocker.MagicMock(return_value=[]))
+    mock_open = mocker.patch("builtins.open", mocker.mock_open())
+
+    profiler = ScanProfiler()
+    profiler.frame()
+    profiler.report()
+    mock_open.assert_called_with("/sd/" + PROFILE_FILENAME, "w")
+    mock_open().write.assert_called_once_with(profiler.to_csv())
+
+    # Without SD the report is only printed
+    mocker.patch("os.listdir", new=mocker.MagicMock(side_effect=OSError))
+    profiler.report()
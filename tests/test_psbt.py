@@ -723,6 +723,72 @@ def test_init_multisig_from_sdcard(mocker, m5stickv, tdata):
         assert isinstance(signer, PSBTSigner)
 
 
+def test_cosigner_index(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_MULTISIG, P2WSH
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(
+        Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"], "", 0, P2WSH)
+    )
+    mocker.spy(PSBTSigner, "xpubs")
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, FORMAT_NONE)
+    signer.outputs()
+
+    # Index is built once and shared by inputs and outputs
+    assert PSBTSigner.xpubs.call_count == 1
+    assert signer.policy["cosigners"] == sorted(
+        xpub.to_base58() for xpub in signer.psbt.xpubs
+    )
+
+    cosigners = signer.cosigner_index()
+    inp = signer.psbt.inputs[0]
+    pubkey, der = list(inp.bip32_derivations.items())[0]
+    origin_xpub = [
+        xpub
+        for xpub, origin_der in signer.psbt.xpubs.items()
+        if origin_der.fingerprint == der.fingerprint
+    ][0]
+    assert cosigners.cosigner(pubkey, der) == origin_xpub.to_base58()
+
+    # A pubkey not derived from the indexed xpub at der is not matched
+    other_pubkey = list(inp.bip32_derivations)[1]
+    assert cosigners.cosigner(other_pubkey, der) is None
+
+
+def test_child_pubkey_hardened_index(mocker, m5stickv, tdata):
+    from embit.bip32 import HARDENED_INDEX, HDError
+    from embit.networks import NETWORKS
+    from embit.psbt import DerivationPath
+    from krux.psbt import PSBTSigner, child_pubkey
+    from krux.key import Key, TYPE_MULTISIG, P2WSH
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    key = Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"], "", 0, P2WSH)
+    xpub = key.account
+    assert child_pubkey(xpub, 5) == xpub.child(5).key
+
+    # Like embit, a public key can't derive a hardened child
+    for index in (HARDENED_INDEX, HARDENED_INDEX + 5):
+        with pytest.raises(HDError):
+            xpub.child(index)
+        with pytest.raises(HDError):
+            child_pubkey(xpub, index)
+
+    # A derivation with a hardened final index is never matched to a cosigner
+    wallet = Wallet(key)
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, FORMAT_NONE)
+    pubkey, der = list(signer.psbt.inputs[0].bip32_derivations.items())[0]
+    hardened_der = DerivationPath(
+        der.fingerprint, der.derivation[:-1] + [HARDENED_INDEX]
+    )
+    with pytest.raises(HDError):
+        signer.cosigner_index().cosigner(pubkey, hardened_der)
+
+
 def test_init_miniscript(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from krux.psbt import PSBTSigner
@@ -989,7 +1055,7 @@ def test_sign_singlesig(mocker, m5stickv, tdata):
             assert psbt_qr[0].payload == case[2].payload
             assert psbt_qr[1] == case[1]
         else:
-            assert signer.psbt_qr() == (case[2], case[1])
+            assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_singlesig_from_sdcard(mocker, m5stickv, tdata):
@@ -1021,7 +1087,7 @@ def test_sign_singlesig_from_sdcard(mocker, m5stickv, tdata):
         if num % 2 == 1:
             # If test case num is odd, check if detected as base64
             assert signer.is_b64_file
-            signed_psbt, _ = signer.psbt_qr()
+            signed_psbt, _, _ = signer.psbt_qr()
             with open("/sd/" + "dummy-signed.psbt", "w") as f:
                 f.write(signed_psbt)
         else:
@@ -1163,7 +1229,7 @@ def test_sign_multisig(mocker, m5stickv, tdata):
         wallet = Wallet(case[0])
         signer = PSBTSigner(wallet, case[1], case[2])
         signer.sign()
-        assert signer.psbt_qr() == (case[3], case[2])
+        assert signer.psbt_qr() == (case[3], case[2], None)
         n += 1
 
 
@@ -1213,7 +1279,7 @@ def test_sign_multisig_with_descriptor(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
     # Repeat signatures with descriptor loaded and more checks
     wallet.load(WSH_MULTISIG, FORMAT_NONE)
@@ -1221,7 +1287,7 @@ def test_sign_multisig_with_descriptor(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_miniscript(mocker, m5stickv, tdata):
@@ -1247,7 +1313,7 @@ def test_sign_miniscript(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
     # Repeat signatures with descriptor loaded and more checks
     wallet.load(WSH_MINISCRIPT, FORMAT_NONE)
@@ -1255,7 +1321,7 @@ def test_sign_miniscript(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_miniscript_from_sdcard(mocker, m5stickv, tdata):
@@ -1278,7 +1344,7 @@ def test_sign_miniscript_from_sdcard(mocker, m5stickv, tdata):
         signer.sign(trim=False)
         if i == 1:
             assert signer.is_b64_file
-            signed_psbt, _ = signer.psbt_qr()
+            signed_psbt, _, _ = signer.psbt_qr()
             with open("/sd/" + "dummy-signed.psbt", "w") as f:
                 f.write(signed_psbt)
         else:
@@ -1312,7 +1378,7 @@ def test_sign_tr_miniscript_internal_key(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
     # Repeat signatures with descriptor loaded and more checks
     wallet.load(TR_MINISCRIPT, FORMAT_NONE)
@@ -1320,7 +1386,7 @@ def test_sign_tr_miniscript_internal_key(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_tr_miniscript_internal_key_from_sdcard(mocker, m5stickv, tdata):
@@ -1349,7 +1415,7 @@ def test_sign_tr_miniscript_internal_key_from_sdcard(mocker, m5stickv, tdata):
         signer.sign(trim=False)
         if i == 1:
             assert signer.is_b64_file
-            signed_psbt, _ = signer.psbt_qr()
+            signed_psbt, _, _ = signer.psbt_qr()
             with open("/sd/" + "dummy-signed.psbt", "w") as f:
                 f.write(signed_psbt)
         else:
@@ -1388,7 +1454,7 @@ def test_sign_tr_miniscript_tap_tree(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
     # Repeat signatures with descriptor loaded and more checks
     wallet.load(TR_MINISCRIPT, FORMAT_NONE)
@@ -1396,7 +1462,7 @@ def test_sign_tr_miniscript_tap_tree(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_tr_miniscript_tap_tree_from_sdcard(mocker, m5stickv, tdata):
@@ -1426,7 +1492,7 @@ def test_sign_tr_miniscript_tap_tree_from_sdcard(mocker, m5stickv, tdata):
         signer.sign(trim=False)
         if i == 1:
             assert signer.is_b64_file
-            signed_psbt, _ = signer.psbt_qr()
+            signed_psbt, _, _ = signer.psbt_qr()
             with open("/sd/" + "dummy-signed.psbt", "w") as f:
                 f.write(signed_psbt)
         else:
@@ -1460,7 +1526,7 @@ def test_sign_tr_expanding_multisig(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
     # Repeat signatures with descriptor loaded and more checks
     wallet.load(TR_EXP_MULTI_MINISCRIPT, FORMAT_NONE)
@@ -1468,7 +1534,7 @@ def test_sign_tr_expanding_multisig(mocker, m5stickv, tdata):
     for case in cases:
         signer = PSBTSigner(wallet, case[0], case[1])
         signer.sign()
-        assert signer.psbt_qr() == (case[2], case[1])
+        assert signer.psbt_qr() == (case[2], case[1], None)
 
 
 def test_sign_tr_expanding_multisig_from_sdcard(mocker, m5stickv, tdata):
@@ -1497,7 +1563,7 @@ def test_sign_tr_expanding_multisig_from_sdcard(mocker, m5stickv, tdata):
         signer.sign(trim=False)
         if i == 1:
             assert signer.is_b64_file
-            signed_psbt, _ = signer.psbt_qr()
+            signed_psbt, _, _ = signer.psbt_qr()
             with open("/sd/" + "dummy-signed.psbt", "w") as f:
                 f.write(signed_psbt)
         else:
@@ -1506,6 +1572,91 @@ def test_sign_tr_expanding_multisig_from_sdcard(mocker, m5stickv, tdata):
         assert mock_file.write_data == case[2]
 
 
+def test_sign_streamed_from_sdcard(mocker, m5stickv, tdata, tmp_path):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_SINGLESIG, TYPE_MULTISIG
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    mocker.patch("krux.psbt.LARGE_PSBT_FILE_SIZE", 0)
+    mocker.patch("krux.settings.SD_PATH", str(tmp_path).lstrip("/"))
+    singlesig = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    multisig = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"]))
+    cases = [
+        (singlesig, tdata.P2PKH_PSBT, tdata.SIGNED_P2PKH_PSBT_SD),
+        (singlesig, tdata.P2WPKH_PSBT, tdata.SIGNED_P2WPKH_PSBT_SD),
+        (singlesig, tdata.P2SH_P2WPKH_PSBT, tdata.SIGNED_P2SH_P2WPKH_PSBT_SD),
+        (singlesig, tdata.P2TR_PSBT, tdata.SIGNED_P2TR_PSBT_SD),
+        (multisig, tdata.P2WSH_PSBT, tdata.SIGNED_P2WSH_PSBT_SD),
+    ]
+
+    for wallet, psbt, signed_psbt in cases:
+        (tmp_path / "dummy.psbt").write_bytes(psbt)
+
+        # Signed to SD, one input at a time
+        signer = PSBTSigner(wallet, None, FORMAT_NONE, "dummy.psbt")
+        assert signer.streamed
+        signer.outputs()
+        with open(tmp_path / "dummy-signed.psbt", "wb") as f:
+            signer.sign_to(f, trim=False)
+        assert (tmp_path / "dummy-signed.psbt").read_bytes() == signed_psbt
+
+        # Signed trimmed to memory, as for QR codes
+        signer = PSBTSigner(wallet, None, FORMAT_NONE, "dummy.psbt")
+        signer.sign()
+        assert not signer.streamed
+        whole_signer = PSBTSigner(wallet, psbt, FORMAT_NONE)
+        whole_signer.sign()
+        assert signer.psbt.serialize() == whole_signer.psbt.serialize()
+
+
+def test_base64_file_decoded_while_read(mocker, m5stickv, tmp_path):
+    import tracemalloc
+    from embit.psbt import PSBT
+    from embit.script import Script
+    from embit.transaction import Transaction, TransactionInput, TransactionOutput
+    from krux.baseconv import Base64Reader, base_decode, base_encode
+
+    # Large PSBT, 200 inputs carrying their previous transactions
+    script_pubkey = Script(b"\x00\x14" + bytes(20))
+    prev_txs = [
+        Transaction(
+            vin=[TransactionInput(i.to_bytes(32, "little"), 0)],
+            vout=[TransactionOutput(1000 + i, script_pubkey)] * 10,
+        )
+        for i in range(200)
+    ]
+    psbt = PSBT(
+        Transaction(
+            vin=[TransactionInput(prev_tx.txid(), 0) for prev_tx in prev_txs],
+            vout=[TransactionOutput(1000, script_pubkey)],
+        )
+    )
+    for inp, prev_tx in zip(psbt.inputs, prev_txs):
+        inp.non_witness_utxo = prev_tx
+    raw_psbt = psbt.serialize()
+    (tmp_path / "large.psbt").write_text(base_encode(raw_psbt, 64))
+    del psbt, prev_txs
+
+    def load_overhead(load):
+        """Peak memory used while loading, above the loaded PSBT itself"""
+        tracemalloc.start()
+        with open(tmp_path / "large.psbt", "rb") as file:
+            loaded = load(file)
+        loaded_size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert loaded.serialize() == raw_psbt
+        return peak - loaded_size
+
+    whole_overhead = load_overhead(
+        lambda f: PSBT.parse(base_decode(f.read().decode(), 64))
+    )
+    streamed_overhead = load_overhead(lambda f: PSBT.read_from(Base64Reader(f)))
+    # The binary PSBT is no longer held whole while it is parsed
+    assert whole_overhead - streamed_overhead > len(raw_psbt) * 9 // 10
+
+
 def test_sign_fails_with_0_sigs_added(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from krux.psbt import PSBTSigner
@@ -1621,7 +1772,7 @@ def test_outputs_singlesig(mocker, m5stickv, tdata):
         print("test_outputs_singlesig case: ", case_num)
         signer = PSBTSigner(case[2], case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[1]
+        assert list(outputs) == case[1]
         case_num += 1
 
 
@@ -1737,13 +1888,13 @@ def test_outputs_multisig(mocker, m5stickv, tdata):
         wallet = case[2]
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[1]
+        assert list(outputs) == case[1]
         if case[3] is not None:
             wallet.load(case[3], FORMAT_NONE)
             assert wallet.has_change_addr()
             signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
             outputs, _ = signer.outputs()
-            assert outputs == case[4]
+            assert list(outputs) == case[4]
 
 
 def test_outputs_miniscript(mocker, m5stickv, tdata):
@@ -1809,12 +1960,12 @@ def test_outputs_miniscript(mocker, m5stickv, tdata):
         wallet = case[2]
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[1]
+        assert list(outputs) == case[1]
         wallet.load(case[3], FORMAT_NONE)
         assert wallet.has_change_addr()
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[4]
+        assert list(outputs) == case[4]
 
 
 def test_outputs_tr_miniscript(mocker, m5stickv, tdata):
@@ -1884,12 +2035,12 @@ def test_outputs_tr_miniscript(mocker, m5stickv, tdata):
         wallet = case[2]
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[1]
+        assert list(outputs) == case[1]
         wallet.load(case[3], FORMAT_NONE)
         assert wallet.has_change_addr()
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[4]
+        assert list(outputs) == case[4]
 
 
 def test_outputs_tr_miniscript_provably_unspendable(mocker, m5stickv, tdata):
@@ -1960,12 +2111,12 @@ def test_outputs_tr_miniscript_provably_unspendable(mocker, m5stickv, tdata):
         wallet = case[2]
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[1]
+        assert list(outputs) == case[1]
         wallet.load(case[3], FORMAT_NONE)
         assert wallet.has_change_addr()
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
         outputs, _ = signer.outputs()
-        assert outputs == case[4]
+        assert list(outputs) == case[4]
 
 
 def test_xpubs_fails_with_no_xpubs(mocker, m5stickv, tdata):
@@ -2002,7 +2153,36 @@ def test_sign_single_1_input_1_output_no_change(m5stickv):
     wallet = Wallet(Key(MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
     signer = PSBTSigner(wallet, PSBT_B64, FORMAT_PMOFN)
     outputs, _ = signer.outputs()
-    assert outputs == OUTPUT
+    assert list(outputs) == OUTPUT
+
+
+def test_outputs_rendered_on_demand(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_MULTISIG, P2WSH
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(
+        Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"], "", 0, P2WSH)
+    )
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, FORMAT_NONE)
+    mocker.spy(signer, "output_message")
+    outputs, _ = signer.outputs()
+
+    # Summary is ready without rendering any output
+    assert len(outputs) == 3
+    assert outputs[0].startswith("Inputs (2):")
+    signer.output_message.assert_not_called()
+
+    messages = list(outputs.pages(1))
+    assert signer.output_message.call_count == 2
+    assert messages[0].startswith("1. Spend:")
+    assert messages[1].startswith("2. Spend:")
+    assert outputs[-1] == messages[1]
+    assert list(outputs) == [outputs[0]] + messages
+    with pytest.raises(IndexError):
+        outputs[3]
 
 
 def test_path_mismatch(mocker, m5stickv, tdata):
@@ -156,6 +156,111 @@ def test_parser(mocker, m5stickv, tdata):
             assert res == tdata.TEST_DATA_B58
 
 
+def test_parser_tracks_missing_parts(mocker, m5stickv):
+    from krux.qr import QRPartParser
+
+    parser = QRPartParser()
+    assert parser.missing_count() == -1
+    assert parser.missing_parts() == []
+
+    parser.parse("p3of4 cc")
+    assert parser.total_count() == 4
+    assert parser.missing_count() == 3
+    assert parser.missing_parts() == [1, 2, 4]
+
+    # Repeated parts don't count twice
+    parser.parse("p3of4 cc")
+    parser.parse("p1of4 aa")
+    assert parser.missing_count() == 2
+    assert parser.missing_parts() == [2, 4]
+    assert not parser.is_complete()
+
+    parser.parse("p4of4 dd")
+    parser.parse("p2of4 bb")
+    assert parser.missing_count() == 0
+    assert parser.missing_parts() == []
+    assert parser.is_complete()
+    assert parser.result() == "aabbccdd"
+
+    # Parts out of the total's range are never complete
+    parser = QRPartParser()
+    parser.parse("p1of2 aa")
+    parser.parse("p3of2 cc")
+    parser.parse("p2of2 bb")
+    assert parser.missing_count() == 0
+    assert not parser.is_complete()
+
+    # A different total tracks again the parts parsed so far
+    parser = QRPartParser()
+    parser.parse("p1of2 aa")
+    parser.parse("p2of3 bb")
+    assert parser.missing_parts() == [3]
+
+
+def test_qr_code_tracker(mocker, m5stickv):
+    from krux.qr import QRCodeTracker, ROI_FULL_FRAME_PERIOD
+    from .shared_mocks import Mockqrcode
+
+    img = mocker.MagicMock(
+        width=mocker.MagicMock(return_value=320),
+        height=mocker.MagicMock(return_value=240),
+    )
+    img.find_qrcodes.return_value = [Mockqrcode("p1of2 aa", (100, 60, 80, 80))]
+    tracker = QRCodeTracker()
+
+    # First snapshot searches the full frame
+    tracker.find_qrcodes(img)
+    img.find_qrcodes.assert_called_with()
+
+    # Then the code's region, padded by half its size
+    for _ in range(ROI_FULL_FRAME_PERIOD):
+        tracker.find_qrcodes(img)
+        img.find_qrcodes.assert_called_with((60, 20, 160, 160))
+
+    # Full frame is searched periodically
+    tracker.find_qrcodes(img)
+    img.find_qrcodes.assert_called_with()
+
+    # And after a miss
+    tracker.find_qrcodes(img)
+    img.find_qrcodes.assert_called_with((60, 20, 160, 160))
+    img.find_qrcodes.return_value = []
+    tracker.find_qrcodes(img)
+    tracker.find_qrcodes(img)
+    img.find_qrcodes.assert_called_with()
+
+    # Region covers every code found, within the image
+    codes = [
+        Mockqrcode("p1of2 aa", (10, 10, 100, 100)),
+        Mockqrcode("p2of2 bb", (200, 120, 100, 100)),
+    ]
+    assert tracker.padded_rect(img, codes) == (0, 0, 320, 240)
+
+
+def test_parser_pmofn_result(mocker, m5stickv):
+    from krux.qr import QRPartParser
+
+    text_parts = ["p2of3 bb", "p3of3 c", "p1of3 aa"]
+    parser = QRPartParser()
+    for part in text_parts:
+        parser.parse(part)
+    assert parser.result() == "aabbc"
+
+    # Binary parts are all kept
+    parser = QRPartParser()
+    for part in text_parts:
+        parser.parse(part)
+    for index in parser.parts:
+        parser.parts[index] = parser.parts[index].encode() + b"\xff"
+    assert parser.result() == b"aa\xffbb\xffc\xff"
+
+    # A single QR code is returned as scanned
+    data = "UUucvki6KWyS35DhetbWPw1DiaccbHKywScF96E8VUwEnN1gss947"
+    parser = QRPartParser()
+    parser.parse(data)
+    assert parser.result() is data
+
+
 def test_to_qr_codes(mocker, m5stickv, tdata):
     from krux.qr import to_qr_codes, FORMAT_NONE, FORMAT_PMOFN, FORMAT_UR, FORMAT_BBQR
     from krux.display import Display
@@ -204,6 +309,40 @@ def test_to_qr_codes(mocker, m5stickv, tdata):
         assert len(codes) == expected_parts
 
 
+def test_cached_qr_codes(mocker, m5stickv):
+    from krux.qr import cached_qr_codes, to_qr_codes, FORMAT_NONE, FORMAT_PMOFN
+    from .shared_mocks import encode
+    import krux.qr
+
+    data = "cHNidP8BAHECAAAAAV" * 40
+    cases = [
+        (FORMAT_NONE, 1),
+        (FORMAT_PMOFN, 6),
+    ]
+    for fmt, expected_parts in cases:
+        expected = []
+        code_generator = to_qr_codes(data, 45, fmt)
+        for _ in range(expected_parts):
+            expected.append(next(code_generator))
+            assert expected[-1][1] == expected_parts
+
+        encode_spy = mocker.patch.object(krux.qr.qrcode, "encode", side_effect=encode)
+        code_generator = cached_qr_codes(data, 45, fmt)
+        for cycle in range(3):
+            for frame in expected:
+                assert next(code_generator) == frame
+        # Only the first cycle was encoded
+        assert encode_spy.call_count == expected_parts
+
+        # Without budget frames are encoded on every cycle
+        encode_spy = mocker.patch.object(krux.qr.qrcode, "encode", side_effect=encode)
+        code_generator = cached_qr_codes(data, 45, fmt, budget=0)
+        for cycle in range(3):
+            for frame in expected:
+                assert next(code_generator) == frame
+        assert encode_spy.call_count == 3 * expected_parts
+
+
 def test_detect_plaintext_qr(mocker, m5stickv):
     from krux.qr import detect_format
 
@@ -214,6 +353,42 @@ def test_detect_plaintext_qr(mocker, m5stickv):
     detect_format(PLAINTEXT_QR_DATA)
 
 
+def test_qr_capacity(m5stickv):
+    from krux.qr import qr_capacity, ECC_LOW, ECC_MEDIUM, ECC_QUARTILE, ECC_HIGH
+
+    # Version 1
+    assert qr_capacity(1, "numeric") == 41
+    assert qr_capacity(1, "alphanumeric") == 25
+    assert qr_capacity(1, "byte") == 17
+    assert qr_capacity(1, "byte", ECC_HIGH) == 7
+    # Version 10, count indicator grows
+    assert qr_capacity(10, "numeric", ECC_MEDIUM) == 513
+    assert qr_capacity(10, "alphanumeric", ECC_QUARTILE) == 221
+    assert qr_capacity(10, "byte") == 271
+    # Version 40
+    assert qr_capacity(40, "numeric") == 7089
+    assert qr_capacity(40, "alphanumeric") == 4296
+    assert qr_capacity(40, "byte") == 2953
+    assert qr_capacity(40, "byte", ECC_HIGH) == 1273
+
+
+def test_max_qr_bytes(m5stickv):
+    from krux.qr import max_qr_bytes, ECC_MEDIUM
+
+    # Version 1 (21 + 2 frame)
+    assert max_qr_bytes(23) == 17
+    assert max_qr_bytes(10) == 17
+    # Version 3 (29 + 2 frame), used by printers
+    assert max_qr_bytes(33) == 53
+    assert max_qr_bytes(33, "alphanumeric") == 77
+    assert max_qr_bytes(33, ecc=ECC_MEDIUM) == 42
+    # Versions above 20 are no longer clamped
+    assert max_qr_bytes(101) == 858
+    assert max_qr_bytes(105) == 929
+    assert max_qr_bytes(179) == 2953
+    assert max_qr_bytes(500) == 2953
+
+
 def test_find_min_num_parts(m5stickv):
     from krux.qr import find_min_num_parts
 
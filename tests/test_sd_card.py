@@ -71,3 +71,98 @@ def test_sd_card_dir_not_exists(m5stickv, mocker_sd_card_dir_not_exist):
     from krux.sd_card import SDHandler
 
     assert not SDHandler.dir_exists("adir")
+
+
+def test_sd_nested_handlers_share_mount(m5stickv, mocker_sd_card_ok):
+    import machine
+    from krux.sd_card import SDHandler
+
+    with SDHandler():
+        with SDHandler() as sd:
+            sd.read("afile")
+            with SDHandler():
+                assert SDHandler.sessions == 3
+
+    # nested handlers reuse the outer handler's mount
+    machine.SDCard.remount.assert_called_once()
+    assert SDHandler.sessions == 0
+
+    # a new session remounts, the card may have been changed meanwhile
+    with SDHandler():
+        pass
+    assert machine.SDCard.remount.call_count == 2
+
+
+def test_sd_nested_handler_remounts_after_card_removed(m5stickv, mocker):
+    import machine
+    import os
+    from krux.sd_card import SDHandler
+
+    mocker.patch("os.listdir", new=mocker.MagicMock(return_value=["somefile"]))
+
+    with SDHandler():
+        os.listdir.side_effect = [OSError("SDCard not found"), ["somefile"]]
+        with SDHandler():
+            pass
+
+    assert machine.SDCard.remount.call_count == 2
+
+
+def test_sd_io_error_drops_mount(m5stickv, mocker_sd_card_ok):
+    import machine
+    from krux.sd_card import SDHandler
+
+    with SDHandler():
+        try:
+            with SDHandler():
+                raise OSError("I/O error")
+        except OSError:
+            pass
+        assert not SDHandler.mounted
+
+        with SDHandler():
+            assert SDHandler.mounted
+
+    assert machine.SDCard.remount.call_count == 2
+    assert SDHandler.sessions == 0
+
+
+def test_sd_not_found_does_not_open_session(m5stickv, mocker_sd_card_dir_not_exist):
+    import pytest
+    from krux.sd_card import SDHandler
+
+    with pytest.raises(OSError):
+        with SDHandler():
+            pass
+
+    assert SDHandler.sessions == 0
+    assert not SDHandler.mounted
+
+
+def test_sd_session_shares_mount(m5stickv, mocker_sd_card_ok):
+    import machine
+    from krux.sd_card import SDHandler, SDSession
+
+    # Card check and file access of a flow share one remount
+    with SDSession():
+        with SDHandler():
+            pass
+        with SDHandler() as sd:
+            sd.read("afile")
+
+    machine.SDCard.remount.assert_called_once()
+    assert SDHandler.sessions == 0
+
+
+def test_sd_session_without_card(m5stickv, mocker_sd_card_dir_not_exist):
+    import pytest
+    from krux.sd_card import SDHandler, SDSession
+
+    # No error is raised by the session, handlers within fail as usual
+    with SDSession():
+        assert not SDHandler.mounted
+        with pytest.raises(OSError):
+            with SDHandler():
+                pass
+
+    assert SDHandler.sessions == 0
@@ -223,6 +223,46 @@ def test_store_get():
         assert s.get(case[0], case[1], case[3]) == case[2]
 
 
+def test_store_get_does_not_copy_settings(mocker):
+    from krux.settings import Store
+    import krux.settings
+
+    s = Store()
+    s.set("ns1.ns2", "setting", "value")
+    mocker.spy(krux.settings.json, "dumps")
+    mocker.spy(krux.settings.json, "loads")
+
+    assert s.get("ns1.ns2", "setting", "default") == "value"
+    assert s.get("ns1.ns2", "other", "default") == "default"
+    assert s.get("ns1.ns3", "setting", "default") == "default"
+    assert s.get("ns1.ns2.setting", "setting", "default") == "default"
+
+    # Settings are walked in place, never round-tripped through json
+    krux.settings.json.dumps.assert_not_called()
+    krux.settings.json.loads.assert_not_called()
+    assert s.settings == {"ns1": {"ns2": {"setting": "value"}}}
+
+
+def test_store_get_cache_invalidation():
+    from krux.settings import Store
+
+    s = Store()
+
+    # Cached misses return each call's default value
+    assert s.get("ns1", "setting", "default1") == "default1"
+    assert s.get("ns1", "setting", "default2") == "default2"
+
+    # set invalidates cached lookups
+    s.set("ns1", "setting", "value")
+    assert s.get("ns1", "setting", "default") == "value"
+    s.set("ns1", "setting", "new_value")
+    assert s.get("ns1", "setting", "default") == "new_value"
+
+    # delete invalidates cached lookups
+    s.delete("ns1", "setting")
+    assert s.get("ns1", "setting", "default") == "default"
+
+
 def test_store_set():
     from krux.settings import Store
 
@@ -988,6 +988,228 @@ def test_receive_addresses(mocker, m5stickv, tdata):
         n += 1
 
 
+def test_branch_descriptor(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    for wallet_data in (
+        tdata.BLUEWALLET_SINGLESIG_WALLET_DATA,
+        tdata.SPECTER_MULTISIG_WALLET_DATA,
+        tdata.LIANA_MINISCRIPT_DESCRIPTOR,
+        tdata.LIANA_TAP_EXPANDING_MINISCRIPT_DESCRIPTOR,
+    ):
+        wallet = Wallet(None)
+        wallet.load(wallet_data, FORMAT_NONE)
+        network = NETWORKS[wallet.which_network()]
+        for branch_index in range(wallet.descriptor.num_branches):
+            # Addresses from the cached branch match full derivations
+            assert list(
+                wallet.obtain_addresses(5, limit=3, branch_index=branch_index)
+            ) == [
+                wallet.descriptor.derive(i, branch_index=branch_index).address(
+                    network=network
+                )
+                for i in range(5, 8)
+            ]
+            assert wallet.branch_descriptor(branch_index) is wallet.branch_descriptor(
+                branch_index
+            )
+
+        # Loading another descriptor drops the cached branches
+        branch = wallet.branch_descriptor(0)
+        wallet.load(wallet_data, FORMAT_NONE)
+        assert wallet.branch_descriptor(0) is not branch
+
+
+def test_address_index(mocker, m5stickv, tdata, tmp_path):
+    from embit.script import address_to_scriptpubkey
+    from krux.wallet import Wallet
+    from krux.address_index import AddressIndex
+
+    mocker.patch(
+        "krux.address_index.Store.get_vfs_location",
+        return_value=str(tmp_path) + "/",
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.address_index = False
+    assert Wallet(tdata.SINGLESIG_KEY).address_index() is None
+
+    settings.return_value.security.address_index = True
+    wallet = Wallet(tdata.SINGLESIG_KEY)
+    addresses = list(wallet.obtain_addresses(0, limit=20))
+    address_index = wallet.address_index(0)
+    assert len(address_index) == 20
+
+    # Derivations that don't continue the table are not recorded
+    list(wallet.obtain_addresses(30, limit=5))
+    assert len(address_index) == 20
+    assert address_index.save()
+
+    stored = AddressIndex(wallet.descriptor, 0)
+    assert len(stored) == 20
+    assert list(stored.find(address_to_scriptpubkey(addresses[13]))) == [13]
+    change_addr = next(wallet.obtain_addresses(0, limit=1, branch_index=1))
+    assert list(stored.find(address_to_scriptpubkey(change_addr))) == []
+
+    # New records are appended to the stored table
+    list(wallet.obtain_addresses(20, limit=5))
+    assert address_index.save()
+    assert len(AddressIndex(wallet.descriptor, 0)) == 25
+    assert len(wallet.address_index(1)) == 1
+
+
+def test_address_index_partial_record(mocker, m5stickv, tdata, tmp_path):
+    from embit.script import address_to_scriptpubkey
+    from krux.wallet import Wallet
+    from krux.address_index import AddressIndex, ADDRESS_INDEX_MAGIC
+
+    mocker.patch(
+        "krux.address_index.Store.get_vfs_location",
+        return_value=str(tmp_path) + "/",
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.address_index = True
+
+    wallet = Wallet(tdata.SINGLESIG_KEY)
+    addresses = list(wallet.obtain_addresses(0, limit=10))
+    address_index = wallet.address_index(0)
+    assert address_index.save()
+
+    # An interrupted write left a partial trailing record
+    path = str(tmp_path) + "/" + address_index.filename
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02")
+
+    stored = AddressIndex(wallet.descriptor, 0)
+    assert len(stored) == 10
+    for i in range(10, 15):
+        stored.append(
+            i, address_to_scriptpubkey(list(wallet.obtain_addresses(i, 1))[0])
+        )
+    assert stored.save()
+
+    # The file was rewritten, so later records are still aligned
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[: len(ADDRESS_INDEX_MAGIC)] == ADDRESS_INDEX_MAGIC
+    assert len(data) == len(ADDRESS_INDEX_MAGIC) + 15 * 4
+    reloaded = AddressIndex(wallet.descriptor, 0)
+    assert len(reloaded) == 15
+    assert list(reloaded.find(address_to_scriptpubkey(addresses[7]))) == [7]
+    last_addr = list(wallet.obtain_addresses(14, 1))[0]
+    assert list(reloaded.find(address_to_scriptpubkey(last_addr))) == [14]
+
+
+def test_descriptor_cache(mocker, m5stickv, tdata, tmp_path):
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_PMOFN
+
+    mocker.patch(
+        "krux.settings.Store.get_vfs_location", return_value=str(tmp_path) + "/"
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.cache_descriptor = True
+
+    wallet = Wallet(tdata.MULTISIG_NATIVE_SW_1)
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN)
+    assert wallet.save_cache()
+
+    cached = Wallet(tdata.MULTISIG_NATIVE_SW_1)
+    mocker.spy(cached, "_validate_descriptor")
+    assert cached.load_cache()
+    cached._validate_descriptor.assert_not_called()
+    assert cached.is_loaded()
+    assert cached.wallet_data == wallet.wallet_data
+    assert cached.wallet_qr_format == FORMAT_PMOFN
+    assert str(cached.descriptor) == str(wallet.descriptor)
+    assert cached.label == wallet.label
+    assert cached.policy == wallet.policy
+    assert list(cached.obtain_addresses(0, limit=3)) == list(
+        wallet.obtain_addresses(0, limit=3)
+    )
+
+    # Cache of another key, or of the same mnemonic with another policy, is ignored
+    assert not Wallet(tdata.MULTISIG_NESTED_SW_1).load_cache()
+    assert not Wallet(tdata.SINGLESIG_KEY).load_cache()
+
+    # Tampered cache falls back to a regular load
+    cache_file = tmp_path / "descriptor.json"
+    cache_file.write_text(cache_file.read_text().replace("Specter", "Other"))
+    assert not Wallet(tdata.MULTISIG_NATIVE_SW_1).load_cache()
+
+    settings.return_value.security.cache_descriptor = False
+    assert not wallet.save_cache()
+    assert not Wallet(tdata.MULTISIG_NATIVE_SW_1).load_cache()
+
+
+def test_descriptor_cache_disabled(mocker, m5stickv, tdata, tmp_path):
+    from krux.wallet import Wallet, delete_descriptor_cache
+    from krux.qr import FORMAT_PMOFN
+
+    mocker.patch(
+        "krux.settings.Store.get_vfs_location", return_value=str(tmp_path) + "/"
+    )
+    settings = mocker.patch("krux.wallet.Settings")
+    settings.return_value.security.cache_descriptor = True
+    cache_file = tmp_path / "descriptor.json"
+
+    wallet = Wallet(tdata.MULTISIG_NATIVE_SW_1)
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN)
+    assert wallet.save_cache()
+    assert cache_file.exists()
+
+    # A cache left from when the setting was enabled is removed, not restored
+    settings.return_value.security.cache_descriptor = False
+    assert not Wallet(tdata.MULTISIG_NATIVE_SW_1).load_cache()
+    assert not cache_file.exists()
+
+    settings.return_value.security.cache_descriptor = True
+    assert wallet.save_cache()
+    settings.return_value.security.cache_descriptor = False
+    assert not wallet.save_cache()
+    assert not cache_file.exists()
+
+    settings.return_value.security.cache_descriptor = True
+    assert wallet.save_cache()
+    delete_descriptor_cache()
+    assert not cache_file.exists()
+    # Nothing to remove
+    delete_descriptor_cache()
+
+
+def test_descriptor_cache_form(mocker, m5stickv, tdata):
+    from krux.wallet import (
+        Wallet,
+        descriptor_cache_form,
+        descriptor_from_cache_form,
+    )
+    from krux.qr import FORMAT_NONE
+
+    for wallet_data in (
+        tdata.BLUEWALLET_SINGLESIG_WALLET_DATA,
+        tdata.SPECTER_MULTISIG_WALLET_DATA,
+        tdata.LIANA_MINISCRIPT_DESCRIPTOR,
+        tdata.LIANA_TAPROOT_MINISCRIPT_DESCRIPTOR,
+        tdata.LIANA_TAP_EXPANDING_MINISCRIPT_DESCRIPTOR,
+    ):
+        wallet = Wallet(None)
+        wallet.load(wallet_data, FORMAT_NONE)
+        template, keys = descriptor_cache_form(wallet.descriptor)
+        assert "xpub" not in template
+        assert len(keys) == len(wallet.descriptor.keys)
+
+        descriptor = descriptor_from_cache_form(template, keys)
+        assert str(descriptor) == str(wallet.descriptor)
+        for branch_index in range(descriptor.num_branches):
+            assert (
+                descriptor.derive(7, branch_index=branch_index).script_pubkey()
+                == wallet.descriptor.derive(
+                    7, branch_index=branch_index
+                ).script_pubkey()
+            )
+
+
 def test_load_multisig(mocker, m5stickv, tdata):
     from krux.wallet import Wallet
     from krux.qr import FORMAT_NONE, FORMAT_PMOFN, FORMAT_UR
@@ -1573,6 +1795,24 @@ def test_parse_address_raises_errors(mocker, m5stickv, tdata):
             parse_address(case)
 
 
+def test_parse_address_list(mocker, m5stickv, tdata):
+    from krux.wallet import parse_address_list
+
+    data = (
+        "index,address\r\n"
+        "0,bc1qx2zuday8d6j4ufh4df6e9ttd06lnfmn2cuz0vn\r\n"
+        "1,14ihRbmxbgZ6JN9HdDDo6u6nGradHDy4GJ\r\n"
+        "bitcoin:32iCX1pY1iztdgM5qzurGLPMu5xhNfAUtg; invalidaddress\n"
+        "BC1QX2ZUDAY8D6J4UFH4DF6E9TTD06LNFMN2CUZ0VN\n"
+    )
+    assert parse_address_list(data) == [
+        "bc1qx2zuday8d6j4ufh4df6e9ttd06lnfmn2cuz0vn",
+        "14ihRbmxbgZ6JN9HdDDo6u6nGradHDy4GJ",
+        "32iCX1pY1iztdgM5qzurGLPMu5xhNfAUtg",
+    ]
+    assert parse_address_list("no addresses here") == []
+
+
 def test_to_unambiguous_descriptor(mocker, m5stickv, tdata):
     from embit.descriptor import Descriptor
     from krux.wallet import to_unambiguous_descriptor